@@ -1,10 +1,11 @@
+import argparse
 import sys
 import logging
 import threading
 import time
 import tkinter as tk
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import os
 import json
 from datetime import datetime
@@ -14,18 +15,40 @@ import asyncio
 src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 
+from src.utils.startup_profiler import (
+    DEFAULT_REPORT_PATH,
+    enable_startup_profiler,
+    get_startup_profiler,
+    mark_startup,
+    startup_phase,
+)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options (unknown options are ignored)."""
+    parser = argparse.ArgumentParser(description="Weather Dashboard")
+    parser.add_argument(
+        "--profile-startup",
+        nargs="?",
+        const=str(DEFAULT_REPORT_PATH),
+        default=None,
+        metavar="REPORT",
+        help=f"Record import and startup phase times and write a report (default: {DEFAULT_REPORT_PATH})",
+    )
+    return parser.parse_known_args(argv)[0]
+
+
+# The profiler has to be running before the imports below in order to time them
+if __name__ == "__main__":
+    _cli_args = parse_args()
+    if _cli_args.profile_startup:
+        enable_startup_profiler(Path(_cli_args.profile_startup))
+
 from utils.loading_manager import LoadingManager
 from dotenv import load_dotenv
 
-# Async loading imports
-try:
-    from src.services.async_service_manager import AsyncServiceManager
-    from src.services.async_loader import LoadingResult
-    from src.ui.components.progressive_loader import ProgressiveLoader
-    ASYNC_AVAILABLE = True
-except ImportError as e:
-    logging.warning(f"Async loading not available: {e}")
-    ASYNC_AVAILABLE = False
+# The async entry point (AsyncServiceManager, ProgressiveLoader) is imported
+# by main_async() only, so the sync path does not pay for it
 
 
 def ensure_directories():
@@ -715,26 +738,40 @@ def main_sync():
     logger.info("Starting Weather Dashboard (Sync Mode)...")
     
     # Ensure required directories exist
-    ensure_directories()
+    with startup_phase("ensure_directories"):
+        ensure_directories()
     
     # Load environment
-    load_dotenv()
+    with startup_phase("load_dotenv"):
+        load_dotenv()
 
     dashboard = None
     try:
         # Import and create the professional dashboard directly
-        from src.ui.professional_weather_dashboard import ProfessionalWeatherDashboard
-        from src.services.config.config_service import ConfigService
-        from src.ui.safe_widgets import SafeWidget
+        with startup_phase("import_dashboard"):
+            from src.ui.professional_weather_dashboard import ProfessionalWeatherDashboard
+            from src.services.config.config_service import ConfigService
+            from src.ui.safe_widgets import SafeWidget
 
         # Initialize config service
-        config_service = ConfigService()
+        with startup_phase("config_service"):
+            config_service = ConfigService()
         logger.info("Configuration service initialized successfully")
 
         # Create and run the dashboard
-        dashboard = ProfessionalWeatherDashboard(config_service=config_service)
+        with startup_phase("create_dashboard"):
+            dashboard = ProfessionalWeatherDashboard(config_service=config_service)
         logger.info("Dashboard created successfully")
 
+        profiler = get_startup_profiler()
+        if profiler is not None:
+            # The first idle callback runs once the first frame has been drawn
+            def on_first_window():
+                mark_startup("first_window")
+                profiler.write_report()
+
+            dashboard.after_idle(on_first_window)
+
         # Start the main loop
         dashboard.mainloop()
 
@@ -757,6 +794,11 @@ def main_sync():
             except Exception as destroy_error:
                 logger.error(f"Error destroying dashboard: {destroy_error}")
         
+        # Rewrite the startup profile with everything loaded after the first window
+        profiler = get_startup_profiler()
+        if profiler is not None:
+            profiler.write_report()
+        
         logger.info("Application shutdown complete")
 
 
@@ -766,9 +808,13 @@ def main():
     os.environ['ASYNC_MODE'] = 'false'
     
     # Setup logging first
-    setup_logging()
+    with startup_phase("setup_logging"):
+        setup_logging()
     logger = logging.getLogger(__name__)
     
+    if get_startup_profiler() is not None:
+        logger.info(f"📊 Startup profiling enabled; report: {get_startup_profiler().report_path}")
+    
     try:
         logger.info("Starting in SYNC mode for stability")
         
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Microbenchmark for cache get/set cost as the number of entries grows.
+
+Measures per-operation time of CacheService, the database CacheManager and
+TieredCache at increasing sizes, including a phase where every set has to
+evict. Per-operation cost should stay flat from 1k to 100k entries; the
+script exits non-zero if the largest size is more than --max-ratio times
+slower than the smallest.
+
+Usage:
+    python scripts/benchmark_cache.py [--sizes 1000 10000 100000] [--max-ratio 3]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.services.cache.cache_service import CacheService  # noqa: E402
+from src.services.cache.tiered_cache import TieredCache  # noqa: E402
+from src.services.database.cache_manager import CacheManager  # noqa: E402
+
+
+def _payload(i: int) -> Dict[str, float]:
+    """Small forecast-like value."""
+    return {"temp": 20.0 + i % 10, "humidity": 50.0, "wind": 3.5}
+
+
+def _per_op_us(func: Callable[[int], object], count: int) -> float:
+    """Run func(i) for i in range(count) and return microseconds per call."""
+    start = time.perf_counter()
+    for i in range(count):
+        func(i)
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def bench_cache_service(size: int) -> Dict[str, float]:
+    """Benchmark CacheService with room for size entries."""
+    cache = CacheService(max_size=size, max_memory_mb=1024, cleanup_interval=3600)
+    try:
+        set_us = _per_op_us(lambda i: cache.set(f"k{i}", _payload(i)), size)
+        get_us = _per_op_us(lambda i: cache.get(f"k{i}"), size)
+        # Every set beyond capacity evicts
+        evict_us = _per_op_us(lambda i: cache.set(f"e{i}", _payload(i)), size)
+    finally:
+        cache.close()
+    return {"set": set_us, "get": get_us, "set+evict": evict_us}
+
+
+def bench_database_cache_manager(size: int) -> Dict[str, float]:
+    """Benchmark the database CacheManager with room for size entries."""
+    cache = CacheManager(max_size=1024 * 1024 * 1024, max_entries=size, enable_compression=False)
+    set_us = _per_op_us(lambda i: cache.set(f"k{i}", _payload(i)), size)
+    get_us = _per_op_us(lambda i: cache.get(f"k{i}"), size)
+    evict_us = _per_op_us(lambda i: cache.set(f"e{i}", _payload(i)), size)
+    return {"set": set_us, "get": get_us, "set+evict": evict_us}
+
+
+def bench_tiered_cache(size: int) -> Dict[str, float]:
+    """Benchmark TieredCache (L1 only) with room for size entries."""
+    cache = TieredCache(max_memory_mb=1024, max_entries=size, sweep_interval=0)
+    try:
+        set_us = _per_op_us(lambda i: cache.set("bench", f"k{i}", _payload(i)), size)
+        get_us = _per_op_us(lambda i: cache.get("bench", f"k{i}"), size)
+        evict_us = _per_op_us(lambda i: cache.set("bench", f"e{i}", _payload(i)), size)
+    finally:
+        cache.close()
+    return {"set": set_us, "get": get_us, "set+evict": evict_us}
+
+
+BENCHMARKS = {
+    "CacheService": bench_cache_service,
+    "database.CacheManager": bench_database_cache_manager,
+    "TieredCache": bench_tiered_cache,
+}
+
+
+def main(argv: List[str] = None) -> int:
+    """Run the benchmark and print a table of microseconds per operation."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--max-ratio", type=float, default=3.0)
+    args = parser.parse_args(argv)
+
+    sizes = sorted(args.sizes)
+    failures = []
+
+    print(f"{'cache':<24}{'op':<12}" + "".join(f"{n:>12,}" for n in sizes) + f"{'ratio':>10}")
+    for name, bench in BENCHMARKS.items():
+        results = {size: bench(size) for size in sizes}
+        for op in ("set", "get", "set+evict"):
+            timings = [results[size][op] for size in sizes]
+            ratio = timings[-1] / timings[0] if timings[0] > 0 else 0.0
+            print(f"{name:<24}{op:<12}" + "".join(f"{t:>10.2f}us" for t in timings) + f"{ratio:>9.2f}x")
+            if ratio > args.max_ratio:
+                failures.append(f"{name} {op}: {ratio:.2f}x slower at {sizes[-1]:,} entries")
+
+    if failures:
+        print("\n❌ Per-operation cost grew with cache size:")
+        for failure in failures:
+            print(f"  {failure}")
+        return 1
+
+    print(f"\n✅ Per-operation cost flat within {args.max_ratio}x from {sizes[0]:,} to {sizes[-1]:,} entries")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Benchmark streaming data export against building the export in memory.
+
+Fills a temporary database with synthetic weather history, then exports it
+the previous way (every row loaded and converted, then one json.dump) and
+with the streaming exporter in each format. Reports time and peak traced
+memory; the streaming peak should not grow with the number of rows.
+
+Usage:
+    python scripts/benchmark_export.py [--rows 100000] [--page-size 1000]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import insert, select  # noqa: E402
+
+from src.services.database.database_manager import DatabaseManager  # noqa: E402
+from src.services.database.models import WeatherHistory  # noqa: E402
+from src.services.database.streaming_export import StreamingExporter  # noqa: E402
+
+
+async def populate(db: DatabaseManager, rows: int, batch: int = 10000) -> None:
+    """Insert synthetic weather history rows."""
+    start = datetime(2020, 1, 1)
+    async with db.get_async_session() as session:
+        for offset in range(0, rows, batch):
+            await session.execute(
+                insert(WeatherHistory),
+                [
+                    {
+                        "location": f"City {i % 100}",
+                        "latitude": 40.0 + i % 10,
+                        "longitude": -70.0 - i % 10,
+                        "timestamp": start + timedelta(minutes=10 * i),
+                        "temperature": 15.0 + i % 20,
+                        "humidity": 50 + i % 40,
+                        "condition": "Clouds",
+                        "description": "broken clouds",
+                        "raw_data": {"source": "benchmark", "index": i},
+                    }
+                    for i in range(offset, min(rows, offset + batch))
+                ],
+            )
+        await session.commit()
+
+
+async def export_in_memory(db: DatabaseManager, path: Path) -> None:
+    """Previous approach: materialize every row, then dump once."""
+    async with db.get_async_session() as session:
+        result = await session.execute(select(WeatherHistory).order_by(WeatherHistory.timestamp.desc()))
+        records = [record.to_dict() for record in result.scalars().all()]
+    data = {"metadata": {"statistics": {"weather_history": len(records)}}, "data": {"weather_history": records}}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, default=str)
+
+
+async def measure(label: str, coro) -> None:
+    tracemalloc.start()
+    started = time.perf_counter()
+    await coro
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<24} {elapsed:8.2f}s  peak {peak / 1e6:8.1f} MB")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        out = Path(temp_dir)
+        db = DatabaseManager(str(out / "benchmark.db"))
+        await db.initialize()
+        await populate(db, args.rows)
+        print(f"{args.rows} rows, page size {args.page_size} (times include tracemalloc overhead)")
+
+        exporter = StreamingExporter(db, page_size=args.page_size)
+        await measure("in-memory json", export_in_memory(db, out / "legacy.json"))
+        for format, name in [("json", "export.json"), ("jsonl", "export.jsonl"),
+                             ("csv", "export.csv"), ("xml", "export.xml"),
+                             ("json", "export.json.gz")]:
+            await measure(f"streaming {name}", exporter.export(out / name, ["weather_history"], format=format))
+
+        for path in sorted(out.glob("*export*")) + [out / "legacy.json"]:
+            print(f"  {path.name:<16} {path.stat().st_size / 1e6:8.1f} MB")
+        await db.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
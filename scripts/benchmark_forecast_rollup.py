@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""Benchmark forecast-to-daily rollups over many cities.
+
+Builds synthetic OpenWeather 5-day/3-hour payloads and times the previous
+per-entry implementation (dict-of-lists grouping with a ForecastEntry object
+per slot) against the columnar parse with per-city and batched rollups, and
+the daily rollup on its own, vectorized across all cities and in pure Python.
+The daily summaries of the old and new paths are compared before timing.
+
+Usage:
+    python scripts/benchmark_forecast_rollup.py [--cities 1000] [--slots 40] [--repeat 3]
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytz  # noqa: E402
+
+from src.models.weather import forecast_series  # noqa: E402
+from src.models.weather.forecast_series import rollup_daily  # noqa: E402
+from src.models.weather.current_weather import WeatherCondition  # noqa: E402
+from src.models.weather.forecast_models import (  # noqa: E402
+    DailyForecast,
+    ForecastData,
+    ForecastEntry,
+)
+
+CONDITIONS = [("Clear", "clear sky"), ("Clouds", "broken clouds"), ("Rain", "light rain")]
+
+
+def make_payloads(cities: int, slots: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Create synthetic forecast payloads for a number of cities."""
+    rng = random.Random(seed)
+    start = int(time.time()) // 10800 * 10800
+    payloads = []
+    for city in range(cities):
+        items = []
+        for slot in range(slots):
+            main, description = rng.choice(CONDITIONS)
+            items.append(
+                {
+                    "dt": start + slot * 10800,
+                    "main": {
+                        "temp": rng.uniform(-10, 35),
+                        "feels_like": rng.uniform(-12, 35),
+                        "humidity": rng.randint(20, 100),
+                        "pressure": rng.randint(990, 1030),
+                    },
+                    "weather": [{"main": main, "description": description}],
+                    "wind": {"speed": rng.uniform(0, 15), "deg": rng.randint(0, 359)},
+                    "clouds": {"all": rng.randint(0, 100)},
+                    "pop": rng.random(),
+                    "rain": {"3h": rng.uniform(0, 3)} if main == "Rain" else {},
+                }
+            )
+        payloads.append(
+            {
+                "city": {
+                    "name": f"City {city}",
+                    "country": "XX",
+                    "coord": {"lat": rng.uniform(-60, 60), "lon": rng.uniform(-180, 180)},
+                    "timezone": rng.choice(range(-43200, 50401, 3600)),
+                },
+                "list": items,
+            }
+        )
+    return payloads
+
+
+def legacy_daily_forecasts(data: Dict[str, Any]) -> List[DailyForecast]:
+    """Previous implementation: one ForecastEntry per slot, dict-of-lists grouping."""
+    city = data.get("city", {})
+    timezone_offset = city.get("timezone", 0)
+    hourly_forecasts = []
+    daily_data = defaultdict(
+        lambda: {
+            "temps": [],
+            "conditions": [],
+            "descriptions": [],
+            "humidity": [],
+            "wind_speeds": [],
+            "precipitation_probs": [],
+            "precipitation_amounts": [],
+        }
+    )
+
+    for item in data.get("list", [])[:40]:
+        weather = item.get("weather", [{}])[0]
+        main = item.get("main", {})
+        wind = item.get("wind", {})
+        local_timestamp = datetime.fromtimestamp(item.get("dt", 0), tz=pytz.UTC) + timedelta(
+            seconds=timezone_offset
+        )
+        hourly_forecasts.append(
+            ForecastEntry(
+                timestamp=local_timestamp,
+                condition=WeatherCondition.from_openweather(weather.get("main", "Unknown")),
+                description=weather.get("description", "Unknown").title(),
+                temperature=main.get("temp", 0.0),
+                feels_like=main.get("feels_like", 0.0),
+                humidity=main.get("humidity", 0),
+                pressure=main.get("pressure", 0.0),
+                wind_speed=wind.get("speed"),
+                wind_direction=wind.get("deg"),
+                cloudiness=item.get("clouds", {}).get("all"),
+                precipitation_probability=item.get("pop"),
+                precipitation_amount=item.get("rain", {}).get("3h", 0)
+                + item.get("snow", {}).get("3h", 0),
+            )
+        )
+        day = daily_data[local_timestamp.date()]
+        day["temps"].append(main.get("temp", 0.0))
+        day["conditions"].append(weather.get("main", "Unknown"))
+        day["descriptions"].append(weather.get("description", "Unknown"))
+        day["humidity"].append(main.get("humidity", 0))
+        day["wind_speeds"].append(wind.get("speed", 0))
+        day["precipitation_probs"].append(item.get("pop", 0))
+        day["precipitation_amounts"].append(
+            item.get("rain", {}).get("3h", 0) + item.get("snow", {}).get("3h", 0)
+        )
+
+    daily_forecasts = []
+    for day_date in sorted(daily_data)[:5]:
+        day = daily_data[day_date]
+        daily_forecasts.append(
+            DailyForecast(
+                date=datetime.combine(day_date, datetime.min.time()),
+                condition=WeatherCondition.from_openweather(
+                    Counter(day["conditions"]).most_common(1)[0][0]
+                ),
+                description=Counter(day["descriptions"]).most_common(1)[0][0].title(),
+                temp_min=min(day["temps"]),
+                temp_max=max(day["temps"]),
+                humidity=int(sum(day["humidity"]) / len(day["humidity"])),
+                wind_speed=sum(day["wind_speeds"]) / len(day["wind_speeds"]),
+                precipitation_probability=max(day["precipitation_probs"]),
+                precipitation_amount=sum(day["precipitation_amounts"]),
+            )
+        )
+    return daily_forecasts
+
+
+def assert_same_daily(expected: List[DailyForecast], actual: List[DailyForecast]) -> None:
+    """Assert two daily summaries match (floats up to summation order)."""
+    assert len(expected) == len(actual), "day count differs"
+    for old, new in zip(expected, actual):
+        assert old.date == new.date, (old.date, new.date)
+        assert old.condition == new.condition and old.description == new.description
+        assert old.humidity == new.humidity
+        for name in ("temp_min", "temp_max", "wind_speed", "precipitation_probability", "precipitation_amount"):
+            assert abs(getattr(old, name) - getattr(new, name)) < 1e-9, name
+
+
+def check_equivalence(payloads: List[Dict[str, Any]]) -> None:
+    """Verify the per-city and batch paths produce the old daily summaries."""
+    batch = ForecastData.from_openweather_forecasts(payloads)
+    for payload, batched in zip(payloads, batch):
+        expected = legacy_daily_forecasts(payload)
+        assert_same_daily(expected, ForecastData.from_openweather_forecast(payload).daily_forecasts)
+        assert_same_daily(expected, batched.daily_forecasts)
+
+
+def best_of(func: Callable[[], Any], repeat: int) -> float:
+    """Best wall time in seconds over repeat runs."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(argv: List[str] = None) -> int:
+    """Run the benchmark and print timings per path."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cities", type=int, default=1000)
+    parser.add_argument("--slots", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    payloads = make_payloads(args.cities, args.slots)
+    check_equivalence(payloads[:200])
+    series = [ForecastData.from_openweather_forecast(p).hourly_forecasts for p in payloads]
+
+    offsets = [0.0] * len(series)
+    results = {
+        "legacy parse + group": best_of(lambda: [legacy_daily_forecasts(p) for p in payloads], args.repeat),
+        "columnar, per-city rollup": best_of(
+            lambda: [ForecastData.from_openweather_forecast(p) for p in payloads], args.repeat
+        ),
+        "columnar, batch rollup": best_of(
+            lambda: ForecastData.from_openweather_forecasts(payloads), args.repeat
+        ),
+    }
+
+    numpy_available = forecast_series.NUMPY_AVAILABLE
+    if numpy_available:
+        results["rollup only (numpy batch)"] = best_of(
+            lambda: rollup_daily(series, DailyForecast, days=5, utc_offsets=offsets), args.repeat
+        )
+    forecast_series.NUMPY_AVAILABLE = False
+    try:
+        results["rollup only (python)"] = best_of(
+            lambda: rollup_daily(series, DailyForecast, days=5, utc_offsets=offsets), args.repeat
+        )
+    finally:
+        forecast_series.NUMPY_AVAILABLE = numpy_available
+
+    print(f"{args.cities:,} cities x {args.slots} slots (best of {args.repeat})")
+    baseline = results["legacy parse + group"]
+    for name, seconds in results.items():
+        per_city = seconds / args.cities * 1e6
+        print(f"  {name:<28}{seconds * 1000:>10.1f} ms{per_city:>10.1f} us/city{baseline / seconds:>8.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Build the offline gazetteer index and measure autocomplete latency.
+
+Indexes a GeoNames-style dump (or a synthetic one when --source is omitted),
+then times index build, cold open and per-query search for prefix, exact and
+misspelled queries. Exits non-zero if the p95 lookup exceeds --max-ms.
+
+Usage:
+    python scripts/benchmark_gazetteer.py [--source data/gazetteer/cities15000.txt]
+        [--places 30000] [--queries 2000] [--max-ms 5]
+"""
+
+import argparse
+import random
+import string
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.services.weather.gazetteer import Gazetteer  # noqa: E402
+
+SYLLABLES = [c + v for c in "bcdfghjklmnprstvwz" for v in "aeiou"] + ["port", "ville", "burg", "ham", "ton", "stad"]
+
+
+def write_synthetic_dump(path: Path, places: int, seed: int = 42) -> List[str]:
+    """Write a GeoNames-format dump of random city names and return the names."""
+    rng = random.Random(seed)
+    names = []
+    with open(path, "w", encoding="utf-8") as f:
+        for geoname_id in range(places):
+            name = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).title()
+            if rng.random() < 0.2:
+                name += " " + "".join(rng.choice(SYLLABLES) for _ in range(2)).title()
+            names.append(name)
+            fields = [
+                str(geoname_id), name, name, "",
+                f"{rng.uniform(-60, 70):.5f}", f"{rng.uniform(-180, 180):.5f}",
+                "P", "PPL", rng.choice(["US", "GB", "DE", "FR", "BR"]), "",
+                f"{rng.randint(1, 50):02d}", "", "", "",
+                str(int(rng.paretovariate(1.2) * 1000)), "", "", "UTC", "2024-01-01",
+            ]
+            f.write("\t".join(fields) + "\n")
+    return names
+
+
+def misspell(name: str, rng: random.Random) -> str:
+    """Introduce one substitution, deletion or transposition."""
+    chars = list(name.lower())
+    position = rng.randrange(1, len(chars) - 1)
+    edit = rng.choice(("substitute", "delete", "transpose"))
+    if edit == "substitute":
+        chars[position] = rng.choice(string.ascii_lowercase)
+    elif edit == "delete":
+        del chars[position]
+    else:
+        chars[position], chars[position - 1] = chars[position - 1], chars[position]
+    return "".join(chars)
+
+
+def percentile(timings: List[float], fraction: float) -> float:
+    ordered = sorted(timings)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def main(argv: List[str] = None) -> int:
+    """Run the benchmark and print build, open and lookup timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--source", type=Path, help="GeoNames dump (synthetic if omitted)")
+    parser.add_argument("--places", type=int, default=30000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--max-ms", type=float, default=5.0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(7)
+    with tempfile.TemporaryDirectory() as workdir:
+        workdir = Path(workdir)
+        if args.source:
+            source = args.source
+            with open(source, encoding="utf-8") as f:
+                names = [line.split("\t")[1] for line in f if line.count("\t") > 14]
+        else:
+            source = workdir / "synthetic.txt"
+            names = write_synthetic_dump(source, args.places)
+
+        index_path = workdir / "index.gzidx"
+        start = time.perf_counter()
+        Gazetteer.build(source, index_path)
+        build_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        gazetteer = Gazetteer(index_path)
+        open_ms = (time.perf_counter() - start) * 1000
+
+        sample = [rng.choice(names) for _ in range(args.queries)]
+        workloads = {
+            "prefix (3-5 chars)": [n[: rng.randint(3, 5)] for n in sample],
+            "exact name": sample,
+        }
+        typo_targets = [n for n in sample if len(n) > 4]
+        workloads["misspelled"] = [misspell(n, rng) for n in typo_targets]
+
+        stats = gazetteer.get_stats()
+        print(
+            f"{stats['places']:,} places, {stats['keys']:,} keys, {stats['trigrams']:,} trigrams, "
+            f"index {stats['index_bytes'] / 1e6:.1f} MB"
+        )
+        print(f"  build {build_s:.2f} s, open {open_ms:.2f} ms")
+
+        failures = []
+        for label, queries in workloads.items():
+            timings = []
+            for query in queries:
+                start = time.perf_counter()
+                gazetteer.search(query)
+                timings.append((time.perf_counter() - start) * 1000)
+            p50, p95 = percentile(timings, 0.5), percentile(timings, 0.95)
+            print(f"  {label:<20} p50 {p50:6.2f} ms  p95 {p95:6.2f} ms  max {max(timings):6.2f} ms")
+            if p95 > args.max_ms:
+                failures.append(f"{label}: p95 {p95:.2f} ms > {args.max_ms} ms")
+
+        hits = sum(
+            1
+            for query, name in zip(workloads["misspelled"], typo_targets)
+            if any(place.name == name for place in gazetteer.search(query))
+        )
+        print(f"  misspelled queries resolving to the intended name: {hits / len(workloads['misspelled']):.0%}")
+        gazetteer.close()
+
+    if failures:
+        print("\n❌ Lookup latency over budget:")
+        for failure in failures:
+            print(f"  {failure}")
+        return 1
+
+    print(f"\n✅ p95 lookup within {args.max_ms} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
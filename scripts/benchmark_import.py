@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Benchmark bulk data import against record-by-record import.
+
+Exports synthetic weather history from a temporary database, then imports
+it into a fresh one record by record (existence query, insert and commit
+per record, as the previous import did) and with the bulk importer
+(streamed, chunked transactions, keyed conflict join, executemany).
+Also times a second bulk import of the same file, where every record
+already exists, with "skip" and "overwrite" resolution.
+
+Usage:
+    python scripts/benchmark_import.py [--rows 100000] [--baseline-rows 5000] [--chunk-size 1000]
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import insert, select  # noqa: E402
+
+from src.services.database.bulk_import import BulkImporter, iter_import_records, validate_chunk  # noqa: E402
+from src.services.database.database_manager import DatabaseManager  # noqa: E402
+from src.services.database.models import WeatherHistory  # noqa: E402
+from src.services.database.streaming_export import StreamingExporter  # noqa: E402
+
+
+async def populate(db: DatabaseManager, rows: int, batch: int = 10000) -> None:
+    """Insert synthetic weather history rows."""
+    start = datetime(2020, 1, 1)
+    async with db.get_async_session() as session:
+        for offset in range(0, rows, batch):
+            await session.execute(
+                insert(WeatherHistory),
+                [
+                    {
+                        "location": f"City {i % 100}",
+                        "latitude": 40.0 + i % 10,
+                        "longitude": -70.0 - i % 10,
+                        "timestamp": start + timedelta(minutes=10 * i),
+                        "temperature": 15.0 + i % 20,
+                        "humidity": 50 + i % 40,
+                        "condition": "Clouds",
+                        "description": "broken clouds",
+                        "raw_data": {"source": "benchmark", "index": i},
+                    }
+                    for i in range(offset, min(rows, offset + batch))
+                ],
+            )
+        await session.commit()
+
+
+async def import_per_record(db: DatabaseManager, path: Path, limit: int) -> int:
+    """Previous approach: one existence check, insert and commit per record."""
+    imported = 0
+    async with db.get_async_session() as session:
+        for table, record in iter_import_records(path):
+            if table != "weather_history":
+                continue
+            if imported >= limit:
+                break
+            rows, _ = validate_chunk(table, [record], imported)
+            row = rows[0]
+            exists = await session.execute(
+                select(WeatherHistory.id).where(
+                    WeatherHistory.location == row["location"],
+                    WeatherHistory.timestamp == row["timestamp"],
+                )
+            )
+            if exists.first() is None:
+                session.add(WeatherHistory(**row))
+                await session.commit()
+            imported += 1
+    return imported
+
+
+async def timed(label: str, rows: int, coro) -> None:
+    started = time.perf_counter()
+    await coro
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28} {elapsed:8.2f}s  {rows / elapsed:10.0f} records/s")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--baseline-rows", type=int, default=5000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        out = Path(temp_dir)
+        source = DatabaseManager(str(out / "source.db"))
+        await source.initialize()
+        await populate(source, args.rows)
+        export_file = out / "export.json"
+        await StreamingExporter(source).export(export_file, ["weather_history"])
+        await source.close()
+        print(f"{args.rows} records, chunk size {args.chunk_size}")
+
+        baseline_rows = min(args.rows, args.baseline_rows)
+        baseline = DatabaseManager(str(out / "baseline.db"))
+        await baseline.initialize()
+        await timed(f"per-record ({baseline_rows})", baseline_rows,
+                    import_per_record(baseline, export_file, baseline_rows))
+        await baseline.close()
+
+        target = DatabaseManager(str(out / "target.db"))
+        await target.initialize()
+        importer = BulkImporter(target, chunk_size=args.chunk_size)
+        await timed("bulk validate", args.rows, asyncio.to_thread(importer.validate, export_file))
+        await timed("bulk import", args.rows, importer.import_file(export_file))
+        await timed("bulk re-import (skip)", args.rows, importer.import_file(export_file, "skip"))
+        await timed("bulk re-import (overwrite)", args.rows, importer.import_file(export_file, "overwrite"))
+        await target.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
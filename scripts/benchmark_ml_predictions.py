@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Time 24-hour ML weather predictions for one city versus many.
+
+Trains the hourly and direct multi-horizon models on synthetic history in a
+temporary directory, then compares per-city predict_weather() calls with
+predict_weather_batch() (chained hourly steps and direct multi-horizon).
+
+Usage:
+    python scripts/benchmark_ml_predictions.py [--cities 100] [--hours 24] [--repeat 3]
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.services.weather.ml_weather_service import MLWeatherService  # noqa: E402
+
+START = 1_700_000_000
+
+
+def synthetic_history(hours: int, seed: int = 0) -> List[Dict[str, float]]:
+    """Hourly observations with daily temperature and humidity cycles."""
+    rng = random.Random(seed)
+    history = []
+    for hour in range(hours):
+        phase = hour / 24 * 2 * math.pi
+        history.append({
+            "dt": START + 3600 * hour,
+            "temp": 15 + 8 * math.sin(phase) + rng.gauss(0, 1),
+            "humidity": 60 + 20 * math.cos(phase) + rng.gauss(0, 3),
+            "pressure": 1013 + rng.gauss(0, 4),
+            "wind_speed": abs(rng.gauss(5, 2)),
+            "clouds": rng.randint(0, 100),
+            "visibility": 10000,
+        })
+    return history
+
+
+def best_time(run: Callable[[], object], repeat: int) -> float:
+    """Best wall time of repeat runs, in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def main(argv: List[str] = None) -> int:
+    """Train on synthetic data and print prediction timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cities", type=int, default=100)
+    parser.add_argument("--hours", type=int, default=24)
+    parser.add_argument("--history", type=int, default=3000, help="Hours of training data")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    history = synthetic_history(args.history)
+    rng = random.Random(1)
+    cities = [
+        dict(history[-1], temp=rng.uniform(-5, 35), humidity=rng.uniform(20, 95))
+        for _ in range(args.cities)
+    ]
+
+    previous_dir = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        # The service keeps its models in ./models
+        os.chdir(workdir)
+        try:
+            service = MLWeatherService()
+            start = time.perf_counter()
+            service.train_models(history)
+            service.train_horizon_models(history, args.hours)
+            print(f"Trained on {len(history):,} hours in {time.perf_counter() - start:.1f} s\n")
+
+            rows = [
+                ("1 city, predict_weather", lambda: service.predict_weather(dict(cities[0]), args.hours)),
+                (
+                    f"{args.cities} cities, predict_weather loop",
+                    lambda: [service.predict_weather(dict(city), args.hours) for city in cities],
+                ),
+                (
+                    f"{args.cities} cities, batch (hourly steps)",
+                    lambda: service.predict_weather_batch(cities, args.hours, use_horizon_models=False),
+                ),
+                (
+                    "1 city, batch (direct multi-horizon)",
+                    lambda: service.predict_weather_batch(cities[:1], args.hours),
+                ),
+                (
+                    f"{args.cities} cities, batch (direct multi-horizon)",
+                    lambda: service.predict_weather_batch(cities, args.hours),
+                ),
+            ]
+            # predict_weather uses the multi-horizon models when present; time the
+            # hourly chain it replaces by hiding them for the per-city rows
+            horizon_models = service.horizon_models
+            for label, run in rows:
+                service.horizon_models = horizon_models if "direct" in label else {}
+                elapsed = best_time(run, args.repeat)
+                print(f"  {label:<42} {elapsed:9.1f} ms")
+            service.horizon_models = horizon_models
+        finally:
+            os.chdir(previous_dir)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Measure what the ML weather service costs at startup, eager versus lazy.
+
+Each measurement runs in a fresh interpreter so import caches are cold.
+"eager" is what startup paid before the service moved behind a lazy handle:
+import the module, construct MLWeatherService (importing scikit-learn,
+pandas and matplotlib) and load the saved models. "lazy" imports the module
+and takes the get_ml_weather_service() handle, deferring all of that to the
+idle-time preload or the first ML request.
+
+Models are trained once on synthetic history in a temporary directory so
+the model-loading step has real artifacts to map.
+
+Usage:
+    python scripts/benchmark_ml_startup.py [--repeat 5] [--history 2000]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+
+_TRAIN = """
+from benchmark_ml_predictions import synthetic_history
+from src.services.weather.ml_weather_service import MLWeatherService
+history = synthetic_history({history})
+service = MLWeatherService()
+service.train_models(history)
+service.train_horizon_models(history, 24)
+"""
+
+# Prints one JSON object of phase timings (ms) on its last line
+_MEASURE = """
+import json, sys, time
+timings = {{}}
+start = time.perf_counter()
+import src.services
+timings["packages"] = (time.perf_counter() - start) * 1000
+start = time.perf_counter()
+from src.services.weather import ml_weather_service
+timings["import"] = (time.perf_counter() - start) * 1000
+start = time.perf_counter()
+if "{mode}" == "eager":
+    service = ml_weather_service.MLWeatherService()
+    timings["construct"] = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    service.preload_models()
+    timings["load_models"] = (time.perf_counter() - start) * 1000
+else:
+    service = ml_weather_service.get_ml_weather_service()
+    timings["handle"] = (time.perf_counter() - start) * 1000
+timings["sklearn_imported"] = "sklearn" in sys.modules
+start = time.perf_counter()
+service.predict_weather({{"temp": 18, "humidity": 60, "dt": 1700000000}}, 24)
+timings["first_predict"] = (time.perf_counter() - start) * 1000
+print(json.dumps(timings))
+"""
+
+
+def run_child(code: str, workdir: str) -> str:
+    """Run code in a fresh interpreter with the repo importable."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(ROOT), str(ROOT / "scripts")]))
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=workdir, env=env,
+        capture_output=True, text=True, check=True,
+    )
+    return result.stdout.strip().splitlines()[-1] if result.stdout.strip() else ""
+
+
+def measure(mode: str, workdir: str, repeat: int) -> Dict[str, float]:
+    """Median phase timings of a mode over repeat cold starts."""
+    runs: List[Dict[str, float]] = [
+        json.loads(run_child(_MEASURE.format(mode=mode), workdir)) for _ in range(repeat)
+    ]
+    return {
+        key: (runs[0][key] if isinstance(runs[0][key], bool) else statistics.median(r[key] for r in runs))
+        for key in runs[0]
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    """Train throwaway models, then print eager versus lazy startup timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Cold starts per mode")
+    parser.add_argument("--history", type=int, default=2000, help="Hours of training data")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        # The service keeps its models in ./models
+        run_child(_TRAIN.format(history=args.history), workdir)
+        results = {mode: measure(mode, workdir, args.repeat) for mode in ("eager", "lazy")}
+
+    eager, lazy = results["eager"], results["lazy"]
+    eager_startup = eager["import"] + eager["construct"] + eager["load_models"]
+    lazy_startup = lazy["import"] + lazy["handle"]
+
+    print(f"Median of {args.repeat} cold starts (ms)\n")
+    print(f"  {'':<34} {'eager':>9} {'lazy':>9}")
+    print(f"  {'import src.services (shared)':<34} {eager['packages']:9.1f} {lazy['packages']:9.1f}")
+    print(f"  {'import ml_weather_service':<34} {eager['import']:9.1f} {lazy['import']:9.1f}")
+    print(f"  {'construct service / take handle':<34} {eager['construct']:9.1f} {lazy['handle']:9.1f}")
+    print(f"  {'load saved models':<34} {eager['load_models']:9.1f} {'deferred':>9}")
+    print(f"  {'ML cost on the startup path':<34} {eager_startup:9.1f} {lazy_startup:9.1f}")
+    print(f"  {'first 24h prediction':<34} {eager['first_predict']:9.1f} {lazy['first_predict']:9.1f}")
+    print(f"\n  scikit-learn imported before first use: eager={eager['sklearn_imported']} "
+          f"lazy={lazy['sklearn_imported']}")
+    print(f"  Cold-start delta: {eager_startup - lazy_startup:.1f} ms moved off the startup path")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
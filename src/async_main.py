@@ -10,21 +10,41 @@ import os
 import sys
 import time
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any
 
 # Add src directory to path
 src_path = Path(__file__).parent
 if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
 
+# Shares main.py's profiler when started from there (src importable as a package)
+try:
+    from src.utils.startup_profiler import (
+        DEFAULT_REPORT_PATH,
+        enable_startup_profiler,
+        get_startup_profiler,
+        mark_startup,
+        startup_phase,
+    )
+except ImportError:
+    from utils.startup_profiler import (
+        DEFAULT_REPORT_PATH,
+        enable_startup_profiler,
+        get_startup_profiler,
+        mark_startup,
+        startup_phase,
+    )
+
 # Environment setup
 from dotenv import load_dotenv
 load_dotenv()
 
-# Async services
-from services.async_service_manager import AsyncServiceManager
-from services.async_loader import LoadingResult
-from ui.components.progressive_loader import ProgressiveLoader
+# The progressive loader and service manager are imported by the startup
+# phases that use them, so the skeleton window appears before the services
+# (and their dependencies) are imported
+if TYPE_CHECKING:
+    from services.async_service_manager import AsyncServiceManager
+    from ui.components.progressive_loader import ProgressiveLoader
 
 
 class AsyncWeatherApp:
@@ -42,8 +62,8 @@ class AsyncWeatherApp:
         self.startup_time = 0.0
         
         # Services
-        self.service_manager: Optional[AsyncServiceManager] = None
-        self.progressive_loader: Optional[ProgressiveLoader] = None
+        self.service_manager: Optional["AsyncServiceManager"] = None
+        self.progressive_loader: Optional["ProgressiveLoader"] = None
         
         # UI components
         self.root = None
@@ -137,6 +157,7 @@ class AsyncWeatherApp:
             self.root.geometry(f"1200x800+{x}+{y}")
             
             # Create progressive loader
+            from ui.components.progressive_loader import ProgressiveLoader
             self.progressive_loader = ProgressiveLoader(
                 parent=self.root
             )
@@ -160,6 +181,7 @@ class AsyncWeatherApp:
             self.loading_phase = "services"
             
             # Create service manager
+            from services.async_service_manager import AsyncServiceManager
             self.service_manager = AsyncServiceManager(
                 progress_callback=self._on_loading_progress
             )
@@ -264,16 +286,22 @@ class AsyncWeatherApp:
             self.logger.info("Starting async application startup")
             
             # Phase 1: Create skeleton UI (immediate feedback)
-            await self._create_skeleton_ui()
+            with startup_phase("skeleton_ui"):
+                await self._create_skeleton_ui()
+            mark_startup("first_window")
             
             # Phase 2: Initialize services (parallel loading)
-            service_results = await self._initialize_services()
+            with startup_phase("initialize_services"):
+                service_results = await self._initialize_services()
             
             # Phase 3: Create dashboard (with loaded services)
-            await self._create_dashboard()
+            with startup_phase("create_dashboard"):
+                await self._create_dashboard()
+            mark_startup("dashboard_ready")
             
             # Phase 4: Load initial data (background)
-            await self._load_initial_data()
+            with startup_phase("load_initial_data"):
+                await self._load_initial_data()
             
             # Startup complete
             self.startup_time = time.time() - start_time
@@ -286,6 +314,11 @@ class AsyncWeatherApp:
             summary = self.service_manager.get_initialization_summary()
             self.logger.info(f"Startup summary: {summary}")
             
+            profiler = get_startup_profiler()
+            if profiler is not None:
+                profiler.collect_service_manager(self.service_manager)
+                profiler.write_report()
+            
         except Exception as e:
             self.logger.error(f"Startup sequence failed: {e}")
             raise
@@ -367,6 +400,10 @@ class AsyncWeatherApp:
 def main():
     """Main entry point for the async weather dashboard."""
     try:
+        if "--profile-startup" in sys.argv:
+            # Modules imported above are already loaded; this times the rest
+            enable_startup_profiler(DEFAULT_REPORT_PATH)
+        
         print("Starting PROJECT CODEFRONT - Advanced Weather Intelligence System...")
         
         # Create and run async application
@@ -4,12 +4,15 @@ DTOs for data export formats (CSV, JSON, XML, PDF reports).
 """
 
 import csv
+import gzip
 import io
 import json
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import IO, Any, Dict, List, Optional, Union
+from xml.sax.saxutils import escape as xml_escape
 
 
 class ExportFormat(Enum):
@@ -426,140 +429,185 @@ class WeatherExportDTO:
     def to_csv(self) -> str:
         """Export to CSV format."""
         output = io.StringIO()
-
-        # Write metadata
-        output.write("# Weather Data Export\n")
-        output.write(f"# Generated: {self.metadata.generated_at.strftime('%Y-%m-%d %H:%M:%S')}\n")
-        output.write(f"# Location: {self.metadata.location}\n")
-        output.write(f"# Format: {self.metadata.format.value}\n")
-        output.write(f"# Scope: {self.metadata.scope.value}\n")
-        if self.metadata.date_range:
-            output.write(f"# Date Range: {self.metadata.date_range}\n")
-        output.write(f"# Records: {self.metadata.record_count}\n")
-        output.write("\n")
-
-        # Write weather records
-        if self.weather_records:
-            output.write("# Current Weather Data\n")
-            writer = csv.writer(output)
-            writer.writerow(WeatherExportRecordDTO.csv_headers())
-            for record in self.weather_records:
-                writer.writerow(record.to_csv_row())
-            output.write("\n")
-
-        # Write forecast records
-        if self.forecast_records:
-            output.write("# Forecast Data\n")
-            writer = csv.writer(output)
-            writer.writerow(ForecastExportRecordDTO.csv_headers())
-            for record in self.forecast_records:
-                writer.writerow(record.to_csv_row())
-            output.write("\n")
-
-        # Write alert records
-        if self.alert_records:
-            output.write("# Alert Data\n")
-            writer = csv.writer(output)
-            writer.writerow(AlertExportRecordDTO.csv_headers())
-            for record in self.alert_records:
-                writer.writerow(record.to_csv_row())
-
+        self.write_csv(output)
         return output.getvalue()
 
     def to_json(self, indent: int = 2) -> str:
         """Export to JSON format."""
-        data = {
-            "metadata": self.metadata.to_dict(),
-            "data": {
-                "weather_records": [record.to_dict() for record in self.weather_records],
-                "forecast_records": [record.to_dict() for record in self.forecast_records],
-                "alert_records": [record.to_dict() for record in self.alert_records],
-            },
-        }
-        return json.dumps(data, indent=indent, default=str)
+        output = io.StringIO()
+        self.write_json(output, indent=indent)
+        return output.getvalue()
 
     def to_xml(self) -> str:
         """Export to XML format."""
-        xml_lines = ['<?xml version="1.0" encoding="UTF-8"?>']
-        xml_lines.append("<weather_export>")
+        output = io.StringIO()
+        self.write_xml(output)
+        return output.getvalue()
+
+    # Streaming writers. Records are written one at a time, so the record
+    # fields may also hold generators for exports too large to build in memory.
+
+    def write_csv(self, fp: IO[str]) -> None:
+        """Write CSV format to a text stream."""
+        # Write metadata
+        fp.write("# Weather Data Export\n")
+        fp.write(f"# Generated: {self.metadata.generated_at.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        fp.write(f"# Location: {self.metadata.location}\n")
+        fp.write(f"# Format: {self.metadata.format.value}\n")
+        fp.write(f"# Scope: {self.metadata.scope.value}\n")
+        if self.metadata.date_range:
+            fp.write(f"# Date Range: {self.metadata.date_range}\n")
+        fp.write(f"# Records: {self.metadata.record_count}\n")
+        fp.write("\n")
+
+        # Each (title, record type, records, blank line after) section is
+        # written only if it has records
+        sections = [
+            ("# Current Weather Data", WeatherExportRecordDTO, self.weather_records, True),
+            ("# Forecast Data", ForecastExportRecordDTO, self.forecast_records, True),
+            ("# Alert Data", AlertExportRecordDTO, self.alert_records, False),
+        ]
+        for title, record_type, records, blank_after in sections:
+            writer = None
+            for record in records:
+                if writer is None:
+                    fp.write(title + "\n")
+                    writer = csv.writer(fp)
+                    writer.writerow(record_type.csv_headers())
+                writer.writerow(record.to_csv_row())
+            if writer is not None and blank_after:
+                fp.write("\n")
+
+    def write_json(self, fp: IO[str], indent: Optional[int] = 2) -> None:
+        """Write JSON format to a text stream, one record at a time."""
+        newline = "" if indent is None else "\n"
+        separator = ", " if indent is None else ",\n"
+
+        def pad(level: int) -> str:
+            return "" if indent is None else " " * (indent * level)
+
+        def dumps(value: Any, level: int) -> str:
+            return json.dumps(value, indent=indent, default=str).replace("\n", "\n" + pad(level))
+
+        fp.write("{" + newline + pad(1) + '"metadata": ' + dumps(self.metadata.to_dict(), 1))
+        fp.write(separator + pad(1) + '"data": {' + newline)
+        sections = [
+            ("weather_records", self.weather_records),
+            ("forecast_records", self.forecast_records),
+            ("alert_records", self.alert_records),
+        ]
+        for index, (name, records) in enumerate(sections):
+            if index:
+                fp.write(separator)
+            fp.write(pad(2) + json.dumps(name) + ": [")
+            empty = True
+            for record in records:
+                fp.write((newline if empty else separator) + pad(3) + dumps(record.to_dict(), 3))
+                empty = False
+            fp.write("]" if empty else newline + pad(2) + "]")
+        fp.write(newline + pad(1) + "}" + newline + "}")
+
+    def write_xml(self, fp: IO[str]) -> None:
+        """Write XML format to a text stream, escaping all values."""
+        started = False
+
+        def line(text: str) -> None:
+            nonlocal started
+            fp.write("\n" + text if started else text)
+            started = True
+
+        def element(name: str, value: Any, depth: int) -> None:
+            line(f"{'  ' * depth}<{name}>{xml_escape(str(value))}</{name}>")
+
+        line('<?xml version="1.0" encoding="UTF-8"?>')
+        line("<weather_export>")
 
         # Metadata
-        xml_lines.append("  <metadata>")
-        xml_lines.append(f"    <export_id>{self.metadata.export_id}</export_id>")
-        xml_lines.append(f"    <format>{self.metadata.format.value}</format>")
-        xml_lines.append(f"    <scope>{self.metadata.scope.value}</scope>")
-        xml_lines.append(
-            f"    <generated_at>{self.metadata.generated_at.isoformat()}</generated_at>"
-        )
-        xml_lines.append(f"    <generated_by>{self.metadata.generated_by}</generated_by>")
-        xml_lines.append(f"    <location>{self.metadata.location}</location>")
+        line("  <metadata>")
+        element("export_id", self.metadata.export_id, 2)
+        element("format", self.metadata.format.value, 2)
+        element("scope", self.metadata.scope.value, 2)
+        element("generated_at", self.metadata.generated_at.isoformat(), 2)
+        element("generated_by", self.metadata.generated_by, 2)
+        element("location", self.metadata.location, 2)
         if self.metadata.date_range:
-            xml_lines.append(f"    <date_range>{self.metadata.date_range}</date_range>")
-        xml_lines.append(f"    <record_count>{self.metadata.record_count}</record_count>")
-        xml_lines.append("  </metadata>")
-
-        # Weather records
-        if self.weather_records:
-            xml_lines.append("  <weather_records>")
-            for record in self.weather_records:
-                xml_lines.append("    <record>")
-                xml_lines.append(f"      <timestamp>{record.timestamp.isoformat()}</timestamp>")
-                xml_lines.append(f"      <location_name>{record.location_name}</location_name>")
-                xml_lines.append(f"      <latitude>{record.latitude}</latitude>")
-                xml_lines.append(f"      <longitude>{record.longitude}</longitude>")
-                xml_lines.append(
-                    f"      <temperature_celsius>{record.temperature_celsius}</temperature_celsius>"
-                )
-                xml_lines.append(
-                    f"      <temperature_fahrenheit>{record.temperature_fahrenheit}</temperature_fahrenheit>"
-                )
-                xml_lines.append(f"      <humidity>{record.humidity}</humidity>")
-                xml_lines.append(f"      <pressure_hpa>{record.pressure_hpa}</pressure_hpa>")
-                xml_lines.append(f"      <wind_speed_mps>{record.wind_speed_mps}</wind_speed_mps>")
-                xml_lines.append(
-                    f"      <weather_condition>{record.weather_condition}</weather_condition>"
-                )
-                xml_lines.append(
-                    f"      <weather_description>{record.weather_description}</weather_description>"
-                )
-                xml_lines.append("    </record>")
-            xml_lines.append("  </weather_records>")
-
-        # Forecast records
-        if self.forecast_records:
-            xml_lines.append("  <forecast_records>")
-            for record in self.forecast_records:
-                xml_lines.append("    <record>")
-                xml_lines.append(
-                    f"      <forecast_timestamp>{record.forecast_timestamp.isoformat()}</forecast_timestamp>"
-                )
-                xml_lines.append(f"      <location_name>{record.location_name}</location_name>")
-                xml_lines.append(
-                    f"      <temperature_celsius>{record.temperature_celsius}</temperature_celsius>"
-                )
-                xml_lines.append(
-                    f"      <weather_condition>{record.weather_condition}</weather_condition>"
-                )
-                xml_lines.append(f"      <forecast_type>{record.forecast_type}</forecast_type>")
-                xml_lines.append("    </record>")
-            xml_lines.append("  </forecast_records>")
-
-        # Alert records
-        if self.alert_records:
-            xml_lines.append("  <alert_records>")
-            for record in self.alert_records:
-                xml_lines.append("    <record>")
-                xml_lines.append(f"      <alert_id>{record.alert_id}</alert_id>")
-                xml_lines.append(f"      <timestamp>{record.timestamp.isoformat()}</timestamp>")
-                xml_lines.append(f"      <event_type>{record.event_type}</event_type>")
-                xml_lines.append(f"      <severity>{record.severity}</severity>")
-                xml_lines.append(f"      <title>{record.title}</title>")
-                xml_lines.append(f"      <is_active>{record.is_active}</is_active>")
-                xml_lines.append("    </record>")
-            xml_lines.append("  </alert_records>")
-
-        xml_lines.append("</weather_export>")
-        return "\n".join(xml_lines)
+            element("date_range", self.metadata.date_range, 2)
+        element("record_count", self.metadata.record_count, 2)
+        line("  </metadata>")
+
+        sections = [
+            ("weather_records", self.weather_records, lambda r: [
+                ("timestamp", r.timestamp.isoformat()),
+                ("location_name", r.location_name),
+                ("latitude", r.latitude),
+                ("longitude", r.longitude),
+                ("temperature_celsius", r.temperature_celsius),
+                ("temperature_fahrenheit", r.temperature_fahrenheit),
+                ("humidity", r.humidity),
+                ("pressure_hpa", r.pressure_hpa),
+                ("wind_speed_mps", r.wind_speed_mps),
+                ("weather_condition", r.weather_condition),
+                ("weather_description", r.weather_description),
+            ]),
+            ("forecast_records", self.forecast_records, lambda r: [
+                ("forecast_timestamp", r.forecast_timestamp.isoformat()),
+                ("location_name", r.location_name),
+                ("temperature_celsius", r.temperature_celsius),
+                ("weather_condition", r.weather_condition),
+                ("forecast_type", r.forecast_type),
+            ]),
+            ("alert_records", self.alert_records, lambda r: [
+                ("alert_id", r.alert_id),
+                ("timestamp", r.timestamp.isoformat()),
+                ("event_type", r.event_type),
+                ("severity", r.severity),
+                ("title", r.title),
+                ("is_active", r.is_active),
+            ]),
+        ]
+        for name, records, fields in sections:
+            opened = False
+            for record in records:
+                if not opened:
+                    line(f"  <{name}>")
+                    opened = True
+                line("    <record>")
+                for field_name, value in fields(record):
+                    element(field_name, value, 3)
+                line("    </record>")
+            if opened:
+                line(f"  </{name}>")
+
+        line("</weather_export>")
+
+    def save(self, path: Union[str, Path], compress: Optional[bool] = None) -> Path:
+        """Stream the export to a file in the metadata's format.
+
+        Args:
+            path: Output file path
+            compress: gzip the output (default: when path ends in .gz)
+
+        Returns:
+            Path: The written file
+        """
+        writers = {
+            ExportFormat.CSV: self.write_csv,
+            ExportFormat.JSON: self.write_json,
+            ExportFormat.XML: self.write_xml,
+        }
+        if self.metadata.format not in writers:
+            raise ValueError(f"Cannot stream {self.metadata.format.value} exports")
+
+        path = Path(path)
+        if compress is None:
+            compress = path.suffix == ".gz"
+        if compress:
+            handle = gzip.open(path, "wt", encoding="utf-8", newline="")
+        else:
+            handle = open(path, "w", encoding="utf-8", newline="")
+        with handle as fp:
+            writers[self.metadata.format](fp)
+        return path
 
     def get_summary(self) -> Dict[str, Any]:
         """Get export summary."""
@@ -30,6 +30,7 @@ from .weather import (
     DailyForecast,
     ForecastData,
     ForecastEntry,
+    ForecastSeries,
     WeatherAlert,
     WeatherCondition,
     WeatherData,
@@ -47,6 +48,7 @@ __all__ = [
     "ForecastEntry",
     "DailyForecast",
     "ForecastData",
+    "ForecastSeries",
     "AlertSeverity",
     "AlertType",
     "WeatherAlert",
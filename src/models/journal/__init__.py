@@ -1,6 +1,9 @@
 """Journal models package."""
 
 from .journal_entry import JournalEntry, Mood, WeatherSnapshot
+from .journal_repository import JournalRepository
+from .journal_search import SearchHit
+from .journal_service import JournalService
 
 __all__ = [
     "JournalEntry",
@@ -8,4 +11,5 @@ __all__ = [
     "WeatherSnapshot",
     "JournalRepository",
     "JournalService",
+    "SearchHit",
 ]
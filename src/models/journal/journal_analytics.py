@@ -0,0 +1,233 @@
+"""Materialized journal statistics, updated as entries change."""
+
+import json
+import logging
+import os
+import re
+import threading
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from .journal_entry import JournalEntry
+
+# Common stop words excluded from word frequencies
+STOP_WORDS = {
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of",
+    "with", "by", "from", "up", "about", "into", "through", "during", "before",
+    "after", "above", "below", "between", "among", "is", "was", "are", "were",
+    "be", "been", "being", "have", "has", "had", "do", "does", "did", "will",
+    "would", "could", "should", "may", "might", "must", "can", "i", "you", "he",
+    "she", "it", "we", "they", "me", "him", "her", "us", "them", "my", "your",
+    "his", "its", "our", "their", "this", "that", "these", "those",
+}
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_WORD_RE = re.compile(r"\b\w+\b")
+
+
+def count_words(text: str) -> Dict[str, int]:
+    """Word frequencies of text for the word cloud (HTML, stop and short words removed)."""
+    words = _WORD_RE.findall(_TAG_RE.sub("", text or "").lower())
+    return dict(Counter(word for word in words if len(word) > 2 and word not in STOP_WORDS))
+
+
+@dataclass
+class EntryStats:
+    """One entry's contribution to the aggregates."""
+
+    day: str  # YYYY-MM-DD of creation
+    weekday: str
+    hour: int
+    mood: Optional[str] = None
+    condition: Optional[str] = None
+    location: str = ""
+    tags: List[str] = field(default_factory=list)
+    word_count: int = 0
+    words: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_entry(cls, entry: JournalEntry) -> "EntryStats":
+        return cls(
+            day=entry.created_at.strftime("%Y-%m-%d"),
+            weekday=entry.created_at.strftime("%A"),
+            hour=entry.created_at.hour,
+            mood=entry.mood.value if entry.mood else None,
+            condition=entry.weather_snapshot.condition if entry.weather_snapshot else None,
+            location=entry.location or "",
+            tags=list(entry.tags),
+            word_count=entry.word_count,
+            words=count_words(entry.content),
+        )
+
+
+class JournalAggregates:
+    """Running totals behind the journal statistics.
+
+    Each entry's contribution is kept so that an update or delete can be
+    subtracted without rescanning the other entries; every statistic is
+    then read straight from the totals.
+    """
+
+    VERSION = 1
+
+    def __init__(self):
+        """Initialize empty aggregates."""
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.RLock()
+        self._entries: Dict[str, EntryStats] = {}
+        self.moods: Counter = Counter()
+        self.days: Counter = Counter()
+        self.weekdays: Counter = Counter()
+        self.hours: Counter = Counter()
+        self.condition_moods: Dict[str, Counter] = {}
+        self.tags: Counter = Counter()
+        self.locations: Counter = Counter()
+        self.words: Counter = Counter()
+        self.total_words = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, entry: JournalEntry):
+        """Count an entry, replacing any earlier version of it."""
+        stats = EntryStats.from_entry(entry)
+        with self._lock:
+            self._apply(self._entries.pop(entry.id, None), -1)
+            self._entries[entry.id] = stats
+            self._apply(stats, 1)
+
+    def remove(self, entry_id: str):
+        """Stop counting an entry."""
+        with self._lock:
+            self._apply(self._entries.pop(entry_id, None), -1)
+
+    def rebuild(self, entries: Iterable[JournalEntry]):
+        """Recount from scratch."""
+        with self._lock:
+            self._clear()
+            for entry in entries:
+                self.add(entry)
+
+    def _clear(self):
+        self._entries.clear()
+        for counter in (self.moods, self.days, self.weekdays, self.hours,
+                        self.tags, self.locations, self.words):
+            counter.clear()
+        self.condition_moods.clear()
+        self.total_words = 0
+
+    def _apply(self, stats: Optional[EntryStats], sign: int):
+        """Add (sign=1) or subtract (sign=-1) one entry's contribution."""
+        if stats is None:
+            return
+
+        def bump(counter: Counter, key, amount: int = 1):
+            counter[key] += sign * amount
+            if counter[key] <= 0:
+                del counter[key]
+
+        bump(self.days, stats.day)
+        bump(self.weekdays, stats.weekday)
+        bump(self.hours, stats.hour)
+        if stats.mood:
+            bump(self.moods, stats.mood)
+            if stats.condition:
+                matrix = self.condition_moods.setdefault(stats.condition, Counter())
+                bump(matrix, stats.mood)
+                if not matrix:
+                    del self.condition_moods[stats.condition]
+        if stats.location:
+            bump(self.locations, stats.location)
+        for tag in stats.tags:
+            bump(self.tags, tag)
+        for word, count in stats.words.items():
+            bump(self.words, word, count)
+        self.total_words += sign * stats.word_count
+
+    # Persistence
+
+    def save(self, path: Path, generation: str):
+        """Write the aggregates for the snapshot with the given generation."""
+        with self._lock:
+            data = {
+                "version": self.VERSION,
+                "generation": generation,
+                "entries": {entry_id: asdict(stats) for entry_id, stats in self._entries.items()},
+                "totals": {
+                    "moods": self.moods,
+                    "days": self.days,
+                    "weekdays": self.weekdays,
+                    "hours": {str(hour): count for hour, count in self.hours.items()},
+                    "condition_moods": self.condition_moods,
+                    "tags": self.tags,
+                    "locations": self.locations,
+                    "words": self.words,
+                    "total_words": self.total_words,
+                },
+            }
+        temp_file = Path(path).with_suffix(".tmp")
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        temp_file.replace(path)
+
+    def load(self, path: Path, generation: Optional[str]) -> bool:
+        """Load saved aggregates if they belong to the snapshot's generation.
+
+        Returns:
+            True if loaded; False if missing, stale or unreadable
+        """
+        if not generation or not Path(path).exists():
+            return False
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != self.VERSION or data.get("generation") != generation:
+                return False
+
+            totals = data["totals"]
+            with self._lock:
+                self._clear()
+                self._entries = {
+                    entry_id: EntryStats(**stats) for entry_id, stats in data["entries"].items()
+                }
+                self.moods.update(totals["moods"])
+                self.days.update(totals["days"])
+                self.weekdays.update(totals["weekdays"])
+                self.hours.update({int(hour): count for hour, count in totals["hours"].items()})
+                self.condition_moods.update(
+                    {condition: Counter(moods) for condition, moods in totals["condition_moods"].items()}
+                )
+                self.tags.update(totals["tags"])
+                self.locations.update(totals["locations"])
+                self.words.update(totals["words"])
+                self.total_words = totals["total_words"]
+            return True
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable journal aggregates: {e}")
+            return False
+
+    # Reads
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Consistent copy of the totals for building statistics."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "moods": Counter(self.moods),
+                "days": Counter(self.days),
+                "weekdays": Counter(self.weekdays),
+                "hours": Counter(self.hours),
+                "condition_moods": {c: Counter(m) for c, m in self.condition_moods.items()},
+                "tags": Counter(self.tags),
+                "locations": Counter(self.locations),
+                "total_words": self.total_words,
+            }
+
+    def top_words(self, count: int = 100) -> Dict[str, int]:
+        """Most frequent words."""
+        with self._lock:
+            return dict(self.words.most_common(count))
@@ -2,19 +2,46 @@
 
 import json
 import logging
+import os
 import shutil
+import threading
+import uuid
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from .journal_analytics import JournalAggregates
 from .journal_entry import JournalEntry, Mood
+from .journal_log import JournalLog
+from .journal_search import JournalSearchIndex, SearchHit, make_snippet
 
 
 class JournalRepository:
-    """Repository for managing journal entries with local persistence."""
-
-    def __init__(self, data_dir: str = "data/journal"):
-        """Initialize repository with data directory."""
+    """Repository for managing journal entries with local persistence.
+
+    Entries live in a snapshot (``entries.json``) plus an append-only log of
+    the changes made since it was written (``entries.wal``), so saving an
+    entry writes only that entry. The log is folded into a new snapshot once
+    it outgrows the snapshot (or ``compact_min_bytes``) and when the
+    repository is closed. The snapshot being replaced is kept in
+    ``backups/`` at most once per ``backup_interval``.
+    """
+
+    def __init__(
+        self,
+        data_dir: str = "data/journal",
+        compact_min_bytes: int = 1024 * 1024,
+        backup_interval: timedelta = timedelta(hours=1),
+        max_backups: int = 10,
+    ):
+        """Initialize repository with data directory.
+
+        Args:
+            data_dir: Directory holding the snapshot, log and backups
+            compact_min_bytes: Log size below which it is never compacted
+            backup_interval: Minimum time between snapshot backups
+            max_backups: Number of snapshot backups to keep
+        """
         self.logger = logging.getLogger(__name__)
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
@@ -24,6 +51,16 @@ class JournalRepository:
         self.backup_dir = self.data_dir / "backups"
         self.backup_dir.mkdir(exist_ok=True)
 
+        self.compact_min_bytes = compact_min_bytes
+        self.backup_interval = backup_interval
+        self.max_backups = max_backups
+        self._log = JournalLog(self.data_dir / "entries.wal")
+        self._lock = threading.RLock()
+
+        # Statistics totals, saved with each snapshot and replayed with the log
+        self.aggregates_file = self.data_dir / "aggregates.json"
+        self.aggregates = JournalAggregates()
+
         # In-memory cache
         self._entries: Dict[str, JournalEntry] = {}
         self._loaded = False
@@ -31,12 +68,18 @@ class JournalRepository:
         # Load existing entries
         self._load_entries()
 
+        # Full-text index, kept current by every mutation below
+        self.search_index = JournalSearchIndex()
+        self.search_index.rebuild(self._entries.values())
+
     def _load_entries(self):
-        """Load entries from JSON file."""
+        """Load entries from the snapshot and replay the change log."""
         try:
+            generation = None
             if self.entries_file.exists():
                 with open(self.entries_file, "r", encoding="utf-8") as f:
                     data = json.load(f)
+                generation = data.get("generation")
 
                 for entry_data in data.get("entries", []):
                     try:
@@ -45,7 +88,26 @@ class JournalRepository:
                     except Exception as e:
                         self.logger.warning(f"Failed to load entry: {e}")
 
-                self.logger.info(f"Loaded {len(self._entries)} journal entries")
+            if not self.aggregates.load(self.aggregates_file, generation):
+                self.aggregates.rebuild(self._entries.values())
+
+            for record in self._log.replay():
+                try:
+                    if record.get("op") == "put":
+                        entry = JournalEntry.from_dict(record["entry"])
+                        self._entries[entry.id] = entry
+                        self.aggregates.add(entry)
+                    elif record.get("op") == "delete":
+                        self._entries.pop(record["id"], None)
+                        self.aggregates.remove(record["id"])
+                except Exception as e:
+                    self.logger.warning(f"Failed to replay journal change: {e}")
+
+            if self._entries or self._log.record_count:
+                self.logger.info(
+                    f"Loaded {len(self._entries)} journal entries "
+                    f"({self._log.record_count} logged changes)"
+                )
             else:
                 self.logger.info("No existing journal entries found")
 
@@ -54,28 +116,69 @@ class JournalRepository:
 
         self._loaded = True
 
-    def _save_entries(self, create_backup: bool = True):
-        """Save entries to JSON file with optional backup."""
+    def _log_put(self, entry: JournalEntry):
+        """Append a created or updated entry to the change log."""
+        with self._lock:
+            self._log.append_put(entry.to_dict())
+            self._maybe_compact()
+
+    def _log_delete(self, entry_id: str):
+        """Append a deletion to the change log."""
+        with self._lock:
+            self._log.append_delete(entry_id)
+            self._maybe_compact()
+
+    def _maybe_compact(self):
+        """Compact once the log outgrows the snapshot, keeping appends amortized O(entry)."""
+        log_size = self._log.size
+        if log_size < self.compact_min_bytes:
+            return
         try:
-            # Create backup if requested and file exists
-            if create_backup and self.entries_file.exists():
-                self._create_backup()
+            snapshot_size = self.entries_file.stat().st_size
+        except OSError:
+            snapshot_size = 0
+        if log_size >= snapshot_size:
+            self.compact()
+
+    def compact(self, create_backup: bool = True):
+        """Write all entries to a new snapshot and empty the change log."""
+        with self._lock:
+            self._save_entries(create_backup=create_backup)
+            self._log.reset()
 
-            # Prepare data for saving
+    def _save_entries(self, create_backup: bool = True):
+        """Save entries to the snapshot file with optional backup."""
+        try:
+            # Prepare data for saving; the generation ties the aggregates
+            # file to this snapshot
+            generation = uuid.uuid4().hex
             data = {
                 "version": "1.0",
                 "created_at": datetime.now().isoformat(),
+                "generation": generation,
                 "entries": [entry.to_dict() for entry in self._entries.values()],
             }
 
             # Write to temporary file first
             temp_file = self.entries_file.with_suffix(".tmp")
             with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+
+            # Keep the snapshot being replaced as a backup, if one is due
+            if create_backup and self.entries_file.exists():
+                self._create_backup()
 
             # Atomic move
             temp_file.replace(self.entries_file)
 
+            try:
+                self.aggregates.save(self.aggregates_file, generation)
+            except Exception as e:
+                # Stale aggregates are detected by generation and rebuilt on load
+                self.logger.warning(f"Failed to save journal aggregates: {e}")
+
             self.logger.debug(f"Saved {len(self._entries)} journal entries")
 
         except Exception as e:
@@ -83,25 +186,51 @@ class JournalRepository:
             raise
 
     def _create_backup(self):
-        """Create backup of current entries file."""
+        """Keep the current snapshot as a backup if the last one is old enough."""
         try:
+            backups = sorted(self.backup_dir.glob("entries_backup_*.json"))
+            if backups:
+                # A hard-linked backup keeps the snapshot's mtime, so the
+                # backup time comes from its name
+                stamp = backups[-1].stem[len("entries_backup_"):]
+                try:
+                    last_backup_at = datetime.strptime(stamp, "%Y%m%d_%H%M%S")
+                except ValueError:
+                    last_backup_at = datetime.min
+                if datetime.now() - last_backup_at < self.backup_interval:
+                    return
+
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_file = self.backup_dir / f"entries_backup_{timestamp}.json"
-            shutil.copy2(self.entries_file, backup_file)
-
-            # Clean old backups (keep last 10)
+            try:
+                # The snapshot is about to be replaced, not modified, so a
+                # hard link preserves it without copying
+                os.link(self.entries_file, backup_file)
+            except OSError:
+                shutil.copy2(self.entries_file, backup_file)
+
+            # Clean old backups (keep last max_backups)
             backups = sorted(self.backup_dir.glob("entries_backup_*.json"))
-            if len(backups) > 10:
-                for old_backup in backups[:-10]:
+            if len(backups) > self.max_backups:
+                for old_backup in backups[: -self.max_backups]:
                     old_backup.unlink()
 
         except Exception as e:
             self.logger.warning(f"Failed to create backup: {e}")
 
+    def close(self):
+        """Fold outstanding changes into the snapshot."""
+        with self._lock:
+            if self._log.record_count or self._log.size:
+                self.compact()
+
     def create_entry(self, entry: JournalEntry) -> JournalEntry:
         """Create a new journal entry."""
-        self._entries[entry.id] = entry
-        self._save_entries()
+        with self._lock:
+            self._entries[entry.id] = entry
+            self.search_index.add(entry)
+            self.aggregates.add(entry)
+            self._log_put(entry)
         self.logger.info(f"Created journal entry: {entry.id}")
         return entry
 
@@ -115,19 +244,25 @@ class JournalRepository:
             raise ValueError(f"Entry {entry.id} not found")
 
         entry.updated_at = datetime.now()
-        self._entries[entry.id] = entry
-        self._save_entries()
+        with self._lock:
+            self._entries[entry.id] = entry
+            self.search_index.add(entry)
+            self.aggregates.add(entry)
+            self._log_put(entry)
         self.logger.info(f"Updated journal entry: {entry.id}")
         return entry
 
     def delete_entry(self, entry_id: str) -> bool:
         """Delete entry by ID."""
-        if entry_id in self._entries:
+        with self._lock:
+            if entry_id not in self._entries:
+                return False
             del self._entries[entry_id]
-            self._save_entries()
-            self.logger.info(f"Deleted journal entry: {entry_id}")
-            return True
-        return False
+            self.search_index.remove(entry_id)
+            self.aggregates.remove(entry_id)
+            self._log_delete(entry_id)
+        self.logger.info(f"Deleted journal entry: {entry_id}")
+        return True
 
     def get_all_entries(self) -> List[JournalEntry]:
         """Get all entries sorted by creation date (newest first)."""
@@ -156,21 +291,51 @@ class JournalRepository:
         ]
         return sorted(entries, key=lambda e: e.created_at, reverse=True)
 
-    def search_entries(self, query: str) -> List[JournalEntry]:
-        """Search entries by content, title, or tags."""
-        query_lower = query.lower()
-        entries = []
-
-        for entry in self._entries.values():
-            # Search in title, content, and tags
-            if (
-                query_lower in entry.title.lower()
-                or query_lower in entry.content.lower()
-                or any(query_lower in tag.lower() for tag in entry.tags)
-            ):
-                entries.append(entry)
-
-        return sorted(entries, key=lambda e: e.created_at, reverse=True)
+    def search_entries(self, query: str, **filters) -> List[JournalEntry]:
+        """Search entries by content, title, tags or location, best match first.
+
+        Args:
+            query: Free-text query (see search for the syntax)
+            **filters: tags, mood, start_date, end_date or limit, as for search
+        """
+        return [hit.entry for hit in self.search(query, **filters)]
+
+    def search(
+        self,
+        query: str,
+        tags: Optional[List[str]] = None,
+        mood: Optional[Mood] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[SearchHit]:
+        """Ranked full-text search with filters and highlighted snippets.
+
+        Every query word must match (``word*`` and the last word match as
+        prefixes); results are ranked by BM25 with title and tag matches
+        weighted above content matches.
+
+        Args:
+            query: Free-text query
+            tags: Entries must carry all of these tags
+            mood: Entries must have this mood
+            start_date: Earliest creation time
+            end_date: Latest creation time
+            limit: Maximum number of results
+
+        Returns:
+            Search hits, best first
+        """
+        hits = []
+        for entry_id, score, terms in self.search_index.search(
+            query, tags=tags, mood=mood, start_date=start_date, end_date=end_date, limit=limit
+        ):
+            entry = self._entries.get(entry_id)
+            if entry is None:
+                continue
+            snippet = make_snippet(entry.content, terms) or make_snippet(entry.title, terms)
+            hits.append(SearchHit(entry=entry, score=score, snippet=snippet, matched_terms=terms))
+        return hits
 
     def get_entries_by_tag(self, tag: str) -> List[JournalEntry]:
         """Get entries by tag."""
@@ -184,152 +349,41 @@ class JournalRepository:
 
     def get_mood_statistics(self) -> Dict[Mood, int]:
         """Get mood statistics across all entries."""
-        mood_counts = {mood: 0 for mood in Mood}
-
-        for entry in self._entries.values():
-            if entry.mood:
-                mood_counts[entry.mood] += 1
-
-        return mood_counts
+        moods = self.aggregates.snapshot()["moods"]
+        return {mood: moods.get(mood.value, 0) for mood in Mood}
 
     def get_writing_frequency(self, days: int = 30) -> Dict[str, int]:
         """Get writing frequency over the last N days."""
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
+        day_counts = self.aggregates.snapshot()["days"]
+        end_date = datetime.now().date()
+        current_date = end_date - timedelta(days=days)
 
         frequency = {}
-        current_date = start_date.date()
-
-        while current_date <= end_date.date():
-            frequency[current_date.strftime("%Y-%m-%d")] = 0
+        while current_date <= end_date:
+            date_key = current_date.strftime("%Y-%m-%d")
+            frequency[date_key] = day_counts.get(date_key, 0)
             current_date += timedelta(days=1)
 
-        for entry in self._entries.values():
-            if start_date <= entry.created_at <= end_date:
-                date_key = entry.created_at.strftime("%Y-%m-%d")
-                frequency[date_key] += 1
-
         return frequency
 
     def get_weather_mood_correlation(self) -> Dict[str, Dict[Mood, int]]:
         """Get correlation between weather conditions and moods."""
-        correlation = {}
-
-        for entry in self._entries.values():
-            if entry.weather_snapshot and entry.mood:
-                condition = entry.weather_snapshot.condition
-                if condition not in correlation:
-                    correlation[condition] = {mood: 0 for mood in Mood}
-                correlation[condition][entry.mood] += 1
+        return {
+            condition: {mood: counts.get(mood.value, 0) for mood in Mood}
+            for condition, counts in self.aggregates.snapshot()["condition_moods"].items()
+        }
 
-        return correlation
+    def get_hourly_distribution(self) -> Dict[int, int]:
+        """Get the number of entries written in each hour of the day."""
+        return dict(self.aggregates.snapshot()["hours"])
 
     def get_all_tags(self) -> List[Tuple[str, int]]:
         """Get all tags with their usage counts."""
-        tag_counts = {}
-
-        for entry in self._entries.values():
-            for tag in entry.tags:
-                tag_counts[tag] = tag_counts.get(tag, 0) + 1
-
-        return sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)
+        return self.aggregates.snapshot()["tags"].most_common()
 
     def get_word_cloud_data(self) -> Dict[str, int]:
-        """Get word frequency data for word cloud generation."""
-        import re
-        from collections import Counter
-
-        # Common stop words to exclude
-        stop_words = {
-            "the",
-            "a",
-            "an",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "by",
-            "from",
-            "up",
-            "about",
-            "into",
-            "through",
-            "during",
-            "before",
-            "after",
-            "above",
-            "below",
-            "between",
-            "among",
-            "is",
-            "was",
-            "are",
-            "were",
-            "be",
-            "been",
-            "being",
-            "have",
-            "has",
-            "had",
-            "do",
-            "does",
-            "did",
-            "will",
-            "would",
-            "could",
-            "should",
-            "may",
-            "might",
-            "must",
-            "can",
-            "i",
-            "you",
-            "he",
-            "she",
-            "it",
-            "we",
-            "they",
-            "me",
-            "him",
-            "her",
-            "us",
-            "them",
-            "my",
-            "your",
-            "his",
-            "her",
-            "its",
-            "our",
-            "their",
-            "this",
-            "that",
-            "these",
-            "those",
-        }
-
-        all_words = []
-
-        for entry in self._entries.values():
-            # Remove HTML tags and extract words
-            clean_text = re.sub(r"<[^>]+>", "", entry.content)
-            words = re.findall(r"\b\w+\b", clean_text.lower())
-
-            # Filter out stop words and short words
-            filtered_words = [word for word in words if len(word) > 2 and word not in stop_words]
-
-            all_words.extend(filtered_words)
-
-        # Count word frequencies
-        word_counts = Counter(all_words)
-
-        # Return top 100 words
-        return dict(word_counts.most_common(100))
+        """Get word frequency data for word cloud generation (top 100 words)."""
+        return self.aggregates.top_words(100)
 
     def export_to_json(self, file_path: str) -> bool:
         """Export all entries to JSON file."""
@@ -369,6 +423,8 @@ class JournalRepository:
                         continue
 
                     self._entries[entry.id] = entry
+                    self.search_index.add(entry)
+                    self.aggregates.add(entry)
                     imported += 1
 
                 except Exception as e:
@@ -376,7 +432,7 @@ class JournalRepository:
                     skipped += 1
 
             if imported > 0:
-                self._save_entries()
+                self.compact()
 
             self.logger.info(f"Imported {imported} entries, skipped {skipped}")
             return imported, skipped
@@ -387,9 +443,9 @@ class JournalRepository:
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get comprehensive statistics about journal entries."""
-        entries = list(self._entries.values())
+        totals = self.aggregates.snapshot()
 
-        if not entries:
+        if not totals["entries"]:
             return {
                 "total_entries": 0,
                 "total_words": 0,
@@ -401,43 +457,30 @@ class JournalRepository:
             }
 
         # Basic stats
-        total_entries = len(entries)
-        total_words = sum(entry.word_count for entry in entries)
+        total_entries = totals["entries"]
+        total_words = totals["total_words"]
         average_words = total_words / total_entries if total_entries > 0 else 0
 
         # Mood distribution
-        mood_stats = self.get_mood_statistics()
-        mood_distribution = {mood.value: count for mood, count in mood_stats.items()}
+        mood_distribution = {mood.value: totals["moods"].get(mood.value, 0) for mood in Mood}
 
-        # Writing streak (consecutive days with entries)
-        dates = sorted([entry.created_at.date() for entry in entries], reverse=True)
+        # Writing streak (consecutive days with entries, ending today or yesterday)
+        days = totals["days"]
         streak = 0
         current_date = datetime.now().date()
-
-        for date in dates:
-            if date == current_date or date == current_date - timedelta(days=1):
-                streak += 1
-                current_date = date - timedelta(days=1)
-            else:
-                break
+        if current_date.strftime("%Y-%m-%d") not in days:
+            current_date -= timedelta(days=1)
+        while current_date.strftime("%Y-%m-%d") in days:
+            streak += 1
+            current_date -= timedelta(days=1)
 
         # Most productive day (day of week with most entries)
-        day_counts = {}
-        for entry in entries:
-            day = entry.created_at.strftime("%A")
-            day_counts[day] = day_counts.get(day, 0) + 1
-
-        most_productive_day = max(day_counts.items(), key=lambda x: x[1])[0] if day_counts else None
+        weekdays = totals["weekdays"].most_common(1)
+        most_productive_day = weekdays[0][0] if weekdays else None
 
         # Favorite location
-        location_counts = {}
-        for entry in entries:
-            if entry.location:
-                location_counts[entry.location] = location_counts.get(entry.location, 0) + 1
-
-        favorite_location = (
-            max(location_counts.items(), key=lambda x: x[1])[0] if location_counts else None
-        )
+        locations = totals["locations"].most_common(1)
+        favorite_location = locations[0][0] if locations else None
 
         return {
             "total_entries": total_entries,
@@ -447,6 +490,6 @@ class JournalRepository:
             "writing_streak": streak,
             "most_productive_day": most_productive_day,
             "favorite_location": favorite_location,
-            "first_entry_date": min(entry.created_at for entry in entries).strftime("%Y-%m-%d"),
-            "last_entry_date": max(entry.created_at for entry in entries).strftime("%Y-%m-%d"),
+            "first_entry_date": min(days),
+            "last_entry_date": max(days),
         }
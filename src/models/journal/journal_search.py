@@ -0,0 +1,300 @@
+"""Inverted full-text index over journal entries."""
+
+import bisect
+import math
+import re
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .journal_entry import JournalEntry, Mood
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_TOKEN_RE = re.compile(r"\w+")
+
+# Term weight per field; a title match counts three content matches
+FIELD_WEIGHTS = {"title": 3.0, "tags": 2.0, "location": 1.5, "content": 1.0}
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# A prefix expands to at most this many indexed terms (the most common
+# ones), so a one-letter prefix typed into the search box stays cheap
+MAX_PREFIX_EXPANSIONS = 64
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens of text with HTML tags removed."""
+    if not text:
+        return []
+    return _TOKEN_RE.findall(_TAG_RE.sub(" ", text).lower())
+
+
+@dataclass
+class SearchHit:
+    """A ranked search result."""
+
+    entry: JournalEntry
+    score: float
+    snippet: str = ""
+    matched_terms: List[str] = field(default_factory=list)
+
+
+@dataclass
+class _IndexedEntry:
+    """What the index keeps about one entry."""
+
+    terms: Dict[str, float]  # term -> field-weighted frequency
+    length: float
+    created_at: datetime
+    mood: Optional[Mood]
+    tags: Set[str]
+
+
+class JournalSearchIndex:
+    """Inverted index with BM25 ranking, prefix matching and filters.
+
+    Updated incrementally as entries are added, changed and removed, so a
+    query only touches the postings of its own terms.
+    """
+
+    def __init__(self):
+        """Initialize empty index."""
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._vocabulary: List[str] = []  # sorted, for prefix lookups
+        self._docs: Dict[str, _IndexedEntry] = {}
+        self._total_length = 0.0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add(self, entry: JournalEntry):
+        """Index an entry, replacing any earlier version of it."""
+        terms: Dict[str, float] = {}
+        fields = {
+            "title": entry.title,
+            "tags": " ".join(entry.tags),
+            "location": entry.location,
+            "content": entry.content,
+        }
+        for name, text in fields.items():
+            weight = FIELD_WEIGHTS[name]
+            for token in tokenize(text):
+                terms[token] = terms.get(token, 0.0) + weight
+
+        with self._lock:
+            self._remove_locked(entry.id)
+            doc = _IndexedEntry(
+                terms=terms,
+                length=sum(terms.values()),
+                created_at=entry.created_at,
+                mood=entry.mood,
+                tags={tag.lower() for tag in entry.tags},
+            )
+            self._docs[entry.id] = doc
+            self._total_length += doc.length
+            for term, frequency in terms.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = {}
+                    bisect.insort(self._vocabulary, term)
+                postings[entry.id] = frequency
+
+    def remove(self, entry_id: str):
+        """Drop an entry from the index."""
+        with self._lock:
+            self._remove_locked(entry_id)
+
+    def _remove_locked(self, entry_id: str):
+        doc = self._docs.pop(entry_id, None)
+        if doc is None:
+            return
+        self._total_length -= doc.length
+        for term in doc.terms:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(entry_id, None)
+            if not postings:
+                del self._postings[term]
+                index = bisect.bisect_left(self._vocabulary, term)
+                if index < len(self._vocabulary) and self._vocabulary[index] == term:
+                    del self._vocabulary[index]
+
+    def rebuild(self, entries: Iterable[JournalEntry]):
+        """Replace the index contents with entries."""
+        with self._lock:
+            self._postings.clear()
+            self._vocabulary.clear()
+            self._docs.clear()
+            self._total_length = 0.0
+            for entry in entries:
+                self.add(entry)
+
+    def expand(self, term: str, prefix: bool) -> List[str]:
+        """Indexed terms a query term matches."""
+        with self._lock:
+            if not prefix:
+                return [term] if term in self._postings else []
+            start = bisect.bisect_left(self._vocabulary, term)
+            matches = []
+            for candidate in self._vocabulary[start:]:
+                if not candidate.startswith(term):
+                    break
+                matches.append(candidate)
+            if len(matches) > MAX_PREFIX_EXPANSIONS:
+                matches.sort(key=lambda candidate: len(self._postings[candidate]), reverse=True)
+                matches = matches[:MAX_PREFIX_EXPANSIONS]
+            return matches
+
+    def search(
+        self,
+        query: str,
+        tags: Optional[Iterable[str]] = None,
+        mood: Optional[Union[Mood, Iterable[Mood]]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        prefix_last: bool = True,
+    ) -> List[Tuple[str, float, List[str]]]:
+        """Find entries matching every query term and the filters.
+
+        A term ending in ``*`` matches any word starting with it; with
+        prefix_last the final term does too, for search-as-you-type.
+
+        Args:
+            query: Free-text query
+            tags: Entries must carry all of these tags
+            mood: Entries must have this mood (or one of these moods)
+            start_date: Earliest creation time
+            end_date: Latest creation time
+            limit: Maximum number of results
+            prefix_last: Treat the last query term as a prefix
+
+        Returns:
+            (entry_id, score, matched terms) tuples, best first; without
+            query terms, every entry passing the filters, newest first
+        """
+        raw_terms = query.split()
+        parsed: List[Tuple[str, bool]] = []
+        for position, raw in enumerate(raw_terms):
+            prefix = raw.endswith("*") or (prefix_last and position == len(raw_terms) - 1)
+            for token in tokenize(raw):
+                parsed.append((token, prefix))
+
+        wanted_tags = {tag.lower() for tag in tags} if tags else set()
+        if isinstance(mood, Mood):
+            wanted_moods = {mood}
+        else:
+            wanted_moods = set(mood) if mood else set()
+
+        def passes(entry_id: str) -> bool:
+            doc = self._docs[entry_id]
+            if wanted_tags and not wanted_tags <= doc.tags:
+                return False
+            if wanted_moods and doc.mood not in wanted_moods:
+                return False
+            if start_date and doc.created_at < start_date:
+                return False
+            if end_date and doc.created_at > end_date:
+                return False
+            return True
+
+        with self._lock:
+            if not parsed:
+                ids = [entry_id for entry_id in self._docs if passes(entry_id)]
+                ids.sort(key=lambda entry_id: self._docs[entry_id].created_at, reverse=True)
+                return [(entry_id, 0.0, []) for entry_id in ids[:limit]]
+
+            count = len(self._docs)
+            average_length = self._total_length / count if count else 1.0
+            scores: Optional[Dict[str, float]] = None
+            matched: Dict[str, List[str]] = {}
+
+            # Every query term must match; its score is the best of its expansions
+            for term, prefix in parsed:
+                term_scores: Dict[str, float] = {}
+                term_matches: Dict[str, List[str]] = {}
+                for candidate in self.expand(term, prefix):
+                    postings = self._postings[candidate]
+                    idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                    for entry_id, frequency in postings.items():
+                        if scores is not None and entry_id not in scores:
+                            continue
+                        length = self._docs[entry_id].length
+                        score = idf * frequency * (BM25_K1 + 1) / (
+                            frequency + BM25_K1 * (1 - BM25_B + BM25_B * length / average_length)
+                        )
+                        term_scores[entry_id] = max(score, term_scores.get(entry_id, 0.0))
+                        term_matches.setdefault(entry_id, []).append(candidate)
+
+                if scores is None:
+                    scores = {entry_id: score for entry_id, score in term_scores.items() if passes(entry_id)}
+                else:
+                    scores = {
+                        entry_id: scores[entry_id] + score
+                        for entry_id, score in term_scores.items()
+                        if entry_id in scores
+                    }
+                for entry_id in scores:
+                    matched.setdefault(entry_id, []).extend(term_matches[entry_id])
+                if not scores:
+                    return []
+
+            ranked = sorted(
+                scores.items(),
+                key=lambda item: (item[1], self._docs[item[0]].created_at),
+                reverse=True,
+            )
+            return [(entry_id, score, matched[entry_id]) for entry_id, score in ranked[:limit]]
+
+
+def make_snippet(
+    text: str, terms: Iterable[str], width: int = 160, markers: Tuple[str, str] = ("«", "»")
+) -> str:
+    """Excerpt of text around the first matched term, with matches marked.
+
+    Args:
+        text: Text to excerpt (HTML tags are removed)
+        terms: Indexed terms to highlight
+        width: Approximate snippet length in characters
+        markers: Strings placed before and after each highlighted word
+
+    Returns:
+        Snippet, or "" if no term occurs in the text
+    """
+    terms = set(terms)
+    if not text or not terms:
+        return ""
+    plain = " ".join(_TAG_RE.sub(" ", text).split())
+    words = [match for match in _TOKEN_RE.finditer(plain) if match.group().lower() in terms]
+    if not words:
+        return ""
+
+    start = max(0, words[0].start() - width // 3)
+    if start:
+        space = plain.find(" ", start)
+        start = space + 1 if 0 <= space < words[0].start() else start
+    end = min(len(plain), start + width)
+    if end < len(plain):
+        space = plain.rfind(" ", words[0].end(), end)
+        end = space if space > 0 else end
+
+    pieces = []
+    cursor = start
+    for match in words:
+        if match.start() < start:
+            continue
+        if match.end() > end:
+            break
+        pieces.append(plain[cursor:match.start()])
+        pieces.append(f"{markers[0]}{match.group()}{markers[1]}")
+        cursor = match.end()
+    pieces.append(plain[cursor:end])
+
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if end < len(plain) else ""
+    return prefix + "".join(pieces) + suffix
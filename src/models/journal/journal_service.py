@@ -7,6 +7,7 @@ from typing import Any, Callable, Dict, List, Optional
 
 from .journal_entry import JournalEntry, Mood, WeatherSnapshot
 from .journal_repository import JournalRepository
+from .journal_search import SearchHit
 
 
 class JournalService:
@@ -98,9 +99,17 @@ class JournalService:
         """Get all entries sorted by creation date."""
         return self.repository.get_all_entries()
 
-    def search_entries(self, query: str) -> List[JournalEntry]:
-        """Search entries by content, title, or tags."""
-        return self.repository.search_entries(query)
+    def search_entries(self, query: str, **filters) -> List[JournalEntry]:
+        """Search entries by content, title, tags or location, best match first."""
+        return self.repository.search_entries(query, **filters)
+
+    def search(self, query: str, **filters) -> List[SearchHit]:
+        """Ranked search returning hits with highlighted snippets.
+
+        Accepts the tags, mood, start_date, end_date and limit filters of
+        JournalRepository.search.
+        """
+        return self.repository.search(query, **filters)
 
     def get_entries_by_date_range(
         self, start_date: datetime, end_date: datetime
@@ -241,20 +250,15 @@ class JournalService:
 
     def get_writing_patterns(self) -> Dict[str, Any]:
         """Get writing pattern insights."""
-        entries = self.get_all_entries()
+        # Analyze writing times
+        hour_counts = self.repository.get_hourly_distribution()
 
-        if not entries:
+        if not hour_counts:
             return {"patterns": [], "recommendations": []}
 
         patterns = []
         recommendations = []
 
-        # Analyze writing times
-        hour_counts = {}
-        for entry in entries:
-            hour = entry.created_at.hour
-            hour_counts[hour] = hour_counts.get(hour, 0) + 1
-
         if hour_counts:
             peak_hour = max(hour_counts.items(), key=lambda x: x[1])[0]
             patterns.append(f"You write most often at {peak_hour}:00")
@@ -439,4 +443,5 @@ class JournalService:
     def cleanup(self):
         """Cleanup resources and stop auto-save timer."""
         self._stop_auto_save_timer()
+        self.repository.close()
         self.logger.info("Journal service cleaned up")
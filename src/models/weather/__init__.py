@@ -3,12 +3,14 @@
 This package contains weather-related data models:
 - current_weather: Current weather data models
 - forecast_models: Weather forecast data structures
+- forecast_series: Columnar storage for hourly forecast points
 - alert_models: Weather alert models
 """
 
 from .alert_models import AlertSeverity, AlertType, WeatherAlert
 from .current_weather import WeatherCondition, WeatherData, safe_divide
 from .forecast_models import DailyForecast, ForecastData, ForecastEntry
+from .forecast_series import ForecastSeries, rollup_daily
 
 __all__ = [
     # Utilities
@@ -20,6 +22,8 @@ __all__ = [
     "ForecastEntry",
     "DailyForecast",
     "ForecastData",
+    "ForecastSeries",
+    "rollup_daily",
     # Alerts
     "AlertSeverity",
     "AlertType",
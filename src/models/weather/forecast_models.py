@@ -4,14 +4,15 @@ Defines structured data classes for weather forecast information.
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..location.location_models import Location
 from .current_weather import WeatherCondition
+from .forecast_series import DATACLASS_SLOTS, ForecastSeries, rollup_daily
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ForecastEntry:
     """Single forecast entry."""
 
@@ -49,7 +50,7 @@ class ForecastEntry:
         return int(self.precipitation_probability * 100) if self.precipitation_probability else None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DailyForecast:
     """Daily forecast summary."""
 
@@ -86,14 +87,26 @@ class DailyForecast:
 
 @dataclass
 class ForecastData:
-    """Weather forecast data."""
+    """Weather forecast data.
+
+    Hourly points are held column-wise in a ForecastSeries; a list of
+    ForecastEntry objects passed in is converted on construction.
+    """
 
     location: Location
     timestamp: datetime
-    hourly_forecasts: List[ForecastEntry] = field(default_factory=list)
+    hourly_forecasts: ForecastSeries = field(
+        default_factory=lambda: ForecastSeries(ForecastEntry)
+    )
     daily_forecasts: List[DailyForecast] = field(default_factory=list)
     raw_data: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self):
+        if not isinstance(self.hourly_forecasts, ForecastSeries):
+            self.hourly_forecasts = ForecastSeries.from_entries(
+                self.hourly_forecasts, ForecastEntry
+            )
+
     @property
     def forecast_hours(self) -> int:
         """Number of hours in forecast."""
@@ -104,8 +117,8 @@ class ForecastData:
         """Number of days in forecast."""
         return len(self.daily_forecasts)
 
-    def get_hourly_forecast(self, hours: int = 24) -> List[ForecastEntry]:
-        """Get forecast for next N hours."""
+    def get_hourly_forecast(self, hours: int = 24) -> ForecastSeries:
+        """Get forecast for next N hours (a view, no copying)."""
         return self.hourly_forecasts[:hours]
 
     def get_daily_forecast(self, days: int = 5) -> List[DailyForecast]:
@@ -114,12 +127,7 @@ class ForecastData:
 
     def get_temperature_range(self, hours: int = 24) -> tuple[float, float]:
         """Get temperature range for next N hours."""
-        if not self.hourly_forecasts:
-            return (0.0, 0.0)
-
-        forecasts = self.get_hourly_forecast(hours)
-        temps = [f.temperature for f in forecasts]
-        return (min(temps), max(temps))
+        return self.get_hourly_forecast(hours).temperature_range()
 
     @classmethod
     def from_openweather_forecast(cls, data: Dict[str, Any]) -> "ForecastData":
@@ -128,8 +136,40 @@ class ForecastData:
         Parses 40 3-hour forecast entries from API and groups by day using local timezone.
         Calculates daily high/low temperatures and determines predominant weather condition.
         """
-        from collections import Counter, defaultdict
+        return cls.from_openweather_forecasts([data])[0]
+
+    @classmethod
+    def from_openweather_forecasts(cls, payloads: List[Dict[str, Any]]) -> List["ForecastData"]:
+        """Create ForecastData for many OpenWeather forecast responses at once.
+
+        Daily summaries for all payloads are computed in a single vectorized
+        rollup, which is much cheaper than one rollup per city.
+        """
+        parsed = [cls._parse_openweather_hourly(data) for data in payloads]
+
+        # Group by local day (timestamps are already shifted) and summarize
+        daily = rollup_daily(
+            [hourly_forecasts for _, hourly_forecasts in parsed],
+            DailyForecast,
+            days=5,
+            utc_offsets=[0.0] * len(parsed),
+        )
 
+        now = datetime.now()
+        return [
+            cls(
+                location=location,
+                timestamp=now,
+                hourly_forecasts=hourly_forecasts,
+                daily_forecasts=daily_forecasts,
+                raw_data=data,
+            )
+            for data, (location, hourly_forecasts), daily_forecasts in zip(payloads, parsed, daily)
+        ]
+
+    @staticmethod
+    def _parse_openweather_hourly(data: Dict[str, Any]) -> Tuple[Location, ForecastSeries]:
+        """Parse the location and hourly series from an OpenWeather forecast response."""
         import pytz
 
         city = data.get("city", {})
@@ -146,33 +186,16 @@ class ForecastData:
             longitude=city.get("coord", {}).get("lon", 0.0),
         )
 
-        # Parse hourly forecasts (limit to 40 entries as per API)
-        hourly_forecasts = []
-        daily_data = defaultdict(
-            lambda: {
-                "temps": [],
-                "conditions": [],
-                "descriptions": [],
-                "humidity": [],
-                "wind_speeds": [],
-                "wind_directions": [],
-                "precipitation_probs": [],
-                "precipitation_amounts": [],
-                "entries": [],
-            }
-        )
-
+        # Parse hourly forecasts (limit to 40 entries as per API) straight into
+        # columns; timestamps are shifted to local time and labelled UTC
+        hourly_forecasts = ForecastSeries(ForecastEntry, tz=pytz.UTC)
         for item in forecast_list[:40]:  # Limit to 40 3-hour entries
             weather = item.get("weather", [{}])[0]
             main = item.get("main", {})
             wind = item.get("wind", {})
 
-            # Convert timestamp to local time using timezone offset
-            utc_timestamp = datetime.fromtimestamp(item.get("dt", 0), tz=pytz.UTC)
-            local_timestamp = utc_timestamp + timedelta(seconds=timezone_offset)
-
-            forecast_entry = ForecastEntry(
-                timestamp=local_timestamp,
+            hourly_forecasts.append(
+                timestamp=item.get("dt", 0) + timezone_offset,
                 condition=WeatherCondition.from_openweather(weather.get("main", "Unknown")),
                 description=weather.get("description", "Unknown").title(),
                 temperature=main.get("temp", 0.0),
@@ -186,77 +209,5 @@ class ForecastData:
                 precipitation_amount=item.get("rain", {}).get("3h", 0)
                 + item.get("snow", {}).get("3h", 0),
             )
-            hourly_forecasts.append(forecast_entry)
-
-            # Group by day for daily forecasts
-            day_key = local_timestamp.date()
-            daily_data[day_key]["temps"].append(main.get("temp", 0.0))
-            daily_data[day_key]["conditions"].append(weather.get("main", "Unknown"))
-            daily_data[day_key]["descriptions"].append(weather.get("description", "Unknown"))
-            daily_data[day_key]["humidity"].append(main.get("humidity", 0))
-            daily_data[day_key]["wind_speeds"].append(wind.get("speed", 0))
-            daily_data[day_key]["wind_directions"].append(wind.get("deg", 0))
-            daily_data[day_key]["precipitation_probs"].append(item.get("pop", 0))
-            daily_data[day_key]["precipitation_amounts"].append(
-                item.get("rain", {}).get("3h", 0) + item.get("snow", {}).get("3h", 0)
-            )
-            daily_data[day_key]["entries"].append(forecast_entry)
-
-        # Create daily forecasts
-        daily_forecasts = []
-        for day_date in sorted(daily_data.keys())[:5]:  # Limit to 5 days
-            day_info = daily_data[day_date]
-
-            # Calculate daily statistics
-            temps = day_info["temps"]
-            temp_min = min(temps) if temps else 0.0
-            temp_max = max(temps) if temps else 0.0
-
-            # Determine predominant weather condition
-            condition_counts = Counter(day_info["conditions"])
-            predominant_condition = (
-                condition_counts.most_common(1)[0][0] if condition_counts else "Unknown"
-            )
 
-            # Get most common description
-            description_counts = Counter(day_info["descriptions"])
-            predominant_description = (
-                description_counts.most_common(1)[0][0] if description_counts else "Unknown"
-            )
-
-            # Calculate averages
-            avg_humidity = (
-                sum(day_info["humidity"]) / len(day_info["humidity"]) if day_info["humidity"] else 0
-            )
-            avg_wind_speed = (
-                sum(day_info["wind_speeds"]) / len(day_info["wind_speeds"])
-                if day_info["wind_speeds"]
-                else 0
-            )
-            max_precipitation_prob = (
-                max(day_info["precipitation_probs"]) if day_info["precipitation_probs"] else 0
-            )
-            total_precipitation = (
-                sum(day_info["precipitation_amounts"]) if day_info["precipitation_amounts"] else 0
-            )
-
-            daily_forecast = DailyForecast(
-                date=datetime.combine(day_date, datetime.min.time()),
-                condition=WeatherCondition.from_openweather(predominant_condition),
-                description=predominant_description.title(),
-                temp_min=temp_min,
-                temp_max=temp_max,
-                humidity=int(avg_humidity),
-                wind_speed=avg_wind_speed,
-                precipitation_probability=max_precipitation_prob,
-                precipitation_amount=total_precipitation,
-            )
-            daily_forecasts.append(daily_forecast)
-
-        return cls(
-            location=location,
-            timestamp=datetime.now(),
-            hourly_forecasts=hourly_forecasts,
-            daily_forecasts=daily_forecasts,
-            raw_data=data,
-        )
+        return location, hourly_forecasts
@@ -0,0 +1,585 @@
+"""Columnar Forecast Series
+
+Stores a forecast as one typed array per numeric field instead of one object
+per forecast point. A 5-day/3-hour forecast becomes ten small arrays plus two
+lists of shared references (conditions and interned descriptions), which keeps
+hundreds of cached city forecasts cheap to hold in memory.
+
+Slices are views over the same columns, and ForecastEntry objects are only
+materialized when a caller indexes or iterates the series.
+"""
+
+import math
+import sys
+from array import array
+from collections import Counter
+from collections.abc import Sequence
+from datetime import date, datetime, time, timedelta, tzinfo
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Keyword arguments for per-point dataclasses; slots=True needs Python 3.10+
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Numeric columns in storage order; "time" holds POSIX timestamps
+NUMERIC_COLUMNS = (
+    "time",
+    "temperature",
+    "feels_like",
+    "humidity",
+    "pressure",
+    "wind_speed",
+    "wind_direction",
+    "cloudiness",
+    "precipitation_probability",
+    "precipitation_amount",
+)
+
+# Columns stored as NaN when missing and restored as None
+OPTIONAL_COLUMNS = frozenset(
+    {
+        "wind_speed",
+        "wind_direction",
+        "cloudiness",
+        "precipitation_probability",
+        "precipitation_amount",
+    }
+)
+
+# Columns restored as int on ForecastEntry
+INT_COLUMNS = frozenset({"humidity", "wind_direction", "cloudiness"})
+
+_NAN = float("nan")
+
+_SECONDS_PER_DAY = 86400.0
+_EPOCH_DATE = date(1970, 1, 1)
+
+
+def _to_float(value: Optional[float]) -> float:
+    """Convert an optional number to a column value (None becomes NaN)."""
+    return _NAN if value is None else float(value)
+
+
+class _Columns:
+    """Column storage shared between a series and its views."""
+
+    __slots__ = ("numeric", "conditions", "descriptions")
+
+    def __init__(self):
+        self.numeric: Dict[str, array] = {name: array("d") for name in NUMERIC_COLUMNS}
+        self.conditions: List[Any] = []
+        self.descriptions: List[str] = []
+
+
+class ForecastSeries(Sequence):
+    """Array-backed sequence of forecast points.
+
+    Behaves like a read-only list of ForecastEntry objects (len, indexing,
+    iteration, slicing) while storing the data column-wise. Slicing with a
+    step of 1 returns a zero-copy view; column() exposes the raw values without
+    creating any per-point objects.
+
+    Series are built once with append()/append_entry() and then read. Arrays
+    cannot grow while a column memoryview is held, so finish building before
+    handing the series out.
+    """
+
+    __slots__ = ("_entry_type", "_tz", "_columns", "_start", "_stop")
+
+    def __init__(
+        self,
+        entry_type: type,
+        tz: Optional[tzinfo] = None,
+        _columns: Optional[_Columns] = None,
+        _start: int = 0,
+        _stop: Optional[int] = None,
+    ):
+        """
+        Initialize forecast series.
+
+        Args:
+            entry_type: ForecastEntry class materialized on item access
+            tz: Timezone for restored timestamps (None for naive local time)
+        """
+        self._entry_type = entry_type
+        self._tz = tz
+        self._columns = _columns if _columns is not None else _Columns()
+        self._start = _start
+        self._stop = _stop
+
+    @classmethod
+    def from_entries(
+        cls, entries: Iterable[Any], entry_type: type, tz: Optional[tzinfo] = None
+    ) -> "ForecastSeries":
+        """Create a series from ForecastEntry-like objects.
+
+        Args:
+            entries: Objects with ForecastEntry attributes
+            entry_type: ForecastEntry class materialized on item access
+            tz: Timezone for restored timestamps; defaults to the first entry's tzinfo
+
+        Returns:
+            New series owning its columns
+        """
+        if isinstance(entries, ForecastSeries):
+            return entries
+
+        series = None
+        for entry in entries:
+            if series is None:
+                series = cls(entry_type, tz if tz is not None else entry.timestamp.tzinfo)
+            series.append_entry(entry)
+        return series if series is not None else cls(entry_type, tz)
+
+    # Building
+
+    def append(
+        self,
+        timestamp: Union[datetime, float],
+        condition: Any,
+        description: str,
+        temperature: float,
+        feels_like: float,
+        humidity: float,
+        pressure: float,
+        wind_speed: Optional[float] = None,
+        wind_direction: Optional[float] = None,
+        cloudiness: Optional[float] = None,
+        precipitation_probability: Optional[float] = None,
+        precipitation_amount: Optional[float] = None,
+    ) -> None:
+        """Append one forecast point.
+
+        Args:
+            timestamp: Point time as datetime or POSIX timestamp
+            condition: WeatherCondition value
+            description: Human-readable description
+            temperature..precipitation_amount: ForecastEntry fields
+        """
+        if self._stop is not None or self._start:
+            raise ValueError("Cannot append to a ForecastSeries view")
+
+        numeric = self._columns.numeric
+        numeric["time"].append(
+            timestamp.timestamp() if isinstance(timestamp, datetime) else float(timestamp)
+        )
+        numeric["temperature"].append(float(temperature))
+        numeric["feels_like"].append(float(feels_like))
+        numeric["humidity"].append(float(humidity))
+        numeric["pressure"].append(float(pressure))
+        numeric["wind_speed"].append(_to_float(wind_speed))
+        numeric["wind_direction"].append(_to_float(wind_direction))
+        numeric["cloudiness"].append(_to_float(cloudiness))
+        numeric["precipitation_probability"].append(_to_float(precipitation_probability))
+        numeric["precipitation_amount"].append(_to_float(precipitation_amount))
+        self._columns.conditions.append(condition)
+        # Descriptions repeat across points and cities; share one string each
+        self._columns.descriptions.append(sys.intern(description) if description else description)
+
+    def append_entry(self, entry: Any) -> None:
+        """Append a ForecastEntry-like object."""
+        self.append(
+            entry.timestamp,
+            entry.condition,
+            entry.description,
+            entry.temperature,
+            entry.feels_like,
+            entry.humidity,
+            entry.pressure,
+            getattr(entry, "wind_speed", None),
+            getattr(entry, "wind_direction", None),
+            getattr(entry, "cloudiness", None),
+            getattr(entry, "precipitation_probability", None),
+            getattr(entry, "precipitation_amount", None),
+        )
+
+    # Sequence protocol
+
+    @property
+    def _end(self) -> int:
+        """Absolute index one past the last point of this series."""
+        return len(self._columns.conditions) if self._stop is None else self._stop
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self._entry_at(self._start + i) for i in range(start, stop, step)]
+            stop = max(start, stop)
+            return ForecastSeries(
+                self._entry_type,
+                self._tz,
+                _columns=self._columns,
+                _start=self._start + start,
+                _stop=self._start + stop,
+            )
+
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("ForecastSeries index out of range")
+        return self._entry_at(self._start + index)
+
+    def __iter__(self) -> Iterator[Any]:
+        for position in range(self._start, self._end):
+            yield self._entry_at(position)
+
+    def __repr__(self) -> str:
+        return f"ForecastSeries({len(self)} points, entry_type={self._entry_type.__name__})"
+
+    def _entry_at(self, position: int) -> Any:
+        """Materialize the ForecastEntry at an absolute column position."""
+        numeric = self._columns.numeric
+        values = {}
+        for name in NUMERIC_COLUMNS[1:]:
+            value = numeric[name][position]
+            if name in OPTIONAL_COLUMNS and math.isnan(value):
+                values[name] = None
+            elif name in INT_COLUMNS:
+                values[name] = int(value)
+            else:
+                values[name] = value
+
+        return self._entry_type(
+            timestamp=datetime.fromtimestamp(numeric["time"][position], self._tz),
+            condition=self._columns.conditions[position],
+            description=self._columns.descriptions[position],
+            **values,
+        )
+
+    # Column access
+
+    @property
+    def tz(self) -> Optional[tzinfo]:
+        """Timezone used for restored timestamps."""
+        return self._tz
+
+    def column(self, name: str) -> Union[memoryview, List[Any]]:
+        """Get one column for this series without creating per-point objects.
+
+        Args:
+            name: Numeric column name, "condition" or "description"
+
+        Returns:
+            memoryview of float64 values for numeric columns (missing values are
+            NaN), or a list for condition/description
+        """
+        if name == "condition":
+            return self._columns.conditions[self._start:self._end]
+        if name == "description":
+            return self._columns.descriptions[self._start:self._end]
+        return memoryview(self._columns.numeric[name])[self._start:self._end]
+
+    def as_array(self, name: str) -> Any:
+        """Get a numeric column as a NumPy array view (memoryview if NumPy is unavailable)."""
+        view = self.column(name)
+        if NUMPY_AVAILABLE and isinstance(view, memoryview):
+            return np.frombuffer(view, dtype=np.float64)
+        return view
+
+    def timestamps(self) -> List[datetime]:
+        """Get point times as datetimes."""
+        return [datetime.fromtimestamp(t, self._tz) for t in self.column("time")]
+
+    def temperature_range(self) -> Tuple[float, float]:
+        """Get (min, max) temperature, or (0.0, 0.0) for an empty series."""
+        if not len(self):
+            return (0.0, 0.0)
+        temps = self.column("temperature")
+        return (min(temps), max(temps))
+
+    def for_date(self, day: date) -> "ForecastSeries":
+        """Get the points falling on a calendar day.
+
+        Args:
+            day: Day in the series timezone
+
+        Returns:
+            View when the day's points are contiguous, otherwise a compact copy
+        """
+        start = datetime.combine(day, time.min, tzinfo=self._tz).timestamp()
+        end = datetime.combine(day + timedelta(days=1), time.min, tzinfo=self._tz).timestamp()
+        positions = [i for i, t in enumerate(self.column("time")) if start <= t < end]
+
+        if not positions:
+            return self[0:0]
+        if positions[-1] - positions[0] + 1 == len(positions):
+            return self[positions[0]:positions[-1] + 1]
+        return self.take(positions)
+
+    def daily_rollup(
+        self,
+        daily_type: type,
+        days: Optional[int] = None,
+        utc_offset: Optional[float] = None,
+    ) -> List[Any]:
+        """Aggregate points into per-day summaries.
+
+        See rollup_daily(); use that directly to aggregate many series at once.
+
+        Args:
+            daily_type: DailyForecast class to build
+            days: Keep only the first N days
+            utc_offset: Seconds east of UTC defining day boundaries; defaults to
+                the series timezone (local time for naive series) at the first point
+
+        Returns:
+            List of daily_type, ordered by date
+        """
+        offsets = None if utc_offset is None else [utc_offset]
+        return rollup_daily([self], daily_type, days=days, utc_offsets=offsets)[0]
+
+    def utc_offset(self) -> float:
+        """Seconds east of UTC for this series' timezone at its first point."""
+        if not len(self):
+            return 0.0
+        first = datetime.fromtimestamp(self.column("time")[0], self._tz)
+        if self._tz is None:
+            first = first.astimezone()
+        offset = first.utcoffset()
+        return offset.total_seconds() if offset else 0.0
+
+    def take(self, positions: Iterable[int]) -> "ForecastSeries":
+        """Copy selected points (relative positions) into a new series."""
+        series = ForecastSeries(self._entry_type, self._tz)
+        source = self._columns
+        target = series._columns
+        for position in positions:
+            absolute = self._start + position
+            for name in NUMERIC_COLUMNS:
+                target.numeric[name].append(source.numeric[name][absolute])
+            target.conditions.append(source.conditions[absolute])
+            target.descriptions.append(source.descriptions[absolute])
+        return series
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate bytes held by this series' share of the columns."""
+        points = len(self)
+        return points * (len(NUMERIC_COLUMNS) * 8 + 2 * 8)
+
+
+# Below this many points the fixed cost of NumPy calls outweighs the work
+_NUMPY_MIN_POINTS = 256
+
+# Aggregated numeric columns; missing values count as zero like the API defaults
+_ROLLUP_COLUMNS = ("humidity", "wind_speed", "precipitation_probability", "precipitation_amount")
+
+
+def rollup_daily(
+    series_list: Sequence,
+    daily_type: type,
+    days: Optional[int] = None,
+    utc_offsets: Optional[Sequence[float]] = None,
+) -> List[List[Any]]:
+    """Aggregate forecast series into per-day summaries.
+
+    Groups every series' points by calendar day and computes min/max
+    temperature, mean humidity and wind speed, max precipitation probability,
+    summed precipitation and the most common condition/description (ties go
+    to the one seen first that day). With NumPy, all series are grouped in a
+    single vectorized pass; otherwise each series is folded in one Python pass.
+
+    Args:
+        series_list: ForecastSeries to aggregate
+        daily_type: DailyForecast class to build
+        days: Keep only the first N days of each series
+        utc_offsets: Seconds east of UTC per series defining day boundaries;
+            defaults to each series' timezone at its first point
+
+    Returns:
+        One list of daily_type per series, ordered by date
+    """
+    if utc_offsets is None:
+        utc_offsets = [series.utc_offset() for series in series_list]
+
+    total_points = sum(len(series) for series in series_list)
+    if NUMPY_AVAILABLE and total_points >= _NUMPY_MIN_POINTS:
+        groups = _rollup_numpy(series_list, utc_offsets, days)
+    else:
+        groups = _rollup_python(series_list, utc_offsets, days)
+
+    results: List[List[Any]] = [[] for _ in series_list]
+    dates: Dict[int, datetime] = {}
+    for series_index, day_number, condition, description, temp_min, temp_max, humidity, wind, pop, amount in groups:
+        day_start = dates.get(day_number)
+        if day_start is None:
+            day_start = dates[day_number] = datetime.combine(
+                _EPOCH_DATE + timedelta(days=day_number), time.min
+            )
+        results[series_index].append(
+            daily_type(
+                date=day_start,
+                condition=condition,
+                description=description,
+                temp_min=temp_min,
+                temp_max=temp_max,
+                humidity=int(humidity),
+                wind_speed=wind,
+                precipitation_probability=pop,
+                precipitation_amount=amount,
+            )
+        )
+    return results
+
+
+def _first_mode(group_ids: Any, codes: Any, group_count: int) -> Any:
+    """Most common code per group, ties broken by first occurrence."""
+    code_count = int(codes.max()) + 1
+    keys, first_seen, counts = np.unique(
+        group_ids * code_count + codes, return_index=True, return_counts=True
+    )
+    key_groups = keys // code_count
+    # Per group: highest count first, then earliest first occurrence
+    order = np.lexsort((first_seen, -counts, key_groups))
+    winners = order[np.concatenate(([True], key_groups[order][1:] != key_groups[order][:-1]))]
+    mode = np.empty(group_count, dtype=np.int64)
+    mode[key_groups[winners]] = keys[winners] % code_count
+    return mode
+
+
+def _encode(values: List[Any]) -> Tuple[Any, List[Any]]:
+    """Encode hashable values as integer codes (and the code -> value table)."""
+    table: Dict[Any, int] = {}
+    codes = np.fromiter(
+        (table.setdefault(value, len(table)) for value in values), dtype=np.int64, count=len(values)
+    )
+    return codes, list(table)
+
+
+def _rollup_numpy(series_list: Sequence, utc_offsets: Sequence[float], days: Optional[int]) -> List[Tuple]:
+    """Per-(series, day) aggregates for all series in one vectorized pass."""
+    active = [(index, series) for index, series in enumerate(series_list) if len(series)]
+    if not active:
+        return []
+
+    lengths = np.array([len(series) for _, series in active])
+    series_ids = np.repeat(np.array([index for index, _ in active]), lengths)
+    offsets = np.repeat(np.array([utc_offsets[index] for index, _ in active], dtype=np.float64), lengths)
+
+    def stacked(name: str) -> Any:
+        return np.concatenate([series.as_array(name) for _, series in active])
+
+    day_numbers = np.floor((stacked("time") + offsets) / _SECONDS_PER_DAY).astype(np.int64)
+    order = np.lexsort((day_numbers, series_ids))
+    sorted_series = series_ids[order]
+    sorted_days = day_numbers[order]
+    boundaries = np.concatenate(
+        ([True], (sorted_series[1:] != sorted_series[:-1]) | (sorted_days[1:] != sorted_days[:-1]))
+    )
+    starts = np.flatnonzero(boundaries)
+    counts = np.diff(np.append(starts, len(order)))
+    group_ids = np.cumsum(boundaries) - 1
+
+    temperature = stacked("temperature")[order]
+    temp_min = np.minimum.reduceat(temperature, starts)
+    temp_max = np.maximum.reduceat(temperature, starts)
+
+    values = np.column_stack([stacked(name) for name in _ROLLUP_COLUMNS])[order]
+    values[np.isnan(values)] = 0.0
+    sums = np.add.reduceat(values, starts, axis=0)
+    maxima = np.maximum.reduceat(values, starts, axis=0)
+    humidity = sums[:, 0] / counts
+    wind = sums[:, 1] / counts
+    pop = maxima[:, 2]
+    amount = sums[:, 3]
+
+    conditions, condition_table = _encode([c for _, series in active for c in series.column("condition")])
+    descriptions, description_table = _encode(
+        [d for _, series in active for d in series.column("description")]
+    )
+    condition_mode = _first_mode(group_ids, conditions[order], len(starts))
+    description_mode = _first_mode(group_ids, descriptions[order], len(starts))
+
+    group_series = sorted_series[starts]
+    keep = np.ones(len(starts), dtype=bool)
+    if days is not None:
+        # Rank of each day within its series
+        series_first = np.concatenate(([True], group_series[1:] != group_series[:-1]))
+        first_group = np.maximum.accumulate(np.where(series_first, np.arange(len(starts)), 0))
+        keep = (np.arange(len(starts)) - first_group) < days
+
+    return [
+        (
+            series_index,
+            day_number,
+            condition_table[condition_code],
+            description_table[description_code],
+            t_min,
+            t_max,
+            h,
+            w,
+            p,
+            a,
+        )
+        for series_index, day_number, condition_code, description_code, t_min, t_max, h, w, p, a, kept in zip(
+            group_series.tolist(),
+            sorted_days[starts].tolist(),
+            condition_mode.tolist(),
+            description_mode.tolist(),
+            temp_min.tolist(),
+            temp_max.tolist(),
+            humidity.tolist(),
+            wind.tolist(),
+            pop.tolist(),
+            amount.tolist(),
+            keep.tolist(),
+        )
+        if kept
+    ]
+
+
+def _rollup_python(series_list: Sequence, utc_offsets: Sequence[float], days: Optional[int]) -> List[Tuple]:
+    """Per-(series, day) aggregates, one pass over each series' columns."""
+    groups = []
+    for series_index, series in enumerate(series_list):
+        columns = [series.column(name) for name in ("time", "temperature") + _ROLLUP_COLUMNS]
+        conditions = series.column("condition")
+        descriptions = series.column("description")
+        utc_offset = utc_offsets[series_index]
+
+        accumulators: Dict[int, List[Any]] = {}
+        for position, (t, temp, humidity, wind, pop, amount) in enumerate(zip(*columns)):
+            day_number = int((t + utc_offset) // _SECONDS_PER_DAY)
+            acc = accumulators.get(day_number)
+            if acc is None:
+                acc = accumulators[day_number] = [Counter(), Counter(), temp, temp, 0.0, 0.0, 0.0, 0.0, 0]
+            acc[0][conditions[position]] += 1
+            acc[1][descriptions[position]] += 1
+            acc[2] = min(acc[2], temp)
+            acc[3] = max(acc[3], temp)
+            acc[4] += humidity
+            acc[5] += 0.0 if math.isnan(wind) else wind
+            acc[6] = max(acc[6], 0.0 if math.isnan(pop) else pop)
+            acc[7] += 0.0 if math.isnan(amount) else amount
+            acc[8] += 1
+
+        for day_number in sorted(accumulators)[:days]:
+            condition_counts, description_counts, temp_min, temp_max, humidity, wind, pop, amount, count = (
+                accumulators[day_number]
+            )
+            groups.append(
+                (
+                    series_index,
+                    day_number,
+                    condition_counts.most_common(1)[0][0],
+                    description_counts.most_common(1)[0][0],
+                    temp_min,
+                    temp_max,
+                    humidity / count,
+                    wind / count,
+                    pop,
+                    amount,
+                )
+            )
+    return groups
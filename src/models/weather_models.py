@@ -8,6 +8,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
+from .weather.forecast_series import DATACLASS_SLOTS, ForecastSeries
+
 
 def safe_divide(a, b, default=0):
     """Safely divide two numbers, returning default if division by zero."""
@@ -309,7 +311,7 @@ class WeatherData:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ForecastEntry:
     """Single forecast entry."""
 
@@ -347,7 +349,7 @@ class ForecastEntry:
         return int(self.precipitation_probability * 100) if self.precipitation_probability else None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DailyForecast:
     """Daily forecast summary."""
 
@@ -384,14 +386,26 @@ class DailyForecast:
 
 @dataclass
 class ForecastData:
-    """Weather forecast data."""
+    """Weather forecast data.
+
+    Hourly points are held column-wise in a ForecastSeries; a list of
+    ForecastEntry objects passed in is converted on construction.
+    """
 
     location: Location
     timestamp: datetime
-    hourly_forecasts: List[ForecastEntry] = field(default_factory=list)
+    hourly_forecasts: ForecastSeries = field(
+        default_factory=lambda: ForecastSeries(ForecastEntry)
+    )
     daily_forecasts: List[DailyForecast] = field(default_factory=list)
     raw_data: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self):
+        if not isinstance(self.hourly_forecasts, ForecastSeries):
+            self.hourly_forecasts = ForecastSeries.from_entries(
+                self.hourly_forecasts, ForecastEntry
+            )
+
     @property
     def forecast_hours(self) -> int:
         """Number of hours in forecast."""
@@ -402,8 +416,8 @@ class ForecastData:
         """Number of days in forecast."""
         return len(self.daily_forecasts)
 
-    def get_hourly_forecast(self, hours: int = 24) -> List[ForecastEntry]:
-        """Get forecast for next N hours."""
+    def get_hourly_forecast(self, hours: int = 24) -> ForecastSeries:
+        """Get forecast for next N hours (a view, no copying)."""
         return self.hourly_forecasts[:hours]
 
     def get_daily_forecast(self, days: int = 5) -> List[DailyForecast]:
@@ -412,12 +426,7 @@ class ForecastData:
 
     def get_temperature_range(self, hours: int = 24) -> tuple[float, float]:
         """Get temperature range for next N hours."""
-        if not self.hourly_forecasts:
-            return (0.0, 0.0)
-
-        forecasts = self.get_hourly_forecast(hours)
-        temps = [f.temperature for f in forecasts]
-        return (min(temps), max(temps))
+        return self.get_hourly_forecast(hours).temperature_range()
 
     @classmethod
     def from_openweather_forecast(cls, data: Dict[str, Any]) -> "ForecastData":
@@ -433,15 +442,15 @@ class ForecastData:
             longitude=city.get("coord", {}).get("lon", 0.0),
         )
 
-        # Parse hourly forecasts
-        hourly_forecasts = []
+        # Parse hourly forecasts straight into columns
+        hourly_forecasts = ForecastSeries(ForecastEntry)
         for item in forecast_list:
             weather = item.get("weather", [{}])[0]
             main = item.get("main", {})
             wind = item.get("wind", {})
 
-            forecast_entry = ForecastEntry(
-                timestamp=datetime.fromtimestamp(item.get("dt", 0)),
+            hourly_forecasts.append(
+                timestamp=item.get("dt", 0),
                 condition=WeatherCondition.from_openweather(weather.get("main", "Unknown")),
                 description=weather.get("description", "Unknown").title(),
                 temperature=main.get("temp", 0.0),
@@ -453,7 +462,6 @@ class ForecastData:
                 cloudiness=item.get("clouds", {}).get("all"),
                 precipitation_probability=item.get("pop"),
             )
-            hourly_forecasts.append(forecast_entry)
 
         return cls(
             location=location,
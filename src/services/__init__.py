@@ -4,42 +4,81 @@ Provides all application services including weather, database, AI, configuration
 and performance optimization services.
 """
 
-# Import service modules
-from . import weather
-from . import database
-from . import ai
-from . import config
-from . import cache
+import importlib
+from typing import Any
 
-# Import remaining services
-from .github_team_service import GitHubTeamService
-from .google_maps_service import GoogleMapsService
-from .logging_service import LoggingService
-from .maps_service import WeatherMapsService
-from .search_state_service import SearchStateService
+# Names are resolved on first access (PEP 562) so that importing one
+# service does not pull in folium, matplotlib, pandas and SQLAlchemy for
+# all the others before the first window is shown.
+_SUBPACKAGES = ("weather", "database", "ai", "config", "cache")
 
-# Import performance optimization services
-from .async_service import AsyncService, get_async_service
-from .lazy_loading import LazyService, lazy_property, lazy_init
-from .memory_optimizer import MemoryOptimizer, get_memory_optimizer
-from .database_optimizer import DatabaseOptimizer, get_database_optimizer
-from .image_optimizer import ImageOptimizer, get_image_optimizer
-from .chart_optimizer import ChartOptimizer, get_chart_optimizer
-from .ai_optimizer import AIResponseOptimizer, get_ai_optimizer
-from .performance_monitor import PerformanceMonitor, get_performance_monitor
+_LAZY_ATTRIBUTES = {
+    # Legacy services
+    "GitHubTeamService": "github_team_service",
+    "GoogleMapsService": "google_maps_service",
+    "LoggingService": "logging_service",
+    "WeatherMapsService": "maps_service",
+    "SearchStateService": "search_state_service",
+    # Performance optimization services
+    "AsyncService": "async_service",
+    "get_async_service": "async_service",
+    "LazyService": "lazy_loading",
+    "lazy_property": "lazy_loading",
+    "lazy_init": "lazy_loading",
+    "MemoryOptimizer": "memory_optimizer",
+    "get_memory_optimizer": "memory_optimizer",
+    "DatabaseOptimizer": "database_optimizer",
+    "get_database_optimizer": "database_optimizer",
+    "ImageOptimizer": "image_optimizer",
+    "get_image_optimizer": "image_optimizer",
+    "ChartOptimizer": "chart_optimizer",
+    "get_chart_optimizer": "chart_optimizer",
+    "AIResponseOptimizer": "ai_optimizer",
+    "get_ai_optimizer": "ai_optimizer",
+    "PerformanceMonitor": "performance_monitor",
+    "get_performance_monitor": "performance_monitor",
+    # Error handling and logging
+    "WeatherAppError": "exceptions",
+    "APIError": "exceptions",
+    "ConfigurationError": "exceptions",
+    "DataValidationError": "exceptions",
+    "DatabaseError": "exceptions",
+    "CacheError": "exceptions",
+    "UIError": "exceptions",
+    "NetworkError": "exceptions",
+    "AuthenticationError": "exceptions",
+    "RateLimitError": "exceptions",
+    "get_user_friendly_message": "exceptions",
+    "setup_logging": "logging_config",
+    "get_logger": "logging_config",
+    "WeatherAppLogger": "logging_config",
+    "ErrorHandler": "error_handler",
+    "RetryConfig": "error_handler",
+    "CircuitBreaker": "error_handler",
+    "retry_on_exception": "error_handler",
+    "async_retry_on_exception": "error_handler",
+    "safe_execute": "error_handler",
+    "handle_api_error": "error_handler",
+    "handle_database_error": "error_handler",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a service module or exported name on first access."""
+    if name in _SUBPACKAGES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-# Import error handling and logging
-from .exceptions import (
-    WeatherAppError, APIError, ConfigurationError, DataValidationError,
-    DatabaseError, CacheError, UIError, NetworkError, AuthenticationError,
-    RateLimitError, get_user_friendly_message
-)
-from .logging_config import setup_logging, get_logger, WeatherAppLogger
-from .error_handler import (
-    ErrorHandler, RetryConfig, CircuitBreaker,
-    retry_on_exception, async_retry_on_exception,
-    safe_execute, handle_api_error, handle_database_error
-)
 
 __all__ = [
     # Core service modules
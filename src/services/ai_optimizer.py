@@ -17,6 +17,8 @@ from functools import wraps, lru_cache
 from enum import Enum
 import weakref
 
+from .cache.tiered_cache import TieredCache, get_tiered_cache
+
 
 class AIServiceType(Enum):
     """Supported AI service types."""
@@ -148,29 +150,39 @@ class AIResponseEntry:
 
 
 class AIResponseCache:
-    """Cache for AI service responses."""
+    """Cache for AI service responses, stored in a persistent tiered cache namespace."""
     
     def __init__(self, 
                  max_size_mb: float = 500.0,
                  max_entries: int = 10000,
                  default_ttl: float = 3600.0,
-                 compression_enabled: bool = True):
+                 compression_enabled: bool = True,
+                 cache: Optional[TieredCache] = None,
+                 namespace: str = "ai_responses"):
         """
         Initialize AI response cache.
         
         Args:
-            max_size_mb: Maximum cache size in MB
-            max_entries: Maximum number of cache entries
+            max_size_mb: Maximum in-memory cache size in MB
+            max_entries: Maximum number of in-memory cache entries
             default_ttl: Default time-to-live for cached responses
             compression_enabled: Whether to enable compression
+            cache: Tiered cache engine (defaults to the global one)
+            namespace: Namespace for AI response entries
         """
         self.max_size_mb = max_size_mb
         self.max_entries = max_entries
         self.default_ttl = default_ttl
         self.compression_enabled = compression_enabled
         
-        self._cache: Dict[str, AIResponseEntry] = {}
-        self._lock = threading.RLock()
+        # Responses cost API calls to regenerate, so they persist to disk
+        self._cache = (cache or get_tiered_cache()).namespace(
+            namespace,
+            ttl=default_ttl,
+            persist=True,
+            max_size_mb=max_size_mb,
+            max_entries=max_entries
+        )
         self._logger = logging.getLogger(__name__)
         
         # TTL strategies for different response types
@@ -183,13 +195,6 @@ class AIResponseCache:
             ResponseType.TRANSLATION: 86400.0,          # 24 hours
             ResponseType.SUMMARIZATION: 3600.0,         # 1 hour
         }
-        
-        # Start cleanup thread
-        self._cleanup_thread = threading.Thread(
-            target=self._cleanup_loop,
-            daemon=True
-        )
-        self._cleanup_thread.start()
     
     def _generate_key(self, service_type: AIServiceType, response_type: ResponseType,
                      request_params: Dict[str, Any]) -> str:
@@ -305,20 +310,12 @@ class AIResponseCache:
             Cached response data or None
         """
         key = self._generate_key(service_type, response_type, request_params)
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
         
-        with self._lock:
-            if key in self._cache:
-                entry = self._cache[key]
-                
-                # Check if entry is still valid
-                if not entry.is_expired:
-                    entry.access()
-                    return entry.get_decompressed_data()
-                else:
-                    # Remove expired entry
-                    del self._cache[key]
-        
-        return None
+        entry.access()
+        return entry.get_decompressed_data()
     
     def set(self, service_type: AIServiceType, response_type: ResponseType,
            request_params: Dict[str, Any], response_data: Any,
@@ -352,72 +349,20 @@ class AIResponseCache:
             compression_ratio=compression_ratio
         )
         
-        with self._lock:
-            # Check if we need to make space
-            self._ensure_space(entry.size_mb)
-            
-            self._cache[key] = entry
-    
-    def _ensure_space(self, required_mb: float) -> None:
-        """Ensure there's enough space in cache.
-        
-        Args:
-            required_mb: Required space in MB
-        """
-        current_size = self.get_size_mb()
-        
-        # Remove entries if cache is too full
-        while (len(self._cache) >= self.max_entries or 
-               current_size + required_mb > self.max_size_mb):
-            
-            if not self._cache:
-                break
-            
-            # Find entry to remove (LRU with cost consideration)
-            removal_key = self._select_removal_candidate()
-            if removal_key:
-                removed_entry = self._cache.pop(removal_key)
-                current_size -= removed_entry.size_mb
-            else:
-                break
-    
-    def _select_removal_candidate(self) -> Optional[str]:
-        """Select cache entry for removal.
-        
-        Returns:
-            Key of entry to remove
-        """
-        if not self._cache:
-            return None
-        
-        # Score entries based on multiple factors
-        scored_entries = []
-        
-        for key, entry in self._cache.items():
-            # Factors: age, access frequency, cost, size
-            age_score = entry.age_seconds / entry.ttl_seconds  # Higher = older
-            access_score = 1.0 / (entry.access_count + 1)      # Higher = less accessed
-            cost_score = 1.0 / (entry.api_cost + 0.01)         # Higher = cheaper to regenerate
-            size_score = entry.size_mb                          # Higher = larger
-            
-            # Weighted combination
-            total_score = (age_score * 0.3 + access_score * 0.3 + 
-                          cost_score * 0.2 + size_score * 0.2)
-            
-            scored_entries.append((total_score, key))
-        
-        # Return key with highest removal score
-        scored_entries.sort(reverse=True)
-        return scored_entries[0][1]
+        self._cache.set(
+            key,
+            entry,
+            ttl=ttl,
+            tags=[f"service:{service_type.value}", f"type:{response_type.value}"]
+        )
     
     def get_size_mb(self) -> float:
-        """Get current cache size in MB.
+        """Get current in-memory cache size in MB.
         
         Returns:
             Cache size in MB
         """
-        with self._lock:
-            return sum(entry.size_mb for entry in self._cache.values())
+        return self._cache.size_bytes() / 1024 / 1024
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics.
@@ -425,37 +370,42 @@ class AIResponseCache:
         Returns:
             Cache statistics
         """
-        with self._lock:
-            total_accesses = sum(entry.access_count for entry in self._cache.values())
-            total_cost_saved = sum(entry.api_cost * entry.access_count for entry in self._cache.values())
-            avg_compression = sum(entry.compression_ratio for entry in self._cache.values()) / len(self._cache) if self._cache else 1.0
-            
-            service_distribution = defaultdict(int)
-            response_type_distribution = defaultdict(int)
-            
-            for entry in self._cache.values():
-                service_distribution[entry.service_type.value] += 1
-                response_type_distribution[entry.response_type.value] += 1
-            
-            return {
-                'entries': len(self._cache),
-                'max_entries': self.max_entries,
-                'size_mb': self.get_size_mb(),
-                'max_size_mb': self.max_size_mb,
-                'utilization_percent': (len(self._cache) / self.max_entries) * 100,
-                'size_utilization_percent': (self.get_size_mb() / self.max_size_mb) * 100,
-                'total_accesses': total_accesses,
-                'total_cost_saved': total_cost_saved,
-                'avg_compression_ratio': avg_compression,
-                'service_distribution': dict(service_distribution),
-                'response_type_distribution': dict(response_type_distribution),
-                'compression_enabled': self.compression_enabled
-            }
+        entries = [entry for _, entry in self._cache.items()]
+        total_accesses = sum(entry.access_count for entry in entries)
+        total_cost_saved = sum(entry.api_cost * entry.access_count for entry in entries)
+        avg_compression = sum(entry.compression_ratio for entry in entries) / len(entries) if entries else 1.0
+        
+        service_distribution = defaultdict(int)
+        response_type_distribution = defaultdict(int)
+        
+        for entry in entries:
+            service_distribution[entry.service_type.value] += 1
+            response_type_distribution[entry.response_type.value] += 1
+        
+        size_mb = self.get_size_mb()
+        namespace_stats = self._cache.get_stats()
+        
+        return {
+            'entries': len(entries),
+            'persisted_entries': namespace_stats['l2_entries'],
+            'max_entries': self.max_entries,
+            'size_mb': size_mb,
+            'max_size_mb': self.max_size_mb,
+            'utilization_percent': (len(entries) / self.max_entries) * 100,
+            'size_utilization_percent': (size_mb / self.max_size_mb) * 100,
+            'total_accesses': total_accesses,
+            'total_cost_saved': total_cost_saved,
+            'avg_compression_ratio': avg_compression,
+            'service_distribution': dict(service_distribution),
+            'response_type_distribution': dict(response_type_distribution),
+            'compression_enabled': self.compression_enabled,
+            'hit_rate': namespace_stats['hit_rate'],
+            'evictions': namespace_stats['evictions']
+        }
     
     def clear(self) -> None:
         """Clear all cached responses."""
-        with self._lock:
-            self._cache.clear()
+        self._cache.clear()
     
     def invalidate_service(self, service_type: AIServiceType) -> int:
         """Invalidate all entries for a specific service.
@@ -466,41 +416,7 @@ class AIResponseCache:
         Returns:
             Number of entries removed
         """
-        with self._lock:
-            keys_to_remove = [
-                key for key, entry in self._cache.items()
-                if entry.service_type == service_type
-            ]
-            
-            for key in keys_to_remove:
-                del self._cache[key]
-            
-            return len(keys_to_remove)
-    
-    def _cleanup_loop(self) -> None:
-        """Cleanup expired entries periodically."""
-        while True:
-            try:
-                time.sleep(300)  # Check every 5 minutes
-                
-                expired_keys = []
-                
-                with self._lock:
-                    for key, entry in self._cache.items():
-                        if entry.is_expired:
-                            expired_keys.append(key)
-                
-                # Remove expired entries
-                if expired_keys:
-                    with self._lock:
-                        for key in expired_keys:
-                            if key in self._cache:
-                                del self._cache[key]
-                    
-                    self._logger.debug(f"Cleaned up {len(expired_keys)} expired AI response cache entries")
-                
-            except Exception as e:
-                self._logger.error(f"Error in AI response cache cleanup: {e}")
+        return self._cache.invalidate_tags([f"service:{service_type.value}"])
 
 
 class AIResponseOptimizer:
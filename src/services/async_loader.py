@@ -15,6 +15,8 @@ from enum import Enum
 import threading
 from pathlib import Path
 
+from ..utils.dependency_scheduler import DependencyScheduler, ScheduledTask, TaskOutcome
+
 
 class LoadingPriority(Enum):
     """Loading priority levels for task scheduling."""
@@ -75,12 +77,14 @@ class AsyncLoader:
         
         # Progress tracking
         self.progress_callbacks: List[Callable] = []
+        self.completion_callbacks: List[Callable[[LoadingResult], None]] = []
         self.total_tasks = 0
         self.completed_tasks = 0
         
         # State management
         self.is_loading = False
         self.cancelled = False
+        self.scheduler: Optional[DependencyScheduler] = None
         
         self.logger.info(f"AsyncLoader initialized with {max_workers} workers")
     
@@ -101,6 +105,14 @@ class AsyncLoader:
         """
         self.progress_callbacks.append(callback)
     
+    def add_completion_callback(self, callback: Callable[[LoadingResult], None]) -> None:
+        """Add a callback run as each prioritized task finishes.
+        
+        Args:
+            callback: Function that receives the task's LoadingResult
+        """
+        self.completion_callbacks.append(callback)
+    
     async def load_parallel(self, tasks: Dict[str, Callable]) -> Dict[str, Any]:
         """Load multiple components in parallel.
         
@@ -207,157 +219,101 @@ class AsyncLoader:
     
     async def load_with_priorities(self) -> Dict[str, LoadingResult]:
         """Load all registered tasks respecting priority and dependencies.
-        
+
+        Each task starts as soon as its own dependencies have succeeded;
+        priority only orders tasks that become ready at the same time. A task
+        whose dependency failed is not run.
+
         Returns:
             Dictionary of task results
         """
         if not self.tasks:
             self.logger.warning("No tasks registered for loading")
             return {}
-        
+
         self.is_loading = True
         self.cancelled = False
         self.total_tasks = len(self.tasks)
         self.completed_tasks = 0
-        
-        # Sort tasks by priority
-        sorted_tasks = sorted(
-            self.tasks.values(),
-            key=lambda t: (t.priority.value, t.name)
-        )
-        
-        # Group by priority for parallel execution within priority levels
-        priority_groups = {}
-        for task in sorted_tasks:
-            if task.priority not in priority_groups:
-                priority_groups[task.priority] = []
-            priority_groups[task.priority].append(task)
-        
-        results = {}
-        
-        # Execute each priority group
-        for priority in LoadingPriority:
-            if priority not in priority_groups or self.cancelled:
-                continue
-                
-            group_tasks = priority_groups[priority]
-            self.logger.info(f"Loading {len(group_tasks)} {priority.name} priority tasks")
-            
-            # Execute tasks in this priority group in parallel
-            group_results = await self._execute_task_group(group_tasks)
-            results.update(group_results)
-        
-        self.is_loading = False
-        self.logger.info(f"Completed loading {len(results)} tasks")
-        return results
-    
-    async def _execute_task_group(self, tasks: List[LoadingTask]) -> Dict[str, LoadingResult]:
-        """Execute a group of tasks with the same priority.
-        
+        self.results = {}
+
+        self.scheduler = DependencyScheduler(max_workers=self.max_workers, name="services")
+        cached: Dict[str, bool] = {}
+        for task in self.tasks.values():
+            self.scheduler.add_task(ScheduledTask(
+                name=task.name,
+                func=self._cached_call(task, cached),
+                dependencies=list(task.dependencies),
+                priority=task.priority.value,
+                timeout=task.timeout,
+                attempts=max(1, task.retry_count),
+            ))
+
+        def on_task_complete(outcome: TaskOutcome):
+            result = LoadingResult(
+                task_name=outcome.name,
+                success=outcome.success,
+                data=outcome.result,
+                error=outcome.error,
+                duration=outcome.duration,
+                from_cache=cached.get(outcome.name, False),
+            )
+            self.results[outcome.name] = result
+            if outcome.success:
+                self.logger.info(f"Successfully executed {outcome.name} in {outcome.duration:.2f}s")
+            else:
+                self.logger.error(f"Task {outcome.name} failed: {outcome.error}")
+            for callback in self.completion_callbacks:
+                try:
+                    callback(result)
+                except Exception as e:
+                    self.logger.error(f"Completion callback failed: {e}")
+            self._mark_task_completed(outcome.name)
+
+        try:
+            await self.scheduler.run_async(on_task_complete, executor=self.executor)
+        finally:
+            self.is_loading = False
+
+        self.logger.info(f"Completed loading {len(self.results)} tasks")
+        return dict(self.results)
+
+    def _cached_call(self, task: LoadingTask, cached: Dict[str, bool]) -> Callable:
+        """Wrap a task function with the result cache.
+
         Args:
-            tasks: List of tasks to execute
-            
+            task: Task to wrap
+            cached: Records which tasks were answered from the cache
+
         Returns:
-            Dictionary of task results
+            Function for the scheduler to run
         """
-        results = {}
-        
-        async def execute_single_task(task: LoadingTask) -> LoadingResult:
-            """Execute a single task with retry logic."""
-            start_time = time.time()
-            
-            # Check dependencies
-            for dep in task.dependencies:
-                if dep not in results or not results[dep].success:
-                    error_msg = f"Dependency {dep} not satisfied for task {task.name}"
-                    self.logger.error(error_msg)
-                    return LoadingResult(
-                        task_name=task.name,
-                        success=False,
-                        error=Exception(error_msg),
-                        duration=time.time() - start_time
-                    )
-            
-            # Check cache
+        def call():
             if self.cache_enabled and task.cache_key and task.cache_key in self.cache:
                 cached_data, timestamp = self.cache[task.cache_key]
                 if time.time() - timestamp < self.cache_ttl:
                     self.logger.info(f"Using cached result for {task.name}")
-                    result = LoadingResult(
-                        task_name=task.name,
-                        success=True,
-                        data=cached_data,
-                        duration=time.time() - start_time,
-                        from_cache=True
-                    )
-                    self._mark_task_completed(task.name)
-                    return result
-            
-            # Execute with retries
-            last_error = None
-            for attempt in range(task.retry_count):
-                if self.cancelled:
-                    break
-                    
-                try:
-                    self.logger.info(f"Executing {task.name} (attempt {attempt + 1}/{task.retry_count})")
-                    
-                    # Execute with timeout
-                    loop = asyncio.get_event_loop()
-                    data = await asyncio.wait_for(
-                        loop.run_in_executor(self.executor, task.func),
-                        timeout=task.timeout
-                    )
-                    
-                    # Cache result
-                    if self.cache_enabled and task.cache_key:
-                        self.cache[task.cache_key] = (data, time.time())
-                    
-                    duration = time.time() - start_time
-                    self.logger.info(f"Successfully executed {task.name} in {duration:.2f}s")
-                    
-                    result = LoadingResult(
-                        task_name=task.name,
-                        success=True,
-                        data=data,
-                        duration=duration
-                    )
-                    
-                    self._mark_task_completed(task.name)
-                    return result
-                    
-                except Exception as e:
-                    last_error = e
-                    self.logger.warning(f"Attempt {attempt + 1} failed for {task.name}: {e}")
-                    
-                    if attempt < task.retry_count - 1:
-                        await asyncio.sleep(0.5 * (attempt + 1))  # Exponential backoff
-            
-            # All attempts failed
-            duration = time.time() - start_time
-            self.logger.error(f"Task {task.name} failed after {task.retry_count} attempts")
-            
-            result = LoadingResult(
-                task_name=task.name,
-                success=False,
-                error=last_error,
-                duration=duration
-            )
-            
-            self._mark_task_completed(task.name)
-            return result
-        
-        # Execute all tasks in the group concurrently
-        task_results = await asyncio.gather(*[
-            execute_single_task(task) for task in tasks
-        ])
-        
-        # Convert to dictionary
-        for result in task_results:
-            results[result.task_name] = result
-        
-        return results
-    
+                    cached[task.name] = True
+                    return cached_data
+
+            self.logger.info(f"Executing {task.name}")
+            data = task.func()
+            if self.cache_enabled and task.cache_key:
+                self.cache[task.cache_key] = (data, time.time())
+            return data
+
+        return call
+
+    def get_schedule_report(self) -> Dict[str, Any]:
+        """Timings and critical path of the last load_with_priorities run.
+
+        Returns:
+            Dictionary from DependencyScheduler.get_report
+        """
+        if self.scheduler is None:
+            return {"status": "not_run"}
+        return self.scheduler.get_report()
+
     def _update_progress(self, task_name: str, progress: float, error: str = None):
         """Update progress and notify callbacks.
         
@@ -390,6 +346,8 @@ class AsyncLoader:
     def cancel_loading(self):
         """Cancel all ongoing loading operations."""
         self.cancelled = True
+        if self.scheduler is not None:
+            self.scheduler.cancel()
         self.logger.info("Loading operations cancelled")
     
     def clear_cache(self):
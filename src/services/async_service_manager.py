@@ -38,6 +38,10 @@ class AsyncServiceManager:
         if progress_callback:
             self.loader.add_progress_callback(self._on_progress_update)
         
+        # Publish each service as soon as it loads so dependents started
+        # right after it can find it
+        self.loader.add_completion_callback(self._on_service_loaded)
+        
         # Service initialization status
         self.is_initialized = False
         self.initialization_time = 0.0
@@ -57,6 +61,15 @@ class AsyncServiceManager:
             except Exception as e:
                 self.logger.error(f"Progress callback failed: {e}")
     
+    def _on_service_loaded(self, result: LoadingResult):
+        """Store a service as soon as its initializer succeeds.
+        
+        Args:
+            result: Loading result of the service's task
+        """
+        if result.success and result.data is not None:
+            self.services[result.task_name] = result.data
+    
     def _setup_loading_tasks(self):
         """Setup all loading tasks with proper priorities and dependencies."""
         # Critical services (must load first)
@@ -312,13 +325,12 @@ class AsyncServiceManager:
             # Setup loading tasks
             self._setup_loading_tasks()
             
-            # Execute all tasks with priority handling
+            # Execute all tasks; each starts once its dependencies are loaded
             results = await self.loader.load_with_priorities()
             
-            # Store successful services
+            # Successful services were stored as they completed
             for task_name, result in results.items():
                 if result.success and result.data is not None:
-                    self.services[task_name] = result.data
                     self.logger.info(f"Service {task_name} loaded successfully")
                 else:
                     self.logger.warning(f"Service {task_name} failed to load: {result.error}")
@@ -335,6 +347,9 @@ class AsyncServiceManager:
                 f"Service initialization completed: {successful_services}/{total_services} "
                 f"services loaded in {self.initialization_time:.2f}s"
             )
+            critical_path = self.get_startup_schedule().get("critical_path") or []
+            if critical_path:
+                self.logger.info(f"Critical path: {' → '.join(critical_path)}")
             
             return results
             
@@ -394,6 +409,14 @@ class AsyncServiceManager:
         """
         return service_name in self.services and self.services[service_name] is not None
     
+    def get_startup_schedule(self) -> Dict[str, Any]:
+        """Get per-service timings and the critical path of initialization.
+        
+        Returns:
+            Dictionary with makespan, parallelism, critical path and task timings
+        """
+        return self.loader.get_schedule_report()
+    
     def get_initialization_summary(self) -> Dict[str, Any]:
         """Get a summary of the initialization process.
         
@@ -413,6 +436,7 @@ class AsyncServiceManager:
             "failed_services": failed,
             "initialization_time": self.initialization_time,
             "cache_stats": self.loader.get_cache_stats(),
+            "critical_path": self.get_startup_schedule().get("critical_path", []),
             "services": list(self.services.keys())
         }
     
@@ -1,11 +1,22 @@
 """Cache services for performance optimization.
 
-Provides memory and file-based caching with TTL and automatic cleanup.
+Provides memory and file-based caching with TTL and automatic cleanup,
+and a unified L1/L2 tiered cache engine shared across subsystems.
 """
 
 from .cache_service import CacheService, CacheStats, CacheEntry, CacheDecorator, get_cache
 from .memory_cache import MemoryCache, WeakValueCache, get_memory_cache, cache_ui_component, get_ui_component
 from .file_cache import FileCache, FileCacheEntry, get_file_cache
+from .persistent_store import (
+    CacheBackend, SQLiteCacheBackend, JSONFileCacheBackend,
+    PersistentCacheStore, create_cache_backend, migrate_json_cache
+)
+from .sweeper import CacheSweeper, get_cache_sweeper
+from .tiered_cache import (
+    TieredCache, CacheNamespace, NamespacePolicy, NamespaceStats,
+    DiskCacheTier, FrequencySketch, estimate_size, get_tiered_cache
+)
+from .geocode_store import GeocodeStore, GeocodeEntry, normalize_geocode_query, get_geocode_store
 from .cache_manager import (
     CacheManager, CacheLevel, CachePolicy, 
     CacheDecorator as ManagerDecorator, 
@@ -33,6 +44,32 @@ __all__ = [
     'FileCacheEntry',
     'get_file_cache',
     
+    # Persistent store
+    'CacheBackend',
+    'SQLiteCacheBackend',
+    'JSONFileCacheBackend',
+    'PersistentCacheStore',
+    'create_cache_backend',
+    'migrate_json_cache',
+    
+    # Tiered cache
+    'TieredCache',
+    'CacheNamespace',
+    'NamespacePolicy',
+    'NamespaceStats',
+    'DiskCacheTier',
+    'FrequencySketch',
+    'estimate_size',
+    'get_tiered_cache',
+    'CacheSweeper',
+    'get_cache_sweeper',
+    
+    # Geocode store
+    'GeocodeStore',
+    'GeocodeEntry',
+    'normalize_geocode_query',
+    'get_geocode_store',
+    
     # Cache manager
     'CacheManager',
     'CacheLevel',
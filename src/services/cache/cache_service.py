@@ -1,6 +1,8 @@
 """Cache service implementation with TTL and performance monitoring.
 
 Provides caching functionality for API responses, database queries, and computed results.
+Entries are kept in recency order in an OrderedDict with incrementally maintained
+byte accounting, so get, set and eviction are O(1) regardless of cache size.
 """
 
 import time
@@ -8,11 +10,14 @@ import threading
 import weakref
 from typing import Any, Optional, Dict, Tuple, Callable
 from dataclasses import dataclass
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 import logging
 import json
 import hashlib
 
+from .sweeper import get_cache_sweeper
+from .tiered_cache import estimate_size
+
 
 @dataclass
 class CacheStats:
@@ -58,7 +63,8 @@ class CacheService:
                  default_ttl: float = 300,  # 5 minutes
                  max_size: int = 1000,
                  max_memory_mb: int = 100,
-                 cleanup_interval: float = 60):
+                 cleanup_interval: float = 60,
+                 low_water_ratio: float = 0.9):
         """
         Initialize cache service.
         
@@ -67,23 +73,24 @@ class CacheService:
             max_size: Maximum number of cache entries
             max_memory_mb: Maximum memory usage in MB
             cleanup_interval: Cleanup interval in seconds
+            low_water_ratio: Fraction of each limit to evict down to once a
+                limit is exceeded, so eviction runs in batches
         """
         self.default_ttl = default_ttl
         self.max_size = max_size
         self.max_memory_bytes = max_memory_mb * 1024 * 1024
         self.cleanup_interval = cleanup_interval
+        self.low_water_ratio = min(max(low_water_ratio, 0.0), 1.0)
         
-        self._cache: Dict[str, CacheEntry] = {}
+        # Least recently used first
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
         self._stats = CacheStats()
         self._lock = threading.RLock()
         self._logger = logging.getLogger(__name__)
         
-        # Start cleanup thread
-        self._cleanup_thread = threading.Thread(
-            target=self._periodic_cleanup,
-            daemon=True
-        )
-        self._cleanup_thread.start()
+        # Expired entries are removed by the shared cache sweeper
+        self._sweep_task = f"cache-service-{id(self):x}"
+        get_cache_sweeper().register(self._sweep_task, self._cleanup_expired, cleanup_interval)
     
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache.
@@ -102,11 +109,12 @@ class CacheService:
             entry = self._cache[key]
             
             if entry.is_expired():
-                del self._cache[key]
+                self._remove(key)
                 self._stats.misses += 1
                 self._stats.evictions += 1
                 return None
             
+            self._cache.move_to_end(key)
             self._stats.hits += 1
             return entry.access()
     
@@ -125,16 +133,13 @@ class CacheService:
         size = self._estimate_size(value)
         
         with self._lock:
-            # Check memory limits
-            if self._would_exceed_memory(size):
-                self._evict_lru()
+            # Replacing a key releases its old size first
+            self._remove(key)
             
-            # Check size limits
-            if len(self._cache) >= self.max_size:
-                self._evict_lru()
+            if self._would_exceed_memory(size) or len(self._cache) >= self.max_size:
+                self._evict_to_low_water(size)
             
-            entry = CacheEntry(value, ttl, size)
-            self._cache[key] = entry
+            self._cache[key] = CacheEntry(value, ttl, size)
             self._stats.memory_usage += size
     
     def delete(self, key: str) -> bool:
@@ -147,9 +152,7 @@ class CacheService:
             True if entry was deleted, False if not found
         """
         with self._lock:
-            if key in self._cache:
-                entry = self._cache.pop(key)
-                self._stats.memory_usage -= entry.size
+            if self._remove(key):
                 self._stats.evictions += 1
                 return True
             return False
@@ -240,22 +243,9 @@ class CacheService:
             return len(keys_to_delete)
     
     def _estimate_size(self, value: Any) -> int:
-        """Estimate memory size of value."""
+        """Estimate memory size of value (computed once per set, never re-serialized)."""
         try:
-            if isinstance(value, (str, bytes)):
-                return len(value)
-            elif isinstance(value, (int, float, bool)):
-                return 8
-            elif isinstance(value, (list, tuple)):
-                return sum(self._estimate_size(item) for item in value)
-            elif isinstance(value, dict):
-                return sum(
-                    self._estimate_size(k) + self._estimate_size(v)
-                    for k, v in value.items()
-                )
-            else:
-                # Fallback to JSON serialization size
-                return len(json.dumps(value, default=str))
+            return estimate_size(value)
         except Exception:
             return 1024  # Default estimate
     
@@ -263,31 +253,54 @@ class CacheService:
         """Check if adding size would exceed memory limit."""
         return self._stats.memory_usage + additional_size > self.max_memory_bytes
     
+    def _remove(self, key: str) -> bool:
+        """Remove an entry and release its size."""
+        entry = self._cache.pop(key, None)
+        if entry is None:
+            return False
+        self._stats.memory_usage -= entry.size
+        return True
+    
     def _evict_lru(self) -> None:
         """Evict least recently used entry."""
         if not self._cache:
             return
         
-        # Find LRU entry
-        lru_key = min(
-            self._cache.keys(),
-            key=lambda k: self._cache[k].last_access
-        )
-        
-        entry = self._cache.pop(lru_key)
+        lru_key, entry = self._cache.popitem(last=False)
         self._stats.memory_usage -= entry.size
         self._stats.evictions += 1
         
         self._logger.debug(f"Evicted LRU entry: {lru_key}")
     
-    def _periodic_cleanup(self) -> None:
-        """Periodic cleanup of expired entries."""
-        while True:
-            try:
-                time.sleep(self.cleanup_interval)
-                self._cleanup_expired()
-            except Exception as e:
-                self._logger.error(f"Error in cache cleanup: {e}")
+    def _evict_to_low_water(self, incoming_size: int = 0) -> int:
+        """Evict least recently used entries until below the low-water mark.
+        
+        Args:
+            incoming_size: Size of the entry about to be inserted
+            
+        Returns:
+            Number of entries evicted
+        """
+        target_entries = min(int(self.max_size * self.low_water_ratio), self.max_size - 1)
+        target_bytes = self.max_memory_bytes * self.low_water_ratio - incoming_size
+        
+        evicted = 0
+        while self._cache and (
+            len(self._cache) > target_entries or self._stats.memory_usage > target_bytes
+        ):
+            _, entry = self._cache.popitem(last=False)
+            self._stats.memory_usage -= entry.size
+            evicted += 1
+        
+        self._stats.evictions += evicted
+        if evicted:
+            self._logger.debug(f"Evicted {evicted} LRU entries")
+        return evicted
+    
+    def close(self) -> None:
+        """Stop periodic cleanup and clear the cache."""
+        get_cache_sweeper().unregister(self._sweep_task)
+        self.clear()
     
     def _cleanup_expired(self) -> None:
         """Remove expired entries."""
@@ -298,8 +311,7 @@ class CacheService:
             ]
             
             for key in expired_keys:
-                entry = self._cache.pop(key)
-                self._stats.memory_usage -= entry.size
+                self._remove(key)
                 self._stats.evictions += 1
             
             if expired_keys:
@@ -0,0 +1,308 @@
+"""Persistent geocoding answer store shared by all geocoders.
+
+One SQLite (WAL) table holds answers keyed by (source, normalized query):
+"Paris,  FR" and "paris, fr" share an entry. Each source has its own TTL
+for results and a shorter one for misses, so a typo is sent to the
+provider once per negative TTL instead of on every keystroke. Expiry is
+indexed, so purging touches only expired rows, and a small in-memory LRU
+keeps hot answers off the disk.
+"""
+
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = Path("cache") / "geocode_store.db"
+
+# (result TTL, miss TTL) in seconds per geocoding source
+DEFAULT_SOURCE_TTLS: Dict[str, Tuple[float, float]] = {
+    "nominatim": (30 * 86400, 86400),
+    "openweather": (30 * 86400, 86400),
+    "google": (30 * 86400, 6 * 3600),
+}
+FALLBACK_TTLS: Tuple[float, float] = (7 * 86400, 12 * 3600)
+
+_COMMA = re.compile(r"\s*,\s*")
+_MAX_SQL_PARAMS = 900
+
+
+def normalize_geocode_query(query: str) -> str:
+    """Normalize a query for lookup ("  New York ,US" -> "new york, us")."""
+    return _COMMA.sub(", ", " ".join(query.casefold().split())).strip(", ")
+
+
+@dataclass(frozen=True)
+class GeocodeEntry:
+    """Stored geocoding answer; payload is None for a cached miss."""
+
+    source: str
+    query: str
+    payload: Any
+    created_at: float
+    expires_at: float
+
+    @property
+    def is_negative(self) -> bool:
+        """Whether this entry records that the query had no results."""
+        return self.payload is None
+
+
+class GeocodeStore:
+    """SQLite geocoding store with negative caching and per-source TTLs."""
+
+    def __init__(
+        self,
+        db_path: Union[str, Path] = DEFAULT_DB_PATH,
+        source_ttls: Optional[Dict[str, Tuple[float, float]]] = None,
+        memory_entries: int = 1024,
+    ):
+        """
+        Initialize geocode store.
+
+        Args:
+            db_path: Database file path
+            source_ttls: {source: (result_ttl, miss_ttl)} overriding the defaults
+            memory_entries: Entries kept in the in-memory LRU
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.source_ttls = dict(DEFAULT_SOURCE_TTLS)
+        self.source_ttls.update(source_ttls or {})
+        self.memory_entries = memory_entries
+
+        self._memory: "OrderedDict[Tuple[str, str], GeocodeEntry]" = OrderedDict()
+        self._stats = {"hits": 0, "negative_hits": 0, "misses": 0, "writes": 0}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS geocode_entries (
+                source TEXT NOT NULL,
+                query_key TEXT NOT NULL,
+                query TEXT NOT NULL,
+                payload TEXT,
+                created_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                PRIMARY KEY (source, query_key)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_geocode_entries_query_key "
+            "ON geocode_entries(query_key)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_geocode_entries_expires_at "
+            "ON geocode_entries(expires_at)"
+        )
+        self._conn.commit()
+
+    def ttls_for(self, source: str) -> Tuple[float, float]:
+        """(result TTL, miss TTL) for a source."""
+        return self.source_ttls.get(source, FALLBACK_TTLS)
+
+    def get(self, source: str, query: str) -> Optional[GeocodeEntry]:
+        """Get the live entry for a query, or None if unknown or expired."""
+        key = (source, normalize_geocode_query(query))
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                row = self._conn.execute(
+                    "SELECT query, payload, created_at, expires_at FROM geocode_entries "
+                    "WHERE source = ? AND query_key = ? AND expires_at > ?",
+                    (key[0], key[1], now),
+                ).fetchone()
+                if row is not None:
+                    entry = self._row_to_entry(source, row)
+                    self._remember(key, entry)
+            elif entry.expires_at <= now:
+                del self._memory[key]
+                entry = None
+            else:
+                self._memory.move_to_end(key)
+
+            if entry is None:
+                self._stats["misses"] += 1
+            elif entry.is_negative:
+                self._stats["negative_hits"] += 1
+            else:
+                self._stats["hits"] += 1
+        return entry
+
+    def put(self, source: str, query: str, payload: Any, ttl: Optional[float] = None) -> None:
+        """Store results for a query (JSON-serializable payload)."""
+        if payload is None:
+            raise ValueError("Use put_negative() to cache a miss")
+        self._write(source, query, payload, ttl if ttl is not None else self.ttls_for(source)[0])
+
+    def put_negative(self, source: str, query: str, ttl: Optional[float] = None) -> None:
+        """Record that a query had no results."""
+        self._write(source, query, None, ttl if ttl is not None else self.ttls_for(source)[1])
+
+    def _write(self, source: str, query: str, payload: Any, ttl: float) -> None:
+        now = time.time()
+        key = (source, normalize_geocode_query(query))
+        encoded = None if payload is None else json.dumps(payload, default=str)
+        entry = GeocodeEntry(source, query, payload, now, now + ttl)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO geocode_entries "
+                "(source, query_key, query, payload, created_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (source, key[1], query, encoded, now, entry.expires_at),
+            )
+            self._remember(key, entry)
+            self._stats["writes"] += 1
+
+    def invalidate(self, query: str, source: Optional[str] = None) -> int:
+        """Drop a query's entries (for one source or all)."""
+        query_key = normalize_geocode_query(query)
+        with self._lock, self._conn:
+            if source is None:
+                cursor = self._conn.execute(
+                    "DELETE FROM geocode_entries WHERE query_key = ?", (query_key,)
+                )
+            else:
+                cursor = self._conn.execute(
+                    "DELETE FROM geocode_entries WHERE source = ? AND query_key = ?",
+                    (source, query_key),
+                )
+            for key in [k for k in self._memory if k[1] == query_key and source in (None, k[0])]:
+                del self._memory[key]
+            return cursor.rowcount
+
+    def purge_expired(self) -> int:
+        """Delete expired entries (an index range scan on expires_at)."""
+        now = time.time()
+        with self._lock:
+            with self._conn:
+                cursor = self._conn.execute(
+                    "DELETE FROM geocode_entries WHERE expires_at <= ?", (now,)
+                )
+            for key in [k for k, entry in self._memory.items() if entry.expires_at <= now]:
+                del self._memory[key]
+            return cursor.rowcount
+
+    def warm_up(
+        self,
+        queries: Iterable[str],
+        resolver: Optional[Callable[[str], Any]] = None,
+        max_resolve: int = 10,
+    ) -> int:
+        """Preload stored answers for likely queries (favourites, recent searches).
+
+        Live entries for every source are read in batched IN queries into the
+        in-memory LRU. If a resolver is given, up to max_resolve queries with
+        no live entry are passed to it on a background thread, so their first
+        search is answered from the store; the resolver is expected to go
+        through the normal geocoding path, which stores its answer.
+
+        Args:
+            queries: Candidate queries
+            resolver: Optional callable resolving one query
+            max_resolve: Maximum queries handed to the resolver
+
+        Returns:
+            Number of entries loaded into memory
+        """
+        originals: Dict[str, str] = {}
+        for query in queries:
+            if query and query.strip():
+                originals.setdefault(normalize_geocode_query(query), query.strip())
+        if not originals:
+            return 0
+
+        now = time.time()
+        found = set()
+        loaded = 0
+        keys = list(originals)
+        with self._lock:
+            for start in range(0, len(keys), _MAX_SQL_PARAMS):
+                chunk = keys[start:start + _MAX_SQL_PARAMS]
+                rows = self._conn.execute(
+                    "SELECT source, query_key, query, payload, created_at, expires_at "
+                    f"FROM geocode_entries WHERE query_key IN ({','.join('?' * len(chunk))}) "
+                    "AND expires_at > ?",
+                    (*chunk, now),
+                ).fetchall()
+                for source, query_key, *rest in rows:
+                    self._remember((source, query_key), self._row_to_entry(source, rest))
+                    found.add(query_key)
+                    loaded += 1
+
+        missing = [originals[key] for key in keys if key not in found][:max_resolve]
+        if resolver and missing:
+            def resolve_missing():
+                for query in missing:
+                    try:
+                        resolver(query)
+                    except Exception as e:
+                        logger.debug(f"Geocode warm-up failed for {query}: {e}")
+
+            threading.Thread(target=resolve_missing, name="geocode-warm-up", daemon=True).start()
+
+        logger.debug(
+            f"🗺️ Geocode warm-up: {loaded} entries loaded, {len(missing)} queries resolving"
+        )
+        return loaded
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics."""
+        with self._lock:
+            total, negative = self._conn.execute(
+                "SELECT COUNT(*), COUNT(*) - COUNT(payload) FROM geocode_entries"
+            ).fetchone()
+            stats = dict(self._stats)
+            stats.update(
+                {"entries": total, "negative_entries": negative, "memory_entries": len(self._memory)}
+            )
+        return stats
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM geocode_entries")
+            self._memory.clear()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _row_to_entry(self, source: str, row) -> GeocodeEntry:
+        query, payload, created_at, expires_at = row
+        return GeocodeEntry(
+            source, query, None if payload is None else json.loads(payload), created_at, expires_at
+        )
+
+    def _remember(self, key: Tuple[str, str], entry: GeocodeEntry) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+
+# Global geocode store instance
+_global_geocode_store: Optional[GeocodeStore] = None
+_geocode_store_lock = threading.Lock()
+
+
+def get_geocode_store() -> GeocodeStore:
+    """Get the global geocode store."""
+    global _global_geocode_store
+    with _geocode_store_lock:
+        if _global_geocode_store is None:
+            _global_geocode_store = GeocodeStore()
+        return _global_geocode_store
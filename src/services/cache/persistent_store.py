@@ -0,0 +1,446 @@
+"""Persistent key/entry store with pluggable disk backends.
+
+Keeps an in-memory key index, loads entry values lazily on first access and
+writes only the entries that changed, so persisting one city costs the size
+of that city's entry rather than the size of everything ever cached.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import MutableMapping
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Set, Tuple, Union
+
+from .sweeper import get_cache_sweeper
+
+
+def entry_timestamp(entry: Dict[str, Any]) -> float:
+    """Get the epoch timestamp of a cache entry ({"data", "timestamp", "ttl"})."""
+    value = entry.get("timestamp") if isinstance(entry, dict) else None
+    try:
+        if isinstance(value, str):
+            return datetime.fromisoformat(value).timestamp()
+        if isinstance(value, datetime):
+            return value.timestamp()
+        if isinstance(value, (int, float)):
+            return float(value)
+    except (ValueError, OverflowError, OSError):
+        pass
+    return time.time()
+
+
+class CacheBackend(ABC):
+    """Disk backend for PersistentCacheStore."""
+
+    @abstractmethod
+    def load_index(self) -> Dict[str, Tuple[float, Optional[float]]]:
+        """Load the key index as {key: (timestamp, ttl)} without entry values."""
+
+    @abstractmethod
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load one entry value, or None if missing."""
+
+    @abstractmethod
+    def write(self, upserts: Dict[str, Dict[str, Any]], deletes: Set[str]) -> None:
+        """Persist changed entries and deletions."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+    @abstractmethod
+    def compact(self, cutoff: float, default_ttl: float) -> int:
+        """Remove entries whose ttl (plus grace) expired before cutoff.
+
+        Args:
+            cutoff: Epoch time; an entry is removed if timestamp + ttl < cutoff
+            default_ttl: TTL for entries stored without one
+
+        Returns:
+            Number of entries removed
+        """
+
+    def close(self) -> None:
+        """Release backend resources."""
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """SQLite (WAL mode) backend storing one row per cache entry."""
+
+    def __init__(self, db_path: Union[str, Path]):
+        """
+        Initialize SQLite backend.
+
+        Args:
+            db_path: Database file path
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                timestamp REAL NOT NULL,
+                ttl REAL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_entries_timestamp "
+            "ON cache_entries(timestamp)"
+        )
+        self._conn.commit()
+
+    def load_index(self) -> Dict[str, Tuple[float, Optional[float]]]:
+        """Load the key index without entry values."""
+        with self._lock:
+            rows = self._conn.execute("SELECT key, timestamp, ttl FROM cache_entries").fetchall()
+        return {key: (timestamp, ttl) for key, timestamp, ttl in rows}
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load one entry value."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def write(self, upserts: Dict[str, Dict[str, Any]], deletes: Set[str]) -> None:
+        """Persist changed entries and deletions in one transaction."""
+        rows = [
+            (key, json.dumps(entry, default=str), entry_timestamp(entry), entry.get("ttl"))
+            for key, entry in upserts.items()
+        ]
+        with self._lock, self._conn:
+            if rows:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO cache_entries (key, value, timestamp, ttl) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+            if deletes:
+                self._conn.executemany(
+                    "DELETE FROM cache_entries WHERE key = ?", [(key,) for key in deletes]
+                )
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache_entries")
+
+    def compact(self, cutoff: float, default_ttl: float) -> int:
+        """Remove expired rows and checkpoint the WAL."""
+        with self._lock:
+            with self._conn:
+                cursor = self._conn.execute(
+                    "DELETE FROM cache_entries WHERE timestamp + COALESCE(ttl, ?) < ?",
+                    (default_ttl, cutoff),
+                )
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class JSONFileCacheBackend(CacheBackend):
+    """Legacy backend that keeps the whole cache in one JSON document."""
+
+    def __init__(self, file_path: Union[str, Path]):
+        """
+        Initialize JSON file backend.
+
+        Args:
+            file_path: JSON file path
+        """
+        self.file_path = Path(file_path)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        if self.file_path.exists():
+            with open(self.file_path, "r", encoding="utf-8") as f:
+                self._entries = json.load(f)
+
+    def load_index(self) -> Dict[str, Tuple[float, Optional[float]]]:
+        """Build the key index from the loaded document."""
+        with self._lock:
+            return {
+                key: (entry_timestamp(entry), entry.get("ttl"))
+                for key, entry in self._entries.items()
+            }
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load one entry value."""
+        with self._lock:
+            return self._entries.get(key)
+
+    def write(self, upserts: Dict[str, Dict[str, Any]], deletes: Set[str]) -> None:
+        """Apply changes and rewrite the document."""
+        with self._lock:
+            self._entries.update(upserts)
+            for key in deletes:
+                self._entries.pop(key, None)
+            self._dump()
+
+    def clear(self) -> None:
+        """Remove every entry and the file."""
+        with self._lock:
+            self._entries.clear()
+            if self.file_path.exists():
+                self.file_path.unlink()
+
+    def compact(self, cutoff: float, default_ttl: float) -> int:
+        """Remove expired entries and rewrite the document."""
+        with self._lock:
+            expired = [
+                key
+                for key, entry in self._entries.items()
+                if entry_timestamp(entry) + (entry.get("ttl") or default_ttl) < cutoff
+            ]
+            for key in expired:
+                del self._entries[key]
+            if expired:
+                self._dump()
+            return len(expired)
+
+    def _dump(self) -> None:
+        """Write the document atomically."""
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.file_path.with_suffix(".tmp")
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(self._entries, f, default=str)
+        temp_file.replace(self.file_path)
+
+
+class PersistentCacheStore(MutableMapping):
+    """Dict-like cache of {"data", "timestamp", "ttl"} entries backed by disk.
+
+    Reads hit an in-memory tier first and fall back to a per-key backend load;
+    writes are buffered as dirty keys until flush(). The shared cache sweeper
+    compacts entries whose TTL plus the stale grace period has passed.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        default_ttl: float = 3600,
+        stale_grace: float = 0,
+        compaction_interval: Optional[float] = 900,
+    ):
+        """
+        Initialize persistent cache store.
+
+        Args:
+            backend: Disk backend
+            default_ttl: TTL for entries stored without a "ttl" field
+            stale_grace: Extra seconds expired entries are kept for stale reads
+            compaction_interval: Seconds between background compactions
+                (None disables periodic compaction)
+        """
+        self.backend = backend
+        self.default_ttl = default_ttl
+        self.stale_grace = stale_grace
+        self._lock = threading.RLock()
+        self._logger = logging.getLogger(__name__)
+
+        self._index: Dict[str, Tuple[float, Optional[float]]] = backend.load_index()
+        self._loaded: Dict[str, Dict[str, Any]] = {}
+        self._dirty: Set[str] = set()
+        self._deleted: Set[str] = set()
+
+        self._sweep_task = f"persistent-store-{id(self):x}"
+        if compaction_interval:
+            get_cache_sweeper().register(self._sweep_task, self.compact, compaction_interval)
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._index
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        with self._lock:
+            entry = self._loaded.get(key)
+            if entry is not None:
+                return entry
+            if key not in self._index:
+                raise KeyError(key)
+
+            entry = self.backend.load(key)
+            if entry is None:
+                # Index and backend disagree (e.g. compacted underneath us)
+                self._index.pop(key, None)
+                raise KeyError(key)
+            self._loaded[key] = entry
+            return entry
+
+    def __setitem__(self, key: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._loaded[key] = entry
+            self._index[key] = (entry_timestamp(entry), entry.get("ttl"))
+            self._dirty.add(key)
+            self._deleted.discard(key)
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            if key not in self._index:
+                raise KeyError(key)
+            del self._index[key]
+            self._loaded.pop(key, None)
+            self._dirty.discard(key)
+            self._deleted.add(key)
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._index))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._index)
+
+    def mark_dirty(self, key: str) -> None:
+        """Mark an entry that was mutated in place for the next flush."""
+        with self._lock:
+            if key in self._loaded:
+                self._dirty.add(key)
+
+    def flush(self) -> int:
+        """Persist changed and deleted entries.
+
+        Returns:
+            Number of entries written or deleted
+        """
+        with self._lock:
+            if not self._dirty and not self._deleted:
+                return 0
+            upserts = {key: self._loaded[key] for key in self._dirty if key in self._loaded}
+            deletes = set(self._deleted)
+            self._dirty.clear()
+            self._deleted.clear()
+
+        try:
+            self.backend.write(upserts, deletes)
+        except Exception:
+            # Keep the changes pending so the next flush retries them
+            with self._lock:
+                self._dirty.update(key for key in upserts if key in self._index)
+                self._deleted.update(key for key in deletes if key not in self._index)
+            raise
+        return len(upserts) + len(deletes)
+
+    def clear(self) -> None:
+        """Remove every entry from memory and disk."""
+        with self._lock:
+            self._index.clear()
+            self._loaded.clear()
+            self._dirty.clear()
+            self._deleted.clear()
+            self.backend.clear()
+
+    def compact(self) -> int:
+        """Drop entries older than their TTL plus the stale grace period.
+
+        Returns:
+            Number of entries removed
+        """
+        self.flush()
+        cutoff = time.time() - self.stale_grace
+        removed = self.backend.compact(cutoff, self.default_ttl)
+
+        with self._lock:
+            expired = [
+                key
+                for key, (timestamp, ttl) in self._index.items()
+                if key not in self._dirty and timestamp + (ttl or self.default_ttl) < cutoff
+            ]
+            for key in expired:
+                del self._index[key]
+                self._loaded.pop(key, None)
+
+        if removed:
+            self._logger.debug(f"Compacted {removed} expired cache entries")
+        return removed
+
+    def import_entries(self, entries: Dict[str, Dict[str, Any]]) -> int:
+        """Bulk-import entries (e.g. migrating a legacy JSON cache).
+
+        Returns:
+            Number of entries imported
+        """
+        valid = {key: entry for key, entry in entries.items() if isinstance(entry, dict)}
+        with self._lock:
+            for key, entry in valid.items():
+                self._index[key] = (entry_timestamp(entry), entry.get("ttl"))
+                self._deleted.discard(key)
+        self.backend.write(valid, set())
+        return len(valid)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get store statistics."""
+        with self._lock:
+            return {
+                "backend": type(self.backend).__name__,
+                "entries": len(self._index),
+                "loaded_entries": len(self._loaded),
+                "pending_writes": len(self._dirty) + len(self._deleted),
+            }
+
+    def close(self) -> None:
+        """Flush pending changes, stop compaction and close the backend."""
+        get_cache_sweeper().unregister(self._sweep_task)
+        try:
+            self.flush()
+        finally:
+            self.backend.close()
+
+
+def migrate_json_cache(json_file: Union[str, Path], store: PersistentCacheStore) -> int:
+    """Import a legacy whole-file JSON cache into a store and retire the file.
+
+    The JSON file is renamed to ``<name>.migrated`` so the migration runs once.
+
+    Args:
+        json_file: Legacy JSON cache file
+        store: Destination store
+
+    Returns:
+        Number of entries migrated
+    """
+    json_file = Path(json_file)
+    if not json_file.exists():
+        return 0
+
+    with open(json_file, "r", encoding="utf-8") as f:
+        entries = json.load(f)
+
+    migrated = store.import_entries(entries) if isinstance(entries, dict) else 0
+    json_file.replace(json_file.with_name(json_file.name + ".migrated"))
+    logging.getLogger(__name__).info(f"Migrated {migrated} entries from {json_file.name}")
+    return migrated
+
+
+def create_cache_backend(backend: str, path: Union[str, Path]) -> CacheBackend:
+    """Create a cache backend by name.
+
+    Args:
+        backend: "sqlite" or "json"
+        path: Backend file path (suffix is adjusted to the backend)
+
+    Returns:
+        Cache backend instance
+    """
+    path = Path(path)
+    if backend == "json":
+        return JSONFileCacheBackend(path.with_suffix(".json"))
+    if backend == "sqlite":
+        return SQLiteCacheBackend(path.with_suffix(".db"))
+    raise ValueError(f"Unknown cache backend: {backend}")
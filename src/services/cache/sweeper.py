@@ -0,0 +1,166 @@
+"""Shared background sweeper for cache maintenance.
+
+Every cache in the application registers its periodic cleanup here instead of
+starting its own daemon thread, so a long-running process keeps exactly one
+maintenance thread regardless of how many caches are alive.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+
+@dataclass
+class SweepTask:
+    """Periodic maintenance task."""
+    name: str
+    func: Callable[[], Any]
+    interval: float
+    next_run: float
+    runs: int = 0
+    failures: int = 0
+    last_duration: float = 0.0
+
+
+class CacheSweeper:
+    """Single daemon thread running registered cache maintenance tasks."""
+
+    def __init__(self, min_wait: float = 1.0):
+        """
+        Initialize cache sweeper.
+
+        Args:
+            min_wait: Minimum seconds between wake-ups
+        """
+        self.min_wait = min_wait
+        self._tasks: Dict[str, SweepTask] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+        self._logger = logging.getLogger(__name__)
+
+    def register(self, name: str, func: Callable[[], Any], interval: float) -> None:
+        """Register (or replace) a periodic task.
+
+        Args:
+            name: Unique task name
+            func: Callable run every interval seconds
+            interval: Seconds between runs
+        """
+        with self._lock:
+            self._tasks[name] = SweepTask(
+                name=name,
+                func=func,
+                interval=max(float(interval), self.min_wait),
+                next_run=time.monotonic() + interval,
+            )
+            self._ensure_thread()
+        self._wakeup.set()
+
+    def unregister(self, name: str) -> bool:
+        """Remove a task.
+
+        Args:
+            name: Task name
+
+        Returns:
+            True if the task existed
+        """
+        with self._lock:
+            return self._tasks.pop(name, None) is not None
+
+    def run_now(self, name: Optional[str] = None) -> int:
+        """Run one task (or all tasks) immediately on the calling thread.
+
+        Args:
+            name: Task name, or None for every task
+
+        Returns:
+            Number of tasks run
+        """
+        with self._lock:
+            tasks = [self._tasks[name]] if name in self._tasks else (
+                list(self._tasks.values()) if name is None else []
+            )
+        for task in tasks:
+            self._run_task(task)
+        return len(tasks)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-task run statistics."""
+        with self._lock:
+            return {
+                'thread_alive': bool(self._thread and self._thread.is_alive()),
+                'tasks': {
+                    task.name: {
+                        'interval': task.interval,
+                        'runs': task.runs,
+                        'failures': task.failures,
+                        'last_duration': task.last_duration,
+                    }
+                    for task in self._tasks.values()
+                },
+            }
+
+    def shutdown(self) -> None:
+        """Stop the sweeper thread."""
+        self._stopped = True
+        self._wakeup.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=2.0)
+
+    def _ensure_thread(self) -> None:
+        """Start the sweeper thread on first registration."""
+        if self._stopped or (self._thread and self._thread.is_alive()):
+            return
+        self._thread = threading.Thread(
+            target=self._run,
+            name="CacheSweeper",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Sweeper loop: sleep until the next task is due, then run it."""
+        while not self._stopped:
+            now = time.monotonic()
+            with self._lock:
+                due = [task for task in self._tasks.values() if task.next_run <= now]
+                upcoming = min((task.next_run for task in self._tasks.values()), default=now + 60.0)
+
+            for task in due:
+                self._run_task(task)
+
+            if not due:
+                self._wakeup.wait(max(upcoming - now, self.min_wait))
+                self._wakeup.clear()
+
+    def _run_task(self, task: SweepTask) -> None:
+        """Run a task and reschedule it."""
+        start = time.monotonic()
+        try:
+            task.func()
+        except Exception as e:
+            task.failures += 1
+            self._logger.error(f"Error in cache sweep task '{task.name}': {e}")
+        finally:
+            task.runs += 1
+            task.last_duration = time.monotonic() - start
+            task.next_run = time.monotonic() + task.interval
+
+
+# Global sweeper instance
+_global_sweeper: Optional[CacheSweeper] = None
+_sweeper_lock = threading.Lock()
+
+
+def get_cache_sweeper() -> CacheSweeper:
+    """Get global cache sweeper instance."""
+    global _global_sweeper
+    with _sweeper_lock:
+        if _global_sweeper is None:
+            _global_sweeper = CacheSweeper()
+        return _global_sweeper
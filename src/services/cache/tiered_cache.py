@@ -0,0 +1,940 @@
+"""Unified two-tier cache engine.
+
+L1 is an in-process cache bounded by bytes and entry count. Entries live in an
+OrderedDict, so lookups, recency updates and evictions are O(1), and byte
+totals are maintained incrementally instead of being recomputed on eviction.
+An optional TinyLFU admission filter keeps one-off keys from pushing out hot
+ones.
+
+L2 is a SQLite file (WAL mode) holding pickled values for namespaces that opt
+into persistence; L1 misses fall through to it and promote the value back.
+
+Callers work through namespaces, each with its own TTL policy and optional
+memory budget, and can invalidate by tag across both tiers. Expired entries
+are removed by the shared CacheSweeper rather than a per-cache thread.
+"""
+
+import fnmatch
+import logging
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+from array import array
+from collections import OrderedDict, defaultdict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .sweeper import CacheSweeper, get_cache_sweeper
+
+
+_MISSING = object()
+
+LKey = Tuple[str, str]
+
+
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """Estimate the in-memory size of a value in bytes.
+
+    Bytes-like values and strings are measured exactly; containers are walked
+    a few levels deep so the estimate is computed once per set, not per eviction.
+
+    Args:
+        value: Value to measure
+
+    Returns:
+        Approximate size in bytes
+    """
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value)
+
+    size = sys.getsizeof(value)
+    if _depth >= 3:
+        return size
+
+    if isinstance(value, dict):
+        size += sum(
+            estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1)
+            for k, v in value.items()
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, _depth + 1) for item in value)
+    elif hasattr(value, "__dict__"):
+        size += estimate_size(vars(value), _depth + 1)
+    return size
+
+
+@dataclass
+class NamespacePolicy:
+    """TTL and tiering policy for a cache namespace."""
+    ttl: float = 3600.0
+    persist: bool = False
+    max_bytes: Optional[int] = None
+    max_entries: Optional[int] = None
+
+
+@dataclass
+class NamespaceStats:
+    """Counters for a cache namespace."""
+    hits: int = 0
+    l2_hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    rejections: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Calculate hit rate across both tiers."""
+        total = self.hits + self.l2_hits + self.misses
+        return (self.hits + self.l2_hits) / total if total > 0 else 0.0
+
+    def merge(self, other: "NamespaceStats") -> None:
+        """Add another namespace's counters to this one."""
+        for name, value in asdict(other).items():
+            setattr(self, name, getattr(self, name) + value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert counters to a dictionary."""
+        data = asdict(self)
+        data["hit_rate"] = self.hit_rate
+        return data
+
+
+class _L1Entry:
+    """In-memory cache entry."""
+
+    __slots__ = ("value", "size", "expires_at", "tags")
+
+    def __init__(self, value: Any, size: int, expires_at: float, tags: frozenset):
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+        self.tags = tags
+
+
+class FrequencySketch:
+    """Count-min sketch of access frequencies for TinyLFU admission.
+
+    Counters saturate at 15 and are halved after every `sample_size`
+    increments, so the sketch tracks recent popularity in fixed memory.
+    """
+
+    _SEEDS = (0x9E3779B1, 0x85EBCA77, 0xC2B2AE3D, 0x27D4EB2F)
+
+    def __init__(self, width: int = 4096):
+        """
+        Initialize frequency sketch.
+
+        Args:
+            width: Counters per row (rounded up to a power of two)
+        """
+        self._width = 1 << max(4, (int(width) - 1).bit_length())
+        self._mask = self._width - 1
+        self._rows = [array("B", bytes(self._width)) for _ in self._SEEDS]
+        self._sample_size = self._width * 10
+        self._additions = 0
+
+    def _indexes(self, key: Any) -> Iterable[Tuple[array, int]]:
+        h = hash(key)
+        for row, seed in zip(self._rows, self._SEEDS):
+            yield row, ((h ^ seed) * 0x01000193 >> 7) & self._mask
+
+    def increment(self, key: Any) -> None:
+        """Record one access of key."""
+        for row, index in self._indexes(key):
+            if row[index] < 15:
+                row[index] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._reset()
+
+    def frequency(self, key: Any) -> int:
+        """Estimate how often key was accessed recently."""
+        return min(row[index] for row, index in self._indexes(key))
+
+    def _reset(self) -> None:
+        """Halve every counter to age out old popularity."""
+        for row in self._rows:
+            for i in range(self._width):
+                row[i] >>= 1
+        self._additions //= 2
+
+
+class DiskCacheTier:
+    """SQLite-backed L2 tier storing pickled values."""
+
+    def __init__(self, db_path: Union[str, Path]):
+        """
+        Initialize disk tier.
+
+        Args:
+            db_path: SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value BLOB NOT NULL,
+                expires_at REAL NOT NULL,
+                size INTEGER NOT NULL,
+                PRIMARY KEY (namespace, key)
+            );
+            CREATE INDEX IF NOT EXISTS idx_cache_entries_expires
+                ON cache_entries(expires_at);
+            CREATE TABLE IF NOT EXISTS cache_tags (
+                tag TEXT NOT NULL,
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                PRIMARY KEY (tag, namespace, key)
+            );
+            CREATE INDEX IF NOT EXISTS idx_cache_tags_entry
+                ON cache_tags(namespace, key);
+            """
+        )
+        self._conn.commit()
+
+    def get(self, namespace: str, key: str) -> Optional[Tuple[bytes, float, frozenset]]:
+        """Load (blob, expires_at, tags) for an entry, or None if missing."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache_entries WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+            if row is None:
+                return None
+            tags = frozenset(
+                tag for (tag,) in self._conn.execute(
+                    "SELECT tag FROM cache_tags WHERE namespace = ? AND key = ?",
+                    (namespace, key),
+                )
+            )
+        return row[0], row[1], tags
+
+    def put(self, namespace: str, key: str, blob: bytes, expires_at: float, tags: frozenset) -> None:
+        """Insert or replace an entry."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (namespace, key, value, expires_at, size) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (namespace, key, sqlite3.Binary(blob), expires_at, len(blob)),
+            )
+            self._conn.execute(
+                "DELETE FROM cache_tags WHERE namespace = ? AND key = ?", (namespace, key)
+            )
+            if tags:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO cache_tags (tag, namespace, key) VALUES (?, ?, ?)",
+                    [(tag, namespace, key) for tag in tags],
+                )
+
+    def delete(self, namespace: str, key: str) -> bool:
+        """Delete an entry."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key = ?", (namespace, key)
+            )
+            self._conn.execute(
+                "DELETE FROM cache_tags WHERE namespace = ? AND key = ?", (namespace, key)
+            )
+            return cursor.rowcount > 0
+
+    def delete_tags(self, tags: Iterable[str], namespace: Optional[str] = None) -> Set[LKey]:
+        """Delete every entry carrying any of the tags.
+
+        Returns:
+            (namespace, key) pairs removed
+        """
+        tags = list(tags)
+        if not tags:
+            return set()
+        placeholders = ",".join("?" * len(tags))
+        query = f"SELECT DISTINCT namespace, key FROM cache_tags WHERE tag IN ({placeholders})"
+        params: List[Any] = list(tags)
+        if namespace is not None:
+            query += " AND namespace = ?"
+            params.append(namespace)
+
+        with self._lock, self._conn:
+            keys = {(ns, key) for ns, key in self._conn.execute(query, params)}
+            self._delete_keys(keys)
+        return keys
+
+    def delete_pattern(self, namespace: str, pattern: str) -> Set[LKey]:
+        """Delete entries in a namespace whose key matches a glob pattern."""
+        with self._lock, self._conn:
+            keys = {
+                (namespace, key) for (key,) in self._conn.execute(
+                    "SELECT key FROM cache_entries WHERE namespace = ? AND key GLOB ?",
+                    (namespace, pattern),
+                )
+            }
+            self._delete_keys(keys)
+        return keys
+
+    def clear(self, namespace: Optional[str] = None) -> int:
+        """Delete every entry, or every entry in one namespace."""
+        with self._lock, self._conn:
+            if namespace is None:
+                cursor = self._conn.execute("DELETE FROM cache_entries")
+                self._conn.execute("DELETE FROM cache_tags")
+            else:
+                cursor = self._conn.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ?", (namespace,)
+                )
+                self._conn.execute("DELETE FROM cache_tags WHERE namespace = ?", (namespace,))
+            return cursor.rowcount
+
+    def purge_expired(self, now: float, namespace: Optional[str] = None) -> int:
+        """Delete entries that expired before now."""
+        query = "SELECT namespace, key FROM cache_entries WHERE expires_at <= ?"
+        params: List[Any] = [now]
+        if namespace is not None:
+            query += " AND namespace = ?"
+            params.append(namespace)
+
+        with self._lock, self._conn:
+            keys = {(ns, key) for ns, key in self._conn.execute(query, params)}
+            self._delete_keys(keys)
+        return len(keys)
+
+    def enforce_size(self, max_bytes: int) -> int:
+        """Delete the soonest-expiring entries until the tier fits max_bytes."""
+        with self._lock, self._conn:
+            total = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM cache_entries"
+            ).fetchone()[0]
+            if total <= max_bytes:
+                return 0
+
+            keys = set()
+            for ns, key, size in self._conn.execute(
+                "SELECT namespace, key, size FROM cache_entries ORDER BY expires_at"
+            ):
+                keys.add((ns, key))
+                total -= size
+                if total <= max_bytes:
+                    break
+            self._delete_keys(keys)
+        return len(keys)
+
+    def get_statistics(self) -> Dict[str, Dict[str, int]]:
+        """Get per-namespace entry counts and sizes."""
+        with self._lock:
+            return {
+                ns: {"entries": count, "size_bytes": size}
+                for ns, count, size in self._conn.execute(
+                    "SELECT namespace, COUNT(*), COALESCE(SUM(size), 0) "
+                    "FROM cache_entries GROUP BY namespace"
+                )
+            }
+
+    def close(self) -> None:
+        """Checkpoint the WAL and close the connection."""
+        with self._lock:
+            try:
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            finally:
+                self._conn.close()
+
+    def _delete_keys(self, keys: Set[LKey]) -> None:
+        """Delete entries and their tags (caller holds the lock)."""
+        if keys:
+            self._conn.executemany(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key = ?", keys
+            )
+            self._conn.executemany(
+                "DELETE FROM cache_tags WHERE namespace = ? AND key = ?", keys
+            )
+
+
+class TieredCache:
+    """L1 memory + L2 disk cache shared by every subsystem."""
+
+    def __init__(
+        self,
+        max_memory_mb: float = 256.0,
+        max_entries: int = 100000,
+        disk_path: Optional[Union[str, Path]] = None,
+        max_disk_mb: float = 1024.0,
+        admission: str = "lru",
+        sweep_interval: float = 300.0,
+        sweeper: Optional[CacheSweeper] = None,
+    ):
+        """
+        Initialize tiered cache.
+
+        Args:
+            max_memory_mb: L1 byte budget shared by all namespaces
+            max_entries: L1 entry budget shared by all namespaces
+            disk_path: SQLite file for the L2 tier (None disables L2)
+            max_disk_mb: L2 byte budget enforced by the sweeper
+            admission: "lru" to admit every write, "tinylfu" to admit a new
+                key over a full L1 only if it is accessed more than the victim
+            sweep_interval: Seconds between expiry sweeps (0 disables them)
+            sweeper: Sweeper to register with (defaults to the global one)
+        """
+        if admission not in ("lru", "tinylfu"):
+            raise ValueError(f"Unknown admission policy: {admission}")
+
+        self.max_memory_bytes = int(max_memory_mb * 1024 * 1024)
+        self.max_entries = max_entries
+        self.max_disk_bytes = int(max_disk_mb * 1024 * 1024)
+        self.admission = admission
+
+        self._lock = threading.RLock()
+        self._logger = logging.getLogger(__name__)
+
+        self._l1: "OrderedDict[LKey, _L1Entry]" = OrderedDict()
+        self._ns_keys: Dict[str, "OrderedDict[str, None]"] = defaultdict(OrderedDict)
+        self._ns_bytes: Dict[str, int] = defaultdict(int)
+        self._tag_index: Dict[str, Set[LKey]] = defaultdict(set)
+        self._bytes = 0
+
+        self._policies: Dict[str, NamespacePolicy] = {}
+        self._stats: Dict[str, NamespaceStats] = defaultdict(NamespaceStats)
+        self._sketch = FrequencySketch(width=min(max_entries, 1 << 20)) if admission == "tinylfu" else None
+
+        self._disk: Optional[DiskCacheTier] = None
+        if disk_path is not None:
+            try:
+                self._disk = DiskCacheTier(disk_path)
+            except (sqlite3.Error, OSError) as e:
+                self._logger.warning(f"⚠️ Disk cache tier unavailable, running memory-only: {e}")
+
+        self._sweeper = sweeper or get_cache_sweeper()
+        self._sweep_task = f"tiered-cache-{id(self):x}"
+        if sweep_interval:
+            self._sweeper.register(self._sweep_task, self.sweep, sweep_interval)
+
+    # Namespaces
+
+    def configure_namespace(
+        self,
+        name: str,
+        ttl: Optional[float] = None,
+        persist: Optional[bool] = None,
+        max_size_mb: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ) -> NamespacePolicy:
+        """Create or update a namespace policy.
+
+        Args:
+            name: Namespace name
+            ttl: Default TTL in seconds for entries without an explicit TTL
+            persist: Whether entries are written through to the L2 tier
+            max_size_mb: L1 byte budget for this namespace
+            max_entries: L1 entry budget for this namespace
+
+        Returns:
+            The namespace policy
+        """
+        with self._lock:
+            policy = self._policies.setdefault(name, NamespacePolicy())
+            if ttl is not None:
+                policy.ttl = float(ttl)
+            if persist is not None:
+                policy.persist = bool(persist)
+            if max_size_mb is not None:
+                policy.max_bytes = int(max_size_mb * 1024 * 1024)
+            if max_entries is not None:
+                policy.max_entries = int(max_entries)
+            self._enforce_limits(name)
+            return policy
+
+    def namespace(self, name: str, **policy: Any) -> "CacheNamespace":
+        """Get a namespace view, applying any policy overrides.
+
+        Args:
+            name: Namespace name
+            **policy: Arguments for configure_namespace
+
+        Returns:
+            CacheNamespace bound to this engine
+        """
+        self.configure_namespace(name, **policy)
+        return CacheNamespace(self, name)
+
+    def get_policy(self, namespace: str) -> NamespacePolicy:
+        """Get the policy of a namespace (default policy if unconfigured)."""
+        with self._lock:
+            return self._policies.get(namespace) or self._policies.setdefault(namespace, NamespacePolicy())
+
+    # Core operations
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        """Get a value, falling through from L1 to L2.
+
+        Args:
+            namespace: Namespace name
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            Cached value or default
+        """
+        lkey = (namespace, key)
+        now = time.time()
+
+        with self._lock:
+            if self._sketch is not None:
+                self._sketch.increment(lkey)
+            entry = self._l1.get(lkey)
+            if entry is not None:
+                if entry.expires_at > now:
+                    self._l1.move_to_end(lkey)
+                    self._ns_keys[namespace].move_to_end(key)
+                    self._stats[namespace].hits += 1
+                    return entry.value
+                self._remove(lkey)
+                self._stats[namespace].expirations += 1
+            persist = self.get_policy(namespace).persist
+
+        if persist and self._disk is not None:
+            try:
+                row = self._disk.get(namespace, key)
+                if row is not None:
+                    blob, expires_at, tags = row
+                    if expires_at > now:
+                        value = pickle.loads(blob)
+                        with self._lock:
+                            self._stats[namespace].l2_hits += 1
+                            self._store_l1(lkey, value, len(blob), expires_at, tags)
+                        return value
+                    self._disk.delete(namespace, key)
+            except Exception as e:
+                self._logger.warning(f"⚠️ Disk cache read failed for {namespace}/{key}: {e}")
+
+        with self._lock:
+            self._stats[namespace].misses += 1
+        return default
+
+    def set(
+        self,
+        namespace: str,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        tags: Optional[Iterable[str]] = None,
+        size: Optional[int] = None,
+    ) -> bool:
+        """Store a value in L1 and, for persistent namespaces, L2.
+
+        Args:
+            namespace: Namespace name
+            key: Cache key
+            value: Value to cache
+            ttl: TTL in seconds (defaults to the namespace TTL)
+            tags: Tags for group invalidation
+            size: Size in bytes if already known
+
+        Returns:
+            True if the value was stored in at least one tier
+        """
+        policy = self.get_policy(namespace)
+        expires_at = time.time() + (policy.ttl if ttl is None else float(ttl))
+        tag_set = frozenset(tags or ())
+
+        blob = None
+        if policy.persist and self._disk is not None:
+            try:
+                blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception as e:
+                self._logger.warning(f"⚠️ Value for {namespace}/{key} is not picklable, caching in memory only: {e}")
+
+        if size is None:
+            size = len(blob) if blob is not None else estimate_size(value)
+
+        lkey = (namespace, key)
+        with self._lock:
+            self._stats[namespace].sets += 1
+            if self._sketch is not None:
+                self._sketch.increment(lkey)
+            admitted = self._store_l1(lkey, value, size, expires_at, tag_set)
+
+        persisted = False
+        if blob is not None:
+            try:
+                self._disk.put(namespace, key, blob, expires_at, tag_set)
+                persisted = True
+            except sqlite3.Error as e:
+                self._logger.warning(f"⚠️ Disk cache write failed for {namespace}/{key}: {e}")
+
+        return admitted or persisted
+
+    def delete(self, namespace: str, key: str) -> bool:
+        """Delete a key from both tiers."""
+        with self._lock:
+            removed = self._remove((namespace, key))
+        if self._disk is not None and self.get_policy(namespace).persist:
+            removed = self._disk.delete(namespace, key) or removed
+        return removed
+
+    def contains(self, namespace: str, key: str) -> bool:
+        """Check whether a live value exists without counting a hit or miss."""
+        with self._lock:
+            entry = self._l1.get((namespace, key))
+            if entry is not None and entry.expires_at > time.time():
+                return True
+        if self._disk is not None and self.get_policy(namespace).persist:
+            row = self._disk.get(namespace, key)
+            return row is not None and row[1] > time.time()
+        return False
+
+    def get_or_compute(
+        self,
+        namespace: str,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: Optional[float] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> Any:
+        """Get a cached value or compute and cache it.
+
+        Args:
+            namespace: Namespace name
+            key: Cache key
+            compute: Zero-argument callable producing the value
+            ttl: TTL in seconds (defaults to the namespace TTL)
+            tags: Tags for group invalidation
+
+        Returns:
+            Cached or freshly computed value
+        """
+        value = self.get(namespace, key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.set(namespace, key, value, ttl=ttl, tags=tags)
+        return value
+
+    def items(self, namespace: str) -> List[Tuple[str, Any]]:
+        """Snapshot of the live L1 (key, value) pairs of a namespace."""
+        now = time.time()
+        with self._lock:
+            return [
+                (key, entry.value)
+                for key in self._ns_keys.get(namespace, ())
+                for entry in (self._l1[(namespace, key)],)
+                if entry.expires_at > now
+            ]
+
+    # Invalidation
+
+    def invalidate_tags(self, tags: Iterable[str], namespace: Optional[str] = None) -> int:
+        """Remove every entry carrying any of the tags.
+
+        Args:
+            tags: Tags to invalidate
+            namespace: Restrict to one namespace (None for all)
+
+        Returns:
+            Number of distinct entries removed
+        """
+        tags = list(tags)
+        removed: Set[LKey] = set()
+        with self._lock:
+            for tag in tags:
+                for lkey in list(self._tag_index.get(tag, ())):
+                    if namespace is None or lkey[0] == namespace:
+                        self._remove(lkey)
+                        removed.add(lkey)
+        if self._disk is not None:
+            removed |= self._disk.delete_tags(tags, namespace)
+
+        with self._lock:
+            for ns, _ in removed:
+                self._stats[ns].invalidations += 1
+        return len(removed)
+
+    def clear_pattern(self, namespace: str, pattern: str) -> int:
+        """Remove entries in a namespace whose key matches a glob pattern.
+
+        Args:
+            namespace: Namespace name
+            pattern: fnmatch-style pattern, e.g. "weather_*"
+
+        Returns:
+            Number of distinct entries removed
+        """
+        removed: Set[LKey] = set()
+        with self._lock:
+            for key in [k for k in self._ns_keys.get(namespace, ()) if fnmatch.fnmatchcase(k, pattern)]:
+                self._remove((namespace, key))
+                removed.add((namespace, key))
+        if self._disk is not None:
+            removed |= self._disk.delete_pattern(namespace, pattern)
+        return len(removed)
+
+    def clear(self, namespace: Optional[str] = None) -> int:
+        """Remove every entry, or every entry in one namespace, from both tiers.
+
+        Returns:
+            Number of L1 entries removed
+        """
+        with self._lock:
+            if namespace is None:
+                count = len(self._l1)
+                self._l1.clear()
+                self._ns_keys.clear()
+                self._ns_bytes.clear()
+                self._tag_index.clear()
+                self._bytes = 0
+            else:
+                keys = list(self._ns_keys.get(namespace, ()))
+                for key in keys:
+                    self._remove((namespace, key))
+                count = len(keys)
+        if self._disk is not None:
+            self._disk.clear(namespace)
+        return count
+
+    def sweep(self, namespace: Optional[str] = None) -> int:
+        """Remove expired entries from both tiers and enforce the L2 budget.
+
+        Args:
+            namespace: Restrict to one namespace (None for all)
+
+        Returns:
+            Number of entries removed
+        """
+        now = time.time()
+        with self._lock:
+            expired = [
+                lkey for lkey, entry in self._l1.items()
+                if entry.expires_at <= now and (namespace is None or lkey[0] == namespace)
+            ]
+            for lkey in expired:
+                self._remove(lkey)
+                self._stats[lkey[0]].expirations += 1
+
+        removed = len(expired)
+        if self._disk is not None:
+            removed += self._disk.purge_expired(now, namespace)
+            if namespace is None:
+                removed += self._disk.enforce_size(self.max_disk_bytes)
+
+        if removed:
+            self._logger.debug(f"🧹 Swept {removed} expired cache entries")
+        return removed
+
+    # Statistics
+
+    def size_bytes(self, namespace: Optional[str] = None) -> int:
+        """Get L1 bytes used overall or by one namespace."""
+        with self._lock:
+            return self._bytes if namespace is None else self._ns_bytes.get(namespace, 0)
+
+    def get_stats(self, namespace: Optional[str] = None) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Args:
+            namespace: Namespace to report (None for the whole engine)
+
+        Returns:
+            Statistics dictionary
+        """
+        disk_stats = self._disk.get_statistics() if self._disk is not None else {}
+
+        with self._lock:
+            if namespace is not None:
+                policy = self.get_policy(namespace)
+                stats = self._stats[namespace].to_dict()
+                stats.update({
+                    "namespace": namespace,
+                    "entries": len(self._ns_keys.get(namespace, ())),
+                    "size_bytes": self._ns_bytes.get(namespace, 0),
+                    "size_mb": self._ns_bytes.get(namespace, 0) / 1024 / 1024,
+                    "l2_entries": disk_stats.get(namespace, {}).get("entries", 0),
+                    "l2_size_bytes": disk_stats.get(namespace, {}).get("size_bytes", 0),
+                    "policy": asdict(policy),
+                })
+                return stats
+
+            totals = NamespaceStats()
+            for ns_stats in self._stats.values():
+                totals.merge(ns_stats)
+            stats = totals.to_dict()
+            stats.update({
+                "entries": len(self._l1),
+                "max_entries": self.max_entries,
+                "size_bytes": self._bytes,
+                "size_mb": self._bytes / 1024 / 1024,
+                "max_size_mb": self.max_memory_bytes / 1024 / 1024,
+                "utilization_percent": (self._bytes / self.max_memory_bytes) * 100 if self.max_memory_bytes else 0.0,
+                "admission": self.admission,
+                "l2_enabled": self._disk is not None,
+                "l2_entries": sum(s["entries"] for s in disk_stats.values()),
+                "l2_size_bytes": sum(s["size_bytes"] for s in disk_stats.values()),
+                "namespaces": sorted(set(self._policies) | set(self._ns_keys)),
+            })
+            return stats
+
+    def close(self) -> None:
+        """Stop sweeping and close the disk tier."""
+        self._sweeper.unregister(self._sweep_task)
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
+
+    # L1 internals (caller holds the lock)
+
+    def _store_l1(self, lkey: LKey, value: Any, size: int, expires_at: float, tags: frozenset) -> bool:
+        """Insert into L1, applying admission and evicting as needed."""
+        namespace, key = lkey
+        policy = self.get_policy(namespace)
+        replacing = self._remove(lkey)
+
+        if size > self.max_memory_bytes or (policy.max_bytes is not None and size > policy.max_bytes):
+            return False
+
+        if (not replacing and self._sketch is not None and self._l1
+                and (self._bytes + size > self.max_memory_bytes or len(self._l1) >= self.max_entries)):
+            victim = next(iter(self._l1))
+            if self._sketch.frequency(lkey) < self._sketch.frequency(victim):
+                self._stats[namespace].rejections += 1
+                return False
+
+        self._l1[lkey] = _L1Entry(value, size, expires_at, tags)
+        self._ns_keys[namespace][key] = None
+        self._ns_bytes[namespace] += size
+        self._bytes += size
+        for tag in tags:
+            self._tag_index[tag].add(lkey)
+
+        self._enforce_limits(namespace)
+        return lkey in self._l1
+
+    def _enforce_limits(self, namespace: str) -> None:
+        """Evict least recently used entries until all budgets are met."""
+        policy = self._policies.get(namespace)
+        if policy is not None:
+            ns_keys = self._ns_keys.get(namespace)
+            while ns_keys and (
+                (policy.max_bytes is not None and self._ns_bytes[namespace] > policy.max_bytes)
+                or (policy.max_entries is not None and len(ns_keys) > policy.max_entries)
+            ):
+                self._remove((namespace, next(iter(ns_keys))))
+                self._stats[namespace].evictions += 1
+
+        while self._l1 and (self._bytes > self.max_memory_bytes or len(self._l1) > self.max_entries):
+            lkey = next(iter(self._l1))
+            self._remove(lkey)
+            self._stats[lkey[0]].evictions += 1
+
+    def _remove(self, lkey: LKey) -> bool:
+        """Remove an entry from L1 and its indexes."""
+        entry = self._l1.pop(lkey, None)
+        if entry is None:
+            return False
+
+        namespace, key = lkey
+        ns_keys = self._ns_keys.get(namespace)
+        if ns_keys is not None:
+            ns_keys.pop(key, None)
+            if not ns_keys:
+                del self._ns_keys[namespace]
+        self._ns_bytes[namespace] -= entry.size
+        self._bytes -= entry.size
+        for tag in entry.tags:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(lkey)
+                if not keys:
+                    del self._tag_index[tag]
+        return True
+
+
+class CacheNamespace:
+    """View of a TieredCache bound to one namespace."""
+
+    def __init__(self, engine: TieredCache, name: str):
+        """
+        Initialize namespace view.
+
+        Args:
+            engine: Tiered cache engine
+            name: Namespace name
+        """
+        self.engine = engine
+        self.name = name
+
+    @property
+    def policy(self) -> NamespacePolicy:
+        """Namespace policy."""
+        return self.engine.get_policy(self.name)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a cached value."""
+        return self.engine.get(self.name, key, default)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None,
+            tags: Optional[Iterable[str]] = None, size: Optional[int] = None) -> bool:
+        """Cache a value."""
+        return self.engine.set(self.name, key, value, ttl=ttl, tags=tags, size=size)
+
+    def delete(self, key: str) -> bool:
+        """Delete a cached value."""
+        return self.engine.delete(self.name, key)
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any], ttl: Optional[float] = None,
+                       tags: Optional[Iterable[str]] = None) -> Any:
+        """Get a cached value or compute and cache it."""
+        return self.engine.get_or_compute(self.name, key, compute, ttl=ttl, tags=tags)
+
+    def items(self) -> List[Tuple[str, Any]]:
+        """Snapshot of live in-memory entries."""
+        return self.engine.items(self.name)
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Remove entries carrying any of the tags."""
+        return self.engine.invalidate_tags(tags, namespace=self.name)
+
+    def clear_pattern(self, pattern: str) -> int:
+        """Remove entries whose key matches a glob pattern."""
+        return self.engine.clear_pattern(self.name, pattern)
+
+    def clear_expired(self) -> int:
+        """Remove expired entries."""
+        return self.engine.sweep(self.name)
+
+    def clear(self) -> int:
+        """Remove every entry in the namespace."""
+        return self.engine.clear(self.name)
+
+    def size_bytes(self) -> int:
+        """Get in-memory bytes used by the namespace."""
+        return self.engine.size_bytes(self.name)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get namespace statistics."""
+        return self.engine.get_stats(self.name)
+
+    def __contains__(self, key: str) -> bool:
+        return self.engine.contains(self.name, key)
+
+
+# Global tiered cache instance
+_global_tiered_cache: Optional[TieredCache] = None
+_tiered_cache_lock = threading.Lock()
+
+
+def get_tiered_cache() -> TieredCache:
+    """Get global tiered cache instance."""
+    global _global_tiered_cache
+    with _tiered_cache_lock:
+        if _global_tiered_cache is None:
+            _global_tiered_cache = TieredCache(disk_path=Path("cache") / "tiered_cache.db")
+        return _global_tiered_cache
@@ -18,6 +18,8 @@ from functools import wraps, lru_cache
 from enum import Enum
 import weakref
 
+from .cache.tiered_cache import TieredCache, get_tiered_cache
+
 try:
     import matplotlib
     matplotlib.use('Agg')  # Use non-interactive backend
@@ -132,12 +134,14 @@ class ChartCacheEntry:
 
 
 class ChartCache:
-    """Cache for rendered charts."""
+    """Cache for rendered charts, stored in a tiered cache namespace."""
     
     def __init__(self, 
                  max_size_mb: float = 200.0,
                  max_entries: int = 1000,
-                 ttl_seconds: float = 7200.0):  # 2 hours default
+                 ttl_seconds: float = 7200.0,  # 2 hours default
+                 cache: Optional[TieredCache] = None,
+                 namespace: str = "charts"):
         """
         Initialize chart cache.
         
@@ -145,21 +149,20 @@ class ChartCache:
             max_size_mb: Maximum cache size in MB
             max_entries: Maximum number of cache entries
             ttl_seconds: Time-to-live for cached charts
+            cache: Tiered cache engine (defaults to the global one)
+            namespace: Namespace for chart entries
         """
         self.max_size_mb = max_size_mb
         self.max_entries = max_entries
         self.ttl_seconds = ttl_seconds
         
-        self._cache: Dict[str, ChartCacheEntry] = {}
-        self._lock = threading.RLock()
-        self._logger = logging.getLogger(__name__)
-        
-        # Start cleanup thread
-        self._cleanup_thread = threading.Thread(
-            target=self._cleanup_loop,
-            daemon=True
+        self._cache = (cache or get_tiered_cache()).namespace(
+            namespace,
+            ttl=ttl_seconds,
+            max_size_mb=max_size_mb,
+            max_entries=max_entries
         )
-        self._cleanup_thread.start()
+        self._logger = logging.getLogger(__name__)
     
     def _generate_key(self, chart_params: Dict[str, Any]) -> str:
         """Generate cache key for chart.
@@ -208,21 +211,12 @@ class ChartCache:
         Returns:
             Cached chart data or None
         """
-        key = self._generate_key(chart_params)
-        
-        with self._lock:
-            if key in self._cache:
-                entry = self._cache[key]
-                
-                # Check if entry is still valid
-                if entry.age_seconds < self.ttl_seconds:
-                    entry.access()
-                    return entry.chart_data
-                else:
-                    # Remove expired entry
-                    del self._cache[key]
+        entry = self._cache.get(self._generate_key(chart_params))
+        if entry is None:
+            return None
         
-        return None
+        entry.access()
+        return entry.chart_data
     
     def set(self, chart_params: Dict[str, Any], chart_data: bytes, 
            format: OutputFormat, size: Tuple[int, int], render_time: float) -> None:
@@ -245,33 +239,7 @@ class ChartCache:
             render_time=render_time
         )
         
-        with self._lock:
-            # Check if we need to make space
-            self._ensure_space(entry.size_mb)
-            
-            self._cache[key] = entry
-    
-    def _ensure_space(self, required_mb: float) -> None:
-        """Ensure there's enough space in cache.
-        
-        Args:
-            required_mb: Required space in MB
-        """
-        current_size = self.get_size_mb()
-        
-        # Remove entries if cache is too full
-        while (len(self._cache) >= self.max_entries or 
-               current_size + required_mb > self.max_size_mb):
-            
-            if not self._cache:
-                break
-            
-            # Find least recently used entry
-            lru_key = min(self._cache.keys(), 
-                         key=lambda k: self._cache[k].last_accessed)
-            
-            removed_entry = self._cache.pop(lru_key)
-            current_size -= removed_entry.size_mb
+        self._cache.set(key, entry, size=len(chart_data))
     
     def get_size_mb(self) -> float:
         """Get current cache size in MB.
@@ -279,8 +247,7 @@ class ChartCache:
         Returns:
             Cache size in MB
         """
-        with self._lock:
-            return sum(entry.size_mb for entry in self._cache.values())
+        return self._cache.size_bytes() / 1024 / 1024
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics.
@@ -288,52 +255,29 @@ class ChartCache:
         Returns:
             Cache statistics
         """
-        with self._lock:
-            total_accesses = sum(entry.access_count for entry in self._cache.values())
-            avg_render_time = sum(entry.render_time for entry in self._cache.values()) / len(self._cache) if self._cache else 0
-            
-            return {
-                'entries': len(self._cache),
-                'max_entries': self.max_entries,
-                'size_mb': self.get_size_mb(),
-                'max_size_mb': self.max_size_mb,
-                'utilization_percent': (len(self._cache) / self.max_entries) * 100,
-                'size_utilization_percent': (self.get_size_mb() / self.max_size_mb) * 100,
-                'total_accesses': total_accesses,
-                'avg_render_time': avg_render_time,
-                'ttl_seconds': self.ttl_seconds
-            }
+        entries = [entry for _, entry in self._cache.items()]
+        total_accesses = sum(entry.access_count for entry in entries)
+        avg_render_time = sum(entry.render_time for entry in entries) / len(entries) if entries else 0
+        size_mb = self.get_size_mb()
+        namespace_stats = self._cache.get_stats()
+        
+        return {
+            'entries': len(entries),
+            'max_entries': self.max_entries,
+            'size_mb': size_mb,
+            'max_size_mb': self.max_size_mb,
+            'utilization_percent': (len(entries) / self.max_entries) * 100,
+            'size_utilization_percent': (size_mb / self.max_size_mb) * 100,
+            'total_accesses': total_accesses,
+            'avg_render_time': avg_render_time,
+            'ttl_seconds': self.ttl_seconds,
+            'hit_rate': namespace_stats['hit_rate'],
+            'evictions': namespace_stats['evictions']
+        }
     
     def clear(self) -> None:
         """Clear all cached charts."""
-        with self._lock:
-            self._cache.clear()
-    
-    def _cleanup_loop(self) -> None:
-        """Cleanup expired entries periodically."""
-        while True:
-            try:
-                time.sleep(600)  # Check every 10 minutes
-                
-                current_time = time.time()
-                expired_keys = []
-                
-                with self._lock:
-                    for key, entry in self._cache.items():
-                        if entry.age_seconds > self.ttl_seconds:
-                            expired_keys.append(key)
-                
-                # Remove expired entries
-                if expired_keys:
-                    with self._lock:
-                        for key in expired_keys:
-                            if key in self._cache:
-                                del self._cache[key]
-                    
-                    self._logger.debug(f"Cleaned up {len(expired_keys)} expired chart cache entries")
-                
-            except Exception as e:
-                self._logger.error(f"Error in chart cache cleanup: {e}")
+        self._cache.clear()
 
 
 class FigureManager:
@@ -3,25 +3,46 @@
 Provides database access, repository pattern implementation, and data management.
 """
 
-from .repositories import (
-    BaseRepository,
-    WeatherRepository,
-    PreferencesRepository,
-    ActivityRepository,
-    JournalRepository,
-)
-from .models import (
-    WeatherHistory,
-    UserPreferences,
-    ActivityLog,
-    JournalEntry,
-)
-from .database_manager import DatabaseManager
-from .data_service import DataService
-from .cache_manager import CacheManager
-from .migration_manager import MigrationManager
-from .export_import_manager import ExportImportManager
-from .backup_manager import BackupManager
+import importlib
+from typing import Any
+
+# Resolved on first access (PEP 562): the SQLAlchemy models and
+# repositories are not needed by callers that only use the sqlite3-based
+# DatabaseService, so they stay off the startup path.
+_LAZY_ATTRIBUTES = {
+    "BaseRepository": "repositories",
+    "WeatherRepository": "repositories",
+    "PreferencesRepository": "repositories",
+    "ActivityRepository": "repositories",
+    "JournalRepository": "repositories",
+    "WeatherHistory": "models",
+    "UserPreferences": "models",
+    "ActivityLog": "models",
+    "JournalEntry": "models",
+    "DatabaseManager": "database_manager",
+    "DataService": "data_service",
+    "CacheManager": "cache_manager",
+    "MigrationManager": "migration_manager",
+    "ExportImportManager": "export_import_manager",
+    "BackupManager": "backup_manager",
+    "StreamingExporter": "streaming_export",
+    "ExportProgress": "streaming_export",
+    "BulkImporter": "bulk_import",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported name's module on first access."""
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "BaseRepository",
@@ -39,4 +60,7 @@ __all__ = [
     "MigrationManager",
     "ExportImportManager",
     "BackupManager",
+    "StreamingExporter",
+    "ExportProgress",
+    "BulkImporter",
 ]
\ No newline at end of file
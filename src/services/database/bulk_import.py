@@ -0,0 +1,512 @@
+"""Bulk data import.
+
+Reads an export file as a stream of records, validates them column by
+column in chunks, finds records that already exist with one keyed join per
+chunk against a temporary table, and writes each chunk with executemany
+inserts and updates in its own transaction. Memory use depends on the
+chunk size, not on the size of the file.
+
+Reads the JSON document and JSON-lines layouts written by
+StreamingExporter, optionally gzip-compressed.
+"""
+
+import gzip
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy import Column, Integer, MetaData, Table, and_, delete, insert, select, update
+from sqlalchemy.schema import CreateTable, DropTable
+
+from .database_manager import DatabaseManager
+from .models import ActivityLog, JournalEntry, UserPreferences, WeatherHistory
+
+
+@dataclass
+class ImportTableSpec:
+    """How records of one table are validated and matched."""
+
+    model: Any
+    key_columns: Tuple[str, ...]  # natural key used to find existing rows
+    required: Tuple[str, ...]
+    datetime_columns: Tuple[str, ...] = ()
+    numeric_ranges: Dict[str, Tuple[Optional[float], Optional[float]]] = field(default_factory=dict)
+
+    @property
+    def columns(self) -> Set[str]:
+        return {column.name for column in self.model.__table__.columns}
+
+
+IMPORT_TABLES = {
+    "weather_history": ImportTableSpec(
+        WeatherHistory,
+        key_columns=("location", "timestamp"),
+        required=("location", "latitude", "longitude", "timestamp", "temperature", "condition"),
+        datetime_columns=("timestamp", "created_at", "updated_at"),
+        numeric_ranges={
+            "latitude": (-90, 90),
+            "longitude": (-180, 180),
+            "temperature": (None, None),
+            "humidity": (0, 100),
+        },
+    ),
+    "user_preferences": ImportTableSpec(
+        UserPreferences,
+        key_columns=("user_id",),
+        required=("user_id",),
+        datetime_columns=("created_at", "updated_at"),
+        numeric_ranges={"refresh_interval": (0, None)},
+    ),
+    "activity_log": ImportTableSpec(
+        ActivityLog,
+        key_columns=("user_id", "activity_name", "selected_at"),
+        required=("user_id", "activity_name", "location", "selected_at"),
+        datetime_columns=("selected_at", "completed_at", "created_at", "updated_at"),
+        numeric_ranges={"rating": (1, 5), "duration_minutes": (0, None)},
+    ),
+    "journal_entries": ImportTableSpec(
+        JournalEntry,
+        key_columns=("user_id", "date"),
+        required=("user_id", "date"),
+        datetime_columns=("date", "created_at", "updated_at"),
+        numeric_ranges={"mood_score": (1, 10), "energy_level": (1, 10)},
+    ),
+}
+
+
+class ImportFormatError(ValueError):
+    """The import file is not a readable export."""
+
+
+def open_import_file(path: Path) -> IO[str]:
+    """Open an export for reading, decompressing gzip files transparently."""
+    with open(path, "rb") as f:
+        compressed = f.read(2) == b"\x1f\x8b"
+    if compressed:
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def is_json_lines(path: Path) -> bool:
+    """Whether a path names a JSON-lines export (``.jsonl`` or ``.jsonl.gz``)."""
+    suffixes = Path(path).suffixes
+    if suffixes and suffixes[-1] == ".gz":
+        suffixes = suffixes[:-1]
+    return bool(suffixes) and suffixes[-1] == ".jsonl"
+
+
+def iter_json_lines(fp: IO[str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield ("metadata", metadata) and (table, record) pairs from a JSON-lines export."""
+    for number, line in enumerate(fp, 1):
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ImportFormatError(f"Line {number}: {e}") from e
+        if "metadata" in item:
+            yield "metadata", item["metadata"]
+        elif "table" in item and "record" in item:
+            yield item["table"], item["record"]
+        else:
+            raise ImportFormatError(f"Line {number}: expected a metadata or table record")
+
+
+class _JsonDocumentReader:
+    """Incremental reader for ``{"metadata": {...}, "data": {table: [records]}}``.
+
+    Decodes one value at a time with ``JSONDecoder.raw_decode`` from a
+    buffer refilled in chunks, so a record is only ever held on its own.
+    """
+
+    CHUNK_SIZE = 1 << 16
+
+    def __init__(self, fp: IO[str]):
+        self._fp = fp
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Read another chunk; False at end of file."""
+        if self._eof:
+            return False
+        chunk = self._fp.read(self.CHUNK_SIZE)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Next non-whitespace character ("" at end of file)."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char: str) -> None:
+        found = self._peek()
+        if found != char:
+            raise ImportFormatError(f"Expected {char!r}, found {found or 'end of file'!r}")
+        self._pos += 1
+
+    def _value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                # A number at the end of the buffer may continue in the next chunk
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError as e:
+                if self._eof:
+                    raise ImportFormatError(f"Invalid JSON: {e}") from e
+            self._fill()
+
+    def _members(self) -> Iterator[str]:
+        """Keys of the object being read, leaving each value for the caller."""
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self._value()
+            if not isinstance(key, str):
+                raise ImportFormatError("Expected an object key")
+            self._expect(":")
+            yield key
+            if self._peek() == ",":
+                self._pos += 1
+                continue
+            self._expect("}")
+            return
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        for key in self._members():
+            if key == "metadata":
+                yield "metadata", self._value()
+            elif key == "data":
+                for table in self._members():
+                    if self._peek() != "[":
+                        raise ImportFormatError(f"Invalid data format for table: {table}")
+                    self._pos += 1
+                    if self._peek() == "]":
+                        self._pos += 1
+                        continue
+                    while True:
+                        yield table, self._value()
+                        if self._peek() == ",":
+                            self._pos += 1
+                            continue
+                        self._expect("]")
+                        break
+            else:
+                self._value()
+
+
+def iter_import_records(path: Path) -> Iterator[Tuple[str, Any]]:
+    """Stream ("metadata", metadata) and (table, record) pairs from an export file."""
+    with open_import_file(path) as fp:
+        if is_json_lines(path):
+            yield from iter_json_lines(fp)
+        else:
+            yield from _JsonDocumentReader(fp)
+
+
+def _parse_datetime(value: Any) -> Any:
+    """datetime from an ISO string; None on failure."""
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def validate_chunk(
+    table: str, records: List[Any], start_index: int
+) -> Tuple[List[Optional[Dict[str, Any]]], List[str]]:
+    """Validate a chunk of records column by column.
+
+    Args:
+        table: Table name
+        records: Raw records from the import file
+        start_index: Index of the first record within its table
+
+    Returns:
+        (rows, errors): one database row per record (None where the record
+        is invalid) with datetimes parsed and unknown fields dropped, and
+        the validation errors
+    """
+    spec = IMPORT_TABLES[table]
+    errors: List[str] = []
+    invalid: Set[int] = set()
+
+    def fail(position: int, message: str) -> None:
+        invalid.add(position)
+        errors.append(f"{table}[{start_index + position}]: {message}")
+
+    for position, record in enumerate(records):
+        if not isinstance(record, dict):
+            fail(position, "Record must be a dictionary")
+    positions = [position for position in range(len(records)) if position not in invalid]
+
+    for name in spec.required:
+        for position in positions:
+            if records[position].get(name) is None:
+                fail(position, f"Missing required field '{name}'")
+
+    parsed: Dict[str, List[Any]] = {}
+    for name in spec.datetime_columns:
+        column = [records[position].get(name) for position in positions]
+        values = [None if raw is None else _parse_datetime(raw) for raw in column]
+        for position, raw, value in zip(positions, column, values):
+            if raw is not None and value is None:
+                fail(position, f"Invalid {name} format")
+        parsed[name] = values
+
+    for name, (low, high) in spec.numeric_ranges.items():
+        for position in positions:
+            raw = records[position].get(name)
+            if raw is None:
+                continue
+            try:
+                number = float(raw)
+            except (ValueError, TypeError):
+                fail(position, f"Invalid {name} value")
+                continue
+            if (low is not None and number < low) or (high is not None and number > high):
+                fail(position, f"{name} must be between {low} and {high}")
+
+    rows: List[Optional[Dict[str, Any]]] = [None] * len(records)
+    columns = spec.columns - {"id"}
+    for offset, position in enumerate(positions):
+        if position in invalid:
+            continue
+        row = {name: value for name, value in records[position].items() if name in columns}
+        for name, values in parsed.items():
+            if name in row:
+                row[name] = values[offset]
+        rows[position] = row
+    return rows, errors
+
+
+@dataclass
+class ImportStats:
+    """Counts from an import."""
+
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0
+    conflicts: int = 0
+    tables: Dict[str, int] = field(default_factory=dict)
+
+
+class BulkImporter:
+    """Imports export files in chunked transactions."""
+
+    MAX_REPORTED_ERRORS = 100
+
+    def __init__(self, db_manager: DatabaseManager, chunk_size: int = 1000):
+        """Initialize importer.
+
+        Args:
+            db_manager: Database manager instance
+            chunk_size: Records validated and written per transaction
+        """
+        self._db_manager = db_manager
+        self.chunk_size = chunk_size
+        self._logger = logging.getLogger(__name__)
+
+    def _chunks(self, path: Path, metadata: Dict[str, Any]) -> Iterator[Tuple[str, List[Any], int]]:
+        """Group the file's records into (table, records, start index) chunks.
+
+        The file's metadata is stored into the metadata dict as it is read.
+        """
+        counts: Dict[str, int] = {}
+        table, chunk = None, []
+        for name, record in iter_import_records(path):
+            if name == "metadata":
+                if isinstance(record, dict):
+                    metadata.update(record)
+                continue
+            if chunk and (name != table or len(chunk) >= self.chunk_size):
+                yield table, chunk, counts.get(table, 0) - len(chunk)
+                chunk = []
+            table = name
+            counts[name] = counts.get(name, 0) + 1
+            chunk.append(record)
+        if chunk:
+            yield table, chunk, counts[table] - len(chunk)
+
+    def validate(self, path: Path) -> Dict[str, Any]:
+        """Check an import file without touching the database.
+
+        Returns:
+            Dict with "valid", "errors" (the first MAX_REPORTED_ERRORS) and
+            "statistics" (records per table)
+        """
+        errors: List[str] = []
+        error_count = 0
+        statistics: Dict[str, int] = {}
+        metadata: Dict[str, Any] = {}
+
+        try:
+            for table, records, start in self._chunks(path, metadata):
+                if table not in IMPORT_TABLES:
+                    if table not in statistics:
+                        errors.append(f"Unknown table: {table}")
+                        error_count += 1
+                    statistics[table] = statistics.get(table, 0) + len(records)
+                    continue
+                _, chunk_errors = validate_chunk(table, records, start)
+                error_count += len(chunk_errors)
+                errors.extend(chunk_errors[: max(0, self.MAX_REPORTED_ERRORS - len(errors))])
+                statistics[table] = statistics.get(table, 0) + len(records)
+        except (ImportFormatError, OSError, UnicodeDecodeError) as e:
+            return {"valid": False, "errors": [f"Unreadable import file: {e}"], "statistics": statistics}
+
+        if not metadata:
+            errors.insert(0, "Missing metadata section")
+            error_count += 1
+        else:
+            for name in ("version", "exported_at"):
+                if name not in metadata:
+                    errors.insert(0, f"Missing metadata field: {name}")
+                    error_count += 1
+        if error_count > len(errors):
+            errors.append(f"... and {error_count - len(errors)} more errors")
+
+        return {"valid": error_count == 0, "errors": errors, "statistics": statistics}
+
+    async def import_file(
+        self,
+        path: Path,
+        resolution: str = "skip",
+        progress_callback: Optional[Callable[[ImportStats], None]] = None,
+    ) -> ImportStats:
+        """Import a validated file.
+
+        Each chunk is one transaction: existing rows are found with a single
+        join on the table's natural key, new rows are inserted and (for
+        "overwrite" and "merge") existing rows updated with executemany.
+
+        Args:
+            path: Import file
+            resolution: "skip" keeps existing rows (as does "prompt", which
+                cannot ask mid-import), "overwrite" replaces them and "merge"
+                updates them with the imported non-null fields
+            progress_callback: Called with the running totals after each chunk
+
+        Returns:
+            ImportStats: Counts of inserted, updated and skipped records
+        """
+        stats = ImportStats()
+        key_tables: Dict[str, Table] = {}
+
+        async with self._db_manager.get_async_session() as session:
+            try:
+                for table, records, start in self._chunks(path, {}):
+                    spec = IMPORT_TABLES[table]
+                    rows, _ = validate_chunk(table, records, start)
+
+                    # Within a chunk the last record with a key wins
+                    by_key: Dict[tuple, Dict[str, Any]] = {}
+                    for row in rows:
+                        if row is None:
+                            stats.skipped += 1
+                            continue
+                        key = tuple(row[name] for name in spec.key_columns)
+                        if key in by_key:
+                            stats.skipped += 1
+                        by_key[key] = row
+
+                    if table not in key_tables:
+                        key_tables[table] = await self._create_key_table(session, spec)
+                    existing = await self._find_existing(session, spec, key_tables[table], list(by_key))
+
+                    new_rows, updates = [], []
+                    for key, row in by_key.items():
+                        if key not in existing:
+                            # Drop unset values so column defaults apply
+                            new_rows.append({name: value for name, value in row.items() if value is not None})
+                            continue
+                        stats.conflicts += 1
+                        if resolution == "overwrite":
+                            updates.append({**row, "id": existing[key]})
+                        elif resolution == "merge":
+                            merged = {name: value for name, value in row.items() if value is not None}
+                            updates.append({**merged, "id": existing[key]})
+                        else:
+                            stats.skipped += 1
+
+                    if new_rows:
+                        await session.execute(insert(spec.model), new_rows)
+                    if updates:
+                        await session.execute(update(spec.model), updates)
+                    await session.commit()
+
+                    stats.inserted += len(new_rows)
+                    stats.updated += len(updates)
+                    stats.tables[table] = stats.tables.get(table, 0) + len(new_rows) + len(updates)
+                    if progress_callback:
+                        progress_callback(stats)
+            except BaseException:
+                # Earlier chunks stay committed; the caller's backup covers them
+                await session.rollback()
+                raise
+            finally:
+                for key_table in key_tables.values():
+                    await session.execute(DropTable(key_table, if_exists=True))
+                await session.commit()
+
+        self._logger.info(
+            f"📥 Imported {stats.inserted} new and {stats.updated} updated records "
+            f"({stats.skipped} skipped, {stats.conflicts} already present) from {path}"
+        )
+        return stats
+
+    async def _create_key_table(self, session, spec: ImportTableSpec) -> Table:
+        """Temporary table holding one chunk's keys, typed like the target columns."""
+        source = spec.model.__table__
+        key_table = Table(
+            f"_import_keys_{source.name}",
+            MetaData(),
+            Column("position", Integer, primary_key=True),
+            *[Column(name, source.c[name].type) for name in spec.key_columns],
+            prefixes=["TEMPORARY"],
+        )
+        await session.execute(CreateTable(key_table, if_not_exists=True))
+        return key_table
+
+    async def _find_existing(
+        self, session, spec: ImportTableSpec, key_table: Table, keys: List[tuple]
+    ) -> Dict[tuple, int]:
+        """Map the chunk's keys that already exist to the matching row ids."""
+        if not keys:
+            return {}
+        await session.execute(delete(key_table))
+        await session.execute(
+            insert(key_table),
+            [
+                {"position": position, **dict(zip(spec.key_columns, key))}
+                for position, key in enumerate(keys)
+            ],
+        )
+        target = spec.model.__table__
+        query = select(key_table.c.position, target.c.id).join(
+            target, and_(*[target.c[name] == key_table.c[name] for name in spec.key_columns])
+        )
+        result = await session.execute(query)
+        return {keys[position]: row_id for position, row_id in result.all()}
@@ -1,7 +1,9 @@
 """Enhanced Cache Manager with LRU Eviction and Compression.
 
 Provides high-performance thread-safe caching with automatic expiration,
-LRU eviction, compression, and advanced memory management.
+LRU eviction, compression, and advanced memory management. Recency order
+lives in the OrderedDict and the byte total is maintained incrementally, so
+get, set and eviction never scan the whole cache.
 """
 
 import asyncio
@@ -207,16 +209,7 @@ class CacheEntry:
         Returns:
             int: Estimated size in bytes
         """
-        try:
-            # Simple size estimation
-            if isinstance(self.value, str):
-                return len(self.value.encode("utf-8"))
-            elif isinstance(self.value, (dict, list)):
-                return len(json.dumps(self.value, default=str).encode("utf-8"))
-            else:
-                return len(str(self.value).encode("utf-8"))
-        except Exception:
-            return 1024  # Default estimate
+        return self.memory_size
 
     def to_dict(self) -> Dict:
         """Convert entry to dictionary.
@@ -260,7 +253,8 @@ class CacheManager:
             persistence_file: Optional file for cache persistence
             enable_compression: Enable automatic compression
             compression_threshold: Minimum size for compression
-            lru_factor: Fraction of cache to evict when full
+            lru_factor: Fraction of each limit to free when full; eviction
+                runs in one batch down to this low-water mark
         """
         # Use OrderedDict for LRU functionality
         self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
@@ -362,37 +356,45 @@ class CacheManager:
 
         return CompressionType.NONE
 
-    def _evict_lru_entries(self) -> int:
-        """Evict least recently used entries."""
-        if not self._cache:
-            return 0
+    def _remove_entry(self, key: str) -> Optional[CacheEntry]:
+        """Remove an entry and release its size."""
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._current_size -= entry.memory_size
+        return entry
 
-        # Calculate how many entries to evict
-        target_count = max(1, int(len(self._cache) * self._lru_factor))
-        evicted = 0
+    def _evict_lru_entries(self, new_entry_size: int = 0) -> int:
+        """Evict least recently used entries down to the low-water mark.
 
-        # Evict from the beginning (oldest)
-        keys_to_remove = list(self._cache.keys())[:target_count]
+        Args:
+            new_entry_size: Size of the entry about to be inserted
 
-        for key in keys_to_remove:
-            if key in self._cache:
-                entry = self._cache[key]
-                self._current_size -= entry.memory_size
-                del self._cache[key]
-                evicted += 1
-                self._stats.evictions += 1
+        Returns:
+            int: Number of entries evicted
+        """
+        low_water = 1.0 - min(max(self._lru_factor, 0.0), 1.0)
+        target_entries = min(int(self._max_entries * low_water), self._max_entries - 1)
+        target_size = self._max_size * low_water - new_entry_size
 
+        evicted = 0
+        while self._cache and (
+            len(self._cache) > target_entries or self._current_size > target_size
+        ):
+            # Oldest entries are at the front
+            _, entry = self._cache.popitem(last=False)
+            self._current_size -= entry.memory_size
+            evicted += 1
+
+        self._stats.evictions += evicted
         return evicted
 
     def _ensure_capacity(self, new_entry_size: int) -> None:
         """Ensure cache has capacity for new entry."""
-        # Check entry count limit
-        while len(self._cache) >= self._max_entries:
-            self._evict_lru_entries()
-
-        # Check size limit
-        while (self._current_size + new_entry_size) > self._max_size and self._cache:
-            self._evict_lru_entries()
+        if (
+            len(self._cache) >= self._max_entries
+            or (self._current_size + new_entry_size) > self._max_size
+        ):
+            self._evict_lru_entries(new_entry_size)
 
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache with LRU update.
@@ -411,8 +413,7 @@ class CacheManager:
                 return None
 
             if entry.is_expired():
-                self._current_size -= entry.memory_size
-                del self._cache[key]
+                self._remove_entry(key)
                 self._stats.misses += 1
                 return None
 
@@ -458,10 +459,7 @@ class CacheManager:
             entry = CacheEntry(key, value, ttl, tags, compression, priority)
 
             # Remove existing entry if present
-            if key in self._cache:
-                old_entry = self._cache[key]
-                self._current_size -= old_entry.memory_size
-                del self._cache[key]
+            self._remove_entry(key)
 
             # Ensure we have capacity
             self._ensure_capacity(entry.memory_size)
@@ -520,11 +518,9 @@ class CacheManager:
                     keys_to_remove.append(key)
 
             for key in keys_to_remove:
-                if key in self._cache:
-                    entry = self._cache[key]
-                    self._current_size -= entry.memory_size
-                    del self._cache[key]
+                self._remove_entry(key)
 
+            self._stats.total_size = self._current_size
             return len(keys_to_remove)
 
     def bulk_set(
@@ -560,10 +556,7 @@ class CacheManager:
                     expired_keys.append(key)
 
             for key in expired_keys:
-                if key in self._cache:
-                    entry = self._cache[key]
-                    self._current_size -= entry.memory_size
-                    del self._cache[key]
+                if self._remove_entry(key) is not None:
                     cleaned += 1
 
             # Recompress entries that might benefit
@@ -597,10 +590,7 @@ class CacheManager:
             bool: True if entry was deleted
         """
         with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                return True
-            return False
+            return self._remove_entry(key) is not None
 
     def exists(self, key: str) -> bool:
         """Check if key exists and is not expired.
@@ -618,7 +608,7 @@ class CacheManager:
                 return False
 
             if entry.is_expired():
-                del self._cache[key]
+                self._remove_entry(key)
                 return False
 
             return True
@@ -627,6 +617,8 @@ class CacheManager:
         """Clear all cache entries."""
         with self._lock:
             self._cache.clear()
+            self._current_size = 0
+            self._stats.total_size = 0
             self._logger.info("Cache cleared")
 
     def cleanup_expired(self) -> int:
@@ -639,7 +631,7 @@ class CacheManager:
             expired_keys = [key for key, entry in self._cache.items() if entry.is_expired()]
 
             for key in expired_keys:
-                del self._cache[key]
+                self._remove_entry(key)
 
             if expired_keys:
                 self._logger.debug(f"Cleaned up {len(expired_keys)} expired entries")
@@ -655,20 +647,11 @@ class CacheManager:
         Returns:
             bool: True if space was made
         """
-        # Check entry count limit
-        while len(self._cache) >= self._max_entries:
-            if not self._evict_lru_entry():
-                return False
-
-        # Check size limit
-        current_size = self.get_size()
-        new_entry_size = new_entry.size_estimate()
-
-        while current_size + new_entry_size > self._max_size:
-            if not self._evict_lru_entry():
-                return False
-            current_size = self.get_size()
+        new_entry_size = new_entry.memory_size
+        if new_entry_size > self._max_size:
+            return False
 
+        self._ensure_capacity(new_entry_size)
         return True
 
     def _evict_lru_entry(self) -> bool:
@@ -680,11 +663,9 @@ class CacheManager:
         if not self._cache:
             return False
 
-        # Find LRU entry
-        lru_key = min(self._cache.keys(), key=lambda k: self._cache[k].accessed_at)
-
-        del self._cache[lru_key]
-        self._evictions += 1
+        _, entry = self._cache.popitem(last=False)
+        self._current_size -= entry.memory_size
+        self._stats.evictions += 1
 
         return True
 
@@ -695,7 +676,7 @@ class CacheManager:
             int: Cache size in bytes
         """
         with self._lock:
-            return sum(entry.size_estimate() for entry in self._cache.values())
+            return self._current_size
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get cache statistics (alias for get_stats).
@@ -777,15 +758,9 @@ class CacheManager:
         # Remove expired entries first
         self.cleanup_expired()
 
-        # Enforce entry limit
-        while len(self._cache) > self._max_entries:
-            if not self._evict_lru_entry():
-                break
-
-        # Enforce size limit
-        while self.get_size() > self._max_size:
-            if not self._evict_lru_entry():
-                break
+        # Enforce entry and size limits in one batch
+        if len(self._cache) > self._max_entries or self._current_size > self._max_size:
+            self._evict_lru_entries()
 
     async def _cleanup_loop(self) -> None:
         """Background cleanup task."""
@@ -869,7 +844,9 @@ class CacheManager:
                     entry.created_at = created_at
                     entry.access_count = entry_data.get("access_count", 0)
 
+                    self._remove_entry(key)
                     self._cache[key] = entry
+                    self._current_size += entry.memory_size
                     loaded_count += 1
 
             self._logger.info(f"Loaded {loaded_count} cache entries from {self._persistence_file}")
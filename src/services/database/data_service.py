@@ -8,7 +8,7 @@ import logging
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from .backup_manager import BackupManager
 from .cache_manager import CacheManager
@@ -21,6 +21,7 @@ from .repositories import (
     PreferencesRepository,
     WeatherRepository,
 )
+from .streaming_export import ExportProgress
 
 
 class DataService:
@@ -607,6 +608,9 @@ class DataService:
         user_id: Optional[str] = None,
         tables: Optional[List[str]] = None,
         date_range: Optional[Tuple[datetime, datetime]] = None,
+        format: str = "json",
+        compress: Optional[bool] = None,
+        progress_callback: Optional[Callable[[ExportProgress], None]] = None,
     ) -> bool:
         """Export data to file.
 
@@ -615,12 +619,21 @@ class DataService:
             user_id: Optional user ID filter
             tables: Optional table filter
             date_range: Optional date range filter
+            format: "json", "jsonl", "csv" or "xml"
+            compress: gzip the output (default: when export_file ends in .gz)
+            progress_callback: Called after every page of rows with an ExportProgress
 
         Returns:
             bool: True if export was successful
         """
         return await self._export_import_manager.export_data(
-            export_file=export_file, tables=tables, date_range=date_range, user_id=user_id
+            export_file=export_file,
+            tables=tables,
+            date_range=date_range,
+            user_id=user_id,
+            format=format,
+            compress=compress,
+            progress_callback=progress_callback,
         )
 
     async def import_data(
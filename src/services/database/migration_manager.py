@@ -142,6 +142,18 @@ class MigrationManager:
             )
         )
 
+        # Migration 006: Index the normalized location key for exact-match lookups
+        self._migrations.append(
+            Migration(
+                version="006",
+                description="Add normalized location key index",
+                sql="""
+            CREATE INDEX IF NOT EXISTS idx_location_key_timestamp
+                ON weather_history(lower(trim(location)), timestamp);
+            """,
+            )
+        )
+
     async def get_current_version(self) -> Optional[str]:
         """Get current database schema version.
 
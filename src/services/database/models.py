@@ -58,6 +58,8 @@ class WeatherHistory(Base):
     # Indexes for performance
     __table_args__ = (
         Index("idx_location_timestamp", "location", "timestamp"),
+        # Normalized location key; see optimized_queries.location_key()
+        Index("idx_location_key_timestamp", func.lower(func.trim(location)), timestamp),
         Index("idx_coordinates", "latitude", "longitude"),
         Index("idx_timestamp_desc", "timestamp", postgresql_using="btree"),
     )
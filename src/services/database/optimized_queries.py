@@ -1,14 +1,63 @@
 import sqlite3
-from typing import List, Dict, Any, Optional, Tuple
+import string
+from typing import List, Dict, Any, Iterable, Optional, Sequence, Tuple, Union
 from datetime import datetime, timedelta
 import logging
 from contextlib import contextmanager
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 import threading
 from queue import Queue
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Bumped when stored data needs a one-off rewrite (tracked in PRAGMA user_version)
+SCHEMA_VERSION = 1
+
+# Normalized location key, indexed together with timestamp; location_key() must match it
+CITY_KEY_SQL = "lower(trim(city))"
+
+# SQLite builds before 3.32 cap host parameters at 999 per statement
+MAX_IN_PARAMS = 900
+
+# History columns returned by the query engine
+HISTORY_FIELDS = (
+    'temperature', 'condition', 'humidity', 'wind_speed', 'pressure', 'visibility', 'uv_index'
+)
+
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+HistoryCursor = Tuple[str, int]
+
+
+def location_key(name: str) -> str:
+    """Normalize a location name exactly as SQL lower(trim(name)) does.
+    
+    SQLite's lower() only folds ASCII letters and trim() only strips spaces, so
+    this does the same; any difference would make indexed lookups miss rows.
+    """
+    return name.strip(" ").translate(_ASCII_LOWER)
+
+
+def format_timestamp(value: Union[datetime, str, None] = None) -> str:
+    """Format a timestamp as 'YYYY-MM-DD HH:MM:SS[.ffffff]' (now if None).
+    
+    One canonical text form keeps string comparison and index range scans on
+    the timestamp column correct.
+    """
+    if value is None:
+        value = datetime.now()
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    return str(value).replace("T", " ", 1)
+
 class OptimizedDatabase:
     """Optimized database with connection pooling and prepared statements"""
     
@@ -25,6 +74,7 @@ class OptimizedDatabase:
         
         # Create tables first, then indexes
         self.create_tables()
+        self._migrate_schema()
         self.create_indexes()
     
     def _initialize_pool(self):
@@ -89,6 +139,7 @@ class OptimizedDatabase:
             "CREATE INDEX IF NOT EXISTS idx_weather_timestamp ON weather_data(timestamp)",
             "CREATE INDEX IF NOT EXISTS idx_weather_city ON weather_data(city)",
             "CREATE INDEX IF NOT EXISTS idx_weather_city_timestamp ON weather_data(city, timestamp)",
+            f"CREATE INDEX IF NOT EXISTS idx_weather_city_key_timestamp ON weather_data({CITY_KEY_SQL}, timestamp)",
             "CREATE INDEX IF NOT EXISTS idx_journal_date ON journal_entries(date)",
             "CREATE INDEX IF NOT EXISTS idx_journal_mood ON journal_entries(mood)",
             "CREATE INDEX IF NOT EXISTS idx_journal_user_date ON journal_entries(user_id, date)",
@@ -163,28 +214,113 @@ class OptimizedDatabase:
         except Exception as e:
             logger.error(f"Failed to create tables: {e}")
     
-    def get_weather_history_optimized(self, city: str, days: int = 7) -> List[Dict[str, Any]]:
+    def _migrate_schema(self):
+        """Rewrite stored data from older versions of this schema"""
+        try:
+            with self.get_connection() as conn:
+                version = conn.execute("PRAGMA user_version").fetchone()[0]
+                if version < 1:
+                    # Older rows stored isoformat() timestamps with a 'T' separator
+                    conn.execute(
+                        "UPDATE weather_data SET timestamp = replace(timestamp, 'T', ' ') "
+                        "WHERE timestamp LIKE '____-__-__T%'"
+                    )
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        except Exception as e:
+            logger.error(f"Failed to migrate database schema: {e}")
+    
+    def optimize_settings(self):
+        """Refresh query planner statistics so history reads use the composite indexes"""
+        try:
+            with self.get_connection() as conn:
+                conn.execute("ANALYZE")
+                conn.execute("PRAGMA optimize")
+        except Exception as e:
+            logger.error(f"Failed to optimize database settings: {e}")
+    
+    @staticmethod
+    def _fetch_tuples(conn: sqlite3.Connection, query: str, params: Sequence[Any]) -> List[tuple]:
+        """Run a query returning plain tuples instead of sqlite3.Row objects"""
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(query, params)
+        return cursor.fetchall()
+    
+    def _fetch_history_batch(
+        self,
+        cities: Iterable[str],
+        fields: Sequence[str],
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        descending: bool = False
+    ) -> Dict[str, List[tuple]]:
+        """Read history rows for many cities with IN-batched indexed queries.
+        
+        Args:
+            cities: City names (matched on the normalized location key)
+            fields: Columns to select after timestamp
+            since: Exclusive lower timestamp bound
+            until: Inclusive upper timestamp bound
+            descending: Newest rows first
+            
+        Returns:
+            Requested city name -> rows of (timestamp, *fields)
+        """
+        names_by_key: Dict[str, List[str]] = {}
+        for city in cities:
+            names_by_key.setdefault(location_key(city), []).append(city)
+        
+        keys = list(names_by_key)
+        filters = ""
+        bounds: List[Any] = []
+        if since is not None:
+            filters += " AND timestamp > ?"
+            bounds.append(since)
+        if until is not None:
+            filters += " AND timestamp <= ?"
+            bounds.append(until)
+        order = "DESC" if descending else "ASC"
+        columns = ", ".join(("timestamp",) + tuple(fields))
+        
+        rows_by_key: Dict[str, List[tuple]] = {}
+        with self.get_connection() as conn:
+            for start in range(0, len(keys), MAX_IN_PARAMS):
+                chunk = keys[start:start + MAX_IN_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                query = f"""
+                SELECT {CITY_KEY_SQL} AS city_key, {columns}
+                FROM weather_data
+                WHERE {CITY_KEY_SQL} IN ({placeholders}){filters}
+                ORDER BY city_key, timestamp {order}
+                """
+                rows = self._fetch_tuples(conn, query, chunk + bounds)
+                for key, key_rows in groupby(rows, key=itemgetter(0)):
+                    rows_by_key[key] = [row[1:] for row in key_rows]
+        
+        return {
+            city: rows_by_key.get(key, [])
+            for key, names in names_by_key.items()
+            for city in names
+        }
+    
+    def get_weather_history_optimized(self, city: str, days: int = 7, limit: int = 100) -> List[Dict[str, Any]]:
         """Optimized weather history query"""
-        query = """
-        SELECT 
-            timestamp,
-            temperature,
-            condition,
-            humidity,
-            wind_speed,
-            pressure,
-            uv_index
+        fields = ('temperature', 'condition', 'humidity', 'wind_speed', 'pressure', 'uv_index')
+        columns = ('timestamp',) + fields
+        query = f"""
+        SELECT {", ".join(columns)}
         FROM weather_data 
-        WHERE city = ? 
-        AND timestamp > datetime('now', '-' || ? || ' days')
+        WHERE {CITY_KEY_SQL} = ? 
+        AND timestamp > ?
         ORDER BY timestamp DESC
-        LIMIT 100
+        LIMIT ?
         """
         
         try:
             with self.get_connection() as conn:
-                cursor = conn.execute(query, (city, days))
-                return [dict(row) for row in cursor.fetchall()]
+                since = format_timestamp(datetime.now() - timedelta(days=days))
+                rows = self._fetch_tuples(conn, query, (location_key(city), since, limit))
+                return [dict(zip(columns, row)) for row in rows]
         except Exception as e:
             logger.error(f"Failed to get weather history: {e}")
             return []
@@ -194,34 +330,122 @@ class OptimizedDatabase:
         if not cities:
             return {}
         
-        placeholders = ','.join('?' * len(cities))
+        fields = ('temperature', 'condition', 'humidity', 'wind_speed')
+        columns = ('timestamp',) + fields
+        
+        try:
+            since = format_timestamp(datetime.now() - timedelta(hours=hours))
+            batch = self._fetch_history_batch(cities, fields, since=since, descending=True)
+            return {
+                city: [dict(zip(columns, row), city=city) for row in rows]
+                for city, rows in batch.items()
+                if rows
+            }
+        except Exception as e:
+            logger.error(f"Failed to get batch weather data: {e}")
+            return {}
+    
+    def get_history_columns(
+        self,
+        cities: List[str],
+        since: Union[datetime, str, None] = None,
+        until: Union[datetime, str, None] = None,
+        fields: Sequence[str] = HISTORY_FIELDS
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get weather history for many cities as columns, oldest first.
+        
+        Args:
+            cities: City names (matched on the normalized location key)
+            since: Exclusive lower bound (datetime or timestamp text)
+            until: Inclusive upper bound
+            fields: Columns to return besides 'timestamp'
+            
+        Returns:
+            City -> {column: values}. With NumPy, 'timestamp' is datetime64[us],
+            'condition' is an object array and numeric columns are float64 with
+            NaN for missing values; otherwise each column is a list.
+        """
+        if not cities:
+            return {}
+        
+        names = ('timestamp',) + tuple(fields)
+        
+        try:
+            batch = self._fetch_history_batch(
+                cities,
+                fields,
+                since=format_timestamp(since) if since is not None else None,
+                until=format_timestamp(until) if until is not None else None,
+            )
+        except Exception as e:
+            logger.error(f"Failed to get history columns: {e}")
+            return {}
+        
+        results = {}
+        for city, rows in batch.items():
+            columns = list(zip(*rows)) if rows else [()] * len(names)
+            results[city] = {
+                name: self._to_column(name, values) for name, values in zip(names, columns)
+            }
+        return results
+    
+    @staticmethod
+    def _to_column(name: str, values: Sequence[Any]) -> Any:
+        """Convert one column of values to its NumPy array (or list without NumPy)"""
+        if not NUMPY_AVAILABLE:
+            return list(values)
+        if name == 'timestamp':
+            return np.array(values, dtype='datetime64[us]')
+        if name == 'condition':
+            return np.array(values, dtype=object)
+        return np.array(values, dtype=np.float64)
+    
+    def get_weather_history_page(
+        self,
+        city: str,
+        limit: int = 100,
+        cursor: Optional[HistoryCursor] = None,
+        fields: Sequence[str] = HISTORY_FIELDS
+    ) -> Tuple[List[Dict[str, Any]], Optional[HistoryCursor]]:
+        """Page through a city's history, newest first, by timestamp cursor.
+        
+        Each page is an index range scan starting just after the previous page,
+        so late pages cost the same as the first (unlike OFFSET).
+        
+        Args:
+            city: City name (matched on the normalized location key)
+            limit: Rows per page
+            cursor: Cursor returned with the previous page, None for the first
+            fields: Columns to return besides 'id' and 'timestamp'
+            
+        Returns:
+            (rows, next_cursor); next_cursor is None after the last page
+        """
+        columns = ('id', 'timestamp') + tuple(fields)
+        params: List[Any] = [location_key(city)]
+        after_cursor = ""
+        if cursor is not None:
+            after_cursor = " AND (timestamp, id) < (?, ?)"
+            params.extend(cursor)
+        params.append(limit)
+        
         query = f"""
-        SELECT 
-            city,
-            timestamp,
-            temperature,
-            condition,
-            humidity,
-            wind_speed
-        FROM weather_data 
-        WHERE city IN ({placeholders})
-        AND timestamp > datetime('now', '-{hours} hours')
-        ORDER BY city, timestamp DESC
+        SELECT {", ".join(columns)}
+        FROM weather_data
+        WHERE {CITY_KEY_SQL} = ?{after_cursor}
+        ORDER BY timestamp DESC, id DESC
+        LIMIT ?
         """
         
         try:
             with self.get_connection() as conn:
-                cursor = conn.execute(query, cities)
-                results = {}
-                for row in cursor.fetchall():
-                    city = row['city']
-                    if city not in results:
-                        results[city] = []
-                    results[city].append(dict(row))
-                return results
+                rows = self._fetch_tuples(conn, query, params)
         except Exception as e:
-            logger.error(f"Failed to get batch weather data: {e}")
-            return {}
+            logger.error(f"Failed to get weather history page: {e}")
+            return [], None
+        
+        next_cursor = (rows[-1][1], rows[-1][0]) if len(rows) == limit else None
+        return [dict(zip(columns, row)) for row in rows], next_cursor
     
     def insert_weather_data_batch(self, weather_records: List[Dict[str, Any]]) -> bool:
         """Insert multiple weather records efficiently"""
@@ -239,9 +463,9 @@ class OptimizedDatabase:
                 data = [
                     (
                         record.get('city'),
-                        record.get('timestamp'),
+                        format_timestamp(record.get('timestamp')),
                         record.get('temperature'),
-                        record.get('condition'),
+                        getattr(record.get('condition'), 'value', record.get('condition')),
                         record.get('humidity'),
                         record.get('wind_speed'),
                         record.get('pressure'),
@@ -285,7 +509,7 @@ class OptimizedDatabase:
     
     def get_weather_statistics(self, city: str, days: int = 30) -> Dict[str, Any]:
         """Get weather statistics for a city"""
-        query = """
+        query = f"""
         SELECT 
             COUNT(*) as record_count,
             AVG(temperature) as avg_temp,
@@ -296,20 +520,21 @@ class OptimizedDatabase:
             condition,
             COUNT(condition) as condition_count
         FROM weather_data 
-        WHERE city = ?
-        AND timestamp > datetime('now', '-' || ? || ' days')
+        WHERE {CITY_KEY_SQL} = ?
+        AND timestamp > ?
         GROUP BY condition
         ORDER BY condition_count DESC
         """
         
         try:
             with self.get_connection() as conn:
-                cursor = conn.execute(query, (city, days))
+                params = (location_key(city), format_timestamp(datetime.now() - timedelta(days=days)))
+                cursor = conn.execute(query, params)
                 results = cursor.fetchall()
                 
                 if results:
                     # Get overall stats
-                    overall_query = """
+                    overall_query = f"""
                     SELECT 
                         COUNT(*) as total_records,
                         AVG(temperature) as avg_temp,
@@ -318,11 +543,11 @@ class OptimizedDatabase:
                         AVG(humidity) as avg_humidity,
                         AVG(wind_speed) as avg_wind_speed
                     FROM weather_data 
-                    WHERE city = ?
-                    AND timestamp > datetime('now', '-' || ? || ' days')
+                    WHERE {CITY_KEY_SQL} = ?
+                    AND timestamp > ?
                     """
                     
-                    overall_cursor = conn.execute(overall_query, (city, days))
+                    overall_cursor = conn.execute(overall_query, params)
                     overall_stats = dict(overall_cursor.fetchone())
                     
                     # Add condition breakdown
@@ -339,7 +564,7 @@ class OptimizedDatabase:
     def cleanup_old_data(self, days_to_keep: int = 90) -> bool:
         """Clean up old data to maintain performance"""
         queries = [
-            ("DELETE FROM weather_data WHERE timestamp < datetime('now', '-' || ? || ' days')", (days_to_keep,)),
+            ("DELETE FROM weather_data WHERE timestamp < ?", (format_timestamp(datetime.now() - timedelta(days=days_to_keep)),)),
             ("DELETE FROM search_history WHERE timestamp < datetime('now', '-' || ? || ' days')", (days_to_keep,)),
             ("VACUUM", ())
         ]
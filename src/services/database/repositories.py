@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import select
 
 from .models import ActivityLog, JournalEntry, UserPreferences, WeatherHistory
+from .optimized_queries import location_key
 
 
 class BaseRepository:
@@ -30,6 +31,11 @@ class BaseRepository:
 class WeatherRepository(BaseRepository):
     """Repository for weather history data."""
 
+    @staticmethod
+    def _location_matches(location: str):
+        """Exact match on the normalized location key (uses idx_location_key_timestamp)."""
+        return func.lower(func.trim(WeatherHistory.location)) == location_key(location)
+
     async def save_weather_data(self, weather_data: Dict[str, Any]) -> WeatherHistory:
         """Save weather data to database.
 
@@ -125,7 +131,7 @@ class WeatherRepository(BaseRepository):
         try:
             query = (
                 select(WeatherHistory)
-                .where(WeatherHistory.location.ilike(f"%{location}%"))
+                .where(self._location_matches(location))
                 .order_by(desc(WeatherHistory.timestamp))
                 .limit(1)
             )
@@ -160,7 +166,7 @@ class WeatherRepository(BaseRepository):
                 func.count(WeatherHistory.id).label("record_count"),
             ).where(
                 and_(
-                    WeatherHistory.location.ilike(f"%{location}%"),
+                    self._location_matches(location),
                     WeatherHistory.timestamp >= start_date,
                 )
             )
@@ -0,0 +1,328 @@
+"""Streaming data export.
+
+Pages rows out of SQLite through a server-side cursor and serializes each
+page straight to the output file, so memory stays flat however many rows a
+table holds. Supports a JSON document (the layout ExportImportManager has
+always written), JSON lines, CSV and XML, each optionally gzip-compressed.
+"""
+
+import csv
+import gzip
+import json
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple
+from xml.sax.saxutils import XMLGenerator
+
+from sqlalchemy import asc, desc, func, select
+
+from .database_manager import DatabaseManager
+from .models import ActivityLog, JournalEntry, UserPreferences, WeatherHistory
+
+# Table name -> (model, date column name, user column name, newest first)
+EXPORT_TABLES = {
+    "weather_history": (WeatherHistory, "timestamp", None, True),
+    "user_preferences": (UserPreferences, None, "user_id", False),
+    "activity_log": (ActivityLog, "selected_at", "user_id", True),
+    "journal_entries": (JournalEntry, "date", "user_id", True),
+}
+
+
+@dataclass
+class ExportProgress:
+    """Progress of a running export, reported after every page."""
+
+    table: str
+    table_rows: int
+    table_total: int
+    rows_written: int
+    total_rows: int
+
+    @property
+    def fraction(self) -> float:
+        return self.rows_written / self.total_rows if self.total_rows else 1.0
+
+
+def open_export_file(path: Path, compress: Optional[bool] = None) -> IO[str]:
+    """Open a text stream for an export, gzip-compressed if asked or if path ends in .gz."""
+    path = Path(path)
+    if compress is None:
+        compress = path.suffix == ".gz"
+    if compress:
+        return gzip.open(path, "wt", encoding="utf-8", newline="")
+    return open(path, "w", encoding="utf-8", newline="")
+
+
+def _text(value: Any) -> str:
+    """Scalar as text; structured values as JSON."""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    return "" if value is None else str(value)
+
+
+class RecordWriter:
+    """Serializes an export one record at a time."""
+
+    def __init__(self, fp: IO[str]):
+        self.fp = fp
+
+    def begin(self, metadata: Dict[str, Any]):
+        """Start the document."""
+
+    def begin_table(self, table: str):
+        """Start a table's records."""
+
+    def write(self, record: Dict[str, Any]):
+        """Write one record."""
+        raise NotImplementedError
+
+    def end_table(self):
+        """Finish a table's records."""
+
+    def end(self):
+        """Finish the document."""
+
+
+class JsonDocumentWriter(RecordWriter):
+    """``{"metadata": ..., "data": {table: [records]}}``, written incrementally."""
+
+    def begin(self, metadata: Dict[str, Any]):
+        self.fp.write('{\n"metadata": ')
+        self.fp.write(json.dumps(metadata, indent=2, default=str))
+        self.fp.write(',\n"data": {')
+        self._tables = 0
+
+    def begin_table(self, table: str):
+        self.fp.write(",\n" if self._tables else "\n")
+        self.fp.write(f"{json.dumps(table)}: [")
+        self._tables += 1
+        self._records = 0
+
+    def write(self, record: Dict[str, Any]):
+        self.fp.write(",\n" if self._records else "\n")
+        self.fp.write(json.dumps(record, default=str))
+        self._records += 1
+
+    def end_table(self):
+        self.fp.write("\n]" if self._records else "]")
+
+    def end(self):
+        self.fp.write("\n}\n}\n")
+
+
+class JsonLinesWriter(RecordWriter):
+    """A metadata line, then one ``{"table": ..., "record": ...}`` line per record."""
+
+    def begin(self, metadata: Dict[str, Any]):
+        self.fp.write(json.dumps({"metadata": metadata}, default=str) + "\n")
+
+    def begin_table(self, table: str):
+        self._prefix = '{"table": ' + json.dumps(table) + ', "record": '
+
+    def write(self, record: Dict[str, Any]):
+        self.fp.write(self._prefix + json.dumps(record, default=str) + "}\n")
+
+
+class CsvWriter(RecordWriter):
+    """One CSV block per table, headed by a ``# table`` comment line."""
+
+    def begin(self, metadata: Dict[str, Any]):
+        self.fp.write("# Data Export\n")
+        self.fp.write(f"# Exported: {metadata.get('exported_at', '')}\n")
+        for table, count in (metadata.get("statistics") or {}).items():
+            self.fp.write(f"# {table}: {count} records\n")
+        self._tables = 0
+
+    def begin_table(self, table: str):
+        self.fp.write("\n" if self._tables else "")
+        self.fp.write(f"# {table}\n")
+        self._tables += 1
+        self._writer = None
+
+    def write(self, record: Dict[str, Any]):
+        if self._writer is None:
+            self._writer = csv.DictWriter(self.fp, fieldnames=list(record), extrasaction="ignore")
+            self._writer.writeheader()
+        self._writer.writerow({key: _text(value) for key, value in record.items()})
+
+
+class XmlWriter(RecordWriter):
+    """``<export><table name=...><record><field>...`` with proper escaping.
+
+    Each record is a complete element on its own line, so the file can be
+    read back record by record with ``xml.etree.ElementTree.iterparse``.
+    """
+
+    def begin(self, metadata: Dict[str, Any]):
+        self._xml = XMLGenerator(self.fp, encoding="utf-8", short_empty_elements=True)
+        self._xml.startDocument()
+        self._xml.startElement("export", {})
+        self.fp.write("\n  ")
+        self._xml.startElement("metadata", {})
+        for key, value in metadata.items():
+            self._element(key, value)
+        self._xml.endElement("metadata")
+
+    def begin_table(self, table: str):
+        self.fp.write("\n  ")
+        self._xml.startElement("table", {"name": table})
+
+    def write(self, record: Dict[str, Any]):
+        self.fp.write("\n    ")
+        self._xml.startElement("record", {})
+        for key, value in record.items():
+            if value is not None:
+                self._element(key, value)
+        self._xml.endElement("record")
+
+    def end_table(self):
+        self.fp.write("\n  ")
+        self._xml.endElement("table")
+
+    def end(self):
+        self.fp.write("\n")
+        self._xml.endElement("export")
+        self._xml.endDocument()
+        self.fp.write("\n")
+
+    def _element(self, name: str, value: Any):
+        self._xml.startElement(name, {})
+        self._xml.characters(_text(value))
+        self._xml.endElement(name)
+
+
+WRITERS: Dict[str, Callable[[IO[str]], RecordWriter]] = {
+    "json": JsonDocumentWriter,
+    "jsonl": JsonLinesWriter,
+    "csv": CsvWriter,
+    "xml": XmlWriter,
+}
+
+
+class StreamingExporter:
+    """Exports database tables page by page."""
+
+    def __init__(self, db_manager: DatabaseManager, page_size: int = 1000):
+        """Initialize exporter.
+
+        Args:
+            db_manager: Database manager instance
+            page_size: Rows fetched from the cursor per page
+        """
+        self._db_manager = db_manager
+        self.page_size = page_size
+        self._logger = logging.getLogger(__name__)
+
+    def build_query(
+        self,
+        table: str,
+        date_range: Optional[Tuple[datetime, datetime]] = None,
+        user_id: Optional[str] = None,
+    ):
+        """Select statement for a table's rows within the filters."""
+        model, date_column, user_column, newest_first = EXPORT_TABLES[table]
+        query = select(model)
+        if date_range and date_column:
+            column = getattr(model, date_column)
+            query = query.where(column >= date_range[0], column <= date_range[1])
+        if user_id and user_column:
+            query = query.where(getattr(model, user_column) == user_id)
+        order_column = getattr(model, date_column or "id")
+        return query.order_by(desc(order_column) if newest_first else asc(order_column))
+
+    async def export(
+        self,
+        export_file: Path,
+        tables: List[str],
+        format: str = "json",
+        date_range: Optional[Tuple[datetime, datetime]] = None,
+        user_id: Optional[str] = None,
+        compress: Optional[bool] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        progress_callback: Optional[Callable[[ExportProgress], None]] = None,
+    ) -> Dict[str, int]:
+        """Stream tables to a file.
+
+        The file is written under a temporary name and renamed when
+        complete, so a failed export never leaves a truncated file behind.
+
+        Args:
+            export_file: Output path
+            tables: Tables to export
+            format: One of WRITERS ("json", "jsonl", "csv", "xml")
+            date_range: Optional date range filter
+            user_id: Optional user ID filter
+            compress: gzip the output (default: when export_file ends in .gz)
+            metadata: Extra metadata written at the top of the export
+            progress_callback: Called after every page with an ExportProgress
+
+        Returns:
+            Number of records written per table
+        """
+        if format not in WRITERS:
+            raise ValueError(f"Unsupported export format: {format}")
+        unknown = [table for table in tables if table not in EXPORT_TABLES]
+        if unknown:
+            self._logger.warning(f"Skipping unknown tables: {', '.join(unknown)}")
+            tables = [table for table in tables if table in EXPORT_TABLES]
+
+        export_file = Path(export_file)
+        export_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = export_file.with_name(export_file.name + ".part")
+        if compress is None:
+            compress = export_file.suffix == ".gz"
+        written: Dict[str, int] = {}
+
+        # One session (and so one read transaction) keeps the counts and
+        # the rows consistent with each other
+        async with self._db_manager.get_async_session() as session:
+            totals = {}
+            for table in tables:
+                count_query = select(func.count()).select_from(
+                    self.build_query(table, date_range, user_id).subquery()
+                )
+                totals[table] = (await session.execute(count_query)).scalar_one()
+            total_rows = sum(totals.values())
+
+            header = dict(metadata or {})
+            header.setdefault("exported_at", datetime.now().isoformat())
+            header["statistics"] = totals
+
+            try:
+                with open_export_file(temp_file, compress) as fp:
+                    writer = WRITERS[format](fp)
+                    writer.begin(header)
+                    rows_written = 0
+                    for table in tables:
+                        writer.begin_table(table)
+                        table_rows = 0
+                        query = self.build_query(table, date_range, user_id).execution_options(
+                            yield_per=self.page_size
+                        )
+                        # The identity map holds rows weakly, so each page is
+                        # freed once it has been written
+                        result = await session.stream_scalars(query)
+                        async for page in result.partitions():
+                            for row in page:
+                                writer.write(row.to_dict())
+                            table_rows += len(page)
+                            rows_written += len(page)
+                            if progress_callback:
+                                progress_callback(ExportProgress(
+                                    table, table_rows, totals[table], rows_written, total_rows
+                                ))
+                        writer.end_table()
+                        written[table] = table_rows
+                    writer.end()
+                os.replace(temp_file, export_file)
+            except BaseException:
+                temp_file.unlink(missing_ok=True)
+                raise
+
+        self._logger.info(
+            f"📤 Exported {sum(written.values())} records from {len(tables)} tables to {export_file}"
+        )
+        return written
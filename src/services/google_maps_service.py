@@ -8,9 +8,11 @@ import requests
 import logging
 from typing import Dict, Any, Optional, List, Tuple
 import json
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from datetime import datetime
 
 from .config.config_service import ConfigService
+from .cache.geocode_store import get_geocode_store
 
 
 @dataclass
@@ -67,6 +69,7 @@ class GoogleMapsService:
         self.config = config_service
         self.logger = logging.getLogger('weather_dashboard.google_maps_service')
         self._cache: Dict[str, Dict[str, Any]] = {}
+        self._geocode_store = get_geocode_store()
         self._last_request_time = 0
         self._request_interval = 0.1  # 100ms between requests
         
@@ -124,7 +127,8 @@ class GoogleMapsService:
             
             data = response.json()
             
-            if data.get('status') != 'OK':
+            # ZERO_RESULTS is an answer (nothing found), not an API error
+            if data.get('status') not in ('OK', 'ZERO_RESULTS'):
                 self.logger.error(f"❌ API error: {data.get('status')} - {data.get('error_message', 'Unknown error')}")
                 return None
             
@@ -195,14 +199,25 @@ class GoogleMapsService:
         return results
     
     def geocode(self, address: str) -> Optional[GeocodeResult]:
-        """Geocode an address to coordinates."""
+        """Geocode an address to coordinates.
+        
+        Answers and "not found" results persist in the shared geocode store;
+        failed requests are not cached.
+        """
+        entry = self._geocode_store.get('google', address)
+        if entry is not None:
+            self.logger.debug(f"📋 Using stored geocode for {address}")
+            return None if entry.is_negative else GeocodeResult(**entry.payload)
+        
         self.logger.info(f"📍 Geocoding: {address}")
         
         params = {'address': address}
-        cache_key = f"geocode_{hash(address)}"
-        data = self._make_request('geocode/json', params, cache_key)
+        data = self._make_request('geocode/json', params)
         
-        if not data or not data.get('results'):
+        if not data:
+            return None
+        if not data.get('results'):
+            self._geocode_store.put_negative('google', address)
             return None
         
         result = data['results'][0]
@@ -224,6 +239,8 @@ class GoogleMapsService:
             address_components=address_components
         )
         
+        self._geocode_store.put('google', address, asdict(geocode_result))
+        
         self.logger.info(f"✅ Geocoded to: {geocode_result.latitude}, {geocode_result.longitude}")
         return geocode_result
     
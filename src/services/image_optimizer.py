@@ -16,6 +16,8 @@ from functools import wraps, lru_cache
 from enum import Enum
 import weakref
 
+from .cache.tiered_cache import TieredCache, get_tiered_cache
+
 try:
     from PIL import Image, ImageFilter, ImageEnhance, ImageOps
     PIL_AVAILABLE = True
@@ -117,12 +119,14 @@ class ImageCacheEntry:
 
 
 class ImageCache:
-    """Cache for processed images."""
+    """Cache for processed images, stored in a tiered cache namespace."""
     
     def __init__(self, 
                  max_size_mb: float = 100.0,
                  max_entries: int = 500,
-                 ttl_seconds: float = 3600.0):
+                 ttl_seconds: float = 3600.0,
+                 cache: Optional[TieredCache] = None,
+                 namespace: str = "images"):
         """
         Initialize image cache.
         
@@ -130,21 +134,20 @@ class ImageCache:
             max_size_mb: Maximum cache size in MB
             max_entries: Maximum number of cache entries
             ttl_seconds: Time-to-live for cached images
+            cache: Tiered cache engine (defaults to the global one)
+            namespace: Namespace for image entries
         """
         self.max_size_mb = max_size_mb
         self.max_entries = max_entries
         self.ttl_seconds = ttl_seconds
         
-        self._cache: Dict[str, ImageCacheEntry] = {}
-        self._lock = threading.RLock()
-        self._logger = logging.getLogger(__name__)
-        
-        # Start cleanup thread
-        self._cleanup_thread = threading.Thread(
-            target=self._cleanup_loop,
-            daemon=True
+        self._cache = (cache or get_tiered_cache()).namespace(
+            namespace,
+            ttl=ttl_seconds,
+            max_size_mb=max_size_mb,
+            max_entries=max_entries
         )
-        self._cleanup_thread.start()
+        self._logger = logging.getLogger(__name__)
     
     def _generate_key(self, image_path: str, processing_params: Dict[str, Any]) -> str:
         """Generate cache key for image.
@@ -181,21 +184,12 @@ class ImageCache:
         Returns:
             Cached image data or None
         """
-        key = self._generate_key(image_path, processing_params)
-        
-        with self._lock:
-            if key in self._cache:
-                entry = self._cache[key]
-                
-                # Check if entry is still valid
-                if entry.age_seconds < self.ttl_seconds:
-                    entry.access()
-                    return entry.image_data
-                else:
-                    # Remove expired entry
-                    del self._cache[key]
+        entry = self._cache.get(self._generate_key(image_path, processing_params))
+        if entry is None:
+            return None
         
-        return None
+        entry.access()
+        return entry.image_data
     
     def set(self, image_path: str, processing_params: Dict[str, Any], 
            image_data: bytes, format: ImageFormat, size: Tuple[int, int]) -> None:
@@ -217,33 +211,18 @@ class ImageCache:
             processing_params=processing_params
         )
         
-        with self._lock:
-            # Check if we need to make space
-            self._ensure_space(entry.size_mb)
-            
-            self._cache[key] = entry
+        self._cache.set(key, entry, tags=[f"path:{image_path}"], size=len(image_data))
     
-    def _ensure_space(self, required_mb: float) -> None:
-        """Ensure there's enough space in cache.
+    def invalidate_path(self, image_path: str) -> int:
+        """Remove every cached variant of an image.
         
         Args:
-            required_mb: Required space in MB
-        """
-        current_size = self.get_size_mb()
-        
-        # Remove entries if cache is too full
-        while (len(self._cache) >= self.max_entries or 
-               current_size + required_mb > self.max_size_mb):
-            
-            if not self._cache:
-                break
-            
-            # Find least recently used entry
-            lru_key = min(self._cache.keys(), 
-                         key=lambda k: self._cache[k].last_accessed)
+            image_path: Path to image file
             
-            removed_entry = self._cache.pop(lru_key)
-            current_size -= removed_entry.size_mb
+        Returns:
+            Number of entries removed
+        """
+        return self._cache.invalidate_tags([f"path:{image_path}"])
     
     def get_size_mb(self) -> float:
         """Get current cache size in MB.
@@ -251,8 +230,7 @@ class ImageCache:
         Returns:
             Cache size in MB
         """
-        with self._lock:
-            return sum(entry.size_mb for entry in self._cache.values())
+        return self._cache.size_bytes() / 1024 / 1024
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics.
@@ -260,50 +238,27 @@ class ImageCache:
         Returns:
             Cache statistics
         """
-        with self._lock:
-            total_accesses = sum(entry.access_count for entry in self._cache.values())
-            
-            return {
-                'entries': len(self._cache),
-                'max_entries': self.max_entries,
-                'size_mb': self.get_size_mb(),
-                'max_size_mb': self.max_size_mb,
-                'utilization_percent': (len(self._cache) / self.max_entries) * 100,
-                'size_utilization_percent': (self.get_size_mb() / self.max_size_mb) * 100,
-                'total_accesses': total_accesses,
-                'ttl_seconds': self.ttl_seconds
-            }
+        entries = [entry for _, entry in self._cache.items()]
+        total_accesses = sum(entry.access_count for entry in entries)
+        size_mb = self.get_size_mb()
+        namespace_stats = self._cache.get_stats()
+        
+        return {
+            'entries': len(entries),
+            'max_entries': self.max_entries,
+            'size_mb': size_mb,
+            'max_size_mb': self.max_size_mb,
+            'utilization_percent': (len(entries) / self.max_entries) * 100,
+            'size_utilization_percent': (size_mb / self.max_size_mb) * 100,
+            'total_accesses': total_accesses,
+            'ttl_seconds': self.ttl_seconds,
+            'hit_rate': namespace_stats['hit_rate'],
+            'evictions': namespace_stats['evictions']
+        }
     
     def clear(self) -> None:
         """Clear all cached images."""
-        with self._lock:
-            self._cache.clear()
-    
-    def _cleanup_loop(self) -> None:
-        """Cleanup expired entries periodically."""
-        while True:
-            try:
-                time.sleep(300)  # Check every 5 minutes
-                
-                current_time = time.time()
-                expired_keys = []
-                
-                with self._lock:
-                    for key, entry in self._cache.items():
-                        if entry.age_seconds > self.ttl_seconds:
-                            expired_keys.append(key)
-                
-                # Remove expired entries
-                if expired_keys:
-                    with self._lock:
-                        for key in expired_keys:
-                            if key in self._cache:
-                                del self._cache[key]
-                    
-                    self._logger.debug(f"Cleaned up {len(expired_keys)} expired image cache entries")
-                
-            except Exception as e:
-                self._logger.error(f"Error in image cache cleanup: {e}")
+        self._cache.clear()
 
 
 class ImageProcessor:
@@ -0,0 +1,209 @@
+"""NumPy feature matrix for city weather similarity.
+
+Weather profiles are packed once into an N x F float matrix, kept up to date
+row by row when a city's weather changes. Similarities are computed with
+broadcasting and BLAS instead of per-pair Python loops, and nearest-city
+queries work in row blocks so the full N x N matrix is only built when a
+caller asks for it.
+"""
+
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+FEATURE_COLUMNS = (
+    "temperature",
+    "humidity",
+    "wind_speed",
+    "pressure",
+    "uv_index",
+    "visibility",
+    "feels_like",
+)
+
+# "cosine": cosine similarity of standardized features (StandardScaler +
+# cosine_similarity). "range": 1 - mean(|difference| / typical range),
+# clipped at 0, which needs no fitted statistics.
+METRIC_COLUMNS = {
+    "cosine": ("temperature", "humidity", "wind_speed", "pressure", "uv_index", "visibility"),
+    "range": ("temperature", "humidity", "wind_speed", "pressure"),
+}
+FEATURE_RANGES = {"temperature": 50.0, "humidity": 100.0, "wind_speed": 20.0, "pressure": 100.0}
+
+_BLOCK_ROWS = 1024
+# Cap on the (rows x N x F) temporary of the range metric
+_MAX_BROADCAST_ELEMENTS = 4_000_000
+
+
+def profile_row(profile: Any) -> Tuple[float, ...]:
+    """Feature values of a weather profile (NaN where missing)."""
+    row = []
+    for column in FEATURE_COLUMNS:
+        value = getattr(profile, column, None)
+        if column == "feels_like" and not value:
+            value = profile.temperature
+        row.append(math.nan if value is None else float(value))
+    return tuple(row)
+
+
+class CityFeatureMatrix:
+    """Weather features of a set of cities as one NumPy matrix."""
+
+    def __init__(self, profiles: Sequence[Any]):
+        """
+        Initialize feature matrix.
+
+        Args:
+            profiles: Weather profiles (objects with city_name and feature attributes)
+        """
+        self.names: List[str] = [profile.city_name for profile in profiles]
+        self.index: Dict[str, int] = {}
+        for i, name in enumerate(self.names):
+            self.index.setdefault(name, i)
+        self._rows: List[Tuple[float, ...]] = [profile_row(profile) for profile in profiles]
+        self._raw = np.array(self._rows, dtype=np.float64).reshape(len(self._rows), len(FEATURE_COLUMNS))
+        self._values: Optional[np.ndarray] = None
+        self._unit: Optional[np.ndarray] = None
+        self._matrices: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def changed_rows(self, profiles: Sequence[Any]) -> Optional[List[int]]:
+        """Rows whose features differ from profiles, or None if the cities differ."""
+        if len(profiles) != len(self.names) or any(
+            profile.city_name != name for profile, name in zip(profiles, self.names)
+        ):
+            return None
+        return [i for i, profile in enumerate(profiles) if profile_row(profile) != self._rows[i]]
+
+    def update(self, row: int, profile: Any) -> None:
+        """Replace one city's features.
+
+        The cached range-metric matrix is patched in O(N) (one row and
+        column); standardized features depend on every row, so the cosine
+        matrix is recomputed lazily with a single matrix product.
+        """
+        self._rows[row] = profile_row(profile)
+        self._raw[row] = self._rows[row]
+        self._values = None
+        self._unit = None
+        self._matrices.pop("cosine", None)
+
+        cached = self._matrices.get("range")
+        if cached is not None:
+            cached.flags.writeable = True
+            similarities = self._range_block(row, row + 1)[0]
+            cached[row, :] = similarities
+            cached[:, row] = similarities
+            cached.flags.writeable = False
+
+    def values(self, columns: Sequence[str] = FEATURE_COLUMNS) -> np.ndarray:
+        """Feature values for columns, with missing values set to the column mean."""
+        if self._values is None:
+            values = self._raw.copy()
+            missing = np.isnan(values)
+            if missing.any():
+                counts = (~missing).sum(axis=0)
+                sums = np.where(missing, 0.0, values).sum(axis=0)
+                means = np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0)
+                values[missing] = np.broadcast_to(means, values.shape)[missing]
+            self._values = values
+        return self._values[:, [FEATURE_COLUMNS.index(column) for column in columns]]
+
+    def similarity_matrix(self, metric: str = "cosine") -> np.ndarray:
+        """Full N x N similarity matrix (cached, read-only)."""
+        matrix = self._matrices.get(metric)
+        if matrix is None:
+            matrix = self._block(metric, 0, len(self))
+            matrix.flags.writeable = False
+            self._matrices[metric] = matrix
+        return matrix
+
+    def similarity(self, row1: int, row2: int, metric: str = "cosine") -> float:
+        """Similarity of two cities without building the full matrix."""
+        cached = self._matrices.get(metric)
+        if cached is not None:
+            return float(cached[row1, row2])
+        return float(self._block(metric, row1, row1 + 1)[0, row2])
+
+    def top_k(self, row: int, k: int = 5, metric: str = "cosine") -> List[Tuple[int, float]]:
+        """The k cities most similar to a city, best first (excluding itself)."""
+        similarities = np.array(self._block(metric, row, row + 1)[0])
+        similarities[row] = -np.inf
+        k = min(k, len(self) - 1)
+        if k <= 0:
+            return []
+        best = np.argpartition(-similarities, k - 1)[:k]
+        best = best[np.argsort(-similarities[best], kind="stable")]
+        return [(int(i), float(similarities[i])) for i in best]
+
+    def nearest(self, metric: str = "cosine") -> List[Optional[Tuple[int, float]]]:
+        """Each city's most similar other city as (row, similarity), scanning in row blocks.
+
+        None for a city with no other city to compare with.
+        """
+        nearest: List[Optional[Tuple[int, float]]] = []
+        if len(self) < 2:
+            return [None] * len(self)
+        for start in range(0, len(self), _BLOCK_ROWS):
+            stop = min(start + _BLOCK_ROWS, len(self))
+            block = np.array(self._block(metric, start, stop))
+            rows = np.arange(stop - start)
+            block[rows, rows + start] = -np.inf
+            best = np.argmax(block, axis=1)
+            nearest.extend((int(j), float(block[i, j])) for i, j in zip(rows, best))
+        return nearest
+
+    def most_similar_pair(self, metric: str = "cosine") -> Optional[Tuple[int, int, float]]:
+        """The most similar pair of distinct cities, scanning in row blocks."""
+        best: Optional[Tuple[int, int, float]] = None
+        for start in range(0, len(self), _BLOCK_ROWS):
+            stop = min(start + _BLOCK_ROWS, len(self))
+            block = np.array(self._block(metric, start, stop))
+            # Only pairs (i, j) with j > i
+            block[np.arange(len(self))[None, :] <= np.arange(start, stop)[:, None]] = -np.inf
+            flat = int(np.argmax(block))
+            i, j = divmod(flat, len(self))
+            if np.isfinite(block[i, j]) and (best is None or block[i, j] > best[2]):
+                best = (start + i, j, float(block[i, j]))
+        return best
+
+    def _block(self, metric: str, start: int, stop: int) -> np.ndarray:
+        """Similarities of rows start:stop against every row."""
+        cached = self._matrices.get(metric)
+        if cached is not None:
+            return cached[start:stop]
+        if metric == "cosine":
+            unit = self._unit_standardized()
+            return unit[start:stop] @ unit.T
+        if metric == "range":
+            return self._range_block(start, stop)
+        raise ValueError(f"Unknown similarity metric: {metric}")
+
+    def _unit_standardized(self) -> np.ndarray:
+        """Standardized cosine features scaled to unit length (zero rows stay zero)."""
+        if self._unit is None:
+            features = self.values(METRIC_COLUMNS["cosine"])
+            scale = features.std(axis=0)
+            scale[scale == 0] = 1.0
+            standardized = (features - features.mean(axis=0)) / scale
+            norms = np.linalg.norm(standardized, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            self._unit = standardized / norms
+        return self._unit
+
+    def _range_block(self, start: int, stop: int) -> np.ndarray:
+        columns = METRIC_COLUMNS["range"]
+        scaled = self.values(columns) / np.array([FEATURE_RANGES[c] for c in columns])
+        similarities = np.empty((stop - start, len(self)))
+        step = max(1, _MAX_BROADCAST_ELEMENTS // max(1, len(self) * len(columns)))
+        for chunk in range(start, stop, step):
+            end = min(chunk + step, stop)
+            # (rows, 1, F) - (1, N, F) -> mean absolute difference per pair
+            distance = np.abs(scaled[chunk:end, None, :] - scaled[None, :, :]).mean(axis=2)
+            similarities[chunk - start:end - start] = np.maximum(0.0, 1.0 - distance)
+        rows = np.arange(start, stop)
+        similarities[rows - start, rows] = 1.0
+        return similarities
@@ -4,20 +4,36 @@ Handles weather data, air quality, astronomical data, and advanced search.
 Implements robust error recovery and fallback mechanisms.
 """
 
-import json
+import asyncio
+import importlib.util
 import logging
 import random
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable, Set, Tuple
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+# aiohttp is only used by batch fetches, so it is imported on first use
+AIOHTTP_AVAILABLE = importlib.util.find_spec("aiohttp") is not None
+aiohttp = None
+
+
+def _load_aiohttp():
+    """Import aiohttp into this module on first use."""
+    global aiohttp
+    if aiohttp is None:
+        import aiohttp as aiohttp_module
+
+        aiohttp = aiohttp_module
+    return aiohttp
+
 from .models import (
     WeatherCondition,
     WeatherData,
@@ -25,6 +41,18 @@ from .models import (
     Location,
 )
 from ..config.config_service import ConfigService
+from ..cache.tiered_cache import get_tiered_cache
+from ..cache.geocode_store import get_geocode_store
+from .gazetteer import GazetteerPlace, get_gazetteer
+from ..cache.persistent_store import (
+    JSONFileCacheBackend,
+    PersistentCacheStore,
+    create_cache_backend,
+    entry_timestamp,
+    migrate_json_cache,
+)
+from ...utils.api_optimizer import RateLimiter, SingleFlight
+from ...utils.spatial_index import SpatialIndex
 
 
 # Custom Exception Types for Different Failure Modes
@@ -209,6 +237,22 @@ class WeatherAlert:
         return cls(**data)
 
 
+def _parse_optional_datetime(value: Any) -> Optional[datetime]:
+    """Parse an ISO timestamp (or pass through a datetime/None)."""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value
+
+
+def _parse_condition(value: Any) -> WeatherCondition:
+    """Parse a condition value, including the legacy 'WeatherCondition.X' form."""
+    if isinstance(value, WeatherCondition):
+        return value
+    if value.startswith("WeatherCondition."):
+        return WeatherCondition[value.split(".")[-1]]
+    return WeatherCondition(value)
+
+
 @dataclass
 class EnhancedWeatherData(WeatherData):
     """Enhanced weather data with additional information."""
@@ -222,6 +266,87 @@ class EnhancedWeatherData(WeatherData):
         if self.alerts is None:
             self.alerts = []
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the cached dictionary form used for persistence.
+
+        Fields are copied explicitly rather than via asdict(), which deep-copies
+        raw_data and every nested object. forecast_data is not persisted.
+        """
+        location = self.location
+        return {
+            "weather": {
+                "location": {
+                    "name": location.name,
+                    "country": location.country,
+                    "state": location.state,
+                    "latitude": location.latitude,
+                    "longitude": location.longitude,
+                    "timezone": location.timezone,
+                },
+                "timestamp": self.timestamp.isoformat(),
+                "condition": self.condition.value,
+                "description": self.description,
+                "temperature": self.temperature,
+                "feels_like": self.feels_like,
+                "humidity": self.humidity,
+                "pressure": self.pressure,
+                "visibility": self.visibility,
+                "uv_index": self.uv_index,
+                "wind_speed": self.wind_speed,
+                "wind_direction": self.wind_direction,
+                "wind_gust": self.wind_gust,
+                "cloudiness": self.cloudiness,
+                "sunrise": self.sunrise.isoformat() if self.sunrise else None,
+                "sunset": self.sunset.isoformat() if self.sunset else None,
+                "raw_data": self.raw_data,
+            },
+            "air_quality": self.air_quality.to_dict() if self.air_quality else None,
+            "astronomical": self.astronomical.to_dict() if self.astronomical else None,
+            "alerts": [alert.to_dict() for alert in self.alerts] if self.alerts else [],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EnhancedWeatherData":
+        """Create from the cached dictionary form.
+
+        Also reads entries written by the previous asdict()-based format.
+        Nested dictionaries are copied before decoding so the cached form is
+        never mutated.
+        """
+        weather = data["weather"]
+        location = weather["location"]
+        if isinstance(location, dict):
+            location = Location(**location)
+
+        weather_data = cls(
+            location=location,
+            timestamp=_parse_optional_datetime(weather["timestamp"]),
+            condition=_parse_condition(weather["condition"]),
+            description=weather["description"],
+            temperature=weather["temperature"],
+            feels_like=weather["feels_like"],
+            humidity=weather["humidity"],
+            pressure=weather["pressure"],
+            visibility=weather.get("visibility"),
+            uv_index=weather.get("uv_index"),
+            wind_speed=weather.get("wind_speed"),
+            wind_direction=weather.get("wind_direction"),
+            wind_gust=weather.get("wind_gust"),
+            cloudiness=weather.get("cloudiness"),
+            sunrise=_parse_optional_datetime(weather.get("sunrise")),
+            sunset=_parse_optional_datetime(weather.get("sunset")),
+            raw_data=weather.get("raw_data") or {},
+        )
+
+        if data.get("air_quality"):
+            weather_data.air_quality = AirQualityData.from_dict(dict(data["air_quality"]))
+        if data.get("astronomical"):
+            weather_data.astronomical = AstronomicalData.from_dict(dict(data["astronomical"]))
+        if data.get("alerts"):
+            weather_data.alerts = [WeatherAlert.from_dict(dict(alert)) for alert in data["alerts"]]
+
+        return weather_data
+
 
 class LocationSearchResult:
     """Location search result with enhanced information."""
@@ -269,10 +394,50 @@ class EnhancedWeatherService:
         """Initialize enhanced weather service with robust error recovery."""
         self.config = config_service
         self.logger = logging.getLogger("weather_dashboard.enhanced_weather_service")
-        self._cache: Dict[str, Dict[str, Any]] = {}
         self._cache_file = Path.cwd() / "cache" / "enhanced_weather_cache.json"
+        self._cache_backend = self.config.get_setting("cache.enhanced_weather_backend", "sqlite")
+
+        # Enhanced caching with TTL and stale data support
+        self._cache_ttl = {
+            "current_weather": 600,  # 10 minutes
+            "forecast": 3600,  # 1 hour
+            "air_quality": 1800,  # 30 minutes
+            "geocoding": 86400 * 7,  # 7 days
+            "stale_acceptable": 7200,  # 2 hours for stale data
+        }
         self._load_cache()
 
+        # Decoded EnhancedWeatherData objects keyed by cache key, so repeated
+        # reads skip re-hydrating the cached dictionary form
+        self._weather_objects = get_tiered_cache().namespace(
+            "enhanced_weather_objects",
+            ttl=self._cache_ttl["stale_acceptable"],
+            max_entries=self.config.get_setting("cache.decoded_weather_entries", 256),
+        )
+
+        # Stale-while-revalidate: entries past their TTL but within
+        # stale_acceptable are served immediately and refreshed in the background
+        self._stale_while_revalidate = self.config.get_setting(
+            "cache.stale_while_revalidate", True
+        )
+        self._revalidation_workers = self.config.get_setting("cache.revalidation_workers", 2)
+        self._revalidation_executor: Optional[ThreadPoolExecutor] = None
+        self._revalidating: Set[str] = set()
+        self._revalidation_lock = threading.Lock()
+
+        # Offline city gazetteer answers place-name searches before the geocoding API
+        self._gazetteer_path = self.config.get_setting("search.gazetteer_path", None)
+
+        # Reverse geocoding answers from earlier results or the nearest known
+        # city before calling the API (one request per map click otherwise)
+        self._reverse_cache_radius_km = self.config.get_setting("search.reverse_cache_radius_km", 1.0)
+        self._reverse_city_radius_km = self.config.get_setting("search.reverse_city_radius_km", 20.0)
+        self._reverse_results: SpatialIndex[LocationSearchResult] = SpatialIndex(max_points=1000)
+
+        # Forward geocoding answers and misses persist in the shared geocode store
+        self._geocode_store = get_geocode_store()
+        self._geocode_source = "openweather"
+
         # Offline mode detection
         self._offline_mode = False
         self._last_successful_request = time.time()
@@ -298,14 +463,19 @@ class EnhancedWeatherService:
         # Connection pooling and retry strategy with proper timeouts
         self._session = self._create_session_with_retries()
 
-        # Enhanced caching with TTL and stale data support
-        self._cache_ttl = {
-            "current_weather": 600,  # 10 minutes
-            "forecast": 3600,  # 1 hour
-            "air_quality": 1800,  # 30 minutes
-            "geocoding": 86400 * 7,  # 7 days
-            "stale_acceptable": 7200,  # 2 hours for stale data
-        }
+        # Identical concurrent requests (tabs, comparison panel, collector,
+        # observers) share one in-flight HTTP call
+        self._single_flight = SingleFlight()
+
+        # Batched async fetching: token bucket shared by all coroutines
+        # instead of sleeping a fixed interval before every call
+        self._max_concurrent_requests = self.config.get_setting(
+            "api.max_concurrent_requests", 8
+        )
+        self._async_rate_limiter = RateLimiter(
+            requests_per_second=self.config.get_setting("api.requests_per_second", 5.0),
+            burst_size=self.config.get_setting("api.request_burst_size", 10),
+        )
 
         self.logger.info("🌐 Enhanced Weather Service initialized with robust error recovery")
 
@@ -321,22 +491,31 @@ class EnhancedWeatherService:
         self._observer_lock = threading.Lock()
 
     def _load_cache(self) -> None:
-        """Load enhanced weather cache from file."""
+        """Open the enhanced weather cache store, migrating the legacy JSON file."""
         try:
-            if self._cache_file.exists():
-                with open(self._cache_file, "r", encoding="utf-8") as f:
-                    self._cache = json.load(f)
-                self.logger.debug(f"📁 Loaded enhanced cache with {len(self._cache)} entries")
+            backend = create_cache_backend(self._cache_backend, self._cache_file)
         except Exception as e:
-            self.logger.warning(f"Failed to load enhanced cache: {e}")
-            self._cache = {}
+            self.logger.warning(f"Failed to open enhanced cache backend '{self._cache_backend}': {e}")
+            backend = JSONFileCacheBackend(self._cache_file)
+
+        self._cache = PersistentCacheStore(
+            backend,
+            default_ttl=self._cache_ttl["forecast"],
+            stale_grace=self._cache_ttl["stale_acceptable"],
+        )
+
+        if not isinstance(backend, JSONFileCacheBackend):
+            try:
+                migrate_json_cache(self._cache_file, self._cache)
+            except Exception as e:
+                self.logger.warning(f"Failed to migrate legacy enhanced cache: {e}")
+
+        self.logger.debug(f"📁 Opened enhanced cache with {len(self._cache)} entries")
 
     def _save_cache(self) -> None:
-        """Save enhanced weather cache to file."""
+        """Persist changed enhanced weather cache entries."""
         try:
-            self._cache_file.parent.mkdir(exist_ok=True)
-            with open(self._cache_file, "w", encoding="utf-8") as f:
-                json.dump(self._cache, f, indent=2, default=str)
+            self._cache.flush()
         except Exception as e:
             self.logger.warning(f"Failed to save enhanced cache: {e}")
 
@@ -392,6 +571,10 @@ class EnhancedWeatherService:
             if dead_observers:
                 self.logger.info(f"Cleaned up {len(dead_observers)} dead observers")
     
+    def get_request_coalescing_stats(self) -> Dict[str, Any]:
+        """Get statistics on how many API calls were coalesced into in-flight requests."""
+        return self._single_flight.get_statistics()
+
     def get_observer_count(self) -> int:
         """Get the current number of active observers."""
         with self._observer_lock:
@@ -561,6 +744,74 @@ class EnhancedWeatherService:
 
         return None
 
+    def _get_revalidatable_data(self, cache_key: str, cache_type: str) -> Optional[Dict[str, Any]]:
+        """Get cached data that is past its TTL but still within the stale window.
+
+        Returns None when stale-while-revalidate is disabled, the entry is
+        missing, still fresh, or older than stale_acceptable.
+        """
+        if not self._stale_while_revalidate or cache_key not in self._cache:
+            return None
+
+        cached_data = self._cache[cache_key]
+        if "data" not in cached_data or "timestamp" not in cached_data:
+            return None
+
+        cache_age = time.time() - entry_timestamp(cached_data)
+        ttl = self._cache_ttl.get(cache_type, 600)
+        if ttl <= cache_age < self._cache_ttl["stale_acceptable"]:
+            return cached_data["data"]
+        return None
+
+    def _schedule_revalidation(self, cache_key: str, refresh: Callable[[], Any]) -> bool:
+        """Run refresh in the background unless one is already pending for cache_key.
+
+        Args:
+            cache_key: Cache key being refreshed (deduplication key)
+            refresh: Callable that fetches and stores fresh data
+
+        Returns:
+            True if a new refresh was scheduled
+        """
+        with self._revalidation_lock:
+            if cache_key in self._revalidating:
+                return False
+            self._revalidating.add(cache_key)
+            if self._revalidation_executor is None:
+                self._revalidation_executor = ThreadPoolExecutor(
+                    max_workers=self._revalidation_workers,
+                    thread_name_prefix="WeatherRevalidate",
+                )
+            executor = self._revalidation_executor
+
+        def run() -> None:
+            try:
+                refresh()
+                self.logger.debug(f"🔄 Revalidated {cache_key}")
+            except Exception as e:
+                self.logger.warning(f"⚠️ Background refresh failed for {cache_key}: {e}")
+            finally:
+                with self._revalidation_lock:
+                    self._revalidating.discard(cache_key)
+
+        try:
+            executor.submit(run)
+        except RuntimeError:
+            # Executor shut down
+            with self._revalidation_lock:
+                self._revalidating.discard(cache_key)
+            return False
+        return True
+
+    def get_revalidation_stats(self) -> Dict[str, Any]:
+        """Get stale-while-revalidate state."""
+        with self._revalidation_lock:
+            return {
+                "enabled": bool(self._stale_while_revalidate),
+                "pending": sorted(self._revalidating),
+                "workers": self._revalidation_workers,
+            }
+
     def _convert_to_weatherapi(self, endpoint: str, params: Dict[str, Any], api_key: str) -> tuple[Optional[str], Dict[str, Any]]:
         """Convert OpenWeather API endpoint to WeatherAPI format.
         
@@ -684,7 +935,88 @@ class EnhancedWeatherService:
 
         return fallbacks.get(data_type, {"error": "No offline data available"})
 
+    def _resolve_request_target(
+        self, endpoint: str, params: Dict[str, Any]
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Resolve the URL and parameters for the currently active API.
+
+        Args:
+            endpoint: OpenWeather endpoint (e.g., 'weather', 'forecast')
+            params: Request parameters (updated in place for OpenWeather)
+
+        Returns:
+            Tuple of (url, params) for the API selected by the fallback chain
+        """
+        if self._current_api == "openweather_backup":
+            # Use backup OpenWeather API key
+            backup_key = self.config.get_setting("api.openweather_backup_api_key")
+            params.update({"appid": backup_key, "units": self.config.weather.units})
+            return f"{self.base_url}/{endpoint}", params
+
+        if self._current_api == "weatherapi":
+            # WeatherAPI configuration
+            weatherapi_key = self.config.get_setting("api.weatherapi_api_key")
+            if weatherapi_key:
+                # Convert OpenWeather endpoint to WeatherAPI format
+                weatherapi_url, weatherapi_params = self._convert_to_weatherapi(
+                    endpoint, params, weatherapi_key
+                )
+                if weatherapi_url:
+                    return weatherapi_url, weatherapi_params
+                self.logger.warning("🔄 WeatherAPI endpoint conversion failed, using OpenWeather format")
+            else:
+                self.logger.warning("🔄 WeatherAPI key not available, using primary OpenWeather")
+
+        params.update({"appid": self.api_key, "units": self.config.weather.units})
+        return f"{self.base_url}/{endpoint}", params
+
+    def _check_response_status(self, status_code: int, headers: Any, endpoint: str) -> bool:
+        """Update error tracking for a response status and raise on failures.
+
+        Args:
+            status_code: HTTP status code of the response
+            headers: Response headers (used for Retry-After)
+            endpoint: Endpoint that was requested
+
+        Returns:
+            True if the response body should be parsed, False if the endpoint
+            legitimately has no data for the location
+
+        Raises:
+            RateLimitError, APIKeyError, ValueError, ServiceUnavailableError
+        """
+        if status_code == 200:
+            # Success - reset error tracking
+            self._last_successful_request = time.time()
+            self._offline_mode = False
+            self._reset_backoff()
+            return True
+        elif status_code == 429:
+            # Rate limit exceeded
+            self._consecutive_failures += 1
+            retry_after = int(headers.get("Retry-After", self._current_backoff))
+            raise RateLimitError(retry_after)
+        elif status_code == 401:
+            # Invalid API key
+            raise APIKeyError("Invalid API key - please check your configuration")
+        elif status_code == 404:
+            # Location not found - handle differently for air quality vs weather
+            if "air_pollution" in endpoint:
+                # Air quality data not available for this location - return None gracefully
+                return False
+            # Weather/geocoding location not found - this is an error
+            raise ValueError("Location not found - please check the spelling")
+        else:
+            # Other HTTP errors
+            self._consecutive_failures += 1
+            raise ServiceUnavailableError(f"API returned status {status_code}")
+
     def _make_request(self, endpoint: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Make API request, coalescing concurrent identical requests into one call."""
+        flight_key = SingleFlight.make_key(endpoint, params)
+        return self._single_flight.do(flight_key, lambda: self._execute_request(endpoint, params))
+
+    def _execute_request(self, endpoint: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Make API request with robust error handling, fallback, and intelligent caching."""
         cache_key = f"{endpoint}_{str(sorted(params.items()))}"
 
@@ -709,62 +1041,14 @@ class EnhancedWeatherService:
             self._rate_limit()
 
             # Configure API parameters based on current API
-            if self._current_api == "openweather":
-                params.update({"appid": self.api_key, "units": self.config.weather.units})
-                url = f"{self.base_url}/{endpoint}"
-            elif self._current_api == "openweather_backup":
-                # Use backup OpenWeather API key
-                backup_key = self.config.get_setting("api.openweather_backup_api_key")
-                params.update({"appid": backup_key, "units": self.config.weather.units})
-                url = f"{self.base_url}/{endpoint}"
-            elif self._current_api == "weatherapi":
-                # WeatherAPI configuration
-                weatherapi_key = self.config.get_setting("api.weatherapi_api_key")
-                if weatherapi_key:
-                    # Convert OpenWeather endpoint to WeatherAPI format
-                    weatherapi_url, weatherapi_params = self._convert_to_weatherapi(endpoint, params, weatherapi_key)
-                    if weatherapi_url:
-                        url = weatherapi_url
-                        params = weatherapi_params
-                    else:
-                        self.logger.warning("🔄 WeatherAPI endpoint conversion failed, using OpenWeather format")
-                        params.update({"appid": self.api_key, "units": self.config.weather.units})
-                        url = f"{self.base_url}/{endpoint}"
-                else:
-                    self.logger.warning("🔄 WeatherAPI key not available, using primary OpenWeather")
-                    params.update({"appid": self.api_key, "units": self.config.weather.units})
-                    url = f"{self.base_url}/{endpoint}"
-
+            url, params = self._resolve_request_target(endpoint, params)
 
             # Use session with connection pooling and retries
             response = self._session.get(url, params=params)
 
-            if response.status_code == 200:
-                # Success - reset error tracking
-                self._last_successful_request = time.time()
-                self._offline_mode = False
-                self._reset_backoff()
+            if self._check_response_status(response.status_code, response.headers, endpoint):
                 return response.json()
-            elif response.status_code == 429:
-                # Rate limit exceeded
-                self._consecutive_failures += 1
-                retry_after = int(response.headers.get("Retry-After", self._current_backoff))
-                raise RateLimitError(retry_after)
-            elif response.status_code == 401:
-                # Invalid API key
-                raise APIKeyError("Invalid API key - please check your configuration")
-            elif response.status_code == 404:
-                # Location not found - handle differently for air quality vs weather
-                if "air_pollution" in endpoint:
-                    # Air quality data not available for this location - return None gracefully
-                    return None
-                else:
-                    # Weather/geocoding location not found - this is an error
-                    raise ValueError("Location not found - please check the spelling")
-            else:
-                # Other HTTP errors
-                self._consecutive_failures += 1
-                raise ServiceUnavailableError(f"API returned status {response.status_code}")
+            return None
 
         except (requests.exceptions.Timeout, requests.exceptions.ReadTimeout):
             self.logger.error("⏰ API request timed out")
@@ -811,6 +1095,15 @@ class EnhancedWeatherService:
 
     def _make_geocoding_request(
         self, endpoint: str, params: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Make geocoding API request, coalescing concurrent identical lookups."""
+        flight_key = SingleFlight.make_key(f"geocoding/{endpoint}", params)
+        return self._single_flight.do(
+            flight_key, lambda: self._execute_geocoding_request(endpoint, params)
+        )
+
+    def _execute_geocoding_request(
+        self, endpoint: str, params: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
         """Make geocoding API request with robust error handling and caching."""
         cache_key = f"geocoding_{endpoint}_{str(sorted(params.items()))}"
@@ -1019,7 +1312,7 @@ class EnhancedWeatherService:
 
     def geocode_zip(self, zip_code: str) -> List["LocationResult"]:
         """Geocode a zip/postal code."""
-        from ..models.location import LocationResult
+        from ...models.location import LocationResult
 
         try:
             # Convert existing LocationSearchResult to LocationResult
@@ -1052,7 +1345,7 @@ class EnhancedWeatherService:
         """Reverse geocode coordinates."""
         import re
 
-        from ..models.location import LocationResult
+        from ...models.location import LocationResult
 
         try:
             coordinate_pattern = re.compile(r"^(-?\d+\.?\d*),\s*(-?\d+\.?\d*)$")
@@ -1088,7 +1381,7 @@ class EnhancedWeatherService:
 
     def search_cities_fuzzy(self, query: str) -> List["LocationResult"]:
         """Search cities with fuzzy matching."""
-        from ..models.location import LocationResult
+        from ...models.location import LocationResult
 
         try:
             # Convert existing geocoding search to LocationResult
@@ -1212,6 +1505,24 @@ class EnhancedWeatherService:
                 self.logger.warning(f"Geocoding fallback also failed for {zipcode}: {fallback_e}")
                 return []
 
+    def _reverse_geocode_local(self, lat: float, lon: float) -> Optional[LocationSearchResult]:
+        """Name coordinates from earlier answers or the nearest gazetteer city, or None."""
+        match = self._reverse_results.nearest(lat, lon, self._reverse_cache_radius_km)
+        if match:
+            known = match.value
+        else:
+            gazetteer = get_gazetteer(self._gazetteer_path)
+            nearest = gazetteer.nearest(lat, lon, self._reverse_city_radius_km) if gazetteer else None
+            if nearest is None:
+                return None
+            place, _ = nearest
+            known = LocationSearchResult(
+                name=place.name, country=place.country_code, state=place.admin1
+            )
+        return LocationSearchResult(
+            name=known.name, country=known.country, state=known.state, lat=lat, lon=lon
+        )
+
     def _search_by_coordinates(self, coords: str) -> List[LocationSearchResult]:
         """Search location by coordinates using reverse geocoding."""
         try:
@@ -1236,6 +1547,10 @@ class EnhancedWeatherService:
                 )
 
 
+            local_result = self._reverse_geocode_local(lat, lon)
+            if local_result:
+                return [local_result]
+
             # Use reverse geocoding
             data = self._make_geocoding_request(
                 "geo/1.0/reverse", {"lat": lat, "lon": lon, "limit": 1}
@@ -1250,6 +1565,7 @@ class EnhancedWeatherService:
                     lat=lat,
                     lon=lon,
                 )
+                self._reverse_results.insert((lat, lon), lat, lon, location)
                 return [location]
 
             # If reverse geocoding fails, still return the coordinates as a
@@ -1266,9 +1582,42 @@ class EnhancedWeatherService:
             self.logger.warning(f"Coordinate search failed for {coords}: {e}")
             return []
 
+    def _search_gazetteer(self, query: str, limit: int = 5) -> List[GazetteerPlace]:
+        """Search the offline gazetteer; empty when it is missing or has no match."""
+        gazetteer = get_gazetteer(self._gazetteer_path)
+        if gazetteer is None:
+            return []
+        try:
+            return gazetteer.search(query, limit=limit)
+        except Exception as e:
+            self.logger.warning(f"Gazetteer search failed for {query}: {e}")
+            return []
+
+    @staticmethod
+    def _gazetteer_result(place: GazetteerPlace) -> LocationSearchResult:
+        """Create a LocationSearchResult from an offline gazetteer match."""
+        return LocationSearchResult(
+            name=place.name,
+            country=place.country_code,
+            state=place.admin1,
+            lat=place.latitude,
+            lon=place.longitude,
+        )
+
     def _search_by_geocoding(self, query: str, limit: int = 5) -> List[LocationSearchResult]:
         """Search location using standard geocoding API with multiple query
         strategies and enhanced fallback."""
+        # Place names resolve locally when the gazetteer knows them; loose
+        # fuzzy matches only supplement (or stand in for) the API's answer
+        fuzzy_results: List[LocationSearchResult] = []
+        if self._detect_query_type(query) not in ("zipcode", "coordinates"):
+            places = self._search_gazetteer(query, limit)
+            local_results = [self._gazetteer_result(place) for place in places if place.confident]
+            if local_results:
+                self.logger.debug(f"🗺️ Found {len(local_results)} locations offline for: {query}")
+                return local_results
+            fuzzy_results = [self._gazetteer_result(place) for place in places]
+
         # Try multiple query formats for better results
         query_variations = self._generate_query_variations(query)
 
@@ -1290,9 +1639,7 @@ class EnhancedWeatherService:
                     f"🏙️ Geocoding search attempt {i + 1}/{len(query_variations)}: {query_variant}"
                 )
 
-                data = self._make_geocoding_request(
-                    "geo/1.0/direct", {"q": query_variant, "limit": limit}
-                )
+                data = self._geocode_query(query_variant, limit)
 
                 if data and len(data) > 0:
                     locations = []
@@ -1310,14 +1657,38 @@ class EnhancedWeatherService:
                         f"✅ Found {
                             len(locations)} locations with query: {query_variant}"
                     )
-                    return locations
+                    return self._merge_location_results(locations, fuzzy_results, limit)
 
             except Exception as e:
                 continue
 
+        if fuzzy_results:
+            self.logger.debug(f"🗺️ Falling back to {len(fuzzy_results)} close offline matches for: {query}")
+            return fuzzy_results
+
         self.logger.warning(f"All geocoding attempts failed for: {query}")
         return []
 
+    @staticmethod
+    def _merge_location_results(
+        primary: List[LocationSearchResult], extra: List[LocationSearchResult], limit: int
+    ) -> List[LocationSearchResult]:
+        """Append extra results not already in primary (same place to ~1 km), up to limit."""
+        merged = list(primary)
+        seen = {
+            (round(loc.lat, 2), round(loc.lon, 2))
+            for loc in primary
+            if loc.lat is not None and loc.lon is not None
+        }
+        for loc in extra:
+            if len(merged) >= limit:
+                break
+            key = (round(loc.lat, 2), round(loc.lon, 2))
+            if key not in seen:
+                seen.add(key)
+                merged.append(loc)
+        return merged
+
     def _search_by_airport(self, airport_code: str, limit: int = 5) -> List[LocationSearchResult]:
         """Search location by airport code (IATA/ICAO) with comprehensive airport database."""
         try:
@@ -1470,13 +1841,35 @@ class EnhancedWeatherService:
         return variations
 
     def _geocode_query(self, query: str, limit: int = 5) -> Optional[List[Dict[str, Any]]]:
-        """Make geocoding request with proper error handling."""
+        """Make geocoding request with proper error handling.
+
+        Answers come from the geocode store when it holds at least limit
+        results for the query (or a cached miss); fresh answers are stored,
+        and misses only when the API actually answered.
+        """
+        entry = self._geocode_store.get(self._geocode_source, query)
+        if entry is not None:
+            if entry.is_negative:
+                return []
+            if entry.payload["limit"] >= limit or len(entry.payload["results"]) < entry.payload["limit"]:
+                return entry.payload["results"][:limit]
+
         try:
             # Use the new geocoding request method
             data = self._make_geocoding_request(
                 "geo/1.0/direct", {"q": query, "limit": limit}
             )
 
+            # Offline mode and network failures answer from stale data (or
+            # nothing), which must not be stored as a fresh answer
+            if not self._offline_mode and self._consecutive_failures == 0:
+                if data:
+                    self._geocode_store.put(
+                        self._geocode_source, query, {"limit": limit, "results": data}
+                    )
+                else:
+                    self._geocode_store.put_negative(self._geocode_source, query)
+
             return data if data else []
 
         except Exception as e:
@@ -1484,6 +1877,32 @@ class EnhancedWeatherService:
                 raise e
             raise Exception(f"Request failed: {str(e)}")
 
+    def _parse_air_quality_payload(self, data: Dict[str, Any]) -> AirQualityData:
+        """Parse an OpenWeather air pollution payload into air quality data."""
+        pollution_data = data["list"][0]
+        components = pollution_data["components"]
+
+        return AirQualityData(
+            aqi=pollution_data["main"]["aqi"],
+            co=components.get("co", 0),
+            no=components.get("no", 0),
+            no2=components.get("no2", 0),
+            o3=components.get("o3", 0),
+            so2=components.get("so2", 0),
+            pm2_5=components.get("pm2_5", 0),
+            pm10=components.get("pm10", 0),
+            nh3=components.get("nh3", 0),
+            timestamp=datetime.now(),
+        )
+
+    def _store_air_quality(self, cache_key: str, air_quality: AirQualityData) -> None:
+        """Store air quality data in the in-memory cache (without persisting)."""
+        self._cache[cache_key] = {
+            "data": air_quality.to_dict(),
+            "timestamp": datetime.now().isoformat(),
+            "ttl": self._cache_ttl["air_quality"],
+        }
+
     def get_air_quality(self, lat: float, lon: float) -> Optional[AirQualityData]:
         """Get air quality data for coordinates."""
         cache_key = f"air_quality_{lat}_{lon}"
@@ -1500,28 +1919,10 @@ class EnhancedWeatherService:
             if not data or "list" not in data or not data["list"]:
                 return None
 
-            pollution_data = data["list"][0]
-            components = pollution_data["components"]
-
-            air_quality = AirQualityData(
-                aqi=pollution_data["main"]["aqi"],
-                co=components.get("co", 0),
-                no=components.get("no", 0),
-                no2=components.get("no2", 0),
-                o3=components.get("o3", 0),
-                so2=components.get("so2", 0),
-                pm2_5=components.get("pm2_5", 0),
-                pm10=components.get("pm10", 0),
-                nh3=components.get("nh3", 0),
-                timestamp=datetime.now(),
-            )
+            air_quality = self._parse_air_quality_payload(data)
 
             # Cache the result with TTL (30 minutes)
-            self._cache[cache_key] = {
-                "data": air_quality.to_dict(),
-                "timestamp": datetime.now().isoformat(),
-                "ttl": self._cache_ttl["air_quality"],
-            }
+            self._store_air_quality(cache_key, air_quality)
             self._save_cache()
 
             self.logger.info(
@@ -1538,6 +1939,24 @@ class EnhancedWeatherService:
                 self.logger.warning(f"Air quality fetch failed: {e}")
             return None
 
+    def _build_astronomical_data(self, data: Dict[str, Any]) -> AstronomicalData:
+        """Build astronomical data from the sunrise/sunset of a weather payload."""
+        sunrise = datetime.fromtimestamp(data["sys"]["sunrise"])
+        sunset = datetime.fromtimestamp(data["sys"]["sunset"])
+        day_length = sunset - sunrise
+
+        # Simulate moon phase (in real app, use astronomy API)
+        moon_phase = random.random()
+
+        return AstronomicalData(
+            sunrise=sunrise,
+            sunset=sunset,
+            moonrise=None,  # Would need astronomy API
+            moonset=None,  # Would need astronomy API
+            moon_phase=moon_phase,
+            day_length=day_length,
+        )
+
     def get_astronomical_data(self, lat: float, lon: float) -> Optional[AstronomicalData]:
         """Get astronomical data for coordinates."""
         # This would typically use a separate astronomy API
@@ -1548,23 +1967,7 @@ class EnhancedWeatherService:
             if not data or "sys" not in data:
                 return None
 
-            sunrise = datetime.fromtimestamp(data["sys"]["sunrise"])
-            sunset = datetime.fromtimestamp(data["sys"]["sunset"])
-            day_length = sunset - sunrise
-
-            # Simulate moon phase (in real app, use astronomy API)
-            import random
-
-            moon_phase = random.random()
-
-            astronomical = AstronomicalData(
-                sunrise=sunrise,
-                sunset=sunset,
-                moonrise=None,  # Would need astronomy API
-                moonset=None,  # Would need astronomy API
-                moon_phase=moon_phase,
-                day_length=day_length,
-            )
+            astronomical = self._build_astronomical_data(data)
 
             return astronomical
 
@@ -1583,6 +1986,77 @@ class EnhancedWeatherService:
             self.logger.warning(f"Weather alerts fetch failed: {e}")
             return []
 
+    def _get_decoded_weather(self, cache_key: str) -> Optional[Tuple[float, EnhancedWeatherData]]:
+        """Get (fetched_at, EnhancedWeatherData) for a cache key.
+
+        Serves the decoded-object tier first and decodes the persisted entry
+        only on a tier miss (e.g. after a restart). Returned objects are shared
+        between callers.
+        """
+        decoded = self._weather_objects.get(cache_key)
+        if decoded is not None:
+            return decoded
+
+        if cache_key not in self._cache:
+            return None
+
+        cached_entry = self._cache[cache_key]
+        try:
+            weather_data = EnhancedWeatherData.from_dict(cached_entry["data"])
+        except Exception as e:
+            self.logger.warning(f"Failed to decode cached weather for {cache_key}: {e}")
+            return None
+
+        fetched_at = entry_timestamp(cached_entry)
+        remaining = self._cache_ttl["stale_acceptable"] - (time.time() - fetched_at)
+        if remaining <= 0:
+            return None
+
+        decoded = (fetched_at, weather_data)
+        self._weather_objects.set(cache_key, decoded, ttl=remaining)
+        return decoded
+
+    def _store_enhanced_weather(self, cache_key: str, weather_data: EnhancedWeatherData) -> None:
+        """Store enhanced weather data in the decoded tier and cache store (without persisting)."""
+        fetched_at = time.time()
+        self._weather_objects.set(cache_key, (fetched_at, weather_data))
+
+        # Cache with TTL for current weather (10 minutes)
+        self._cache[cache_key] = {
+            "data": weather_data.to_dict(),
+            "timestamp": datetime.fromtimestamp(fetched_at).isoformat(),
+            "ttl": self._cache_ttl["current_weather"],
+        }
+
+    def _parse_weather_payload(self, data: Dict[str, Any]) -> EnhancedWeatherData:
+        """Parse an OpenWeather current weather payload into enhanced weather data."""
+        location_obj = Location(
+            name=data["name"],
+            country=data["sys"]["country"],
+            latitude=data["coord"]["lat"],
+            longitude=data["coord"]["lon"],
+        )
+
+        condition = WeatherCondition.from_openweather(
+            data["weather"][0]["main"], data["weather"][0]["description"]
+        )
+
+        return EnhancedWeatherData(
+            location=location_obj,
+            timestamp=datetime.now(),
+            condition=condition,
+            description=data["weather"][0]["description"].title(),
+            temperature=round(data["main"]["temp"], 1),
+            feels_like=round(data["main"]["feels_like"], 1),
+            humidity=data["main"]["humidity"],
+            pressure=data["main"]["pressure"],
+            visibility=data.get("visibility", 0) // 1000 if data.get("visibility") else None,
+            wind_speed=round(data["wind"]["speed"], 1) if "wind" in data else None,
+            wind_direction=data["wind"].get("deg", 0) if "wind" in data else None,
+            cloudiness=data["clouds"]["all"] if "clouds" in data else None,
+            raw_data=data,
+        )
+
     def get_enhanced_weather(self, location: str) -> EnhancedWeatherData:
         """Get enhanced weather data with all additional information."""
         # Validate and clean location input
@@ -1595,43 +2069,25 @@ class EnhancedWeatherService:
 
         cache_key = f"enhanced_{location.lower()}"
 
-        # Check cache first with TTL validation
-        if self._is_cache_valid_with_ttl(cache_key, "current_weather"):
-            cached_data = self._cache[cache_key]["data"]
+        decoded = self._get_decoded_weather(cache_key)
+        if decoded is not None:
+            fetched_at, weather_data = decoded
+            cache_age = time.time() - fetched_at
 
-            # Reconstruct enhanced weather data
-            weather_dict = cached_data["weather"].copy()
-            # Convert location dict back to Location object
-            if isinstance(weather_dict["location"], dict):
-                weather_dict["location"] = Location(**weather_dict["location"])
-            # Convert condition string back to WeatherCondition enum
-            if isinstance(weather_dict["condition"], str):
-                # Handle both enum string representation and direct value
-                condition_str = weather_dict["condition"]
-                if condition_str.startswith("WeatherCondition."):
-                    # Extract the enum name (e.g., 'CLEAR' from
-                    # 'WeatherCondition.CLEAR')
-                    enum_name = condition_str.split(".")[-1]
-                    weather_dict["condition"] = getattr(WeatherCondition, enum_name)
-                else:
-                    # Direct enum value (e.g., 'clear')
-                    weather_dict["condition"] = WeatherCondition(condition_str)
-            # Convert timestamp string back to datetime
-            if isinstance(weather_dict["timestamp"], str):
-                weather_dict["timestamp"] = datetime.fromisoformat(weather_dict["timestamp"])
-
-            weather_data = EnhancedWeatherData(**weather_dict)
-            if cached_data.get("air_quality"):
-                weather_data.air_quality = AirQualityData.from_dict(cached_data["air_quality"])
-            if cached_data.get("astronomical"):
-                weather_data.astronomical = AstronomicalData.from_dict(cached_data["astronomical"])
-            if cached_data.get("alerts"):
-                weather_data.alerts = [
-                    WeatherAlert.from_dict(alert) for alert in cached_data["alerts"]
-                ]
-
-            return weather_data
+            if cache_age < self._cache_ttl["current_weather"]:
+                return weather_data
+
+            # Serve stale data immediately; observers get the fresh data when it lands
+            if self._stale_while_revalidate:
+                self._schedule_revalidation(
+                    cache_key, lambda: self._fetch_enhanced_weather(location, cache_key)
+                )
+                return weather_data
+
+        return self._fetch_enhanced_weather(location, cache_key)
 
+    def _fetch_enhanced_weather(self, location: str, cache_key: str) -> EnhancedWeatherData:
+        """Fetch, cache and publish enhanced weather data for a location."""
         # Fetch basic weather data first
         self.logger.info(f"🌤️ Fetching enhanced weather for {location}")
 
@@ -1648,35 +2104,10 @@ class EnhancedWeatherService:
                 raise WeatherServiceError("No weather data received after rate limit retry")
         except (NetworkError, ServiceUnavailableError) as e:
             # Try to get stale cache data
-            stale_data = self._get_stale_cache_data(cache_key)
-            if stale_data:
+            decoded = self._get_decoded_weather(cache_key)
+            if decoded is not None:
                 self.logger.warning(f"🔄 Using stale cached data due to: {e}")
-                # Reconstruct from stale cache
-                weather_dict = stale_data["weather"].copy()
-                if isinstance(weather_dict["location"], dict):
-                    weather_dict["location"] = Location(**weather_dict["location"])
-                if isinstance(weather_dict["condition"], str):
-                    condition_str = weather_dict["condition"]
-                    if condition_str.startswith("WeatherCondition."):
-                        enum_name = condition_str.split(".")[-1]
-                        weather_dict["condition"] = getattr(WeatherCondition, enum_name)
-                    else:
-                        weather_dict["condition"] = WeatherCondition(condition_str)
-                if isinstance(weather_dict["timestamp"], str):
-                    weather_dict["timestamp"] = datetime.fromisoformat(weather_dict["timestamp"])
-
-                weather_data = EnhancedWeatherData(**weather_dict)
-                if stale_data.get("air_quality"):
-                    weather_data.air_quality = AirQualityData.from_dict(stale_data["air_quality"])
-                if stale_data.get("astronomical"):
-                    weather_data.astronomical = AstronomicalData.from_dict(
-                        stale_data["astronomical"]
-                    )
-                if stale_data.get("alerts"):
-                    weather_data.alerts = [
-                        WeatherAlert.from_dict(alert) for alert in stale_data["alerts"]
-                    ]
-                return weather_data
+                return decoded[1]
 
             # If no stale data, use offline fallback
             fallback_data = self._get_offline_fallback("weather", location)
@@ -1709,32 +2140,7 @@ class EnhancedWeatherService:
             raise WeatherServiceError(f"Failed to fetch weather data: {str(e)}") from e
 
         # Parse basic weather data
-        location_obj = Location(
-            name=data["name"],
-            country=data["sys"]["country"],
-            latitude=data["coord"]["lat"],
-            longitude=data["coord"]["lon"],
-        )
-
-        condition = WeatherCondition.from_openweather(
-            data["weather"][0]["main"], data["weather"][0]["description"]
-        )
-
-        weather_data = EnhancedWeatherData(
-            location=location_obj,
-            timestamp=datetime.now(),
-            condition=condition,
-            description=data["weather"][0]["description"].title(),
-            temperature=round(data["main"]["temp"], 1),
-            feels_like=round(data["main"]["feels_like"], 1),
-            humidity=data["main"]["humidity"],
-            pressure=data["main"]["pressure"],
-            visibility=data.get("visibility", 0) // 1000 if data.get("visibility") else None,
-            wind_speed=round(data["wind"]["speed"], 1) if "wind" in data else None,
-            wind_direction=data["wind"].get("deg", 0) if "wind" in data else None,
-            cloudiness=data["clouds"]["all"] if "clouds" in data else None,
-            raw_data=data,
-        )
+        weather_data = self._parse_weather_payload(data)
 
         # Get coordinates for additional data
         lat = data["coord"]["lat"]
@@ -1746,23 +2152,7 @@ class EnhancedWeatherService:
         weather_data.alerts = self.get_weather_alerts(lat, lon)
 
         # Cache the complete result
-        cache_data = {
-            "weather": asdict(weather_data),
-            "air_quality": weather_data.air_quality.to_dict() if weather_data.air_quality else None,
-            "astronomical": (
-                weather_data.astronomical.to_dict() if weather_data.astronomical else None
-            ),
-            "alerts": (
-                [alert.to_dict() for alert in weather_data.alerts] if weather_data.alerts else []
-            ),
-        }
-
-        # Cache with TTL for current weather (10 minutes)
-        self._cache[cache_key] = {
-            "data": cache_data,
-            "timestamp": datetime.now().isoformat(),
-            "ttl": self._cache_ttl["current_weather"],
-        }
+        self._store_enhanced_weather(cache_key, weather_data)
         self._save_cache()
 
         self.logger.info(f"✅ Enhanced weather data retrieved for {location}")
@@ -1826,6 +2216,7 @@ class EnhancedWeatherService:
         if not use_cache:
             # Clear cache for this location to force fresh data
             cache_key = f"enhanced_{location.lower()}"
+            self._weather_objects.delete(cache_key)
             if cache_key in self._cache:
                 del self._cache[cache_key]
         return self.get_enhanced_weather(location)
@@ -1929,20 +2320,19 @@ class EnhancedWeatherService:
             if self._is_cache_valid_with_ttl(cache_key, "forecast"):
                 return self._cache[cache_key]["data"]
 
+            stale_data = self._get_revalidatable_data(cache_key, "forecast")
+            if stale_data is not None:
+                self._schedule_revalidation(
+                    cache_key, lambda: self._fetch_forecast_payload(location, cache_key)
+                )
+                return stale_data
+
             # Fetch forecast data from API
             self.logger.info(f"🌤️ Fetching forecast data for {location}")
 
-            forecast_data = self._make_request("forecast", {"q": location})
+            forecast_data = self._fetch_forecast_payload(location, cache_key)
 
             if forecast_data:
-                # Cache the forecast data with TTL (1 hour)
-                self._cache[cache_key] = {
-                    "data": forecast_data,
-                    "timestamp": datetime.now().isoformat(),
-                    "ttl": self._cache_ttl["forecast"],
-                }
-                self._save_cache()
-
                 return forecast_data
             else:
                 self.logger.warning(f"No forecast data received for {location}")
@@ -1960,13 +2350,31 @@ class EnhancedWeatherService:
         if self._is_cache_valid_with_ttl(cache_key, "forecast"):
             return ForecastData.from_openweather_forecast(self._cache[cache_key]["data"])
 
+        stale_data = self._get_revalidatable_data(cache_key, "forecast")
+        if stale_data is not None:
+            self._schedule_revalidation(
+                cache_key, lambda: self._fetch_forecast_payload(location, cache_key)
+            )
+            return ForecastData.from_openweather_forecast(stale_data)
+
         try:
             # Fetch forecast data
-            data = self._make_request("forecast", {"q": location})
+            data = self._fetch_forecast_payload(location, cache_key)
 
             if not data:
                 raise Exception("No forecast data received")
 
+            return ForecastData.from_openweather_forecast(data)
+
+        except Exception as e:
+            self.logger.error(f"Forecast fetch failed: {e}")
+            raise
+
+    def _fetch_forecast_payload(self, location: str, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Fetch a raw forecast payload and cache it with the forecast TTL."""
+        data = self._make_request("forecast", {"q": location})
+
+        if data:
             # Cache the result with TTL (1 hour)
             self._cache[cache_key] = {
                 "data": data,
@@ -1975,15 +2383,315 @@ class EnhancedWeatherService:
             }
             self._save_cache()
 
-            return ForecastData.from_openweather_forecast(data)
+        return data
+
+    # ------------------------------------------------------------------
+    # Async batched fetching
+    # ------------------------------------------------------------------
+
+    async def _acquire_request_token(self) -> None:
+        """Wait for a token from the shared token bucket without blocking the loop."""
+        while not self._async_rate_limiter.acquire():
+            await asyncio.sleep(max(self._async_rate_limiter.wait_time(), 0.01))
+
+    async def _make_request_async(
+        self,
+        http_session: "aiohttp.ClientSession",
+        semaphore: asyncio.Semaphore,
+        endpoint: str,
+        params: Dict[str, Any],
+    ) -> Optional[Dict[str, Any]]:
+        """Async counterpart of _make_request, coalesced with threaded callers."""
+        flight_key = SingleFlight.make_key(endpoint, params)
+        return await self._single_flight.do_async(
+            flight_key,
+            lambda: self._execute_request_async(http_session, semaphore, endpoint, params),
+        )
+
+    async def _execute_request_async(
+        self,
+        http_session: "aiohttp.ClientSession",
+        semaphore: asyncio.Semaphore,
+        endpoint: str,
+        params: Dict[str, Any],
+    ) -> Optional[Dict[str, Any]]:
+        """Async counterpart of _execute_request sharing its fallback and stale-cache logic."""
+        cache_key = f"{endpoint}_{str(sorted(params.items()))}"
+
+        # Check if we're in offline mode
+        if self._offline_mode:
+            self.logger.warning("🔌 Service in offline mode, trying stale cache")
+            stale_data = self._get_stale_cache_data(cache_key)
+            if stale_data:
+                return stale_data
+            return self._get_offline_fallback("weather", params.get("q", "Unknown"))
+
+        # Apply exponential backoff if needed (without blocking other cities)
+        if self._consecutive_failures > 0:
+            jitter = random.uniform(0, 0.1 * self._current_backoff)
+            await asyncio.sleep(self._current_backoff + jitter)
+
+        # Check if we should switch to fallback API
+        if self._should_use_fallback_api():
+            self._switch_to_fallback_api()
+
+        try:
+            async with semaphore:
+                await self._acquire_request_token()
+
+                url, params = self._resolve_request_target(endpoint, dict(params))
+                async with http_session.get(url, params=params) as response:
+                    if self._check_response_status(response.status, response.headers, endpoint):
+                        return await response.json(content_type=None)
+                    return None
 
+        except asyncio.TimeoutError:
+            self.logger.error("⏰ API request timed out")
+            self._consecutive_failures += 1
+            self._check_offline_mode()
+
+            stale_data = self._get_stale_cache_data(cache_key)
+            if stale_data:
+                return stale_data
+            raise NetworkError("Request timeout - please try again")
+
+        except aiohttp.ClientConnectionError:
+            self.logger.error("🌐 Connection error")
+            self._consecutive_failures += 1
+            self._check_offline_mode()
+
+            stale_data = self._get_stale_cache_data(cache_key)
+            if stale_data:
+                return stale_data
+
+            if self._offline_mode:
+                return self._get_offline_fallback("weather", params.get("q", "Unknown"))
+            raise NetworkError("No internet connection - please check your network")
+
+        except (RateLimitError, APIKeyError):
+            raise
         except Exception as e:
-            self.logger.error(f"Forecast fetch failed: {e}")
+            self.logger.error(f"❌ Unexpected API error: {e}")
+            self._consecutive_failures += 1
+            self._check_offline_mode()
+
+            stale_data = self._get_stale_cache_data(cache_key)
+            if stale_data:
+                return stale_data
+
+            raise WeatherServiceError(f"Weather service error: {str(e)}")
+
+    async def _get_air_quality_async(
+        self,
+        http_session: "aiohttp.ClientSession",
+        semaphore: asyncio.Semaphore,
+        lat: float,
+        lon: float,
+    ) -> Optional[AirQualityData]:
+        """Async counterpart of get_air_quality."""
+        cache_key = f"air_quality_{lat}_{lon}"
+
+        if self._is_cache_valid_with_ttl(cache_key, "air_quality"):
+            return AirQualityData.from_dict(self._cache[cache_key]["data"])
+
+        try:
+            data = await self._make_request_async(
+                http_session, semaphore, "data/2.5/air_pollution", {"lat": lat, "lon": lon}
+            )
+            if not data or "list" not in data or not data["list"]:
+                return None
+
+            air_quality = self._parse_air_quality_payload(data)
+            self._store_air_quality(cache_key, air_quality)
+            return air_quality
+
+        except Exception as e:
+            if "Location not found" in str(e) or "404" in str(e):
+                self.logger.info(f"Air quality data not available for location: {lat}, {lon}")
+            else:
+                self.logger.warning(f"Air quality fetch failed: {e}")
+            return None
+
+    async def _get_enhanced_weather_async(
+        self,
+        http_session: "aiohttp.ClientSession",
+        semaphore: asyncio.Semaphore,
+        location: str,
+    ) -> EnhancedWeatherData:
+        """Fetch enhanced weather for one location with concurrent sub-requests."""
+        cache_key = f"enhanced_{location.lower()}"
+
+        decoded = self._get_decoded_weather(cache_key)
+        if decoded is not None and time.time() - decoded[0] < self._cache_ttl["current_weather"]:
+            return decoded[1]
+
+        try:
+            data = await self._make_request_async(
+                http_session, semaphore, "weather", {"q": location}
+            )
+        except RateLimitError as e:
+            self.logger.warning(f"⏱️ Rate limited, waiting {e.retry_after} seconds")
+            await asyncio.sleep(e.retry_after)
+            data = await self._make_request_async(
+                http_session, semaphore, "weather", {"q": location}
+            )
+        except (NetworkError, ServiceUnavailableError):
+            decoded = self._get_decoded_weather(cache_key)
+            if decoded is not None:
+                return decoded[1]
             raise
 
+        if not data or "coord" not in data:
+            raise WeatherServiceError(f"No weather data received for {location}")
+
+        weather_data = self._parse_weather_payload(data)
+        lat = data["coord"]["lat"]
+        lon = data["coord"]["lon"]
+
+        # Astronomy comes from the same payload instead of a second weather
+        # request; the air quality call overlaps with the other cities' requests
+        weather_data.astronomical = self._build_astronomical_data(data) if "sys" in data else None
+        weather_data.alerts = self.get_weather_alerts(lat, lon)
+        weather_data.air_quality = await self._get_air_quality_async(
+            http_session, semaphore, lat, lon
+        )
+
+        self._store_enhanced_weather(cache_key, weather_data)
+        self.notify_observers(weather_data)
+        return weather_data
+
+    async def get_enhanced_weather_many(
+        self,
+        locations: List[str],
+        max_concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> Dict[str, Any]:
+        """Fetch enhanced weather for many locations concurrently.
+
+        Requests share one HTTP connection pool, a bounded concurrency
+        semaphore and the token-bucket rate limiter, while each request still
+        goes through the primary/backup/WeatherAPI fallback chain and the
+        stale-cache path. The cache file is written once for the whole batch.
+
+        Args:
+            locations: Location names to fetch
+            max_concurrency: Maximum simultaneous HTTP requests
+            return_exceptions: Include per-location exceptions in the result
+                instead of dropping failed locations
+
+        Returns:
+            Dictionary mapping each location to its EnhancedWeatherData
+            (or exception when return_exceptions is True)
+        """
+        # Validate and de-duplicate while preserving order
+        unique_locations: List[str] = []
+        seen = set()
+        for location in locations:
+            if not location or not isinstance(location, str) or len(location.strip()) < 2:
+                self.logger.warning(f"Skipping invalid location in batch: {location!r}")
+                continue
+            location = location.strip()
+            if location.lower() not in seen:
+                seen.add(location.lower())
+                unique_locations.append(location)
+
+        if not unique_locations:
+            return {}
+
+        concurrency = max_concurrency or self._max_concurrent_requests
+        semaphore = asyncio.Semaphore(concurrency)
+        self.logger.info(
+            f"🌐 Batch fetching enhanced weather for {len(unique_locations)} locations "
+            f"(concurrency {concurrency})"
+        )
+        start_time = time.time()
+
+        if AIOHTTP_AVAILABLE:
+            _load_aiohttp()
+            connect_timeout, read_timeout = self._session.timeout
+            timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+            connector = aiohttp.TCPConnector(limit=concurrency)
+            async with aiohttp.ClientSession(
+                timeout=timeout, connector=connector, headers=dict(self._session.headers)
+            ) as http_session:
+                results = await asyncio.gather(
+                    *(
+                        self._get_enhanced_weather_async(http_session, semaphore, location)
+                        for location in unique_locations
+                    ),
+                    return_exceptions=True,
+                )
+        else:
+            # Without aiohttp, bound the blocking client with the same semaphore
+            async def fetch_blocking(location: str) -> EnhancedWeatherData:
+                async with semaphore:
+                    return await asyncio.to_thread(self.get_enhanced_weather, location)
+
+            results = await asyncio.gather(
+                *(fetch_blocking(location) for location in unique_locations),
+                return_exceptions=True,
+            )
+
+        self._save_cache()
+
+        batch_results: Dict[str, Any] = {}
+        failures = 0
+        for location, result in zip(unique_locations, results):
+            if isinstance(result, BaseException):
+                failures += 1
+                self.logger.warning(f"Batch fetch failed for {location}: {result}")
+                if return_exceptions:
+                    batch_results[location] = result
+                continue
+            batch_results[location] = result
+
+        self.logger.info(
+            f"✅ Batch fetch finished: {len(unique_locations) - failures}/{len(unique_locations)} "
+            f"locations in {time.time() - start_time:.2f}s"
+        )
+        return batch_results
+
+    def get_enhanced_weather_batch(
+        self, locations: List[str], max_concurrency: Optional[int] = None
+    ) -> Dict[str, EnhancedWeatherData]:
+        """Blocking wrapper around get_enhanced_weather_many.
+
+        Intended for worker threads (e.g. favourite or team refreshes); must not
+        be called from a thread that is already running an event loop.
+        """
+        return asyncio.run(self.get_enhanced_weather_many(locations, max_concurrency))
+
     def clear_cache(self) -> None:
         """Clear enhanced weather cache."""
         self._cache.clear()
-        if self._cache_file.exists():
-            self._cache_file.unlink()
+        self._weather_objects.clear()
         self.logger.info("🗑️ Enhanced weather cache cleared")
+
+    def warm_up_location_cache(self, queries: List[str], resolve_missing: bool = True) -> int:
+        """Preload geocoding answers for favourite and recent searches.
+
+        Stored answers are loaded in one batch; queries with none are
+        searched on a background thread so their first lookup is local.
+
+        Args:
+            queries: Likely location queries
+            resolve_missing: Search uncached queries in the background
+
+        Returns:
+            Number of stored answers loaded
+        """
+        self._geocode_store.purge_expired()
+        resolver = (
+            self.search_locations_advanced if resolve_missing and not self._offline_mode else None
+        )
+        loaded = self._geocode_store.warm_up(queries, resolver=resolver)
+        self.logger.debug(f"🗺️ Warmed {loaded} geocoding answers for {len(queries)} queries")
+        return loaded
+
+    def shutdown(self) -> None:
+        """Stop background revalidation and persist the cache."""
+        with self._revalidation_lock:
+            executor, self._revalidation_executor = self._revalidation_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        self._save_cache()
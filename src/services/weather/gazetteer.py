@@ -0,0 +1,640 @@
+"""Offline city gazetteer for location autocomplete.
+
+Loads a GeoNames-style city dump (e.g. cities15000.txt) once, builds a compact
+binary index next to the cache and memory-maps it on later runs, so
+autocomplete resolves locally instead of calling a geocoding API per keystroke.
+
+The index holds:
+- place columns (coordinates, population, name/admin1/admin1 code/country
+  references)
+- every normalized name key, sorted byte-wise; binary search over the sorted
+  keys gives prefix ranges the way walking a trie would, without building
+  millions of node objects
+- a trigram directory with posting lists of key ids, used to rank
+  typo-tolerant matches by trigram overlap (Dice similarity)
+"""
+
+import logging
+import math
+import mmap
+import os
+import re
+import struct
+import threading
+import unicodedata
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Sequence
+from heapq import nlargest
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from ...utils.spatial_index import SpatialIndex
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOURCE_PATH = Path("data") / "gazetteer" / "cities15000.txt"
+DEFAULT_CACHE_DIR = Path("cache") / "gazetteer"
+
+INDEX_MAGIC = b"GZIX"
+INDEX_VERSION = 2
+
+# Section order in the index file; typecode None marks raw bytes
+_SECTIONS = (
+    ("strings", None),
+    ("latitude", "d"),
+    ("longitude", "d"),
+    ("population", "I"),
+    ("name_offset", "I"),
+    ("name_length", "I"),
+    ("admin1_offset", "I"),
+    ("admin1_length", "I"),
+    ("admin1_code_offset", "I"),
+    ("admin1_code_length", "I"),
+    ("country_code", None),
+    ("key_offset", "I"),
+    ("key_length", "I"),
+    ("key_place", "I"),
+    ("trigram_code", "Q"),
+    ("trigram_offset", "I"),
+    ("trigram_length", "I"),
+    ("postings", "I"),
+)
+
+# magic, version, source size, source mtime (ns), places, keys, trigrams
+_HEADER = struct.Struct("<4sIQQIII")
+_SECTION_ENTRY = struct.Struct("<QQ")
+
+# GeoNames dump columns
+_GEONAMES_NAME = 1
+_GEONAMES_ASCIINAME = 2
+_GEONAMES_ALTERNATES = 3
+_GEONAMES_LATITUDE = 4
+_GEONAMES_LONGITUDE = 5
+_GEONAMES_COUNTRY = 8
+_GEONAMES_ADMIN1 = 10
+_GEONAMES_POPULATION = 14
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+# Fuzzy matches at least this similar are trusted without asking a geocoder
+CONFIDENT_SIMILARITY = 0.7
+_MAX_POPULATION = 2**32 - 1
+
+
+def normalize_place_name(text: str) -> str:
+    """Normalize a place name for indexing and lookup.
+
+    Case-folds, strips accents and punctuation and collapses whitespace, so
+    "São Paulo", "sao-paulo" and "SAO PAULO" share one key.
+    """
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(_PUNCTUATION.sub(" ", stripped).split())
+
+
+def _trigram_codes(key: str) -> List[int]:
+    """Distinct trigrams of a padded key, packed as 63-bit integers."""
+    padded = f"  {key} "
+    codes = {
+        (ord(padded[i]) << 42) | (ord(padded[i + 1]) << 21) | ord(padded[i + 2])
+        for i in range(len(padded) - 2)
+    }
+    return sorted(codes)
+
+
+@dataclass(frozen=True)
+class GazetteerPlace:
+    """City matched in the gazetteer."""
+
+    name: str
+    country_code: str
+    admin1: str
+    latitude: float
+    longitude: float
+    population: int
+    score: float = 0.0
+    # Trigram Dice similarity to the query; 1.0 for exact and prefix matches
+    similarity: float = 1.0
+
+    @property
+    def confident(self) -> bool:
+        """Whether the match is close enough to skip a network lookup."""
+        return self.similarity >= CONFIDENT_SIMILARITY
+
+    @property
+    def display_name(self) -> str:
+        """Display name like "Springfield, Illinois, US"."""
+        parts = [self.name]
+        if self.admin1 and self.admin1 != self.name:
+            parts.append(self.admin1)
+        if self.country_code:
+            parts.append(self.country_code)
+        return ", ".join(parts)
+
+
+class _SortedKeys(Sequence):
+    """Read-only view of the sorted key table for bisect."""
+
+    __slots__ = ("_strings", "_offsets", "_lengths")
+
+    def __init__(self, strings: memoryview, offsets: memoryview, lengths: memoryview):
+        self._strings = strings
+        self._offsets = offsets
+        self._lengths = lengths
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, index: int) -> bytes:
+        start = self._offsets[index]
+        return bytes(self._strings[start:start + self._lengths[index]])
+
+
+class Gazetteer:
+    """Memory-mapped city gazetteer with prefix and trigram search."""
+
+    def __init__(self, index_path: Union[str, Path]):
+        """
+        Open a built index.
+
+        Args:
+            index_path: Index file written by Gazetteer.build()
+        """
+        self.index_path = Path(index_path)
+        self._file = open(self.index_path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+
+        magic, version, _, _, places, keys, trigrams = _HEADER.unpack_from(self._view, 0)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported gazetteer index: {self.index_path}")
+
+        self.place_count = places
+        self.key_count = keys
+        self.trigram_count = trigrams
+
+        self._sections: Dict[str, memoryview] = {}
+        for position, (name, typecode) in enumerate(_SECTIONS):
+            offset, length = _SECTION_ENTRY.unpack_from(
+                self._view, _HEADER.size + position * _SECTION_ENTRY.size
+            )
+            section = self._view[offset:offset + length]
+            self._sections[name] = section.cast(typecode) if typecode else section
+
+        sections = self._sections
+        self._keys = _SortedKeys(sections["strings"], sections["key_offset"], sections["key_length"])
+
+        # Built on first nearest() call
+        self._spatial_index: Optional[SpatialIndex] = None
+        self._spatial_lock = threading.Lock()
+
+    @classmethod
+    def open(
+        cls,
+        source_path: Union[str, Path] = DEFAULT_SOURCE_PATH,
+        cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR,
+    ) -> "Gazetteer":
+        """Open the index for a dump, building it first if missing or stale.
+
+        Args:
+            source_path: GeoNames-style dump
+            cache_dir: Directory holding built indexes
+
+        Returns:
+            Gazetteer over the cached index
+        """
+        source_path = Path(source_path)
+        index_path = Path(cache_dir) / f"{source_path.stem}.gzidx"
+        if not cls._index_matches(index_path, source_path):
+            cls.build(source_path, index_path)
+        return cls(index_path)
+
+    @staticmethod
+    def _source_fingerprint(source_path: Path) -> Tuple[int, int]:
+        """(size, mtime_ns) identifying the dump an index was built from."""
+        stat = source_path.stat()
+        return stat.st_size, stat.st_mtime_ns
+
+    @classmethod
+    def _index_matches(cls, index_path: Path, source_path: Path) -> bool:
+        """Whether index_path was built by this version from source_path as it is now."""
+        try:
+            with open(index_path, "rb") as f:
+                magic, version, size, mtime, *_ = _HEADER.unpack(f.read(_HEADER.size))
+        except (OSError, struct.error):
+            return False
+        return (magic, version, (size, mtime)) == (
+            INDEX_MAGIC,
+            INDEX_VERSION,
+            cls._source_fingerprint(source_path),
+        )
+
+    @classmethod
+    def build(
+        cls,
+        source_path: Union[str, Path],
+        index_path: Union[str, Path],
+        include_alternate_names: bool = False,
+    ) -> int:
+        """Build an index file from a GeoNames-style dump.
+
+        Tab-separated rows use the GeoNames column layout (name, asciiname,
+        alternatenames, latitude, longitude, ..., country code, ..., admin1
+        code, ..., population). If admin1CodesASCII.txt sits next to the dump,
+        admin1 codes are replaced by their names.
+
+        Args:
+            source_path: Dump to index
+            index_path: Output file (written atomically)
+            include_alternate_names: Also index the alternatenames column
+
+        Returns:
+            Number of places indexed
+        """
+        source_path = Path(source_path)
+        index_path = Path(index_path)
+        admin1_names = cls._load_admin1_names(source_path.parent / "admin1CodesASCII.txt")
+
+        strings = bytearray()
+        string_offsets: Dict[str, Tuple[int, int]] = {}
+
+        def intern(text: str) -> Tuple[int, int]:
+            location = string_offsets.get(text)
+            if location is None:
+                encoded = text.encode("utf-8")
+                location = string_offsets[text] = (len(strings), len(encoded))
+                strings.extend(encoded)
+            return location
+
+        columns = {name: array(typecode) for name, typecode in _SECTIONS if typecode}
+        country_codes = bytearray()
+        key_entries: List[Tuple[bytes, int, int]] = []
+
+        with open(source_path, encoding="utf-8") as f:
+            for line in f:
+                fields = line.rstrip("\n").split("\t")
+                if len(fields) <= _GEONAMES_POPULATION:
+                    continue
+                try:
+                    latitude = float(fields[_GEONAMES_LATITUDE])
+                    longitude = float(fields[_GEONAMES_LONGITUDE])
+                    population = min(int(fields[_GEONAMES_POPULATION] or 0), _MAX_POPULATION)
+                except ValueError:
+                    continue
+
+                place = len(columns["latitude"])
+                name = fields[_GEONAMES_NAME]
+                country = fields[_GEONAMES_COUNTRY][:2].upper()
+                admin1_code = fields[_GEONAMES_ADMIN1]
+                admin1 = admin1_names.get(f"{country}.{admin1_code}", admin1_code)
+
+                name_offset, name_length = intern(name)
+                admin1_offset, admin1_length = intern(admin1)
+                admin1_code_offset, admin1_code_length = intern(admin1_code)
+                columns["latitude"].append(latitude)
+                columns["longitude"].append(longitude)
+                columns["population"].append(population)
+                columns["name_offset"].append(name_offset)
+                columns["name_length"].append(name_length)
+                columns["admin1_offset"].append(admin1_offset)
+                columns["admin1_length"].append(admin1_length)
+                columns["admin1_code_offset"].append(admin1_code_offset)
+                columns["admin1_code_length"].append(admin1_code_length)
+                country_codes.extend(country.encode("ascii", "replace").ljust(2)[:2])
+
+                names = {name, fields[_GEONAMES_ASCIINAME]}
+                if include_alternate_names and fields[_GEONAMES_ALTERNATES]:
+                    names.update(fields[_GEONAMES_ALTERNATES].split(","))
+                for key in {normalize_place_name(n) for n in names if n}:
+                    if key:
+                        key_entries.append((key.encode("utf-8"), -population, place))
+
+        # Sorted keys stand in for a trie; the most populous place comes first per key
+        key_entries.sort()
+        postings: Dict[int, List[int]] = {}
+        for key_id, (key_bytes, _, place) in enumerate(key_entries):
+            offset, length = intern(key_bytes.decode("utf-8"))
+            columns["key_offset"].append(offset)
+            columns["key_length"].append(length)
+            columns["key_place"].append(place)
+            for code in _trigram_codes(key_bytes.decode("utf-8")):
+                postings.setdefault(code, []).append(key_id)
+
+        for code in sorted(postings):
+            ids = postings[code]
+            columns["trigram_code"].append(code)
+            columns["trigram_offset"].append(len(columns["postings"]))
+            columns["trigram_length"].append(len(ids))
+            columns["postings"].extend(ids)
+
+        payloads = []
+        for name, typecode in _SECTIONS:
+            if name == "strings":
+                payloads.append(bytes(strings))
+            elif name == "country_code":
+                payloads.append(bytes(country_codes))
+            else:
+                payloads.append(columns[name].tobytes())
+
+        header_size = _HEADER.size + len(_SECTIONS) * _SECTION_ENTRY.size
+        table = []
+        offset = header_size
+        for payload in payloads:
+            offset += -offset % 8  # keep numeric sections 8-byte aligned
+            table.append((offset, len(payload)))
+            offset += len(payload)
+
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        size, mtime = cls._source_fingerprint(source_path)
+        temp_path = index_path.with_suffix(index_path.suffix + ".tmp")
+        with open(temp_path, "wb") as f:
+            f.write(
+                _HEADER.pack(
+                    INDEX_MAGIC,
+                    INDEX_VERSION,
+                    size,
+                    mtime,
+                    len(columns["latitude"]),
+                    len(key_entries),
+                    len(postings),
+                )
+            )
+            for entry in table:
+                f.write(_SECTION_ENTRY.pack(*entry))
+            for (section_offset, _), payload in zip(table, payloads):
+                f.write(b"\0" * (section_offset - f.tell()))
+                f.write(payload)
+        os.replace(temp_path, index_path)
+
+        logger.info(
+            f"🗺️ Built gazetteer index for {len(columns['latitude']):,} places "
+            f"({len(key_entries):,} keys) at {index_path}"
+        )
+        return len(columns["latitude"])
+
+    @staticmethod
+    def _load_admin1_names(path: Path) -> Dict[str, str]:
+        """Read GeoNames admin1 code -> name ("US.IL" -> "Illinois") if present."""
+        if not path.exists():
+            return {}
+        names = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                fields = line.rstrip("\n").split("\t")
+                if len(fields) >= 2:
+                    names[fields[0]] = fields[1]
+        return names
+
+    # Search
+
+    def search(
+        self,
+        query: str,
+        limit: int = 8,
+        min_similarity: float = 0.4,
+        max_prefix_scan: int = 2000,
+        max_postings: int = 10000,
+    ) -> List[GazetteerPlace]:
+        """Find places for an autocomplete query.
+
+        Prefix matches come from a range scan of the sorted keys; when those do
+        not fill the result list, trigram overlap finds misspelled names. Text
+        after a comma ("Paris, FR", "Springfield, Illinois", "Portland, OR")
+        boosts places whose country code, admin1 name or admin1 code matches.
+        Fuzzy matches carry their similarity; callers should still ask a
+        geocoder unless a result is `confident`.
+
+        Args:
+            query: User input
+            limit: Maximum results
+            min_similarity: Minimum trigram Dice similarity for fuzzy matches
+            max_prefix_scan: Maximum prefix keys examined for ranking
+            max_postings: Posting entries read to generate fuzzy candidates
+
+        Returns:
+            Places, best first
+        """
+        name_part, _, qualifier_part = query.partition(",")
+        key = normalize_place_name(name_part)
+        if not key:
+            return []
+        qualifiers = set(normalize_place_name(qualifier_part).split())
+
+        # Best score per place, and the similarity of fuzzy-only matches
+        scores: Dict[int, float] = {}
+        similarities: Dict[int, float] = {}
+
+        key_bytes = key.encode("utf-8")
+        low = bisect_left(self._keys, key_bytes)
+        high = bisect_left(self._keys, key_bytes + b"\xff", low)
+        key_place = self._sections["key_place"]
+        key_length = self._sections["key_length"]
+        population = self._sections["population"]
+
+        # Exact keys sort first in the prefix range
+        exact_end = low
+        while exact_end < high and key_length[exact_end] == len(key_bytes):
+            scores[key_place[exact_end]] = 3.0
+            exact_end += 1
+
+        # Longer names with this prefix: keep only the most populous
+        prefix_ids = nlargest(
+            limit * 4,
+            range(exact_end, min(high, exact_end + max_prefix_scan)),
+            key=lambda key_id: population[key_place[key_id]],
+        )
+        for key_id in prefix_ids:
+            place = key_place[key_id]
+            score = 2.0 + 0.5 * len(key_bytes) / key_length[key_id]
+            if score > scores.get(place, 0.0):
+                scores[place] = score
+
+        if exact_end == low and len(scores) < limit:
+            for place, similarity in self._fuzzy_candidates(key, min_similarity, max_postings):
+                score = 2.0 * similarity
+                if score > scores.get(place, 0.0):
+                    scores[place] = score
+                    similarities[place] = similarity
+
+        ranked = []
+        for place, score in scores.items():
+            score += self._popularity(place)
+            if qualifiers and self._matches_qualifiers(place, qualifiers):
+                score += 0.5
+            ranked.append((score, place))
+        ranked.sort(reverse=True)
+
+        results = []
+        seen = set()
+        for score, place in ranked:
+            result = self._place(place, score, similarities.get(place, 1.0))
+            identity = (result.name, result.admin1, result.country_code)
+            if identity in seen:
+                continue
+            seen.add(identity)
+            results.append(result)
+            if len(results) >= limit:
+                break
+        return results
+
+    def _fuzzy_candidates(
+        self, key: str, min_similarity: float, max_postings: int, max_candidates: int = 200
+    ) -> Iterator[Tuple[int, float]]:
+        """Yield (place, similarity) for keys sharing enough trigrams with key.
+
+        A key needs at least `needed` shared trigrams to reach min_similarity,
+        so it must appear in one of the len(lists) - needed + 1 rarest posting
+        lists. Only those lists are counted (stopping once max_postings entries
+        were read); the keys hit most often are then scored exactly.
+        """
+        codes = _trigram_codes(key)
+        trigram_code = self._sections["trigram_code"]
+        trigram_offset = self._sections["trigram_offset"]
+        trigram_length = self._sections["trigram_length"]
+        postings = self._sections["postings"]
+
+        lists = []
+        for code in codes:
+            position = bisect_left(trigram_code, code)
+            if position < len(trigram_code) and trigram_code[position] == code:
+                lists.append((trigram_length[position], trigram_offset[position]))
+        lists.sort()
+
+        # Dice >= min_similarity needs at least this many shared trigrams
+        needed = max(1, math.ceil(min_similarity * len(codes) / 2))
+        if len(lists) < needed:
+            return
+
+        shared: Counter = Counter()
+        budget = max_postings
+        for length, start in lists[:len(lists) - needed + 1]:
+            if budget <= 0:
+                break
+            shared.update(postings[start:start + length])
+            budget -= length
+
+        query_codes = set(codes)
+        key_place = self._sections["key_place"]
+        for key_id, _ in shared.most_common(max_candidates):
+            candidate_codes = _trigram_codes(self._keys[key_id].decode("utf-8"))
+            overlap = len(query_codes.intersection(candidate_codes))
+            similarity = 2.0 * overlap / (len(codes) + len(candidate_codes))
+            if similarity >= min_similarity:
+                yield key_place[key_id], similarity
+
+    def nearest(
+        self, latitude: float, longitude: float, max_km: float = 20.0
+    ) -> Optional[Tuple[GazetteerPlace, float]]:
+        """Nearest place within max_km as (place, distance_km), or None."""
+        match = self._spatial().nearest(latitude, longitude, max_km)
+        if match is None:
+            return None
+        return self._place(match.key), match.distance_km
+
+    def _spatial(self) -> SpatialIndex:
+        """Spatial index of place ids, built once from the coordinate columns."""
+        with self._spatial_lock:
+            if self._spatial_index is None:
+                index = SpatialIndex(precisions=(3, 4, 5))
+                latitudes = self._sections["latitude"]
+                longitudes = self._sections["longitude"]
+                for place in range(self.place_count):
+                    index.insert(place, latitudes[place], longitudes[place])
+                self._spatial_index = index
+            return self._spatial_index
+
+    def _popularity(self, place: int) -> float:
+        """Ranking boost from population (0 to ~0.35)."""
+        return 0.05 * math.log10(self._sections["population"][place] + 1)
+
+    def _matches_qualifiers(self, place: int, qualifiers: set) -> bool:
+        """Whether text after the comma names this place's country or admin1 (name or code)."""
+        country = self._country_code(place).lower()
+        admin1_code = normalize_place_name(self._admin1_code(place))
+        admin1 = set(normalize_place_name(self._admin1(place)).split())
+        return bool(qualifiers & ({country, admin1_code} | admin1))
+
+    def _string(self, offset: int, length: int) -> str:
+        return bytes(self._sections["strings"][offset:offset + length]).decode("utf-8")
+
+    def _country_code(self, place: int) -> str:
+        return bytes(self._sections["country_code"][place * 2:place * 2 + 2]).decode("ascii").strip()
+
+    def _admin1(self, place: int) -> str:
+        sections = self._sections
+        return self._string(sections["admin1_offset"][place], sections["admin1_length"][place])
+
+    def _admin1_code(self, place: int) -> str:
+        sections = self._sections
+        return self._string(sections["admin1_code_offset"][place], sections["admin1_code_length"][place])
+
+    def _place(self, place: int, score: float = 0.0, similarity: float = 1.0) -> GazetteerPlace:
+        """Materialize one place."""
+        sections = self._sections
+        return GazetteerPlace(
+            name=self._string(sections["name_offset"][place], sections["name_length"][place]),
+            country_code=self._country_code(place),
+            admin1=self._admin1(place),
+            latitude=sections["latitude"][place],
+            longitude=sections["longitude"][place],
+            population=sections["population"][place],
+            score=score,
+            similarity=similarity,
+        )
+
+    def __len__(self) -> int:
+        return self.place_count
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get index statistics."""
+        return {
+            "places": self.place_count,
+            "keys": self.key_count,
+            "trigrams": self.trigram_count,
+            "index_bytes": len(self._view),
+        }
+
+    def close(self) -> None:
+        """Release the memory map."""
+        self._sections = {}
+        self._keys = None
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if not self._mmap.closed:
+            self._mmap.close()
+        self._file.close()
+
+
+# Global gazetteer instances, one per dump path (None when the dump is missing)
+_global_gazetteers: Dict[Path, Optional[Gazetteer]] = {}
+_gazetteer_lock = threading.Lock()
+
+
+def get_gazetteer(source_path: Union[str, Path, None] = None) -> Optional[Gazetteer]:
+    """Get the global gazetteer for a dump, or None when it is not installed.
+
+    The first call for a path opens (and if needed builds) its index; later
+    calls with the same path reuse it.
+
+    Args:
+        source_path: Dump path; defaults to data/gazetteer/cities15000.txt
+    """
+    source = Path(source_path) if source_path else DEFAULT_SOURCE_PATH
+    key = source.resolve()
+    with _gazetteer_lock:
+        if key not in _global_gazetteers:
+            gazetteer = None
+            if source.exists():
+                try:
+                    gazetteer = Gazetteer.open(source)
+                except Exception as e:
+                    logger.error(f"Failed to load gazetteer from {source}: {e}")
+            else:
+                logger.info(f"No offline gazetteer at {source}; location search uses the network")
+            _global_gazetteers[key] = gazetteer
+        return _global_gazetteers[key]
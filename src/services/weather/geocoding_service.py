@@ -2,24 +2,58 @@ import json
 import logging
 import os
 import re
+import threading
+from dataclasses import replace
 from datetime import datetime, timedelta
 from typing import List, Optional
 
 import requests
-from geopy.exc import GeocoderServiceError, GeocoderTimedOut
-from geopy.geocoders import Nominatim
 
-from .enhanced_weather_service import LocationSearchResult as LocationResult
+from ..cache.geocode_store import GeocodeStore, get_geocode_store
+from ...utils.spatial_index import SpatialIndex
+from .models import LocationResult
+from .gazetteer import GazetteerPlace, get_gazetteer
+
+
+class _GeopyNotLoaded(Exception):
+    """Placeholder for geopy's exceptions until geopy is imported; never raised."""
+
+
+# geopy (and the aiohttp adapter it probes for) is imported on the first
+# geocoder call, keeping it off the startup path
+Nominatim = None
+GeocoderServiceError = _GeopyNotLoaded
+GeocoderTimedOut = _GeopyNotLoaded
+_geopy_lock = threading.Lock()
+
+
+def _load_geopy():
+    """Import geopy into this module on first use."""
+    global Nominatim, GeocoderServiceError, GeocoderTimedOut
+    with _geopy_lock:
+        if Nominatim is None:
+            from geopy.exc import GeocoderServiceError, GeocoderTimedOut
+            from geopy.geocoders import Nominatim
+    return Nominatim
 
 
 class GeocodingService:
     """Service for geocoding, reverse geocoding, and location search."""
 
-    def __init__(self):
+    def __init__(self, config_service=None):
+        """Initialize the geocoding service.
+
+        Args:
+            config_service: Optional configuration service for search settings
+        """
         self.logger = logging.getLogger(__name__)
-        self.geolocator = Nominatim(user_agent="weather_dashboard_v1.0")
+        self.config = config_service
+        self._geolocator = None
+        # Answers (and misses) are kept in the shared geocode store under
+        # this source, with its per-source TTLs
+        self.cache_source = "nominatim"
         self.cache = self.load_cache()
-        self.cache_ttl = timedelta(hours=24)  # Cache for 24 hours
+        self._lookup_state = threading.local()
 
         # Regex patterns for different input types
         self.zip_patterns = {
@@ -32,6 +66,32 @@ class GeocodingService:
 
         self.coordinate_pattern = re.compile(r"^(-?\d+\.?\d*),\s*(-?\d+\.?\d*)$")
 
+        # Reverse geocoding answers locally from earlier results within
+        # reverse_cache_radius_km, then from the nearest gazetteer city
+        # within reverse_city_radius_km, before asking Nominatim
+        self.reverse_cache_radius_km = self._setting("search.reverse_cache_radius_km", 1.0)
+        self.reverse_city_radius_km = self._setting("search.reverse_city_radius_km", 20.0)
+        self._reverse_results: SpatialIndex[LocationResult] = SpatialIndex(max_points=1000)
+
+        # Offline city gazetteer; None uses the default dump location
+        self.gazetteer_path = self._setting("search.gazetteer_path", None)
+
+    def _setting(self, key: str, default):
+        """Configuration setting, or default without a config service."""
+        return self.config.get_setting(key, default) if self.config else default
+
+    @property
+    def gazetteer(self):
+        """The configured offline gazetteer, or None when it is not installed."""
+        return get_gazetteer(self.gazetteer_path)
+
+    @property
+    def geolocator(self):
+        """Nominatim geocoder, created on first use."""
+        if self._geolocator is None:
+            self._geolocator = _load_geopy()(user_agent="weather_dashboard_v1.0")
+        return self._geolocator
+
     def search_locations_advanced(self, query: str) -> List[LocationResult]:
         """Advanced location search supporting multiple formats."""
         query = query.strip()
@@ -39,13 +99,14 @@ class GeocodingService:
         if not query:
             return []
 
-        # Check cache first
-        cache_key = f"search_{query.lower()}"
-        cached_result = self.get_from_cache(cache_key)
-        if cached_result:
+        # Check cache first (a cached miss answers with no results)
+        cached_result = self.get_from_cache(query)
+        if cached_result is not None:
             return [LocationResult(**item) for item in cached_result]
 
         results = []
+        self._lookup_state.failed = False
+        self._lookup_state.fuzzy_only = False
 
         try:
             # Check if zip code
@@ -60,9 +121,13 @@ class GeocodingService:
             else:
                 results = self.search_cities_fuzzy(query)
 
-            # Cache results
+            # Cache results, and misses unless a geocoder request failed;
+            # loose offline matches are never cached
             if results:
-                self.save_to_cache(cache_key, [result.__dict__ for result in results])
+                if not self._lookup_state.fuzzy_only:
+                    self.save_to_cache(query, [result.__dict__ for result in results])
+            elif not self._lookup_state.failed:
+                self.cache.put_negative(self.cache_source, query)
 
         except Exception as e:
             self.logger.error(f"Search error for '{query}': {e}")
@@ -105,6 +170,7 @@ class GeocodingService:
             return []
 
         except (GeocoderTimedOut, GeocoderServiceError) as e:
+            self._lookup_state.failed = True
             self.logger.error(f"Geocoding error for zip '{zip_code}': {e}")
             return []
 
@@ -121,21 +187,58 @@ class GeocodingService:
             if not (-90 <= lat <= 90 and -180 <= lon <= 180):
                 return []
 
+            local_result = self.reverse_geocode_local(lat, lon)
+            if local_result:
+                return [local_result]
+
             location = self.geolocator.reverse(f"{lat}, {lon}", exactly_one=True)
 
             if location:
                 result = self.create_location_result(location)
+                if result:
+                    self._reverse_results.insert((lat, lon), lat, lon, result)
                 return [result] if result else []
 
             return []
 
         except (ValueError, GeocoderTimedOut, GeocoderServiceError) as e:
+            self._lookup_state.failed = True
             self.logger.error(f"Reverse geocoding error for '{coordinates}': {e}")
             return []
 
+    def reverse_geocode_local(self, lat: float, lon: float) -> Optional[LocationResult]:
+        """Name coordinates from earlier answers or the nearest gazetteer city, or None.
+
+        Only the place name comes from the match; the result keeps the
+        queried coordinates.
+        """
+        match = self._reverse_results.nearest(lat, lon, self.reverse_cache_radius_km)
+        if match:
+            known = match.value
+        else:
+            gazetteer = self.gazetteer
+            nearest = gazetteer.nearest(lat, lon, self.reverse_city_radius_km) if gazetteer else None
+            if nearest is None:
+                return None
+            known = self.create_gazetteer_result(nearest[0])
+        return replace(known, latitude=lat, longitude=lon)
+
     def search_cities_fuzzy(self, query: str) -> List[LocationResult]:
         """Search cities with fuzzy matching."""
         try:
+            # Place names resolve locally when the gazetteer knows them; loose
+            # fuzzy matches only supplement (or stand in for) Nominatim's answer
+            fuzzy_results = []
+            gazetteer = self.gazetteer
+            if gazetteer is not None:
+                places = gazetteer.search(query, limit=8)
+                local_results = [
+                    self.create_gazetteer_result(place) for place in places if place.confident
+                ]
+                if local_results:
+                    return local_results
+                fuzzy_results = [self.create_gazetteer_result(place) for place in places]
+
             # Search with different strategies
             strategies = [
                 query,  # Exact query
@@ -171,14 +274,28 @@ class GeocodingService:
                         break
 
                 except (GeocoderTimedOut, GeocoderServiceError):
+                    self._lookup_state.failed = True
                     continue
 
             # Sort by relevance (exact matches first)
             all_results.sort(key=lambda x: self.calculate_relevance_score(x, query), reverse=True)
 
+            if not all_results and fuzzy_results:
+                self._lookup_state.fuzzy_only = True
+                return fuzzy_results
+
+            # Append offline matches not already found (same place to ~1 km)
+            nearby = {(round(r.latitude, 2), round(r.longitude, 2)) for r in all_results}
+            for result in fuzzy_results:
+                location_key = (round(result.latitude, 2), round(result.longitude, 2))
+                if location_key not in nearby:
+                    nearby.add(location_key)
+                    all_results.append(result)
+
             return all_results[:8]
 
         except Exception as e:
+            self._lookup_state.failed = True
             self.logger.error(f"City search error for '{query}': {e}")
             return []
 
@@ -227,6 +344,19 @@ class GeocodingService:
             self.logger.error(f"Error creating location result: {e}")
             return None
 
+    def create_gazetteer_result(self, place: GazetteerPlace) -> LocationResult:
+        """Create LocationResult from an offline gazetteer match."""
+        return LocationResult(
+            name=place.name,
+            display_name=place.display_name,
+            latitude=place.latitude,
+            longitude=place.longitude,
+            country=place.country_code,
+            country_code=place.country_code,
+            state=place.admin1,
+            raw_address=place.display_name,
+        )
+
     def is_relevant_result(self, result: LocationResult, query: str) -> bool:
         """Check if result is relevant to the search query."""
         query_lower = query.lower()
@@ -316,69 +446,70 @@ class GeocodingService:
             self.logger.error(f"Error getting current location: {e}")
             return None
 
-    def load_cache(self) -> dict:
-        """Load geocoding cache from file."""
+    def load_cache(self) -> GeocodeStore:
+        """Open the shared geocode store.
+
+        Search entries from the legacy geocoding_cache.json file are imported
+        once with their remaining TTL and the file is renamed to *.migrated.
+        """
+        cache = get_geocode_store()
         cache_file = os.path.join("cache", "geocoding_cache.json")
+        legacy_ttl = timedelta(hours=24)
 
         try:
             if os.path.exists(cache_file):
                 with open(cache_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                    legacy = json.load(f)
+
+                now = datetime.now()
+                imported = 0
+                for key, item in legacy.items():
+                    age = now - datetime.fromisoformat(item["timestamp"])
+                    if key.startswith("search_") and item["data"] and age < legacy_ttl:
+                        cache.put(
+                            self.cache_source,
+                            key[len("search_"):],
+                            item["data"],
+                            ttl=(legacy_ttl - age).total_seconds(),
+                        )
+                        imported += 1
+
+                os.replace(cache_file, cache_file + ".migrated")
+                self.logger.info(f"Migrated {imported} geocoding cache entries to geocode store")
         except Exception as e:
             self.logger.error(f"Error loading geocoding cache: {e}")
 
-        return {}
+        return cache
 
     def save_cache(self):
-        """Save geocoding cache to file."""
-        cache_file = os.path.join("cache", "geocoding_cache.json")
+        """Persist the geocoding cache (entries are written through on set)."""
 
-        try:
-            os.makedirs("cache", exist_ok=True)
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(self.cache, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            self.logger.error(f"Error saving geocoding cache: {e}")
-
-    def get_from_cache(self, key: str) -> Optional[dict]:
-        """Get item from cache if not expired."""
-        if key in self.cache:
-            item = self.cache[key]
-            timestamp = datetime.fromisoformat(item["timestamp"])
-
-            if datetime.now() - timestamp < self.cache_ttl:
-                return item["data"]
-            else:
-                # Remove expired item
-                del self.cache[key]
+    def get_from_cache(self, query: str) -> Optional[list]:
+        """Get cached results for a query ([] for a cached miss), or None."""
+        entry = self.cache.get(self.cache_source, query)
+        if entry is None:
+            return None
+        return entry.payload or []
 
-        return None
+    def save_to_cache(self, query: str, data: list):
+        """Save results for a query with the source's TTL."""
+        self.cache.put(self.cache_source, query, data)
 
-    def save_to_cache(self, key: str, data: dict):
-        """Save item to cache with timestamp."""
-        self.cache[key] = {"data": data, "timestamp": datetime.now().isoformat()}
+    def warm_up_cache(self, queries: List[str], resolve_missing: bool = True) -> int:
+        """Preload cached answers for favourite and recent queries.
 
-        # Clean up old cache entries periodically
-        if len(self.cache) > 1000:
-            self.cleanup_cache()
+        Args:
+            queries: Likely queries
+            resolve_missing: Resolve queries with no cached answer in the background
 
-        # Save to file
-        self.save_cache()
+        Returns:
+            Number of cached entries loaded
+        """
+        resolver = self.search_locations_advanced if resolve_missing else None
+        return self.cache.warm_up(queries, resolver=resolver)
 
     def cleanup_cache(self):
         """Remove expired cache entries."""
-        now = datetime.now()
-        expired_keys = []
+        removed = self.cache.purge_expired()
 
-        for key, item in self.cache.items():
-            timestamp = datetime.fromisoformat(item["timestamp"])
-            if now - timestamp >= self.cache_ttl:
-                expired_keys.append(key)
-
-        for key in expired_keys:
-            del self.cache[key]
-
-        self.logger.info(
-            f"Cleaned up {
-                len(expired_keys)} expired cache entries"
-        )
+        self.logger.info(f"Cleaned up {removed} expired cache entries")
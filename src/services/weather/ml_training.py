@@ -0,0 +1,442 @@
+"""Streaming, incremental training for the ML weather prediction models.
+
+Training pairs (features at hour t, values at t + 1 hour) are read from the
+weather_history table in keyset-paginated chunks, so history never has to fit
+in memory. Estimators grow with warm_start: each chunk adds trees to the
+humidity forest and boosting stages to the temperature model, and a later run
+continues from the rows added since the previous one. Model size is capped
+(MAX_ESTIMATORS) so prediction cost does not grow with history. The two
+models train in separate processes.
+
+Trained models are saved as versioned directories (models/v<N>/) with a
+manifest; models/CURRENT names the active version. Artifacts are loaded on
+first use with joblib memory mapping.
+"""
+
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import time
+from collections.abc import MutableMapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import joblib
+import numpy as np
+from sklearn.ensemble import GradientBoostingRegressor, RandomForestRegressor
+from sklearn.metrics import mean_absolute_error, r2_score
+from sklearn.preprocessing import StandardScaler
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HISTORY_DB = Path("data") / "weather_dashboard.db"
+CURRENT_POINTER = "CURRENT"
+MANIFEST_NAME = "manifest.json"
+ARTIFACT_FILES = {
+    "temperature_model": "temperature_model.joblib",
+    "humidity_model": "humidity_model.joblib",
+    "temperature_scaler": "temperature_scaler.joblib",
+}
+
+# Consecutive readings of one location this far apart form a training pair
+PAIR_GAP_SECONDS = (1800, 5400)
+# Every HOLDOUT_EVERY-th pair is held out for evaluation instead of training
+HOLDOUT_EVERY = 10
+MAX_HOLDOUT = 5000
+MIN_BATCH_SAMPLES = 100
+# Upper bound on trees (forest) or boosting stages (temperature model) per
+# model; prediction cost grows with it
+MAX_ESTIMATORS = 200
+
+_HISTORY_QUERY = """
+    SELECT lower(trim(location)), timestamp, id, temperature, humidity,
+           pressure, wind_speed, visibility
+    FROM weather_history
+    WHERE id > ? AND (lower(trim(location)), timestamp, id) > (?, ?, ?)
+    ORDER BY lower(trim(location)), timestamp, id
+    LIMIT ?
+"""
+
+
+def local_time_features(local_times: np.ndarray) -> Dict[str, np.ndarray]:
+    """Hour, weekday and month for an array of local datetime64 values."""
+    local = local_times.astype("datetime64[s]")
+    days = local.astype("datetime64[D]")
+    return {
+        "hour": (local - days).astype(np.int64) // 3600,
+        # 1970-01-01 was a Thursday (weekday 3)
+        "day_of_week": (days.astype(np.int64) + 3) % 7,
+        "month": days.astype("datetime64[M]").astype(np.int64) % 12 + 1,
+    }
+
+
+def build_feature_matrix(
+    feature_names: Sequence[str], columns: Dict[str, Any], local_times: np.ndarray
+) -> np.ndarray:
+    """Stack feature columns (plus time features) into an (n, features) matrix."""
+    columns = dict(columns)
+    columns.update(local_time_features(local_times))
+    return np.column_stack([np.asarray(columns[name], dtype=np.float64) for name in feature_names])
+
+
+def iter_history_chunks(
+    db_path: Path, chunk_size: int = 5000, after_id: int = 0
+) -> Iterator[Dict[str, np.ndarray]]:
+    """Stream weather_history rows with id > after_id, ordered by location and time.
+
+    Keyset pagination on the normalized location key index, so each chunk is
+    an index range scan regardless of how far into the table it is.
+    """
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        cursor_key: Tuple[str, str, int] = ("", "", 0)
+        while True:
+            rows = conn.execute(_HISTORY_QUERY, (after_id, *cursor_key, chunk_size)).fetchall()
+            if not rows:
+                return
+            cursor_key = rows[-1][:3]
+            location, timestamp, row_id, temperature, humidity, pressure, wind, visibility = zip(*rows)
+            yield {
+                "location": np.array(location, dtype=object),
+                "timestamp": np.array([str(t)[:19] for t in timestamp], dtype="datetime64[s]"),
+                "id": np.array(row_id, dtype=np.int64),
+                "temperature": _column(temperature, 20),
+                "humidity": _column(humidity, 50),
+                "pressure": _column(pressure, 1013),
+                "wind_speed": _column(wind, 5),
+                # Stored in km
+                "visibility": _column(visibility, 10),
+            }
+            if len(rows) < chunk_size:
+                return
+    finally:
+        conn.close()
+
+
+def _column(values: Sequence[Any], default: float) -> np.ndarray:
+    column = np.array(values, dtype=np.float64)
+    column[np.isnan(column)] = default
+    return column
+
+
+def iter_training_batches(
+    db_path: Path,
+    feature_names: Sequence[str],
+    chunk_size: int = 5000,
+    after_id: int = 0,
+) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, int]]:
+    """Yield (features, next-hour temperature, next-hour humidity, holdout mask, max id).
+
+    The last row of each chunk is carried into the next one so pairs that
+    straddle a chunk boundary are not lost.
+    """
+    carry: Optional[Dict[str, np.ndarray]] = None
+    pair_index = 0
+    for chunk in iter_history_chunks(db_path, chunk_size, after_id):
+        if carry is not None:
+            chunk = {name: np.concatenate([carry[name], values]) for name, values in chunk.items()}
+        carry = {name: values[-1:] for name, values in chunk.items()}
+
+        gaps = (chunk["timestamp"][1:] - chunk["timestamp"][:-1]).astype(np.int64)
+        paired = (
+            (chunk["location"][1:] == chunk["location"][:-1])
+            & (gaps >= PAIR_GAP_SECONDS[0])
+            & (gaps <= PAIR_GAP_SECONDS[1])
+        )
+        max_id = int(chunk["id"].max())
+        count = int(paired.sum())
+        if not count:
+            continue
+
+        features = build_feature_matrix(
+            feature_names,
+            {name: chunk[name][:-1][paired] for name in
+             ("temperature", "humidity", "pressure", "wind_speed", "visibility")}
+            | {"clouds": np.full(count, 50.0)},
+            chunk["timestamp"][:-1][paired],
+        )
+        holdout = (np.arange(pair_index, pair_index + count) % HOLDOUT_EVERY) == 0
+        pair_index += count
+        yield (
+            features,
+            chunk["temperature"][1:][paired],
+            chunk["humidity"][1:][paired],
+            holdout,
+            max_id,
+        )
+
+
+def fit_scaler(
+    db_path: Path, feature_names: Sequence[str], chunk_size: int = 5000, after_id: int = 0
+) -> Tuple[Optional[StandardScaler], int]:
+    """Fit a StandardScaler over all training pairs in one streaming pass."""
+    scaler = StandardScaler()
+    samples = 0
+    for features, _, _, holdout, _ in iter_training_batches(db_path, feature_names, chunk_size, after_id):
+        train = features[~holdout]
+        if len(train):
+            scaler.partial_fit(train)
+            samples += len(train)
+    return (scaler if samples else None), samples
+
+
+@dataclass
+class FitResult:
+    """Outcome of fitting one model on streamed history."""
+
+    target: str
+    model: Any
+    samples: int
+    trained_through_id: int
+    mae: Optional[float] = None
+    r2: Optional[float] = None
+
+
+def new_estimator(target: str, n_estimators: int):
+    """Warm-startable estimator for a target, with the service's hyperparameters."""
+    if target == "temperature":
+        return GradientBoostingRegressor(
+            n_estimators=n_estimators, learning_rate=0.1, max_depth=5, random_state=42, warm_start=True
+        )
+    return RandomForestRegressor(n_estimators=n_estimators, max_depth=10, random_state=42, warm_start=True)
+
+
+def count_history_rows(db_path: Path, after_id: int = 0) -> int:
+    """Number of weather_history rows with id > after_id."""
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM weather_history WHERE id > ?", (after_id,)).fetchone()[0]
+    finally:
+        conn.close()
+
+
+class _RefitNeeded(Exception):
+    """The boosting model has no room for more stages."""
+
+
+def fit_streaming(
+    target: str,
+    db_path: Path,
+    feature_names: Sequence[str],
+    scaler: StandardScaler,
+    model: Any = None,
+    after_id: int = 0,
+    chunk_size: int = 5000,
+    estimators_per_batch: int = 10,
+    max_estimators: int = MAX_ESTIMATORS,
+) -> FitResult:
+    """Grow a model batch by batch over history rows with id > after_id.
+
+    Each batch adds estimators_per_batch trees (forest) or boosting stages
+    fitted on that batch only, so memory stays bounded by the batch size.
+    The model never holds more than max_estimators of them: a fit from
+    scratch sizes its batches so all of history takes half the budget,
+    leaving the rest for incremental runs. Past the cap the forest drops
+    its oldest trees; the boosting model, whose stages each correct the
+    ones before, is refitted from scratch instead.
+    Runs in a worker process; everything it needs is passed in.
+    """
+    if model is None:
+        # Enough rows per batch that the fresh model ends at about half the cap
+        batches = max(1, max_estimators // 2 // estimators_per_batch)
+        rows = count_history_rows(db_path, after_id)
+        batch_samples = max(MIN_BATCH_SAMPLES, chunk_size // 2, -(-rows // batches))
+    else:
+        batch_samples = max(MIN_BATCH_SAMPLES, chunk_size // 2)
+
+    column = 1 if target == "temperature" else 2
+    samples = 0
+    trained_through = after_id
+    pending_x: List[np.ndarray] = []
+    pending_y: List[np.ndarray] = []
+    holdout_x: List[np.ndarray] = []
+    holdout_y: List[np.ndarray] = []
+    holdout_count = 0
+
+    def fit_pending():
+        nonlocal model, samples
+        X = scaler.transform(np.concatenate(pending_x))
+        y = np.concatenate(pending_y)
+        if model is None:
+            model = new_estimator(target, estimators_per_batch)
+        else:
+            if target == "temperature" and model.n_estimators + estimators_per_batch > max_estimators:
+                raise _RefitNeeded
+            model.warm_start = True
+            model.n_estimators += estimators_per_batch
+        model.fit(X, y)
+        if target != "temperature" and len(model.estimators_) > max_estimators:
+            # Trees are independent; the oldest were fitted on the oldest data
+            del model.estimators_[: len(model.estimators_) - max_estimators]
+            model.n_estimators = len(model.estimators_)
+        samples += len(y)
+        pending_x.clear()
+        pending_y.clear()
+
+    try:
+        for batch in iter_training_batches(db_path, feature_names, chunk_size, after_id):
+            features, targets, holdout, max_id = batch[0], batch[column], batch[3], batch[4]
+            trained_through = max(trained_through, max_id)
+            pending_x.append(features[~holdout])
+            pending_y.append(targets[~holdout])
+            if holdout_count < MAX_HOLDOUT and holdout.any():
+                holdout_x.append(features[holdout])
+                holdout_y.append(targets[holdout])
+                holdout_count += int(holdout.sum())
+            if sum(len(y) for y in pending_y) >= batch_samples:
+                fit_pending()
+
+        if pending_y and (model is None or sum(len(y) for y in pending_y) >= MIN_BATCH_SAMPLES):
+            fit_pending()
+    except _RefitNeeded:
+        logger.info(f"{target.title()} model reached {max_estimators} stages; refitting from scratch")
+        return fit_streaming(
+            target, db_path, feature_names, scaler, None, 0, chunk_size, estimators_per_batch, max_estimators
+        )
+
+    result = FitResult(target, model, samples, trained_through)
+    if model is not None and holdout_x:
+        X_test = scaler.transform(np.concatenate(holdout_x)[:MAX_HOLDOUT])
+        y_test = np.concatenate(holdout_y)[:MAX_HOLDOUT]
+        predictions = model.predict(X_test)
+        result.mae = float(mean_absolute_error(y_test, predictions))
+        result.r2 = float(r2_score(y_test, predictions)) if len(y_test) > 1 else None
+    return result
+
+
+def fit_models_parallel(jobs: Dict[str, Dict[str, Any]], parallel: bool = True) -> Dict[str, FitResult]:
+    """Run fit_streaming for each target, in separate processes when possible."""
+    if parallel and len(jobs) > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=len(jobs)) as executor:
+                futures = {target: executor.submit(fit_streaming, target, **kwargs) for target, kwargs in jobs.items()}
+                return {target: future.result() for target, future in futures.items()}
+        except Exception as e:
+            logger.warning(f"Parallel training unavailable ({e}), training sequentially")
+    return {target: fit_streaming(target, **kwargs) for target, kwargs in jobs.items()}
+
+
+@dataclass
+class ModelManifest:
+    """Description of one saved model version."""
+
+    version: int
+    created_at: str
+    feature_names: List[str]
+    samples: int = 0
+    trained_through_id: int = 0
+    metrics: Dict[str, Dict[str, Optional[float]]] = field(default_factory=dict)
+    artifacts: Dict[str, str] = field(default_factory=dict)
+
+
+class ModelVersionStore:
+    """Versioned model artifacts under models/v<N>/ with a CURRENT pointer."""
+
+    def __init__(self, models_dir: Path, keep_versions: int = 3):
+        """
+        Initialize version store.
+
+        Args:
+            models_dir: Root directory for model versions
+            keep_versions: Number of versions kept on disk
+        """
+        self.models_dir = Path(models_dir)
+        self.keep_versions = keep_versions
+
+    def current(self) -> Optional[ModelManifest]:
+        """Manifest of the active version, or None."""
+        try:
+            name = (self.models_dir / CURRENT_POINTER).read_text(encoding="utf-8").strip()
+            with open(self.models_dir / name / MANIFEST_NAME, encoding="utf-8") as f:
+                return ModelManifest(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def artifact_paths(self, manifest: ModelManifest) -> Dict[str, Path]:
+        """Artifact name -> file path for a version."""
+        version_dir = self.models_dir / f"v{manifest.version}"
+        return {name: version_dir / filename for name, filename in manifest.artifacts.items()}
+
+    def save(self, artifacts: Dict[str, Any], manifest: ModelManifest) -> ModelManifest:
+        """Write a new version and make it current.
+
+        Artifacts are dumped uncompressed so they can be memory-mapped on load.
+        """
+        current = self.current()
+        manifest.version = (current.version if current else 0) + 1
+        manifest.created_at = datetime.now().isoformat()
+        version_dir = self.models_dir / f"v{manifest.version}"
+        staging_dir = self.models_dir / f".v{manifest.version}.tmp"
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        staging_dir.mkdir(parents=True)
+
+        manifest.artifacts = {}
+        for name, artifact in artifacts.items():
+            filename = ARTIFACT_FILES.get(name, f"{name}.joblib")
+            joblib.dump(artifact, staging_dir / filename)
+            manifest.artifacts[name] = filename
+        with open(staging_dir / MANIFEST_NAME, "w", encoding="utf-8") as f:
+            json.dump(asdict(manifest), f, indent=2)
+
+        os.replace(staging_dir, version_dir)
+        pointer_tmp = self.models_dir / f"{CURRENT_POINTER}.tmp"
+        pointer_tmp.write_text(version_dir.name, encoding="utf-8")
+        os.replace(pointer_tmp, self.models_dir / CURRENT_POINTER)
+        self._prune(manifest.version)
+        logger.info(f"Saved ML models as version {manifest.version}")
+        return manifest
+
+    def _prune(self, current_version: int) -> None:
+        for path in self.models_dir.glob("v*"):
+            suffix = path.name[1:]
+            if path.is_dir() and suffix.isdigit() and int(suffix) <= current_version - self.keep_versions:
+                shutil.rmtree(path, ignore_errors=True)
+
+
+class LazyArtifacts(MutableMapping):
+    """Name -> model mapping that loads joblib files on first access.
+
+    Membership tests do not load anything; loaded arrays are memory-mapped
+    read-only, so the OS pages them in as they are used.
+    """
+
+    def __init__(self, paths: Optional[Dict[str, Path]] = None, mmap_mode: Optional[str] = "r"):
+        self._paths: Dict[str, Path] = dict(paths or {})
+        self._loaded: Dict[str, Any] = {}
+        self.mmap_mode = mmap_mode
+
+    def is_loaded(self, name: str) -> bool:
+        """Whether an artifact is already in memory."""
+        return name in self._loaded
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in self._loaded:
+            path = self._paths[name]
+            start = time.perf_counter()
+            self._loaded[name] = joblib.load(path, mmap_mode=self.mmap_mode)
+            logger.debug(f"Loaded {path.name} in {(time.perf_counter() - start) * 1000:.1f} ms")
+        return self._loaded[name]
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        self._loaded[name] = value
+        self._paths.pop(name, None)
+
+    def __delitem__(self, name: str) -> None:
+        if name not in self._loaded and name not in self._paths:
+            raise KeyError(name)
+        self._loaded.pop(name, None)
+        self._paths.pop(name, None)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._loaded or name in self._paths
+
+    def __iter__(self):
+        return iter(dict.fromkeys([*self._loaded, *self._paths]))
+
+    def __len__(self) -> int:
+        return len(set(self._loaded) | set(self._paths))
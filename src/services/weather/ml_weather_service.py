@@ -1,47 +1,106 @@
-"""Machine Learning Weather Service for advanced analytics and recommendations."""
+"""Machine Learning Weather Service for advanced analytics and recommendations.
+
+numpy, pandas, matplotlib and scikit-learn are imported by load_ml_libraries()
+when the first MLWeatherService is created, not when this module is imported,
+so the dataclasses below can be used without paying for the ML stack. The UI
+holds the service through get_ml_weather_service(), a LazyProxy that is
+preloaded on a background thread once the dashboard is idle.
+"""
+
+from __future__ import annotations
 
 import logging
 import json
+import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 
-# Conditional imports with fallback
-try:
-    import numpy as np
-    import pandas as pd
-    import matplotlib.pyplot as plt
-    from sklearn.cluster import KMeans
-    from sklearn.preprocessing import StandardScaler
-    from sklearn.decomposition import PCA
-    from sklearn.metrics.pairwise import cosine_similarity
-    from sklearn.neighbors import NearestNeighbors
-    from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
-    from sklearn.model_selection import train_test_split
-    from sklearn.metrics import mean_absolute_error, r2_score
-    import joblib
-    SKLEARN_AVAILABLE = True
-except ImportError:
-    SKLEARN_AVAILABLE = False
-    logging.warning("Required ML libraries (scikit-learn, pandas, numpy, matplotlib) not available. ML features will be limited.")
-    # Create dummy classes for type hints
-    class np:
-        ndarray = object
-    class pd:
-        DataFrame = object
-    class plt:
-        Figure = object
-        @staticmethod
-        def subplots(*args, **kwargs):
-            return None, None
-        @staticmethod
-        def show():
-            pass
-
 from dataclasses import dataclass
 
+from ..lazy_loading import LazyProxy, get_lazy_service
+
 logger = logging.getLogger(__name__)
 
+# Set by load_ml_libraries(); None until the ML stack has been imported
+SKLEARN_AVAILABLE: Optional[bool] = None
+CityFeatureMatrix = None
+
+_ml_import_lock = threading.Lock()
+_service_handle_lock = threading.Lock()
+
+
+def load_ml_libraries() -> bool:
+    """Import the ML libraries into this module on first call.
+
+    Returns:
+        True if scikit-learn and its dependencies are available
+    """
+    global SKLEARN_AVAILABLE, CityFeatureMatrix
+    global np, pd, plt, joblib
+    global KMeans, StandardScaler, PCA, cosine_similarity, NearestNeighbors
+    global RandomForestRegressor, GradientBoostingRegressor, train_test_split
+    global mean_absolute_error, r2_score
+    global DEFAULT_HISTORY_DB, LazyArtifacts, ModelManifest, ModelVersionStore
+    global build_feature_matrix, fit_models_parallel, fit_scaler, local_time_features
+
+    if SKLEARN_AVAILABLE is not None:
+        return SKLEARN_AVAILABLE
+
+    with _ml_import_lock:
+        if SKLEARN_AVAILABLE is not None:
+            return SKLEARN_AVAILABLE
+
+        start_time = time.perf_counter()
+        # Conditional imports with fallback
+        try:
+            import numpy as np
+            import pandas as pd
+            import matplotlib.pyplot as plt
+            from sklearn.cluster import KMeans
+            from sklearn.preprocessing import StandardScaler
+            from sklearn.decomposition import PCA
+            from sklearn.metrics.pairwise import cosine_similarity
+            from sklearn.neighbors import NearestNeighbors
+            from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
+            from sklearn.model_selection import train_test_split
+            from sklearn.metrics import mean_absolute_error, r2_score
+            import joblib
+            from .ml_training import (
+                DEFAULT_HISTORY_DB, LazyArtifacts, ModelManifest, ModelVersionStore,
+                build_feature_matrix, fit_models_parallel, fit_scaler, local_time_features
+            )
+            available = True
+        except ImportError:
+            available = False
+            logging.warning("Required ML libraries (scikit-learn, pandas, numpy, matplotlib) not available. ML features will be limited.")
+            # Create dummy classes for type hints
+            class np:
+                ndarray = object
+            class pd:
+                DataFrame = object
+            class plt:
+                Figure = object
+                @staticmethod
+                def subplots(*args, **kwargs):
+                    return None, None
+                @staticmethod
+                def show():
+                    pass
+
+        # Vectorized similarity needs only numpy
+        try:
+            from .city_similarity import CityFeatureMatrix
+        except ImportError:
+            CityFeatureMatrix = None
+
+        SKLEARN_AVAILABLE = available
+        logger.debug(f"ML libraries imported in {time.perf_counter() - start_time:.2f}s")
+        return SKLEARN_AVAILABLE
+
+
+
 
 @dataclass
 class WeatherProfile:
@@ -98,6 +157,7 @@ class MLWeatherService:
 
     def __init__(self):
         """Initialize ML Weather Service with error handling for missing dependencies."""
+        load_ml_libraries()
         try:
             # Initialize sklearn components only if available
             if SKLEARN_AVAILABLE:
@@ -150,6 +210,7 @@ class MLWeatherService:
             # Initialize cache for performance
             self._similarity_cache = {}
             self._cluster_cache = {}
+            self._feature_matrix = None
             
             # Initialize ML prediction components
             if SKLEARN_AVAILABLE:
@@ -157,6 +218,11 @@ class MLWeatherService:
                 self.models_dir.mkdir(exist_ok=True)
                 self.prediction_models = {}
                 self.prediction_scalers = {}
+                # Direct multi-horizon models: one fit predicts every hour ahead
+                self.horizon_models = {}
+                self._uncertainty_estimators = {}
+                self.model_store = ModelVersionStore(self.models_dir)
+                self.model_manifest = None
                 self.feature_names = [
                     'temperature', 'humidity', 'pressure', 'wind_speed',
                     'hour', 'day_of_week', 'month', 'clouds', 'visibility'
@@ -175,8 +241,11 @@ class MLWeatherService:
             self.nn_model = None
             self._similarity_cache = {}
             self._cluster_cache = {}
+            self._feature_matrix = None
             self.prediction_models = {}
             self.prediction_scalers = {}
+            self.horizon_models = {}
+            self._uncertainty_estimators = {}
 
     def prepare_weather_data(self, weather_profiles: List[WeatherProfile]) -> pd.DataFrame:
         """Prepare weather data for ML analysis."""
@@ -219,40 +288,45 @@ class MLWeatherService:
             logger.error(f"Error preparing weather data: {e}")
             return pd.DataFrame()
 
+    def _get_feature_matrix(self, weather_profiles: List[WeatherProfile]) -> Optional["CityFeatureMatrix"]:
+        """Feature matrix for the profiles, updating the cached one in place when
+        the same cities are passed with only some of their weather changed."""
+        if CityFeatureMatrix is None or not weather_profiles:
+            return None
+
+        matrix = self._feature_matrix
+        changed = matrix.changed_rows(weather_profiles) if matrix is not None else None
+        if changed is None or len(changed) > len(weather_profiles) // 2:
+            matrix = CityFeatureMatrix(weather_profiles)
+            self._feature_matrix = matrix
+        else:
+            for row in changed:
+                matrix.update(row, weather_profiles[row])
+        return matrix
+
+    def _similarity_metric(self) -> str:
+        """Similarity metric: standardized cosine with ML enabled, else range-normalized."""
+        return "cosine" if self.ml_enabled and SKLEARN_AVAILABLE else "range"
+
     def calculate_similarity_matrix(self, weather_profiles: List[WeatherProfile]) -> np.ndarray:
-        """Calculate similarity matrix between cities using cosine similarity."""
+        """Calculate similarity matrix between cities using cosine similarity.
+
+        Features are standardized (as StandardScaler would) and compared with
+        one matrix product; the result is cached until the profiles change and
+        is read-only.
+        """
         try:
             # Check if ML is available
             if not self.ml_enabled or not SKLEARN_AVAILABLE:
                 logger.warning("ML features not available, using basic similarity calculation")
                 return self._calculate_basic_similarity_matrix(weather_profiles)
 
-            df = self.prepare_weather_data(weather_profiles)
-            if df.empty:
+            matrix = self._get_feature_matrix(weather_profiles)
+            if matrix is None:
                 return np.array([])
 
-            # Select features for similarity calculation
-            feature_columns = [
-                "temperature",
-                "humidity",
-                "wind_speed",
-                "pressure",
-                "uv_index",
-                "visibility",
-            ]
-            features = df[feature_columns].values
-
-            # Error boundary for sklearn operations
-            try:
-                # Normalize features
-                features_scaled = self.scaler.fit_transform(features)
-                # Calculate cosine similarity
-                similarity_matrix = cosine_similarity(features_scaled)
-            except Exception as sklearn_error:
-                logger.error(f"Sklearn operation failed: {sklearn_error}, falling back to basic calculation")
-                return self._calculate_basic_similarity_matrix(weather_profiles)
-
-            logger.info(f"Calculated similarity matrix for {len(df)} cities")
+            similarity_matrix = matrix.similarity_matrix("cosine")
+            logger.info(f"Calculated similarity matrix for {len(matrix)} cities")
             return similarity_matrix
 
         except Exception as e:
@@ -262,67 +336,100 @@ class MLWeatherService:
     def _calculate_basic_similarity_matrix(self, weather_profiles: List[WeatherProfile]) -> np.ndarray:
         """Fallback similarity calculation without sklearn."""
         try:
-            df = self.prepare_weather_data(weather_profiles)
-            if df.empty:
+            matrix = self._get_feature_matrix(weather_profiles)
+            if matrix is None:
                 return np.array([])
 
-            feature_columns = ["temperature", "humidity", "wind_speed", "pressure"]
-            features = df[feature_columns].values
-            n_cities = len(features)
-            
-            # Simple normalized euclidean distance converted to similarity
-            similarity_matrix = np.zeros((n_cities, n_cities))
-            
-            for i in range(n_cities):
-                for j in range(n_cities):
-                    if i == j:
-                        similarity_matrix[i][j] = 1.0
-                    else:
-                        # Calculate normalized distance
-                        diff = np.abs(features[i] - features[j])
-                        # Normalize by feature ranges (rough approximation)
-                        normalized_diff = diff / np.array([50, 100, 20, 100])  # temp, humidity, wind, pressure ranges
-                        distance = np.mean(normalized_diff)
-                        similarity_matrix[i][j] = max(0, 1 - distance)
-            
-            logger.info(f"Calculated basic similarity matrix for {n_cities} cities")
+            # Normalized euclidean-style distance converted to similarity
+            similarity_matrix = matrix.similarity_matrix("range")
+
+            logger.info(f"Calculated basic similarity matrix for {len(matrix)} cities")
             return similarity_matrix
             
         except Exception as e:
             logger.error(f"Error in basic similarity calculation: {e}")
             return np.array([])
 
+    def find_similar_cities(
+        self, city: str, weather_profiles: List[WeatherProfile], top_k: int = 5
+    ) -> List[Tuple[str, float]]:
+        """Find the cities most similar to one city, best first.
+
+        Only the city's row of similarities is computed, so this stays cheap
+        for large city sets.
+        """
+        try:
+            matrix = self._get_feature_matrix(weather_profiles)
+            if matrix is None or city not in matrix.index:
+                return []
+
+            neighbors = matrix.top_k(matrix.index[city], top_k, self._similarity_metric())
+            return [(matrix.names[row], score) for row, score in neighbors]
+
+        except Exception as e:
+            logger.error(f"Error finding similar cities: {e}")
+            return []
+
+    def find_closest_cities(self, weather_profiles: List[WeatherProfile]) -> List[Tuple[str, str, float]]:
+        """Each city's most similar other city as (city, closest, similarity).
+
+        One pass over the feature matrix, rather than one find_similar_cities()
+        call (and profile comparison) per city.
+        """
+        try:
+            matrix = self._get_feature_matrix(weather_profiles)
+            if matrix is None:
+                return []
+
+            return [
+                (matrix.names[row], matrix.names[match[0]], match[1])
+                for row, match in enumerate(matrix.nearest(self._similarity_metric()))
+                if match is not None
+            ]
+
+        except Exception as e:
+            logger.error(f"Error finding closest cities: {e}")
+            return []
+
+    def find_most_similar_pair(
+        self, weather_profiles: List[WeatherProfile]
+    ) -> Optional[Tuple[str, str, float]]:
+        """Find the most similar pair of cities as (city1, city2, similarity)."""
+        try:
+            matrix = self._get_feature_matrix(weather_profiles)
+            if matrix is None:
+                return None
+
+            pair = matrix.most_similar_pair(self._similarity_metric())
+            if pair is None:
+                return None
+            return matrix.names[pair[0]], matrix.names[pair[1]], pair[2]
+
+        except Exception as e:
+            logger.error(f"Error finding most similar pair: {e}")
+            return None
+
     def get_city_similarity(
         self, city1: str, city2: str, weather_profiles: List[WeatherProfile]
     ) -> SimilarityResult:
         """Get detailed similarity analysis between two cities."""
         try:
-            df = self.prepare_weather_data(weather_profiles)
-            similarity_matrix = self.calculate_similarity_matrix(weather_profiles)
-
-            if df.empty or similarity_matrix.size == 0:
+            matrix = self._get_feature_matrix(weather_profiles)
+            if matrix is None:
                 return SimilarityResult(city1, city2, 0.0, [], "Unable to calculate similarity")
 
             # Find city indices
-            city1_idx = df[df["city_name"] == city1].index
-            city2_idx = df[df["city_name"] == city2].index
-
-            if len(city1_idx) == 0 or len(city2_idx) == 0:
+            if city1 not in matrix.index or city2 not in matrix.index:
                 return SimilarityResult(city1, city2, 0.0, [], "Cities not found in data")
 
-            city1_idx, city2_idx = city1_idx[0], city2_idx[0]
-            similarity_score = similarity_matrix[city1_idx][city2_idx]
+            city1_idx, city2_idx = matrix.index[city1], matrix.index[city2]
+            similarity_score = matrix.similarity(city1_idx, city2_idx, self._similarity_metric())
 
             # Analyze dominant factors
-            city1_data = df.iloc[city1_idx]
-            city2_data = df.iloc[city2_idx]
-
-            feature_diffs = {
-                "temperature": abs(city1_data["temperature"] - city2_data["temperature"]),
-                "humidity": abs(city1_data["humidity"] - city2_data["humidity"]),
-                "wind_speed": abs(city1_data["wind_speed"] - city2_data["wind_speed"]),
-                "pressure": abs(city1_data["pressure"] - city2_data["pressure"]),
-            }
+            factor_columns = ["temperature", "humidity", "wind_speed", "pressure"]
+            values = matrix.values(factor_columns)
+            differences = np.abs(values[city1_idx] - values[city2_idx])
+            feature_diffs = dict(zip(factor_columns, differences.tolist()))
 
             # Find most similar factors (smallest differences)
             sorted_factors = sorted(feature_diffs.items(), key=lambda x: x[1])
@@ -361,13 +468,13 @@ class MLWeatherService:
                 logger.warning("ML clustering not available, using basic grouping")
                 return self._perform_basic_clustering(weather_profiles)
 
-            df = self.prepare_weather_data(weather_profiles)
-            if df.empty:
+            matrix = self._get_feature_matrix(weather_profiles)
+            if matrix is None:
                 return []
 
             # Select features for clustering
             feature_columns = ["temperature", "humidity", "wind_speed", "pressure", "uv_index"]
-            features = df[feature_columns].values
+            features = matrix.values(feature_columns)
 
             # Error boundary for sklearn clustering operations
             try:
@@ -377,14 +484,14 @@ class MLWeatherService:
                 # Apply PCA for dimensionality reduction if needed
                 if len(feature_columns) > 3:
                     # Dynamically set PCA components based on data size
-                    n_components = min(3, len(df), len(feature_columns))
+                    n_components = min(3, len(matrix), len(feature_columns))
                     self.pca = PCA(n_components=n_components)
                     features_pca = self.pca.fit_transform(features_scaled)
                 else:
                     features_pca = features_scaled
 
                 # Perform clustering
-                n_clusters = min(5, len(df))  # Adjust clusters based on data size
+                n_clusters = min(5, len(matrix))  # Adjust clusters based on data size
                 self.kmeans = KMeans(n_clusters=n_clusters, random_state=42)
                 cluster_labels = self.kmeans.fit_predict(features_pca)
                 
@@ -392,20 +499,23 @@ class MLWeatherService:
                 logger.error(f"Sklearn clustering failed: {sklearn_error}, falling back to basic clustering")
                 return self._perform_basic_clustering(weather_profiles)
 
-            # Analyze clusters
-            df["cluster"] = cluster_labels
+            # Analyze clusters (per-cluster means in one pass)
+            names = np.array(matrix.names, dtype=object)
+            counts = np.bincount(cluster_labels, minlength=n_clusters)
+            sums = np.zeros((n_clusters, features.shape[1]))
+            np.add.at(sums, cluster_labels, features)
+            means = sums / np.maximum(counts, 1)[:, None]
             cluster_results = []
 
             for cluster_id in range(n_clusters):
-                cluster_cities = df[df["cluster"] == cluster_id]["city_name"].tolist()
-                cluster_data = df[df["cluster"] == cluster_id][feature_columns]
+                cluster_cities = names[cluster_labels == cluster_id].tolist()
 
                 # Calculate cluster characteristics
                 characteristics = {
-                    "avg_temperature": float(cluster_data["temperature"].mean()),
-                    "avg_humidity": float(cluster_data["humidity"].mean()),
-                    "avg_wind_speed": float(cluster_data["wind_speed"].mean()),
-                    "avg_pressure": float(cluster_data["pressure"].mean()),
+                    "avg_temperature": float(means[cluster_id, 0]),
+                    "avg_humidity": float(means[cluster_id, 1]),
+                    "avg_wind_speed": float(means[cluster_id, 2]),
+                    "avg_pressure": float(means[cluster_id, 3]),
                 }
 
                 # Get cluster profile or create default
@@ -1373,43 +1483,106 @@ class MLWeatherService:
             return
             
         try:
-            # Try to load existing models
-            temp_model_path = self.models_dir / "temperature_model.joblib"
-            humid_model_path = self.models_dir / "humidity_model.joblib"
-            temp_scaler_path = self.models_dir / "temperature_scaler.joblib"
+            # Versioned artifacts (models/CURRENT -> models/v<N>/) are preferred;
+            # the flat files written by earlier releases are still read.
+            # Either way nothing is loaded until a model is first used.
+            manifest = self.model_store.current()
+            if manifest is not None:
+                paths = self.model_store.artifact_paths(manifest)
+            else:
+                paths = {
+                    name: self.models_dir / f"{name}.joblib"
+                    for name in (
+                        'temperature_model', 'humidity_model', 'temperature_scaler',
+                        'temperature_horizon_model', 'humidity_horizon_model',
+                    )
+                }
+                paths = {name: path for name, path in paths.items() if path.exists()}
             
-            if temp_model_path.exists() and humid_model_path.exists() and temp_scaler_path.exists():
-                self.prediction_models['temperature'] = joblib.load(temp_model_path)
-                self.prediction_models['humidity'] = joblib.load(humid_model_path)
-                self.prediction_scalers['temperature'] = joblib.load(temp_scaler_path)
-                logger.info("Loaded existing ML prediction models")
+            if {'temperature_model', 'humidity_model', 'temperature_scaler'} <= set(paths):
+                self.prediction_models = LazyArtifacts({
+                    'temperature': paths['temperature_model'],
+                    'humidity': paths['humidity_model'],
+                })
+                self.prediction_scalers = LazyArtifacts({'temperature': paths['temperature_scaler']})
+                self.horizon_models = LazyArtifacts({
+                    target: paths[f"{target}_horizon_model"]
+                    for target in ('temperature', 'humidity')
+                    if f"{target}_horizon_model" in paths
+                })
+                self.model_manifest = manifest
+                version = f"version {manifest.version}" if manifest else "unversioned files"
+                logger.info(f"Found ML prediction models ({version}); loading on first use")
             else:
                 logger.info("No existing models found. Models will be trained when data is available.")
+            self._uncertainty_estimators.clear()
                 
         except Exception as e:
             logger.error(f"Error loading ML models: {e}")
     
+    def preload_models(self) -> int:
+        """Load (memory-map) every saved prediction model now instead of on first use.
+        
+        Returns:
+            Number of model artifacts in memory
+        """
+        if not SKLEARN_AVAILABLE:
+            return 0
+        
+        loaded = 0
+        for artifacts in (self.prediction_models, self.prediction_scalers, self.horizon_models):
+            for name in list(artifacts):
+                try:
+                    artifacts[name]
+                    loaded += 1
+                except Exception as e:
+                    logger.warning(f"Could not preload ML model {name}: {e}")
+        return loaded
+    
     def prepare_features(self, weather_data):
         """Extract features from weather data."""
         try:
-            dt = datetime.fromtimestamp(weather_data.get('dt', datetime.now().timestamp()))
-            
-            features = {
-                'temperature': weather_data.get('temp', 20),
-                'humidity': weather_data.get('humidity', 50),
-                'pressure': weather_data.get('pressure', 1013),
-                'wind_speed': weather_data.get('wind_speed', 5),
-                'hour': dt.hour,
-                'day_of_week': dt.weekday(),
-                'month': dt.month,
-                'clouds': weather_data.get('clouds', 50),
-                'visibility': weather_data.get('visibility', 10000) / 1000  # Convert to km
-            }
-            
-            return np.array([features[name] for name in self.feature_names]).reshape(1, -1)
+            return self.prepare_feature_matrix([weather_data])
         except Exception as e:
             logger.error(f"Error preparing features: {e}")
             return np.zeros((1, len(self.feature_names)))
+
+    def prepare_feature_matrix(self, weather_records):
+        """Extract features from many weather records as one (n, features) matrix."""
+        now = datetime.now().timestamp()
+        timestamps = np.array([record.get('dt', now) for record in weather_records], dtype=np.float64)
+        columns = {
+            'temperature': [record.get('temp', 20) for record in weather_records],
+            'humidity': [record.get('humidity', 50) for record in weather_records],
+            'pressure': [record.get('pressure', 1013) for record in weather_records],
+            'wind_speed': [record.get('wind_speed', 5) for record in weather_records],
+            'clouds': [record.get('clouds', 50) for record in weather_records],
+            # Convert to km
+            'visibility': [record.get('visibility', 10000) / 1000 for record in weather_records],
+        }
+        return build_feature_matrix(self.feature_names, columns, self._local_times(timestamps))
+
+    def _time_feature_columns(self, timestamps):
+        """Hour, weekday and month (local time) for an array of Unix timestamps."""
+        return local_time_features(self._local_times(timestamps))
+
+    def _local_times(self, timestamps):
+        """Local wall-clock datetime64 values for an array of Unix timestamps."""
+        seconds = np.floor(timestamps).astype(np.int64)
+        return (seconds + self._utc_offsets(seconds)).astype('datetime64[s]')
+
+    @staticmethod
+    def _utc_offsets(seconds):
+        """Local UTC offset of each timestamp (as datetime.fromtimestamp() applies it).
+        
+        Offsets only change on hour boundaries, so they are looked up once per
+        distinct hour rather than once per timestamp.
+        """
+        hours, inverse = np.unique(seconds // 3600, return_inverse=True)
+        offsets = np.array(
+            [time.localtime(int(hour) * 3600).tm_gmtoff for hour in hours], dtype=np.int64
+        )
+        return offsets[inverse.reshape(seconds.shape)]
     
     def train_models(self, historical_data):
         """Train ML models on historical data."""
@@ -1418,27 +1591,15 @@ class MLWeatherService:
             return False
         
         try:
-            # Prepare training data
-            X = []
-            y_temp = []
-            y_humid = []
-            
-            for i in range(len(historical_data) - 1):
-                current = historical_data[i]
-                next_hour = historical_data[i + 1]
-                
-                features = self.prepare_features(current)
-                X.append(features[0])
-                y_temp.append(next_hour['temp'])
-                y_humid.append(next_hour['humidity'])
-            
-            X = np.array(X)
-            y_temp = np.array(y_temp)
-            y_humid = np.array(y_humid)
+            # Prepare training data: features at t, targets at t + 1 hour
+            X = self.prepare_feature_matrix(historical_data[:-1])
+            y_temp = np.array([record['temp'] for record in historical_data[1:]], dtype=np.float64)
+            y_humid = np.array([record['humidity'] for record in historical_data[1:]], dtype=np.float64)
             
             # Train temperature model
-            self.prediction_scalers['temperature'] = StandardScaler()
-            X_scaled = self.prediction_scalers['temperature'].fit_transform(X)
+            scaler = StandardScaler()
+            X_scaled = scaler.fit_transform(X)
+            self._replace_scaler(scaler)
             
             self.prediction_models['temperature'] = GradientBoostingRegressor(
                 n_estimators=100,
@@ -1455,8 +1616,12 @@ class MLWeatherService:
                 random_state=42
             )
             self.prediction_models['humidity'].fit(X_scaled, y_humid)
+            self._uncertainty_estimators.clear()
             
             # Save models
+            self.model_manifest = ModelManifest(
+                version=0, created_at="", feature_names=list(self.feature_names), samples=len(y_temp)
+            )
             self.save_models()
             
             # Calculate and log accuracy
@@ -1468,17 +1633,195 @@ class MLWeatherService:
             logger.error(f"Error training models: {e}")
             return False
     
+    def _replace_scaler(self, scaler):
+        """Install a newly fitted feature scaler.
+        
+        The direct multi-horizon models were fitted on features scaled by the
+        previous scaler, so they are dropped rather than saved alongside the
+        new one; train_horizon_models() fits them again.
+        """
+        self.prediction_scalers['temperature'] = scaler
+        if self.horizon_models:
+            logger.info("Dropping multi-horizon models fitted with the previous feature scaler")
+            self.horizon_models = {}
+    
+    def train_horizon_models(self, historical_data, hours_ahead=24):
+        """Train direct multi-horizon models on hourly historical data.
+        
+        Each model maps the features at hour t to the values at t+1..t+hours_ahead
+        (one output per hour), so a whole forecast curve comes from a single
+        predict call instead of hours_ahead chained ones. Uses the scaler fitted
+        by train_models(), which must have run first.
+        """
+        if not SKLEARN_AVAILABLE or 'temperature' not in self.prediction_scalers:
+            logger.warning("Train the hourly models before the multi-horizon models.")
+            return False
+        if len(historical_data) < hours_ahead + 100:
+            logger.warning(f"Insufficient data for training. Need at least {hours_ahead + 100} samples.")
+            return False
+        
+        try:
+            samples = len(historical_data) - hours_ahead
+            X_scaled = self.prediction_scalers['temperature'].transform(
+                self.prepare_feature_matrix(historical_data[:samples])
+            )
+            # Row i holds the values at hours i+1 .. i+hours_ahead
+            offsets = np.arange(samples)[:, None] + np.arange(1, hours_ahead + 1)[None, :]
+            targets = {
+                'temperature': np.array([record['temp'] for record in historical_data], dtype=np.float64),
+                'humidity': np.array([record['humidity'] for record in historical_data], dtype=np.float64),
+            }
+            
+            for target, values in targets.items():
+                model = RandomForestRegressor(
+                    n_estimators=50,
+                    max_depth=10,
+                    random_state=42,
+                    n_jobs=-1
+                )
+                model.fit(X_scaled, values[offsets])
+                self.horizon_models[target] = model
+            
+            self._uncertainty_estimators.clear()
+            self.save_models()
+            logger.info(f"Trained direct multi-horizon models for {hours_ahead} hours")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error training multi-horizon models: {e}")
+            return False
+    
     def save_models(self):
-        """Save trained models to disk."""
+        """Save trained models to disk as a new version."""
         try:
             if 'temperature' in self.prediction_models:
-                joblib.dump(self.prediction_models['temperature'], self.models_dir / "temperature_model.joblib")
-                joblib.dump(self.prediction_models['humidity'], self.models_dir / "humidity_model.joblib")
-                joblib.dump(self.prediction_scalers['temperature'], self.models_dir / "temperature_scaler.joblib")
+                artifacts = {
+                    'temperature_model': self.prediction_models['temperature'],
+                    'humidity_model': self.prediction_models['humidity'],
+                    'temperature_scaler': self.prediction_scalers['temperature'],
+                }
+                for target in self.horizon_models:
+                    artifacts[f"{target}_horizon_model"] = self.horizon_models[target]
+                
+                previous = self.model_manifest
+                manifest = ModelManifest(
+                    version=0,
+                    created_at="",
+                    feature_names=list(self.feature_names),
+                    samples=previous.samples if previous else 0,
+                    trained_through_id=previous.trained_through_id if previous else 0,
+                    metrics=previous.metrics if previous else {},
+                )
+                self.model_manifest = self.model_store.save(artifacts, manifest)
                 logger.info("ML models saved successfully")
         except Exception as e:
             logger.error(f"Error saving models: {e}")
     
+    def train_from_history(self, db_path=None, incremental=True, chunk_size=5000, parallel=True):
+        """Train the prediction models from the weather_history table.
+        
+        History is streamed in chunks rather than loaded at once. With
+        incremental=True and saved models, only rows added since the last run
+        are read and the existing estimators are extended (warm start) instead
+        of refitted; otherwise (including after train_models(), whose models
+        were not trained from history) the scaler is fitted in a first
+        streaming pass and the models are trained from scratch. The temperature and humidity
+        models train in parallel processes. Each run saves a new model version.
+        
+        Args:
+            db_path: History database (defaults to data/weather_dashboard.db)
+            incremental: Continue from the current model version
+            chunk_size: Rows read per query
+            parallel: Train the two models in separate processes
+            
+        Returns:
+            True if models were trained and saved
+        """
+        if not SKLEARN_AVAILABLE:
+            return False
+        
+        db_path = Path(db_path or DEFAULT_HISTORY_DB)
+        if not db_path.exists():
+            logger.warning(f"History database not found: {db_path}")
+            return False
+        
+        try:
+            start_time = time.perf_counter()
+            manifest = self.model_manifest
+            # Models from train_models() have no history position
+            # (trained_through_id 0); continuing them would re-read all of
+            # history and add estimators on data they may already have seen
+            resume = (
+                incremental
+                and manifest is not None
+                and manifest.trained_through_id > 0
+                and manifest.feature_names == list(self.feature_names)
+                and 'temperature' in self.prediction_models
+            )
+            if resume:
+                after_id = manifest.trained_through_id
+                scaler = self.prediction_scalers['temperature']
+                models = {
+                    target: self.prediction_models[target] for target in ('temperature', 'humidity')
+                }
+            else:
+                after_id = 0
+                scaler, samples = fit_scaler(db_path, self.feature_names, chunk_size)
+                if scaler is None or samples < 100:
+                    logger.warning("Insufficient data for training. Need at least 100 samples.")
+                    return False
+                models = {'temperature': None, 'humidity': None}
+            
+            jobs = {
+                target: {
+                    'db_path': db_path,
+                    'feature_names': list(self.feature_names),
+                    'scaler': scaler,
+                    'model': model,
+                    'after_id': after_id,
+                    'chunk_size': chunk_size,
+                }
+                for target, model in models.items()
+            }
+            results = fit_models_parallel(jobs, parallel=parallel)
+            
+            if any(result.model is None or result.samples == 0 for result in results.values()):
+                logger.info("No new weather history to train on")
+                return False
+            
+            self.prediction_models['temperature'] = results['temperature'].model
+            self.prediction_models['humidity'] = results['humidity'].model
+            if not resume:
+                self._replace_scaler(scaler)
+            self._uncertainty_estimators.clear()
+            
+            samples = results['temperature'].samples
+            self.model_manifest = ModelManifest(
+                version=0,
+                created_at="",
+                feature_names=list(self.feature_names),
+                samples=samples + (manifest.samples if resume else 0),
+                trained_through_id=max(result.trained_through_id for result in results.values()),
+                metrics={
+                    target: {'mae': result.mae, 'r2': result.r2}
+                    for target, result in results.items()
+                },
+            )
+            self.save_models()
+            
+            for target, result in results.items():
+                if result.mae is not None:
+                    logger.info(f"{target.title()} Model - MAE: {result.mae:.2f}, R²: {result.r2 or 0:.3f}")
+            logger.info(
+                f"Trained on {samples:,} new samples from history in "
+                f"{time.perf_counter() - start_time:.1f}s ({'incremental' if resume else 'full'})"
+            )
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error training models from history: {e}")
+            return False
+    
     def evaluate_models(self, X_scaled, y_temp, y_humid):
         """Evaluate model performance."""
         try:
@@ -1508,72 +1851,149 @@ class MLWeatherService:
     
     def predict_weather(self, current_weather, hours_ahead=24):
         """Generate weather predictions."""
-        if not SKLEARN_AVAILABLE:
-            return self._fallback_predictions(current_weather, hours_ahead)
+        return self.predict_weather_batch([current_weather], hours_ahead)[0]
+    
+    def predict_weather_batch(self, current_weathers, hours_ahead=24, use_horizon_models=True):
+        """Generate weather predictions for many locations at once.
         
-        predictions = []
-        current_data = current_weather.copy()
+        With direct multi-horizon models covering hours_ahead, every curve comes
+        from one predict call per target. Otherwise predictions are chained hour
+        by hour, with all locations stacked into one feature matrix per step.
+        
+        Args:
+            current_weathers: Current weather dictionaries, one per location
+            hours_ahead: Hours to predict
+            use_horizon_models: Use direct multi-horizon models when trained
+            
+        Returns:
+            Prediction lists, one per location
+        """
+        if not current_weathers:
+            return []
+        if not SKLEARN_AVAILABLE:
+            return [self._fallback_predictions(weather, hours_ahead) for weather in current_weathers]
+        if 'temperature' not in self.prediction_models or 'temperature' not in self.prediction_scalers:
+            # Fallback to simple prediction
+            return [self._fallback_predictions(weather, hours_ahead) for weather in current_weathers]
         
         try:
-            for hour in range(hours_ahead):
-                features = self.prepare_features(current_data)
-                
-                if 'temperature' in self.prediction_models and 'temperature' in self.prediction_scalers:
-                    features_scaled = self.prediction_scalers['temperature'].transform(features)
-                    
-                    # Predict
-                    temp_pred = self.prediction_models['temperature'].predict(features_scaled)[0]
-                    humid_pred = self.prediction_models['humidity'].predict(features_scaled)[0]
-                    
-                    # Add uncertainty bounds
-                    temp_std = self.calculate_prediction_uncertainty(features_scaled, 'temperature')
-                    humid_std = self.calculate_prediction_uncertainty(features_scaled, 'humidity')
-                    
-                    prediction = {
-                        'hour': hour + 1,
-                        'temperature': round(temp_pred, 1),
-                        'temperature_min': round(temp_pred - temp_std, 1),
-                        'temperature_max': round(temp_pred + temp_std, 1),
-                        'humidity': round(humid_pred, 0),
-                        'humidity_min': round(max(0, humid_pred - humid_std), 0),
-                        'humidity_max': round(min(100, humid_pred + humid_std), 0),
-                        'confidence': self.calculate_confidence(hour)
-                    }
-                    
-                    predictions.append(prediction)
-                    
-                    # Update current_data for next prediction
-                    current_data['temp'] = temp_pred
-                    current_data['humidity'] = humid_pred
-                    current_data['dt'] += 3600  # Add 1 hour
-                else:
-                    # Fallback to simple prediction
-                    predictions.append(self.simple_prediction(current_data, hour + 1))
+            features_scaled = self.prediction_scalers['temperature'].transform(
+                self.prepare_feature_matrix(current_weathers)
+            )
             
-            return predictions
+            if use_horizon_models and self._horizon_models_cover(hours_ahead):
+                temps, temp_stds = self._predict_with_spread(
+                    self.horizon_models['temperature'], features_scaled
+                )
+                humids, humid_stds = self._predict_with_spread(
+                    self.horizon_models['humidity'], features_scaled
+                )
+                curves = (
+                    temps[:, :hours_ahead], temp_stds[:, :hours_ahead],
+                    humids[:, :hours_ahead], humid_stds[:, :hours_ahead],
+                )
+            else:
+                curves = self._predict_recursive(current_weathers, features_scaled, hours_ahead)
+            
+            return [
+                self._format_predictions(*(curve[row] for curve in curves))
+                for row in range(len(current_weathers))
+            ]
             
         except Exception as e:
             logger.error(f"Error in weather prediction: {e}")
-            return self._fallback_predictions(current_weather, hours_ahead)
+            return [self._fallback_predictions(weather, hours_ahead) for weather in current_weathers]
+    
+    def _horizon_models_cover(self, hours_ahead):
+        """Whether direct multi-horizon models predict at least hours_ahead hours."""
+        return all(
+            target in self.horizon_models
+            and getattr(self.horizon_models[target], 'n_outputs_', 1) >= hours_ahead
+            for target in ('temperature', 'humidity')
+        )
+    
+    def _predict_recursive(self, current_weathers, features_scaled, hours_ahead):
+        """Chain hourly predictions for all locations, one batched step per hour."""
+        scaler = self.prediction_scalers['temperature']
+        features = self.prepare_feature_matrix(current_weathers)
+        columns = {name: index for index, name in enumerate(self.feature_names)}
+        timestamps = np.array(
+            [weather.get('dt', datetime.now().timestamp()) for weather in current_weathers],
+            dtype=np.float64,
+        )
+        
+        shape = (len(current_weathers), hours_ahead)
+        temps, temp_stds = np.empty(shape), np.empty(shape)
+        humids, humid_stds = np.empty(shape), np.empty(shape)
+        
+        for hour in range(hours_ahead):
+            if hour:
+                features_scaled = scaler.transform(features)
+            temps[:, hour] = self.prediction_models['temperature'].predict(features_scaled)
+            humids[:, hour] = self.prediction_models['humidity'].predict(features_scaled)
+            temp_stds[:, hour] = self.calculate_prediction_uncertainty(features_scaled, 'temperature')
+            humid_stds[:, hour] = self.calculate_prediction_uncertainty(features_scaled, 'humidity')
+            
+            # Update features for next prediction
+            features[:, columns['temperature']] = temps[:, hour]
+            features[:, columns['humidity']] = humids[:, hour]
+            timestamps += 3600  # Add 1 hour
+            for name, values in self._time_feature_columns(timestamps).items():
+                features[:, columns[name]] = values
+        
+        return temps, temp_stds, humids, humid_stds
+    
+    def _format_predictions(self, temps, temp_stds, humids, humid_stds):
+        """Build prediction dictionaries for one location from per-hour arrays."""
+        predictions = []
+        for hour, (temp_pred, temp_std, humid_pred, humid_std) in enumerate(
+            zip(temps.tolist(), temp_stds.tolist(), humids.tolist(), humid_stds.tolist())
+        ):
+            predictions.append({
+                'hour': hour + 1,
+                'temperature': round(temp_pred, 1),
+                'temperature_min': round(temp_pred - temp_std, 1),
+                'temperature_max': round(temp_pred + temp_std, 1),
+                'humidity': round(humid_pred, 0),
+                'humidity_min': round(max(0, humid_pred - humid_std), 0),
+                'humidity_max': round(min(100, humid_pred + humid_std), 0),
+                'confidence': self.calculate_confidence(hour)
+            })
+        return predictions
     
     def calculate_prediction_uncertainty(self, features, model_type):
-        """Calculate prediction uncertainty using ensemble variance."""
+        """Calculate prediction uncertainty using ensemble variance.
+        
+        Returns the standard deviation for every row of features: across the
+        last 10 boosting stages for the temperature model, across trees for
+        the humidity forest.
+        """
         try:
-            if model_type == 'temperature':
-                # For gradient boosting, use staged predictions
-                predictions = []
-                for pred in self.prediction_models[model_type].staged_predict(features):
-                    predictions.append(pred[0])
-                return np.std(predictions[-10:])  # Use last 10 estimators
-            else:
-                # For random forest, use tree predictions
-                predictions = []
-                for tree in self.prediction_models[model_type].estimators_:
-                    predictions.append(tree.predict(features)[0])
-                return np.std(predictions)
+            return self._predict_with_spread(self.prediction_models[model_type], features)[1]
         except Exception as e:
             logger.error(f"Error calculating uncertainty: {e}")
-            return 2.0  # Default uncertainty
+            return np.full(len(features), 2.0)  # Default uncertainty
+    
+    def _predict_with_spread(self, model, features):
+        """Predictions and ensemble standard deviations for every row of features."""
+        estimators = self._uncertainty_estimators.get(id(model))
+        if estimators is None:
+            if hasattr(model, 'staged_predict'):
+                # Last 9 boosting trees: the last 10 staged predictions are the
+                # final prediction minus trailing sums of their contributions
+                estimators = [tree[0] for tree in model.estimators_[-9:]]
+            else:
+                estimators = list(model.estimators_)
+            self._uncertainty_estimators[id(model)] = estimators
+        
+        prediction = model.predict(features)
+        tree_outputs = np.stack([estimator.predict(features) for estimator in estimators])
+        if hasattr(model, 'staged_predict'):
+            # stages[k] = prediction - learning_rate * sum(tree_outputs[k:])
+            trailing = np.cumsum(tree_outputs[::-1], axis=0)[::-1] * model.learning_rate
+            stages = np.concatenate([prediction[None, ...] - trailing, prediction[None, ...]])
+            return prediction, stages.std(axis=0)
+        return prediction, tree_outputs.std(axis=0)
     
     def calculate_confidence(self, hours_ahead):
         """Calculate prediction confidence based on time horizon."""
@@ -1618,3 +2038,42 @@ class MLWeatherService:
             # Style the polar plot border
             ax.spines["polar"].set_color(theme.get("primary", "#00FF41"))
             ax.spines["polar"].set_linewidth(2)
+
+
+def get_ml_weather_service() -> LazyProxy:
+    """Get the shared ML weather service handle.
+    
+    The returned proxy creates MLWeatherService (and imports the ML
+    libraries) on first attribute access.
+    """
+    lazy_service = get_lazy_service()
+    proxy = lazy_service.services.get("ml_weather_service")
+    if proxy is None:
+        with _service_handle_lock:
+            proxy = lazy_service.services.get("ml_weather_service")
+            if proxy is None:
+                proxy = lazy_service.register_service("ml_weather_service", MLWeatherService)
+    return proxy
+
+
+def preload_ml_weather_service() -> threading.Thread:
+    """Create the ML weather service and map its models on a background thread.
+    
+    Returns:
+        The started daemon thread
+    """
+    def preload():
+        try:
+            start_time = time.perf_counter()
+            service = get_ml_weather_service().force_load()
+            models = service.preload_models()
+            logger.info(
+                f"🧠 ML weather service preloaded in {time.perf_counter() - start_time:.2f}s "
+                f"({models} models)"
+            )
+        except Exception as e:
+            logger.warning(f"ML weather service preload failed: {e}")
+    
+    thread = threading.Thread(target=preload, name="MLServicePreload", daemon=True)
+    thread.start()
+    return thread
@@ -32,6 +32,7 @@ from .models import (
     WeatherCondition
 )
 from .enhanced_weather_service import AirQualityData
+from ...models.weather.forecast_series import ForecastSeries
 
 
 class WeatherService:
@@ -362,74 +363,40 @@ class WeatherService:
         return weather_data
     
     def _convert_forecast(self, raw_data: Dict, location: Location, days: int) -> ForecastData:
-        """Convert raw API forecast data to ForecastData model."""
-        forecast_list = raw_data.get("list", [])
-        
-        # Group forecast entries by day
-        daily_forecasts = {}
-        hourly_entries = []
+        """Convert raw API forecast data to ForecastData model.
+
+        The 3-hour slots are parsed straight into a columnar series in one pass
+        and rolled up into daily summaries by local day.
+        """
+        hourly_entries = ForecastSeries(ForecastEntry)
         
-        for item in forecast_list[:days * 8]:  # 8 entries per day (3-hour intervals)
-            dt = datetime.fromtimestamp(item.get("dt", 0))
-            date_key = dt.date()
-            
-            # Create forecast entry
+        for item in raw_data.get("list", [])[:days * 8]:  # 8 entries per day (3-hour intervals)
             main = item.get("main", {})
             weather = item.get("weather", [{}])[0]
             wind = item.get("wind", {})
             clouds = item.get("clouds", {})
             
-            condition_id = weather.get("id", 800)
-            condition = self._map_weather_condition(condition_id)
-            
-            entry = ForecastEntry(
-                datetime=dt,
+            hourly_entries.append(
+                timestamp=item.get("dt", 0),
+                condition=self._map_weather_condition(weather.get("id", 800)),
+                description=weather.get("description", ""),
                 temperature=main.get("temp", 0.0),
                 feels_like=main.get("feels_like", 0.0),
                 humidity=main.get("humidity", 0),
                 pressure=main.get("pressure", 0.0),
                 wind_speed=wind.get("speed", 0.0),
                 wind_direction=wind.get("deg", 0),
-                cloud_cover=clouds.get("all", 0),
-                precipitation_probability=item.get("pop", 0.0) * 100,
+                cloudiness=clouds.get("all", 0),
+                precipitation_probability=item.get("pop", 0.0),
                 precipitation_amount=item.get("rain", {}).get("3h", 0.0),
-                condition=condition,
-                description=weather.get("description", ""),
-                icon=weather.get("icon", "")
             )
-            
-            hourly_entries.append(entry)
-            
-            # Group by day for daily forecasts
-            if date_key not in daily_forecasts:
-                daily_forecasts[date_key] = []
-            daily_forecasts[date_key].append(entry)
-        
-        # Create daily forecast summaries
-        daily_forecast_list = []
-        for date, entries in daily_forecasts.items():
-            if entries:
-                # Calculate daily aggregates
-                temps = [e.temperature for e in entries]
-                daily_forecast = DailyForecast(
-                    date=date,
-                    min_temperature=min(temps),
-                    max_temperature=max(temps),
-                    condition=entries[len(entries)//2].condition,  # Use midday condition
-                    description=entries[len(entries)//2].description,
-                    icon=entries[len(entries)//2].icon,
-                    precipitation_probability=max(e.precipitation_probability for e in entries),
-                    precipitation_amount=sum(e.precipitation_amount for e in entries),
-                    wind_speed=sum(e.wind_speed for e in entries) / len(entries),
-                    humidity=sum(e.humidity for e in entries) // len(entries)
-                )
-                daily_forecast_list.append(daily_forecast)
         
         return ForecastData(
             location=location,
-            daily_forecasts=daily_forecast_list,
+            daily_forecasts=hourly_entries.daily_rollup(DailyForecast, days=days),
             hourly_forecasts=hourly_entries,
-            timestamp=datetime.now()
+            timestamp=datetime.now(),
+            raw_data=raw_data
         )
     
     def _convert_air_quality(self, raw_data: Dict) -> Optional[AirQualityData]:
@@ -3,21 +3,51 @@
 Contains all user interface components and styling for the weather dashboard.
 """
 
-# Component imports
-from .components.glassmorphic import GlassmorphicFrame, GlassButton, GlassPanel
-from .components.weather import WeatherCard, TemperatureChart, ForecastDisplay
-from .components.common import LoadingSpinner, ShimmerLoader, ProgressSpinner, ErrorDisplay, InlineErrorDisplay
+import importlib
+from typing import Any
 
-# Layout imports
-from .layouts import MainLayout, TabManager
+# Exports are resolved on first access (PEP 562), so importing one UI module
+# (e.g. the progressive loader shown before the dashboard) does not import
+# the whole dashboard, its tabs and matplotlib first.
+_LAZY_ATTRIBUTES = {
+    # Component imports
+    "GlassmorphicFrame": (".components.glassmorphic", "GlassmorphicFrame"),
+    "GlassButton": (".components.glassmorphic", "GlassButton"),
+    "GlassPanel": (".components.glassmorphic", "GlassPanel"),
+    "WeatherCard": (".components.weather", "WeatherCard"),
+    "TemperatureChart": (".components.weather", "TemperatureChart"),
+    "ForecastDisplay": (".components.weather", "ForecastDisplay"),
+    "LoadingSpinner": (".components.common", "LoadingSpinner"),
+    "ShimmerLoader": (".components.common", "ShimmerLoader"),
+    "ProgressSpinner": (".components.common", "ProgressSpinner"),
+    "ErrorDisplay": (".components.common", "ErrorDisplay"),
+    "InlineErrorDisplay": (".components.common", "InlineErrorDisplay"),
+    # Layout imports
+    "MainLayout": (".layouts", "MainLayout"),
+    "TabManager": (".layouts", "TabManager"),
+    # Theme imports
+    "GlassmorphicTheme": (".themes", "GlassmorphicTheme"),
+    "ThemeManager": (".themes", "ThemeManager"),
+    # Legacy imports for backward compatibility
+    "ProfessionalWeatherDashboard": (".professional_weather_dashboard", "ProfessionalWeatherDashboard"),
+    "LegacyThemeManager": (".theme_manager", "ThemeManager"),
+    "SafeWidget": (".safe_widgets", "SafeWidget"),
+}
 
-# Theme imports
-from .themes import GlassmorphicTheme, ThemeManager
 
-# Legacy imports for backward compatibility
-from .professional_weather_dashboard import ProfessionalWeatherDashboard
-from .theme_manager import ThemeManager as LegacyThemeManager
-from .safe_widgets import SafeWidget
+def __getattr__(name: str) -> Any:
+    """Import an exported component's module on first access."""
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = getattr(importlib.import_module(module_name, __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __version__ = "3.5"
 __author__ = "E. Hunter Petross - Justice Through Code Tech Pathways"
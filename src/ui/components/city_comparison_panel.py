@@ -1428,15 +1428,32 @@ class CityComparisonPanel(ctk.CTkFrame):
 
         # Clear existing comparison display
         self._clear_comparison_display()
+        self.status_label.configure(text=f"Fetching weather for {len(selected_cities)} cities...")
 
-        # Add comparison columns for selected cities
-        for city_name in selected_cities:
-            # Check if this city is from team data
-            is_team_member = city_name in self.team_cities_data
-            self._fetch_and_add_city(city_name, is_team_member=is_team_member)
+        # Fetch all selected cities in one concurrent batch off the UI thread
+        def fetch_batch():
+            batch = {}
+            if hasattr(self.weather_service, "get_enhanced_weather_batch"):
+                try:
+                    batch = self.weather_service.get_enhanced_weather_batch(selected_cities)
+                except Exception as e:
+                    logger.error(f"Batch weather fetch failed: {e}")
+            self.safe_after(0, lambda: self._add_compared_cities(selected_cities, batch))
+
+        threading.Thread(target=fetch_batch, daemon=True).start()
 
         logger.info(f"Comparing {len(selected_cities)} cities: {', '.join(selected_cities)}")
 
+    def _add_compared_cities(self, city_names: List[str], batch: Dict[str, Any]):
+        """Add comparison columns for cities, using batch-fetched weather where available."""
+        for city_name in city_names:
+            # Check if this city is from team data
+            is_team_member = city_name in self.team_cities_data
+            self._fetch_and_add_city(
+                city_name, is_team_member=is_team_member, weather=batch.get(city_name.strip())
+            )
+        self.status_label.configure(text=f"Comparing {len(city_names)} cities")
+
     def _update_comparison_display(self):
         """Update the comparison display with current sorting and filtering."""
         try:
@@ -2285,8 +2302,14 @@ class CityComparisonPanel(ctk.CTkFrame):
         # Show placeholder
         self.placeholder_label.pack(expand=True, pady=50)
 
-    def _fetch_and_add_city(self, city_name: str, is_team_member: bool = False):
-        """Fetch weather data for a city and add comparison column."""
+    def _fetch_and_add_city(self, city_name: str, is_team_member: bool = False, weather=None):
+        """Fetch weather data for a city and add comparison column.
+
+        Args:
+            city_name: City to compare
+            is_team_member: Whether the city comes from team data
+            weather: Already fetched EnhancedWeatherData; fetched here when None
+        """
         try:
             # Initialize base city data
             city_data = {"city_name": city_name, "weather_data": {}}
@@ -2314,8 +2337,10 @@ class CityComparisonPanel(ctk.CTkFrame):
                     city_data["last_updated"] = ""
                     city_data["activity_status"] = "Unknown"
 
-            # Try to get real weather data if weather service is available
-            if self.weather_service:
+            # Use batch-fetched weather, else try the weather service
+            if weather is not None:
+                city_data["weather_data"] = self._comparison_weather_data(weather)
+            elif self.weather_service:
                 try:
                     # Use get_current_weather which returns a dictionary
                     weather_response = self.weather_service.get_current_weather(city_name)
@@ -2407,6 +2432,18 @@ class CityComparisonPanel(ctk.CTkFrame):
         except Exception as e:
             logger.error(f"Failed to fetch weather data for {city_name}: {e}")
 
+    @staticmethod
+    def _comparison_weather_data(weather) -> Dict[str, Any]:
+        """Comparison values from EnhancedWeatherData (wind in km/h)."""
+        return {
+            "temperature": weather.temperature,
+            "description": weather.description,
+            "humidity": weather.humidity,
+            "wind_speed": weather.wind_speed * 3.6 if weather.wind_speed else 0,
+            "pressure": weather.pressure,
+            "feels_like": weather.feels_like,
+        }
+
     def _add_comparison_column(self, city_data: Dict[str, Any], is_team_member: bool = False):
         """Add a comparison column for a city."""
         # Hide placeholder
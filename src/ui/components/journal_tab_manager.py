@@ -45,6 +45,7 @@ class JournalTabManager:
         self.current_entry: Optional[JournalEntry] = None
         self.selected_date: Optional[date] = None
         self.search_query = ""
+        self.search_snippets: Dict[str, str] = {}
         self.filter_mood: Optional[Mood] = None
         self.filter_location = ""
 
@@ -757,9 +758,11 @@ class JournalTabManager:
                 text_color="#FFFFFF80"
             ).grid(row=2, column=0, sticky="w", pady=(3, 0))
 
-        # Content preview with glassmorphic styling
-        if entry.content:
-            preview_text = (
+        # Content preview with glassmorphic styling (the matching passage
+        # when searching)
+        snippet = self.search_snippets.get(entry.id)
+        if snippet or entry.content:
+            preview_text = snippet or (
                 entry.content[:120] + "..." if len(entry.content) > 120 else entry.content
             )
             # Remove HTML tags for preview
@@ -875,15 +878,17 @@ class JournalTabManager:
 
     def _get_filtered_entries(self) -> List[JournalEntry]:
         """Get entries filtered by current search and filter criteria."""
-        entries = self.journal_service.get_all_entries()
+        self.search_snippets = {}
 
-        # Apply search filter
+        # Apply search (ranked, via the journal's full-text index) and mood filter
         if self.search_query:
-            entries = [e for e in entries if self._entry_matches_search(e, self.search_query)]
-
-        # Apply mood filter
-        if self.filter_mood:
-            entries = [e for e in entries if e.mood == self.filter_mood]
+            hits = self.journal_service.search(self.search_query, mood=self.filter_mood)
+            self.search_snippets = {hit.entry.id: hit.snippet for hit in hits if hit.snippet}
+            entries = [hit.entry for hit in hits]
+        else:
+            entries = self.journal_service.get_all_entries()
+            if self.filter_mood:
+                entries = [e for e in entries if e.mood == self.filter_mood]
 
         # Apply location filter
         if self.filter_location:
@@ -895,28 +900,6 @@ class JournalTabManager:
 
         return entries
 
-    def _entry_matches_search(self, entry: JournalEntry, query: str) -> bool:
-        """Check if entry matches search query."""
-        query = query.lower()
-
-        # Search in title
-        if entry.title and query in entry.title.lower():
-            return True
-
-        # Search in content
-        if entry.content and query in entry.content.lower():
-            return True
-
-        # Search in location
-        if entry.location and query in entry.location.lower():
-            return True
-
-        # Search in tags
-        if entry.tags and any(query in tag.lower() for tag in entry.tags):
-            return True
-
-        return False
-
     def _on_search_changed(self, event=None):
         """Handle search query changes."""
         self.search_query = self.search_entry.get().strip()
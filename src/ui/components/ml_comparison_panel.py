@@ -16,10 +16,10 @@ from ...services.github_team_service import GitHubTeamService
 
 # Services
 from ...services.weather.ml_weather_service import (
-    MLWeatherService,
     RecommendationResult,
     SimilarityResult,
     WeatherProfile,
+    get_ml_weather_service,
 )
 from ..theme_manager import ThemeManager
 from .error_handler import ErrorHandler
@@ -212,7 +212,8 @@ class MLComparisonPanel(ctk.CTkFrame):
 
         self.weather_service = weather_service
         self.github_service = github_service
-        self.ml_service = MLWeatherService()
+        # Shared lazy handle: scikit-learn loads on first analysis, not here
+        self.ml_service = get_ml_weather_service()
         self.theme_manager = ThemeManager()
         self.error_handler = ErrorHandler(self)
 
@@ -687,37 +688,21 @@ class MLComparisonPanel(ctk.CTkFrame):
 
             if chart_type == "similarity":
                 # Calculate similarity insights
-                similarity_matrix = self.ml_service.calculate_similarity_matrix(
-                    self.weather_profiles
-                )
-                if similarity_matrix.size > 0:
-                    # Find most similar pair
-                    max_similarity = 0
-                    most_similar_pair = None
+                best_pair = self.ml_service.find_most_similar_pair(self.weather_profiles)
+                if best_pair and best_pair[2] > 0:
+                    city1, city2, max_similarity = best_pair
+                    insights.append(
+                        f"🎯 Most Similar Cities: {city1} and {city2} ({max_similarity:.1%} similarity)"
+                    )
 
-                    for i in range(len(self.weather_profiles)):
-                        for j in range(i + 1, len(self.weather_profiles)):
-                            similarity = similarity_matrix[i][j]
-                            if similarity > max_similarity:
-                                max_similarity = similarity
-                                most_similar_pair = (
-                                    self.weather_profiles[i].city_name,
-                                    self.weather_profiles[j].city_name,
-                                )
-
-                    if most_similar_pair:
-                        insights.append(
-                            f"🎯 Most Similar Cities: {most_similar_pair[0]} and {most_similar_pair[1]} ({max_similarity:.1%} similarity)"
-                        )
-
-                        # Get detailed similarity analysis
-                        similarity_result = self.ml_service.get_city_similarity(
-                            most_similar_pair[0], most_similar_pair[1], self.weather_profiles
-                        )
-                        insights.append(
-                            f"📊 Key Factors: {', '.join(similarity_result.dominant_factors)}"
-                        )
-                        insights.append(f"💡 {similarity_result.recommendation}")
+                    # Get detailed similarity analysis
+                    similarity_result = self.ml_service.get_city_similarity(
+                        city1, city2, self.weather_profiles
+                    )
+                    insights.append(
+                        f"📊 Key Factors: {', '.join(similarity_result.dominant_factors)}"
+                    )
+                    insights.append(f"💡 {similarity_result.recommendation}")
 
             elif chart_type == "clusters":
                 # Generate cluster insights
@@ -882,15 +867,20 @@ class MLComparisonPanel(ctk.CTkFrame):
             analysis.append("🔥 SIMILARITY ANALYSIS")
             analysis.append("-" * 25)
 
-            similarity_matrix = self.ml_service.calculate_similarity_matrix(self.weather_profiles)
-            if similarity_matrix.size > 0:
-                for i in range(len(self.weather_profiles)):
-                    for j in range(i + 1, len(self.weather_profiles)):
-                        city1 = self.weather_profiles[i].city_name
-                        city2 = self.weather_profiles[j].city_name
-                        similarity = similarity_matrix[i][j]
-                        analysis.append(f"{city1} ↔ {city2}: {similarity:.1%} similarity")
-                analysis.append("")
+            if len(self.weather_profiles) <= 12:
+                similarity_matrix = self.ml_service.calculate_similarity_matrix(self.weather_profiles)
+                if similarity_matrix.size > 0:
+                    for i in range(len(self.weather_profiles)):
+                        for j in range(i + 1, len(self.weather_profiles)):
+                            city1 = self.weather_profiles[i].city_name
+                            city2 = self.weather_profiles[j].city_name
+                            similarity = similarity_matrix[i][j]
+                            analysis.append(f"{city1} ↔ {city2}: {similarity:.1%} similarity")
+            else:
+                # Every pair would be N²/2 lines; list each city's closest match
+                for city1, city2, similarity in self.ml_service.find_closest_cities(self.weather_profiles):
+                    analysis.append(f"{city1} ↔ {city2}: {similarity:.1%} similarity (closest)")
+            analysis.append("")
 
         # Clustering analysis
         clusters = self.ml_service.perform_weather_clustering(self.weather_profiles)
@@ -18,6 +18,7 @@ import customtkinter as ctk
 from src.services.weather import LocationResult
 
 from ...services.weather.geocoding_service import GeocodingService
+from ...utils.search_worker import SearchWorker
 
 
 class EnhancedSearchBar(ctk.CTkFrame):
@@ -30,24 +31,36 @@ class EnhancedSearchBar(ctk.CTkFrame):
         super().__init__(parent, **kwargs)
 
         self.weather_service = weather_service
-        self.geocoding_service = GeocodingService()
+        self.geocoding_service = GeocodingService(getattr(weather_service, "config", None))
         self.on_location_selected = on_location_selected
 
         # Search state
-        self.is_searching = False
         self.search_delay_id = None
         self.autocomplete_results: List[LocationResult] = []
         self.selected_index = -1
         self.dropdown_visible = False
         self.loading_spinner_active = False
-        self.search_timer = None
         self.last_search_query = ""
         self.validation_errors = []
 
+        # One background worker runs the latest query (debounced): offline
+        # lookups first, then the network. Superseded queries are dropped.
+        self.search_worker = SearchWorker(
+            stages=[self.local_location_search, self.enhanced_location_search],
+            on_results=self._on_worker_results,
+            on_error=self._on_worker_error,
+            debounce_seconds=0.3,
+        )
+
         # Load search history and favorites
         self.search_history = self.load_search_history()
         self.favorites = self.load_favorites()
 
+        # Preload geocoding answers for likely queries off the UI thread
+        threading.Thread(
+            target=self.warm_up_location_cache, name="search-warm-up", daemon=True
+        ).start()
+
         # Geolocation state
         self.current_detected_location = None
         self.geolocation_permission_denied = False
@@ -103,6 +116,7 @@ class EnhancedSearchBar(ctk.CTkFrame):
 
     def destroy(self):
         """Override destroy to cleanup scheduled calls."""
+        self.search_worker.shutdown()
         self._cleanup_scheduled_calls()
         super().destroy()
 
@@ -196,15 +210,12 @@ class EnhancedSearchBar(ctk.CTkFrame):
 
         query = self.search_entry.get().strip()
 
-        # Cancel previous search timer
-        if self.search_timer:
-            self.search_timer.cancel()
-
         if len(query) >= 3:
-            # Debounce search with 300ms delay
-            self.search_timer = threading.Timer(0.3, self.perform_search, [query])
-            self.search_timer.start()
+            # The search worker debounces and supersedes earlier queries
+            self.perform_search(query)
         else:
+            self.search_worker.cancel()
+            self.hide_loading()
             self.hide_dropdown()
 
     def on_key_press(self, event):
@@ -256,69 +267,49 @@ class EnhancedSearchBar(ctk.CTkFrame):
         return False
 
     def perform_search(self, query: str):
-        """Perform autocomplete search with enhanced validation and error handling."""
-        if self.is_searching:
-            return
-
+        """Queue an autocomplete search with enhanced validation and error handling."""
         # Validate search query
         validation_result = self.validate_search_query(query)
         if not validation_result["valid"]:
+            self.search_worker.cancel()
             self.show_validation_error(validation_result["error"])
             return
 
         # Store last search query
         self.last_search_query = query
-        self.is_searching = True
         self.show_loading()
+        self.search_worker.submit(query)
+
+    def _on_worker_results(self, generation: int, query: str, results, is_final: bool):
+        """Receive results from the search worker thread."""
+        self.safe_after(0, self.handle_search_results, results, generation, is_final)
+
+    def _on_worker_error(self, generation: int, query: str, error: Exception):
+        """Receive a search failure from the search worker thread."""
+        print(f"Search error for '{query}': {error}")
+        self.safe_after(0, self.handle_search_error, self.search_error_message(error), generation)
+
+    def search_error_message(self, error: Exception) -> str:
+        """Map a search exception to a user-friendly message."""
+        from src.services.weather import (
+            APIKeyError,
+            NetworkError,
+            RateLimitError,
+            ServiceUnavailableError,
+            WeatherServiceError,
+        )
 
-        def search_task():
-            try:
-                # Import custom exceptions for proper error handling
-                from src.services.weather import (
-                    APIKeyError,
-                    NetworkError,
-                    RateLimitError,
-                    ServiceUnavailableError,
-                    WeatherServiceError,
-                )
-
-                # Enhanced search with multiple format support
-                results = self.enhanced_location_search(query)
-                self.safe_after(0, self.handle_search_results, results)
-
-            except RateLimitError as e:
-                print(f"Rate limit exceeded: {e}")
-                self.safe_after(
-                    0, self.handle_search_error, "Search rate limit exceeded. Please wait a moment."
-                )
-            except APIKeyError as e:
-                print(f"API key error: {e}")
-                self.safe_after(
-                    0, self.handle_search_error, "API configuration error. Please check settings."
-                )
-            except NetworkError as e:
-                print(f"Network error: {e}")
-                self.safe_after(
-                    0,
-                    self.handle_search_error,
-                    "Network connection error. Please check your internet.",
-                )
-            except ServiceUnavailableError as e:
-                print(f"Service unavailable: {e}")
-                self.safe_after(0, self.handle_search_error, "Search service temporarily unavailable.")
-            except WeatherServiceError as e:
-                print(f"Weather service error: {e}")
-                self.safe_after(0, self.handle_search_error, "Search service error. Please try again.")
-            except Exception as e:
-                print(f"Unexpected search error: {e}")
-                self.safe_after(
-                    0, self.handle_search_error, "An unexpected error occurred during search."
-                )
-            finally:
-                self.is_searching = False
-                self.safe_after(0, self.hide_loading)
-
-        threading.Thread(target=search_task, daemon=True).start()
+        if isinstance(error, RateLimitError):
+            return "Search rate limit exceeded. Please wait a moment."
+        if isinstance(error, APIKeyError):
+            return "API configuration error. Please check settings."
+        if isinstance(error, NetworkError):
+            return "Network connection error. Please check your internet."
+        if isinstance(error, ServiceUnavailableError):
+            return "Search service temporarily unavailable."
+        if isinstance(error, WeatherServiceError):
+            return "Search service error. Please try again."
+        return "An unexpected error occurred during search."
 
     def update_autocomplete_results(self, results: List[LocationResult]):
         """Update autocomplete dropdown with results."""
@@ -469,17 +460,31 @@ class EnhancedSearchBar(ctk.CTkFrame):
 
         self.show_dropdown()
 
-    def handle_search_error(self, error_message: str = "Search failed"):
+    def handle_search_error(self, error_message: str = "Search failed", generation: int = None):
         """Handle search errors with user-friendly messages."""
+        if generation is not None and not self.search_worker.is_current(generation):
+            return
         self.hide_loading()
+        self.autocomplete_results = []
         self.show_no_results(error_message)
         print(f"Search error: {error_message}")
 
-    def handle_search_results(self, results):
-        """Handle successful search results."""
-        self.hide_loading()
+    def handle_search_results(self, results, generation: int = None, is_final: bool = True):
+        """Handle search results; partial results keep the spinner running."""
+        # Results of a superseded query would flicker over the newer ones
+        if generation is not None and not self.search_worker.is_current(generation):
+            return
+        if is_final:
+            self.hide_loading()
+        if results and self.dropdown_visible and self._same_results(results, self.autocomplete_results):
+            return
         self.update_autocomplete_results(results)
 
+    @staticmethod
+    def _same_results(results, shown) -> bool:
+        """Whether results match what the dropdown already shows."""
+        return [r.display_name for r in results[:8]] == [r.display_name for r in shown]
+
     def navigate_dropdown(self, direction: int):
         """Navigate dropdown with arrow keys."""
         if not self.autocomplete_results:
@@ -858,6 +863,27 @@ class EnhancedSearchBar(ctk.CTkFrame):
         # Default to city name
         return "city_name"
 
+    def local_location_search(self, query: str):
+        """Search without the network: coordinates and the offline gazetteer.
+
+        Only confident gazetteer matches are shown here; loose fuzzy matches
+        arrive merged with the network results of the next stage.
+        """
+        search_type = self.detect_search_type(query)
+        if search_type == "coordinates":
+            return self.search_coordinates(query)
+        if search_type in ("zip_code", "postal_code"):
+            return []
+
+        gazetteer = self.geocoding_service.gazetteer
+        if gazetteer is None:
+            return []
+        return [
+            self.geocoding_service.create_gazetteer_result(place)
+            for place in gazetteer.search(query, limit=8)
+            if place.confident
+        ]
+
     def enhanced_location_search(self, query: str):
         """Enhanced location search with multiple format support."""
         search_type = self.detect_search_type(query)
@@ -945,7 +971,6 @@ class EnhancedSearchBar(ctk.CTkFrame):
                     country_code=self.get_country_code_from_name(airport["country"]),
                     state=airport["state"],
                     raw_address=f"{airport['name']}, {airport['state']}, {airport['country']}",
-                    type="airport",
                 )
             ]
 
@@ -974,7 +999,7 @@ class EnhancedSearchBar(ctk.CTkFrame):
                     country_code="",
                     state="",
                     raw_address=f"{lat}, {lon}",
-                    type="coordinates",
+                    place_type="coordinates",
                 )
             ]
         except (ValueError, IndexError):
@@ -1202,6 +1227,26 @@ class EnhancedSearchBar(ctk.CTkFrame):
         # Save to file
         self.save_search_history()
 
+    def warm_up_location_cache(self):
+        """Preload geocoding answers for recent searches and favorites."""
+        queries = [
+            item.get("query", "")
+            for item in self.search_history.get("recent_searches", [])
+            if not item.get("is_geolocation")
+        ]
+        queries.extend(
+            fav.get("display_name") or fav.get("name", "")
+            for fav in self.favorites.get("favorite_locations", [])
+        )
+
+        try:
+            if hasattr(self.weather_service, "warm_up_location_cache"):
+                self.weather_service.warm_up_location_cache(queries)
+            else:
+                self.geocoding_service.warm_up_cache(queries)
+        except Exception as e:
+            print(f"Error warming location cache: {e}")
+
     def clear_search_history(self):
         """Clear all search history."""
         self.search_history = {"recent_searches": [], "favorites": []}
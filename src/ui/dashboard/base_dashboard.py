@@ -21,7 +21,7 @@ from src.ui.components import (
 from src.ui.theme import DataTerminalTheme
 from src.ui.theme_manager import theme_manager
 from src.utils.api_optimizer import APIOptimizer
-from src.services.database import CacheManager
+from src.services.cache.tiered_cache import get_tiered_cache
 from src.utils.component_recycler import ComponentRecycler
 from src.utils.loading_manager import LoadingManager
 from src.utils.startup_optimizer import StartupOptimizer
@@ -75,11 +75,10 @@ class BaseDashboard(ctk.CTk):
 
     def _initialize_optimization_services(self):
         """Initialize performance optimization services."""
-        self.cache_manager = CacheManager(
-            max_size=100,  # 100MB cache
-            enable_compression=True,
-            compression_threshold=1024,  # Compress items > 1KB
-            lru_factor=0.8,  # Evict when 80% full
+        self.cache_manager = get_tiered_cache().namespace(
+            "dashboard",
+            ttl=1800,  # 30 minutes
+            max_size_mb=100,  # 100MB of the shared memory budget
         )
         self.startup_optimizer = StartupOptimizer(app=self, timer_manager=self.timer_manager)
         self.component_recycler = ComponentRecycler()
@@ -28,6 +28,7 @@ from src.services.weather import (
     WeatherData,
     EnhancedWeatherService,
 )
+from src.services.weather.ml_weather_service import preload_ml_weather_service
 from src.services.github_team_service import GitHubTeamService
 from src.services.gemini_service import GeminiService
 from src.ui.components import (
@@ -51,11 +52,11 @@ from src.ui.components.temperature_chart import TemperatureChart
 from src.ui.theme import DataTerminalTheme
 from src.ui.theme_manager import theme_manager
 from src.utils.api_optimizer import APIOptimizer
-from src.services.database import CacheManager
+from src.services.cache.tiered_cache import get_tiered_cache
 from src.utils.component_recycler import ComponentRecycler
 from src.utils.loading_manager import LoadingManager
 from src.utils.startup_optimizer import StartupOptimizer
-from src.services.cache.intelligent_cache import IntelligentCache
+from src.utils.startup_profiler import get_startup_profiler
 from src.ui.utils.lazy_image_loader import get_image_loader
 from src.services.performance_optimizer import get_performance_optimizer, time_operation
 from src.services.database.optimized_queries import get_optimized_db
@@ -80,18 +81,18 @@ class ProfessionalWeatherDashboard(SafeCTk):
         self.logger = logging.getLogger(__name__)
 
         # Initialize performance optimization services first
-        self.cache_manager = CacheManager(
-            max_size=100,  # 100MB cache
-            enable_compression=True,
-            compression_threshold=1024,  # Compress items > 1KB
-            lru_factor=0.8,  # Evict when 80% full
+        self.tiered_cache = get_tiered_cache()
+        self.cache_manager = self.tiered_cache.namespace(
+            "dashboard",
+            ttl=1800,  # 30 minutes
+            max_size_mb=100,  # 100MB of the shared memory budget
         )
         self.startup_optimizer = StartupOptimizer()
         self.component_recycler = ComponentRecycler()
         self.api_optimizer = APIOptimizer()
         
         # Initialize new performance optimization components
-        self.intelligent_cache = IntelligentCache(base_dir="cache")
+        self.weather_cache = self.tiered_cache.namespace("weather", ttl=300, persist=True)
         self.image_loader = get_image_loader()
         self.optimized_db = get_optimized_db()
         self.performance_optimizer = get_performance_optimizer()
@@ -1067,7 +1068,7 @@ class ProfessionalWeatherDashboard(SafeCTk):
                     if hasattr(forecast_data, "hourly_forecasts"):
                         # Filter hourly forecasts for this specific day
                         target_date = day_forecast.date.date()
-                        for hourly in forecast_data.hourly_forecasts:
+                        for hourly in self._hourly_forecasts_for_date(forecast_data, target_date):
                             if hourly.timestamp.date() == target_date:
                                 day_hourly_data.append(
                                     {
@@ -1653,6 +1654,17 @@ class ProfessionalWeatherDashboard(SafeCTk):
         except Exception as e:
             self.logger.error(f"Failed to refresh open hourly windows: {e}")
 
+    def _hourly_forecasts_for_date(self, forecast_data, target_date):
+        """Get the hourly forecasts that may fall on a date.
+
+        Column-backed series are narrowed without materializing every entry;
+        other sequences are returned as-is for the caller to filter.
+        """
+        hourly_forecasts = forecast_data.hourly_forecasts
+        if hasattr(hourly_forecasts, "for_date"):
+            return hourly_forecasts.for_date(target_date)
+        return hourly_forecasts
+
     def _get_hourly_data_for_day(self, day_index):
         """Extract hourly forecast data for a specific day."""
         try:
@@ -1669,7 +1681,7 @@ class ProfessionalWeatherDashboard(SafeCTk):
             target_date = datetime.now().date() + timedelta(days=day_index)
 
             hourly_data = []
-            for forecast in forecast_data.hourly_forecasts:
+            for forecast in self._hourly_forecasts_for_date(forecast_data, target_date):
                 # Get the forecast datetime
                 forecast_dt = forecast.timestamp
 
@@ -1797,9 +1809,15 @@ class ProfessionalWeatherDashboard(SafeCTk):
                 
                 # Try to get hourly forecasts from the first day
                 if hasattr(forecast_data, 'hourly_forecasts') and forecast_data.hourly_forecasts:
-                    for hourly in forecast_data.hourly_forecasts[:24]:  # Get up to 24 hours
-                        temp = hourly.temperature_f if self.temp_unit == "F" else hourly.temperature
-                        hourly_temps.append(temp)
+                    next_hours = forecast_data.hourly_forecasts[:24]  # Get up to 24 hours
+                    if hasattr(next_hours, 'column'):
+                        # Read the temperature column directly instead of building entries
+                        for temp in next_hours.column('temperature'):
+                            hourly_temps.append((temp * 9 / 5) + 32 if self.temp_unit == "F" else temp)
+                    else:
+                        for hourly in next_hours:
+                            temp = hourly.temperature_f if self.temp_unit == "F" else hourly.temperature
+                            hourly_temps.append(temp)
                         
                 # Try to get from daily forecasts with hourly data
                 elif hasattr(forecast_data, 'daily_forecasts') and forecast_data.daily_forecasts:
@@ -2745,8 +2763,9 @@ class ProfessionalWeatherDashboard(SafeCTk):
     def _update_cache_size(self):
         """Update cache size display."""
         try:
-            # Get actual cache size from intelligent cache
-            cache_size_mb = self.intelligent_cache.get_cache_size_mb()
+            # Memory plus disk tier of the shared cache
+            cache_stats = self.tiered_cache.get_stats()
+            cache_size_mb = (cache_stats["size_bytes"] + cache_stats["l2_size_bytes"]) / 1024 / 1024
             if hasattr(self, "cache_size_label"):
                 self.cache_size_label.configure(text=f"Cache Size: {cache_size_mb:.1f} MB")
         except Exception as e:
@@ -2756,7 +2775,7 @@ class ProfessionalWeatherDashboard(SafeCTk):
         """Clear all cached data."""
         try:
             # Clear all cache types
-            self.intelligent_cache.clear_all()
+            self.tiered_cache.clear()
             self.image_loader.clear_cache()
             self._clear_cache()
             self._update_cache_size()
@@ -2768,8 +2787,8 @@ class ProfessionalWeatherDashboard(SafeCTk):
         """Clear only weather-specific cache."""
         try:
             # Clear weather-specific cache entries
-            self.intelligent_cache.clear_pattern("weather_*")
-            self.intelligent_cache.clear_pattern("forecast_*")
+            self.weather_cache.clear_pattern("weather_*")
+            self.weather_cache.clear_pattern("forecast_*")
             self._update_cache_size()
             self.status_label.configure(text="🌤️ Weather cache cleared")
         except Exception as e:
@@ -2786,7 +2805,7 @@ class ProfessionalWeatherDashboard(SafeCTk):
             self.optimized_db.optimize_settings()
             
             # Clear old cache entries
-            self.intelligent_cache.clear_expired()
+            self.tiered_cache.sweep()
             
             # Update performance metrics
             self.performance_optimizer.log_metric("database_optimization", "completed")
@@ -3389,6 +3408,9 @@ class ProfessionalWeatherDashboard(SafeCTk):
         if hasattr(self, "loading_manager"):
             self.loading_manager.shutdown()
 
+        if hasattr(self, "weather_service") and hasattr(self.weather_service, "shutdown"):
+            self.weather_service.shutdown()
+
         self.quit()
         self.destroy()
 
@@ -3493,6 +3515,15 @@ class ProfessionalWeatherDashboard(SafeCTk):
         self.logger.info("Startup optimization complete")
         if hasattr(self, "status_label"):
             self.status_label.configure(text="Ready")
+        # The window is interactive now; import scikit-learn and map the
+        # saved models in the background so the first ML request is instant
+        preload_ml_weather_service()
+
+        profiler = get_startup_profiler()
+        if profiler is not None:
+            profiler.collect_startup_optimizer(self.startup_optimizer)
+            profiler.mark("startup_complete")
+            profiler.write_report()
 
     def _initialize_forecast_cards(self):
         """Initialize forecast cards with recycled components."""
@@ -3755,11 +3786,11 @@ class ProfessionalWeatherDashboard(SafeCTk):
                 raise
         
         try:
-            # Use intelligent cache with 5-minute TTL
-            return self.intelligent_cache.get_or_compute(
+            # Use the weather cache namespace with 5-minute TTL
+            return self.weather_cache.get_or_compute(
                 cache_key, 
                 fetch_weather_data, 
-                ttl_minutes=5
+                ttl=300
             )
         except Exception as e:
             self.logger.error(f"Cache error, falling back to direct fetch: {e}")
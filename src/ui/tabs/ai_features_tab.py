@@ -2,7 +2,7 @@ import customtkinter as ctk
 from ..components.glassmorphic import GlassPanel
 from ..components.common.loading_spinner import LoadingSpinner
 from ...services.ai.ai_manager import AIManager
-from ...services.weather.ml_weather_service import MLWeatherService
+from ...services.weather.ml_weather_service import get_ml_weather_service
 import threading
 import logging
 import json
@@ -18,7 +18,7 @@ class AIFeaturesTab(ctk.CTkFrame):
         self.weather_service = weather_service
         self.gemini_service = gemini_service
         self.ai_manager = None
-        self.ml_weather_service = MLWeatherService()
+        self.ml_weather_service = get_ml_weather_service()
         self.current_feature = "analysis"
         self.font_size = 14  # Default larger font size
         self.text_widgets = []  # Track text widgets for font changes
@@ -3,11 +3,6 @@ import os
 from typing import Any, Callable, Dict, Optional
 import customtkinter as ctk
 
-try:
-    import matplotlib.pyplot as plt
-except ImportError:
-    plt = None
-
 from src.services.logging_config import get_logger
 from src.services.error_handler import safe_execute
 
@@ -259,7 +254,12 @@ class ThemeManager:
             if hasattr(app, "temp_chart"):
                 app.temp_chart.update_theme(theme)
 
-            # Update any matplotlib charts if available
+            # Update any matplotlib charts if available. pyplot is imported
+            # here, on a theme switch, so it stays off the startup path.
+            try:
+                import matplotlib.pyplot as plt
+            except ImportError:
+                plt = None
             if plt is not None:
                 plt.style.use("dark_background")
                 plt.rcParams["figure.facecolor"] = theme["chart_bg"]
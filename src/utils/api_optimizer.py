@@ -4,6 +4,7 @@ API Optimizer for Weather Dashboard
 Implements intelligent API request management, caching, and rate limiting.
 """
 
+import asyncio
 import hashlib
 import json
 import logging
@@ -12,7 +13,7 @@ import time
 from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 
 class RequestPriority(Enum):
@@ -113,6 +114,137 @@ class RateLimiter:
             return needed_tokens / self.requests_per_second
 
 
+class _InFlightCall:
+    """A single in-flight call shared by every concurrent caller."""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+        # Set when the leader is a coroutine so same-loop followers can await it
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.future: Optional[asyncio.Future] = None
+
+    def outcome(self) -> Any:
+        """Return the shared result or re-raise the shared error."""
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class SingleFlight:
+    """Coalesce concurrent identical calls into one in-flight execution.
+
+    The first caller for a key (the leader) runs the call; every caller that
+    arrives with the same key before it finishes waits for and receives the
+    leader's result or exception. Threads and coroutines share the same
+    table, so a tab refresh on the UI worker thread and a batch refresh on an
+    event loop issue one HTTP request between them.
+    """
+
+    # Parameters that identify the caller rather than the resource
+    IGNORED_PARAMS = frozenset({"appid", "key", "api_key", "apikey"})
+
+    def __init__(self):
+        """Initialize single-flight group."""
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _InFlightCall] = {}
+        self._stats = {"executions": 0, "coalesced": 0, "in_flight": 0}
+
+    @classmethod
+    def make_key(cls, endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build a normalized key from an endpoint and its parameters.
+
+        String values are stripped and lower-cased, numbers are normalized and
+        credentials are ignored, so "London" and " london " share a flight.
+        """
+        normalized = {}
+        for name, value in (params or {}).items():
+            if name in cls.IGNORED_PARAMS:
+                continue
+            if isinstance(value, str):
+                value = value.strip().lower()
+            elif isinstance(value, float) and value.is_integer():
+                value = int(value)
+            normalized[name] = value
+        return f"{endpoint.strip('/')}:{json.dumps(normalized, sort_keys=True, default=str)}"
+
+    def _join(self, key: str) -> tuple:
+        """Join an existing flight for key or become its leader."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self._stats["coalesced"] += 1
+                return call, False
+
+            call = _InFlightCall()
+            self._calls[key] = call
+            self._stats["executions"] += 1
+            self._stats["in_flight"] = len(self._calls)
+            return call, True
+
+    def _finish(self, key: str, call: _InFlightCall) -> None:
+        """Publish the leader's outcome and retire the flight."""
+        with self._lock:
+            if self._calls.get(key) is call:
+                del self._calls[key]
+            self._stats["in_flight"] = len(self._calls)
+        call.event.set()
+
+    def do(self, key: str, func: Callable[[], Any]) -> Any:
+        """Run func once for all concurrent callers with the same key (blocking)."""
+        call, is_leader = self._join(key)
+        if not is_leader:
+            call.event.wait()
+            return call.outcome()
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            self._finish(key, call)
+
+    async def do_async(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Await func once for all concurrent callers with the same key."""
+        call, is_leader = self._join(key)
+        if not is_leader:
+            loop = asyncio.get_running_loop()
+            if call.loop is loop and call.future is not None:
+                await asyncio.shield(call.future)
+            else:
+                # Leader lives on another thread or loop
+                await asyncio.to_thread(call.event.wait)
+            return call.outcome()
+
+        loop = asyncio.get_running_loop()
+        call.loop = loop
+        call.future = loop.create_future()
+        try:
+            call.result = await func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            if not call.future.done():
+                call.future.set_result(None)
+            self._finish(key, call)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get coalescing statistics."""
+        with self._lock:
+            stats = self._stats.copy()
+        total = stats["executions"] + stats["coalesced"]
+        stats["total_calls"] = total
+        stats["coalesced_ratio"] = (stats["coalesced"] / max(1, total)) * 100
+        return stats
+
+
 class APIOptimizer:
     """Main API optimization manager."""
 
@@ -0,0 +1,296 @@
+"""Dependency Scheduler
+
+Runs startup work as a DAG: every task starts as soon as all of its declared
+dependencies have finished, instead of waiting for a whole priority tier.
+Blocking initializers run in a thread pool, coroutine functions run on the
+event loop. Priority only orders tasks that are ready at the same moment.
+
+Per-task start/finish times are recorded so that the critical path (the
+chain of dependencies that actually determined when startup finished) can
+be reported, e.g. by the startup profiler.
+
+Used by AsyncLoader (and so AsyncServiceManager) and by StartupOptimizer.
+"""
+
+import asyncio
+import concurrent.futures
+import heapq
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set
+
+
+@dataclass
+class ScheduledTask:
+    """A unit of startup work and the tasks it waits for."""
+
+    name: str
+    func: Callable[[], Any]
+    dependencies: List[str] = field(default_factory=list)
+    priority: int = 3  # lower starts first among tasks that are ready together
+    timeout: Optional[float] = None  # seconds per attempt
+    attempts: int = 1
+    retry_backoff: float = 0.5  # seconds, multiplied by the attempt number
+
+
+@dataclass
+class TaskOutcome:
+    """Result and timing of one scheduled task."""
+
+    name: str
+    success: bool
+    result: Any = None
+    error: Optional[BaseException] = None
+    started_at: Optional[float] = None  # time.perf_counter() values
+    finished_at: Optional[float] = None
+    attempts: int = 0
+    skipped: bool = False  # never started (a dependency failed, a cycle, cancellation)
+
+    @property
+    def duration(self) -> float:
+        if self.started_at is None or self.finished_at is None:
+            return 0.0
+        return self.finished_at - self.started_at
+
+
+class DependencyScheduler:
+    """Starts each task as soon as its dependencies have completed."""
+
+    def __init__(self, max_workers: int = 4, name: str = "startup"):
+        """
+        Initialize dependency scheduler.
+
+        Args:
+            max_workers: Thread pool size for blocking tasks
+            name: Label used in logs and reports
+        """
+        self.name = name
+        self.max_workers = max_workers
+        self.tasks: Dict[str, ScheduledTask] = {}
+        self.outcomes: Dict[str, TaskOutcome] = {}
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.cancelled = False
+        self.logger = logging.getLogger(__name__)
+
+    def add_task(self, task: ScheduledTask) -> None:
+        """Register a task (replacing one with the same name)."""
+        self.tasks[task.name] = task
+
+    def cancel(self) -> None:
+        """Start no further tasks; tasks already running finish normally."""
+        self.cancelled = True
+
+    def run(self, on_complete: Optional[Callable[[TaskOutcome], None]] = None,
+            executor: Optional[concurrent.futures.Executor] = None) -> Dict[str, TaskOutcome]:
+        """Run every task to completion from a thread without an event loop."""
+        return asyncio.run(self.run_async(on_complete, executor))
+
+    async def run_async(self, on_complete: Optional[Callable[[TaskOutcome], None]] = None,
+                        executor: Optional[concurrent.futures.Executor] = None) -> Dict[str, TaskOutcome]:
+        """Run every task to completion.
+
+        Args:
+            on_complete: Called on the event loop thread as each task finishes
+                (or is skipped)
+            executor: Pool for blocking tasks; a private one is created and shut
+                down if omitted
+
+        Returns:
+            Outcome of every registered task by name
+        """
+        loop = asyncio.get_running_loop()
+        own_executor = executor is None
+        if own_executor:
+            executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix=f"{self.name}-init"
+            )
+
+        self.outcomes = {}
+        self.cancelled = False
+        self.started_at = time.perf_counter()
+        order = {name: index for index, name in enumerate(self.tasks)}
+
+        # Unknown dependencies are treated as already satisfied
+        waiting_on: Dict[str, Set[str]] = {}
+        dependents: Dict[str, List[str]] = {name: [] for name in self.tasks}
+        for name, task in self.tasks.items():
+            known = [dep for dep in task.dependencies if dep in self.tasks and dep != name]
+            for dep in set(task.dependencies) - set(known):
+                self.logger.warning(f"Task '{name}' depends on unregistered '{dep}'; ignoring")
+            waiting_on[name] = set(known)
+            for dep in known:
+                dependents[dep].append(name)
+
+        def notify(outcome: TaskOutcome) -> None:
+            if on_complete:
+                try:
+                    on_complete(outcome)
+                except Exception as e:
+                    self.logger.error(f"Completion callback failed for '{outcome.name}': {e}")
+
+        def finish(outcome: TaskOutcome) -> List[str]:
+            """Record an outcome and return dependents that became ready."""
+            self.outcomes[outcome.name] = outcome
+            notify(outcome)
+            ready = []
+            for dependent in dependents[outcome.name]:
+                if dependent in self.outcomes:
+                    continue
+                if not outcome.success:
+                    reason = "cancelled" if self.cancelled else f"dependency '{outcome.name}' failed"
+                    ready.extend(finish(self._skipped(dependent, reason)))
+                    continue
+                waiting_on[dependent].discard(outcome.name)
+                if not waiting_on[dependent]:
+                    ready.append(dependent)
+            return ready
+
+        ready_heap: List[tuple] = []
+
+        def push(names: List[str]) -> None:
+            for ready_name in names:
+                task = self.tasks[ready_name]
+                heapq.heappush(ready_heap, (task.priority, order[ready_name], ready_name))
+
+        push([name for name, deps in waiting_on.items() if not deps])
+
+        running: Dict[asyncio.Future, str] = {}
+        try:
+            while ready_heap or running:
+                while ready_heap:
+                    _, _, name = heapq.heappop(ready_heap)
+                    if self.cancelled:
+                        push(finish(self._skipped(name, "cancelled")))
+                        continue
+                    running[asyncio.ensure_future(self._execute(self.tasks[name], loop, executor))] = name
+
+                if not running:
+                    break
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    running.pop(future)
+                    push(finish(future.result()))
+
+            # Whatever never became ready sits on (or behind) a dependency cycle
+            stuck = [name for name in self.tasks if name not in self.outcomes]
+            if stuck:
+                self.logger.error(f"Dependency cycle among tasks: {', '.join(stuck)}")
+            for name in stuck:
+                self.outcomes[name] = self._skipped(name, "dependency cycle")
+            for name in stuck:
+                notify(self.outcomes[name])
+        finally:
+            self.finished_at = time.perf_counter()
+            if own_executor:
+                executor.shutdown(wait=False)
+
+        succeeded = sum(1 for outcome in self.outcomes.values() if outcome.success)
+        self.logger.info(
+            f"⚡ {self.name}: {succeeded}/{len(self.tasks)} tasks in "
+            f"{self.finished_at - self.started_at:.2f}s "
+            f"(critical path: {' → '.join(self.critical_path()) or 'none'})"
+        )
+        return dict(self.outcomes)
+
+    async def _execute(self, task: ScheduledTask, loop: asyncio.AbstractEventLoop,
+                       executor: concurrent.futures.Executor) -> TaskOutcome:
+        """Run one task with per-attempt timeout and retries.
+
+        A timed-out call keeps running (a blocking initializer cannot be
+        interrupted), so the next attempt waits on that call again (or takes
+        its result) instead of starting a second one; only a call that failed
+        is started afresh.
+        """
+        outcome = TaskOutcome(name=task.name, success=False, started_at=time.perf_counter())
+        in_flight: Optional[asyncio.Future] = None
+        for attempt in range(1, max(1, task.attempts) + 1):
+            outcome.attempts = attempt
+            try:
+                if in_flight is None:
+                    if asyncio.iscoroutinefunction(task.func):
+                        in_flight = asyncio.ensure_future(task.func())
+                    else:
+                        in_flight = loop.run_in_executor(executor, task.func)
+                outcome.result = await asyncio.wait_for(asyncio.shield(in_flight), timeout=task.timeout)
+                outcome.success = True
+                outcome.error = None
+                break
+            except Exception as e:
+                if isinstance(e, asyncio.TimeoutError):
+                    e = TimeoutError(f"'{task.name}' timed out after {task.timeout}s")
+                else:
+                    in_flight = None
+                outcome.error = e
+                self.logger.warning(f"Task '{task.name}' attempt {attempt}/{task.attempts} failed: {e}")
+                if attempt < task.attempts and not self.cancelled:
+                    await asyncio.sleep(task.retry_backoff * attempt)
+                elif self.cancelled:
+                    break
+        if in_flight is not None and not in_flight.done():
+            # Given up on: coroutines stop here, executor threads run out and
+            # their late result or error is dropped
+            in_flight.cancel()
+            in_flight.add_done_callback(lambda future: future.cancelled() or future.exception())
+        outcome.finished_at = time.perf_counter()
+        return outcome
+
+    def _skipped(self, name: str, reason: str) -> TaskOutcome:
+        now = time.perf_counter()
+        return TaskOutcome(
+            name=name, success=False, error=RuntimeError(f"Skipped '{name}': {reason}"),
+            started_at=now, finished_at=now, skipped=True,
+        )
+
+    # Reporting
+
+    def critical_path(self) -> List[str]:
+        """Chain of tasks that determined when the run finished.
+
+        Starts from the task that finished last and follows, at each step,
+        the dependency that finished last (the one the task was waiting on).
+        """
+        finished = [o for o in self.outcomes.values() if not o.skipped and o.finished_at is not None]
+        if not finished:
+            return []
+        path = [max(finished, key=lambda o: o.finished_at).name]
+        while True:
+            deps = [
+                self.outcomes[dep] for dep in self.tasks[path[-1]].dependencies
+                if dep in self.outcomes and dep not in path and not self.outcomes[dep].skipped
+            ]
+            if not deps:
+                break
+            path.append(max(deps, key=lambda o: o.finished_at).name)
+        return list(reversed(path))
+
+    def get_report(self) -> Dict[str, Any]:
+        """Timings, critical path and achieved parallelism as a dictionary."""
+        if self.started_at is None:
+            return {"name": self.name, "status": "not_run"}
+        origin = self.started_at
+        makespan = (self.finished_at or time.perf_counter()) - origin
+        total_work = sum(outcome.duration for outcome in self.outcomes.values())
+        path = self.critical_path()
+        return {
+            "name": self.name,
+            "makespan": makespan,
+            "total_work": total_work,
+            "parallelism": total_work / makespan if makespan > 0 else 0.0,
+            "critical_path": path,
+            "critical_path_work": sum(self.outcomes[name].duration for name in path),
+            "tasks": {
+                name: {
+                    "success": outcome.success,
+                    "skipped": outcome.skipped,
+                    "start": outcome.started_at - origin if outcome.started_at else None,
+                    "finish": outcome.finished_at - origin if outcome.finished_at else None,
+                    "duration": outcome.duration,
+                    "attempts": outcome.attempts,
+                    "dependencies": list(self.tasks[name].dependencies),
+                    "error": str(outcome.error) if outcome.error else None,
+                }
+                for name, outcome in self.outcomes.items()
+            },
+        }
@@ -0,0 +1,160 @@
+"""Search Worker
+
+Single background thread for search-as-you-type. Queries are debounced,
+tagged with a generation number and run through ordered stages (e.g. local
+lookups, then the network); a newer query supersedes the one in flight, so
+stale results are never delivered. Final results are memoized per normalized
+query.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query for memoization ("  New  york" -> "new york")."""
+    return " ".join(query.casefold().split())
+
+
+class SearchWorker:
+    """Run the latest search query on one background thread.
+
+    Each stage is called as stage(query) and returns a list of results.
+    Non-empty results from every stage but the last are delivered as partial
+    updates; the last stage's results are delivered as final (falling back to
+    the latest partial results when it finds nothing). Callbacks run on the
+    worker thread and receive the generation of the query they belong to.
+    """
+
+    def __init__(
+        self,
+        stages: Sequence[Callable[[str], List[Any]]],
+        on_results: Callable[[int, str, List[Any], bool], None],
+        on_error: Callable[[int, str, Exception], None],
+        debounce_seconds: float = 0.3,
+        memo_size: int = 128,
+    ):
+        """Initialize search worker.
+
+        Args:
+            stages: Search functions run in order for each query
+            on_results: Called with (generation, query, results, is_final)
+            on_error: Called with (generation, query, exception)
+            debounce_seconds: Quiet period before a submitted query runs
+            memo_size: Maximum memoized queries
+        """
+        self.stages = list(stages)
+        self.on_results = on_results
+        self.on_error = on_error
+        self.debounce_seconds = debounce_seconds
+        self.memo_size = memo_size
+
+        self.generation = 0
+        self._pending: Optional[tuple] = None  # (generation, query, due)
+        self._memo: "OrderedDict[str, List[Any]]" = OrderedDict()
+        self._condition = threading.Condition()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="search-worker", daemon=True)
+        self._thread.start()
+
+    def submit(self, query: str) -> int:
+        """Queue a query, superseding any pending or running one.
+
+        Returns:
+            Generation number of the query
+        """
+        with self._condition:
+            self.generation += 1
+            self._pending = (self.generation, query, time.monotonic() + self.debounce_seconds)
+            self._condition.notify()
+            return self.generation
+
+    def cancel(self) -> None:
+        """Drop the pending query and discard results of the running one."""
+        with self._condition:
+            self.generation += 1
+            self._pending = None
+
+    def is_current(self, generation: int) -> bool:
+        """Whether results for generation are still wanted."""
+        return generation == self.generation
+
+    def clear_memo(self) -> None:
+        """Forget memoized results."""
+        with self._condition:
+            self._memo.clear()
+
+    def shutdown(self) -> None:
+        """Stop the worker thread."""
+        with self._condition:
+            self._running = False
+            self.generation += 1
+            self._pending = None
+            self._condition.notify()
+
+    def _next_query(self) -> Optional[tuple]:
+        """Wait for a query whose debounce period has elapsed."""
+        with self._condition:
+            while self._running:
+                if self._pending is None:
+                    self._condition.wait()
+                    continue
+                generation, query, due = self._pending
+                remaining = due - time.monotonic()
+                if remaining > 0:
+                    # A newer submit() replaces _pending and wakes us early
+                    self._condition.wait(remaining)
+                    continue
+                self._pending = None
+                return generation, query
+        return None
+
+    def _run(self) -> None:
+        while True:
+            item = self._next_query()
+            if item is None:
+                return
+            generation, query = item
+            try:
+                self._search(generation, query)
+            except Exception as e:
+                if self.is_current(generation):
+                    self.on_error(generation, query, e)
+
+    def _search(self, generation: int, query: str) -> None:
+        key = normalize_query(query)
+        with self._condition:
+            memoized = self._memo.get(key)
+            if memoized is not None:
+                self._memo.move_to_end(key)
+        if memoized is not None:
+            self.on_results(generation, query, memoized, True)
+            return
+
+        results: List[Any] = []
+        last_stage = len(self.stages) - 1
+        for index, stage in enumerate(self.stages):
+            if not self.is_current(generation):
+                return
+            stage_results = stage(query) or []
+            if not self.is_current(generation):
+                return
+            if stage_results:
+                results = stage_results
+            if index < last_stage:
+                if stage_results:
+                    self.on_results(generation, query, results, False)
+                continue
+
+            if results:
+                with self._condition:
+                    self._memo[key] = results
+                    self._memo.move_to_end(key)
+                    while len(self._memo) > self.memo_size:
+                        self._memo.popitem(last=False)
+            self.on_results(generation, query, results, True)
@@ -0,0 +1,223 @@
+"""Spatial Index
+
+In-memory geohash index for "what do we already know near this point"
+lookups: nearest known city, cached observation or map point within N km.
+
+Points are bucketed by geohash cell at several precisions, which makes the
+buckets a quadtree-like pyramid: a query picks the finest precision whose
+cells are at least as tall as the search radius and only inspects the few
+cells its bounding box touches, so lookups stay sub-linear in the number of
+indexed points.
+"""
+
+import math
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Generic, Hashable, Iterator, List, Optional, Set, Tuple, TypeVar
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LAT = 111.195
+
+# Geohash precisions kept per point; cell heights ~156 km, 20 km, 4.9 km, 0.6 km
+DEFAULT_PRECISIONS = (3, 4, 5, 6)
+
+_GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+T = TypeVar("T")
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in kilometres."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def _cell_bits(precision: int) -> Tuple[int, int]:
+    """(longitude bits, latitude bits) of a geohash precision."""
+    bits = precision * 5
+    return (bits + 1) // 2, bits // 2
+
+
+def _cell_x(lon: float, lon_bits: int) -> int:
+    """Unwrapped longitude cell index (may fall outside [0, 2**lon_bits))."""
+    return math.floor((lon + 180.0) / 360.0 * (1 << lon_bits))
+
+
+def _cell(lat: float, lon: float, lon_bits: int, lat_bits: int) -> Tuple[int, int]:
+    """Integer (x, y) geohash cell containing a point."""
+    x = _cell_x(lon, lon_bits) % (1 << lon_bits)
+    y = math.floor((lat + 90.0) / 180.0 * (1 << lat_bits))
+    return x, max(0, min(y, (1 << lat_bits) - 1))
+
+
+def geohash_encode(lat: float, lon: float, precision: int = 7) -> str:
+    """Encode a point as a standard base32 geohash string."""
+    lon_bits, lat_bits = _cell_bits(precision)
+    x, y = _cell(lat, lon, lon_bits, lat_bits)
+    code = 0
+    # Geohash interleaves bits starting with longitude
+    for i in range(precision * 5):
+        if i % 2 == 0:
+            lon_bits -= 1
+            bit = (x >> lon_bits) & 1
+        else:
+            lat_bits -= 1
+            bit = (y >> lat_bits) & 1
+        code = (code << 1) | bit
+    return "".join(
+        _GEOHASH_ALPHABET[(code >> shift) & 31] for shift in range((precision - 1) * 5, -1, -5)
+    )
+
+
+@dataclass(frozen=True)
+class SpatialMatch(Generic[T]):
+    """Indexed point found by a spatial query."""
+
+    key: Hashable
+    latitude: float
+    longitude: float
+    value: T
+    distance_km: float
+
+
+class SpatialIndex(Generic[T]):
+    """Thread-safe geohash index of keyed points."""
+
+    def __init__(
+        self, precisions: Tuple[int, ...] = DEFAULT_PRECISIONS, max_points: Optional[int] = None
+    ):
+        """Initialize spatial index.
+
+        Args:
+            precisions: Geohash precisions to bucket points at, coarse to fine
+            max_points: Evict the oldest inserted points beyond this many
+        """
+        self.max_points = max_points
+        self._levels = []
+        for precision in sorted(precisions):
+            lon_bits, lat_bits = _cell_bits(precision)
+            cell_height_km = 180.0 / (1 << lat_bits) * KM_PER_DEGREE_LAT
+            self._levels.append((lon_bits, lat_bits, cell_height_km))
+        self._buckets: List[Dict[Tuple[int, int], Set[Hashable]]] = [{} for _ in self._levels]
+        self._points: Dict[Hashable, Tuple[float, float, T]] = {}
+        self._lock = threading.RLock()
+
+    def insert(self, key: Hashable, latitude: float, longitude: float, value: T = None) -> None:
+        """Add or move a point."""
+        with self._lock:
+            if key in self._points:
+                self.remove(key)
+            self._points[key] = (latitude, longitude, value)
+            for (lon_bits, lat_bits, _), buckets in zip(self._levels, self._buckets):
+                buckets.setdefault(_cell(latitude, longitude, lon_bits, lat_bits), set()).add(key)
+            if self.max_points is not None:
+                while len(self._points) > self.max_points:
+                    # Dicts keep insertion order, so the first key is the oldest
+                    self.remove(next(iter(self._points)))
+
+    def remove(self, key: Hashable) -> bool:
+        """Remove a point; False if it was not indexed."""
+        with self._lock:
+            point = self._points.pop(key, None)
+            if point is None:
+                return False
+            latitude, longitude, _ = point
+            for (lon_bits, lat_bits, _), buckets in zip(self._levels, self._buckets):
+                cell = _cell(latitude, longitude, lon_bits, lat_bits)
+                members = buckets.get(cell)
+                if members is not None:
+                    members.discard(key)
+                    if not members:
+                        del buckets[cell]
+            return True
+
+    def get(self, key: Hashable) -> Optional[Tuple[float, float, T]]:
+        """(latitude, longitude, value) of an indexed key."""
+        with self._lock:
+            return self._points.get(key)
+
+    def clear(self) -> None:
+        """Remove all points."""
+        with self._lock:
+            self._points.clear()
+            for buckets in self._buckets:
+                buckets.clear()
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._points
+
+    def within(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        predicate: Optional[Callable[[T], bool]] = None,
+    ) -> List[SpatialMatch[T]]:
+        """Points within radius_km, nearest first.
+
+        Args:
+            latitude: Query latitude
+            longitude: Query longitude
+            radius_km: Search radius
+            predicate: Optional filter on point values (e.g. freshness)
+        """
+        matches = []
+        with self._lock:
+            for key in self._candidates(latitude, longitude, radius_km):
+                point_lat, point_lon, value = self._points[key]
+                distance = haversine_km(latitude, longitude, point_lat, point_lon)
+                if distance <= radius_km and (predicate is None or predicate(value)):
+                    matches.append(SpatialMatch(key, point_lat, point_lon, value, distance))
+        matches.sort(key=lambda match: match.distance_km)
+        return matches
+
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        max_km: float,
+        predicate: Optional[Callable[[T], bool]] = None,
+    ) -> Optional[SpatialMatch[T]]:
+        """Nearest point within max_km, or None."""
+        matches = self.within(latitude, longitude, max_km, predicate)
+        return matches[0] if matches else None
+
+    def _candidates(self, latitude: float, longitude: float, radius_km: float) -> Iterator[Hashable]:
+        """Keys in the cells overlapping the radius' bounding box."""
+        # Finest level whose cells are still at least as tall as the radius
+        level = 0
+        for index, (_, _, cell_height_km) in enumerate(self._levels):
+            if cell_height_km >= radius_km:
+                level = index
+        lon_bits, lat_bits, _ = self._levels[level]
+        buckets = self._buckets[level]
+
+        lat_delta = radius_km / KM_PER_DEGREE_LAT
+        min_lat = max(-90.0, latitude - lat_delta)
+        max_lat = min(90.0, latitude + lat_delta)
+        widest_cos = max(
+            0.0, min(math.cos(math.radians(min_lat)), math.cos(math.radians(max_lat)))
+        )
+        x_cells = 1 << lon_bits
+        if widest_cos * KM_PER_DEGREE_LAT * 180.0 <= radius_km:
+            # Near a pole or huge radius: every longitude is in range
+            x_low, x_high = 0, x_cells - 1
+        else:
+            lon_delta = radius_km / (KM_PER_DEGREE_LAT * widest_cos)
+            x_low = _cell_x(longitude - lon_delta, lon_bits)
+            x_high = min(_cell_x(longitude + lon_delta, lon_bits), x_low + x_cells - 1)
+        _, y_low = _cell(min_lat, longitude, lon_bits, lat_bits)
+        _, y_high = _cell(max_lat, longitude, lon_bits, lat_bits)
+
+        for y in range(y_low, y_high + 1):
+            for x in range(x_low, x_high + 1):
+                # Longitude wraps around the antimeridian
+                members = buckets.get((x % x_cells, y))
+                if members:
+                    yield from members
@@ -4,6 +4,7 @@ Startup Optimizer for Weather Dashboard
 Implements lazy loading and progressive enhancement for optimal startup performance.
 """
 
+import concurrent.futures
 import logging
 import threading
 import time
@@ -11,6 +12,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional
 
+from .dependency_scheduler import DependencyScheduler, ScheduledTask, TaskOutcome
+
 try:
     from .timer_manager import TimerManager
 except ImportError:
@@ -57,19 +60,24 @@ class LoadResult:
 class StartupOptimizer:
     """Manages progressive loading and startup optimization."""
 
-    def __init__(self, app=None, timer_manager=None):
+    def __init__(self, app=None, timer_manager=None, max_workers: int = 4):
         """Initialize the startup optimizer.
         
         Args:
             app: The main application instance (for UI operations)
             timer_manager: TimerManager instance for safe timer operations
+            max_workers: Thread pool size for loading components in parallel
         """
         self.components: Dict[str, ComponentConfig] = {}
         self.loaded_components: Dict[str, LoadResult] = {}
         self.loading_queue: List[str] = []
         self.is_loading = False
+        self.max_workers = max_workers
+        self.scheduler: Optional[DependencyScheduler] = None
 
         self._cache: Dict[str, Any] = {}
+        # Loader calls still running (possibly past their timeout), by component
+        self._in_flight: Dict[str, concurrent.futures.Future] = {}
         self._performance_stats = {
             "total_load_time": 0.0,
             "components_loaded": 0,
@@ -149,159 +157,91 @@ class StartupOptimizer:
     def _execute_progressive_loading(
         self, on_component_loaded: Optional[Callable[[str, bool], None]] = None
     ) -> None:
-        """Execute the progressive loading process."""
-        # Sort components by priority and dependencies
-        load_order = self._calculate_load_order()
+        """Execute the progressive loading process.
+
+        Components run on a dependency scheduler: each starts as soon as the
+        components it depends on have loaded, and priority only orders
+        components that are ready at the same time.
+        """
+        with self._lock:
+            components = dict(self.components)
+
+        scheduler = DependencyScheduler(max_workers=self.max_workers, name="components")
+        cached: Dict[str, bool] = {}
+        for name, config in components.items():
+            if name in self.loaded_components and self.loaded_components[name].success:
+                continue
+            scheduler.add_task(ScheduledTask(
+                name=name,
+                func=self._cached_loader(config, cached),
+                # Components loaded earlier satisfy their dependents already
+                dependencies=[
+                    dep for dep in config.dependencies
+                    if not self.is_component_loaded(dep)
+                ],
+                priority=config.priority.value,
+                timeout=config.timeout,
+                attempts=config.retry_count + 1,
+            ))
+        self.scheduler = scheduler
 
         self.logger.info(
-            f"Starting progressive loading of {len(load_order)} components"
+            f"Starting progressive loading of {len(scheduler.tasks)} components"
         )
 
-        # Load components in priority order
-        for priority_group in load_order:
-            self._load_priority_group(priority_group, on_component_loaded)
-
-    def _calculate_load_order(self) -> List[List[str]]:
-        """Calculate the optimal loading order based on priorities and dependencies."""
-        # Group by priority
-        priority_groups = {}
-        for name, config in self.components.items():
-            priority = config.priority.value
-            if priority not in priority_groups:
-                priority_groups[priority] = []
-            priority_groups[priority].append(name)
-
-        # Sort each group by dependencies
-        ordered_groups = []
-        for priority in sorted(priority_groups.keys()):
-            group = priority_groups[priority]
-            ordered_group = self._resolve_dependencies(group)
-            ordered_groups.append(ordered_group)
-
-        return ordered_groups
-
-    def _resolve_dependencies(self, component_names: List[str]) -> List[str]:
-        """Resolve dependencies within a priority group."""
-        resolved = []
-        remaining = component_names.copy()
-        max_iterations = len(component_names) * 2  # Prevent infinite loops
-        iteration = 0
-
-        while remaining and iteration < max_iterations:
-            iteration += 1
-            # Find components with no unresolved dependencies
-            ready = []
-            for name in remaining:
-                config = self.components[name]
-                deps_satisfied = all(
-                    dep in self.loaded_components
-                    or dep in resolved
-                    or dep not in self.components
-                    for dep in config.dependencies
-                )
-                if deps_satisfied:
-                    ready.append(name)
-
-            if not ready:
-                # Check if dependencies are in other priority groups that should be loaded first
-                unmet_deps = set()
-                for name in remaining:
-                    config = self.components[name]
-                    for dep in config.dependencies:
-                        if (
-                            dep not in self.loaded_components
-                            and dep not in resolved
-                            and dep in self.components
-                        ):
-                            dep_priority = self.components[dep].priority.value
-                            current_priority = config.priority.value
-                            if dep_priority <= current_priority:
-                                unmet_deps.add(dep)
-
-                if unmet_deps:
-                    self.logger.debug(
-                        f"Dependencies {list(unmet_deps)} will be loaded in "
-                        f"earlier priority groups"
-                    )
-                    # Load remaining components anyway since dependencies will be satisfied later
-                    ready = remaining
-                else:
-                    # True circular dependency within same priority
-                    self.logger.warning(
-                        f"Circular dependencies detected within priority group: "
-                        f"{remaining}"
-                    )
-                    ready = remaining  # Load anyway
-
-            resolved.extend(ready)
-            for name in ready:
-                remaining.remove(name)
-
-        return resolved
-
-    def _load_priority_group(
-        self,
-        component_names: List[str],
-        on_component_loaded: Optional[Callable[[str, bool], None]] = None,
-    ) -> None:
-        """Load a group of components with the same priority."""
-        if not component_names:
-            return
-
-        # For critical and high priority, load sequentially
-        # For medium and below, load in parallel
-        first_component = self.components[component_names[0]]
-
-        if first_component.priority in [
-            ComponentPriority.CRITICAL,
-            ComponentPriority.HIGH,
-        ]:
-            self._load_sequential(component_names, on_component_loaded)
-        else:
-            self._load_parallel(component_names, on_component_loaded)
+        def on_task_complete(outcome: TaskOutcome) -> None:
+            from_cache = cached.get(outcome.name, False)
+            result = LoadResult(
+                component_name=outcome.name,
+                success=outcome.success,
+                result=outcome.result,
+                error=outcome.error,
+                load_time=0.0 if from_cache else outcome.duration,
+                from_cache=from_cache,
+            )
+            self.loaded_components[outcome.name] = result
 
-    def _load_sequential(
-        self,
-        component_names: List[str],
-        on_component_loaded: Optional[Callable[[str, bool], None]] = None,
-    ) -> None:
-        """Load components sequentially."""
-        for name in component_names:
-            result = self._load_component(name)
+            if from_cache:
+                self._performance_stats["cache_hits"] += 1
+            elif outcome.success:
+                self._performance_stats["components_loaded"] += 1
+                self.logger.info(
+                    f"✓ Component '{outcome.name}' loaded successfully in {outcome.duration:.2f}s"
+                )
+            else:
+                self._performance_stats["components_failed"] += 1
+                self.logger.error(
+                    f"✗ Component '{outcome.name}' failed to load: {outcome.error}"
+                )
 
             if on_component_loaded:
-                on_component_loaded(name, result.success)
-
-    def _load_parallel(
-        self,
-        component_names: List[str],
-        on_component_loaded: Optional[Callable[[str, bool], None]] = None,
-    ) -> None:
-        """Load components in parallel."""
-        threads = []
-        results = {}
-
-        def load_worker(name):
-            results[name] = self._load_component(name)
-
-        # Start all loading threads
-        for name in component_names:
-            thread = threading.Thread(target=load_worker, args=(name,), daemon=True)
-            thread.start()
-            threads.append(thread)
-
-        # Wait for all to complete
-        for thread in threads:
-            thread.join()
-
-        # Notify completion
-        if on_component_loaded:
-            for name in component_names:
-                result = results.get(name)
-                if result:
-                    on_component_loaded(name, result.success)
-
-        self._performance_stats["parallel_loads"] += len(component_names)
+                on_component_loaded(outcome.name, outcome.success)
+
+        scheduler.run(on_task_complete)
+        self._performance_stats["parallel_loads"] += len(scheduler.tasks)
+
+    def _cached_loader(
+        self, config: ComponentConfig, cached: Dict[str, bool]
+    ) -> Callable[[], Any]:
+        """Wrap a component loader with the result cache."""
+
+        def load():
+            if config.cache_result and config.name in self._cache:
+                cached[config.name] = True
+                return self._cache[config.name]
+            self.logger.debug(f"Loading component '{config.name}'")
+            component_result = config.loader_func()
+            if config.cache_result:
+                self._cache[config.name] = component_result
+            return component_result
+
+        return load
+
+    def get_schedule_report(self) -> Dict[str, Any]:
+        """Timings and critical path of the last progressive load."""
+        if self.scheduler is None:
+            return {"status": "not_run"}
+        return self.scheduler.get_report()
 
     def _load_component(self, name: str) -> LoadResult:
         """Load a single component with caching and error handling."""
@@ -328,7 +268,9 @@ class StartupOptimizer:
                 self.logger.debug(f"Loading component '{name}' (attempt {attempt + 1})")
 
                 # Execute loader with timeout
-                component_result = self._execute_with_timeout(config.loader_func, config.timeout)
+                component_result = self._execute_with_timeout(
+                    name, config.loader_func, config.timeout
+                )
 
                 # Cache result if successful
                 if config.cache_result:
@@ -369,28 +311,39 @@ class StartupOptimizer:
         )
         return result
 
-    def _execute_with_timeout(self, func: Callable[[], Any], timeout: float) -> Any:
-        """Execute a function with timeout."""
-        result = [None]
-        exception = [None]
+    def _execute_with_timeout(self, name: str, func: Callable[[], Any], timeout: float) -> Any:
+        """Execute a function with timeout.
 
-        def worker():
-            try:
-                result[0] = func()
-            except Exception as e:
-                exception[0] = e
+        A call that times out keeps running; a retry for the same component
+        waits on it (or takes its result) instead of starting the loader a
+        second time.
+        """
+        with self._lock:
+            call = self._in_flight.get(name)
+            if call is None:
+                call = self._in_flight[name] = concurrent.futures.Future()
 
-        thread = threading.Thread(target=worker, daemon=True)
-        thread.start()
-        thread.join(timeout)
+                def worker():
+                    try:
+                        call.set_result(func())
+                    except Exception as e:
+                        call.set_exception(e)
 
-        if thread.is_alive():
-            raise TimeoutError(f"Component loading timed out after {timeout}s")
+                threading.Thread(target=worker, daemon=True).start()
 
-        if exception[0]:
-            raise exception[0]
+        try:
+            call.result(timeout)
+        except concurrent.futures.TimeoutError:
+            if not call.done():
+                # Kept for the next attempt
+                raise TimeoutError(f"Component loading timed out after {timeout}s")
+        except Exception:
+            pass
 
-        return result[0]
+        with self._lock:
+            if self._in_flight.get(name) is call:
+                del self._in_flight[name]
+        return call.result()
 
     def get_component_result(self, name: str) -> Optional[Any]:
         """Get the result of a loaded component."""
@@ -509,6 +462,8 @@ class StartupOptimizer:
     def shutdown(self) -> None:
         """Shutdown the optimizer and clean up resources."""
         self.is_loading = False
+        if self.scheduler is not None:
+            self.scheduler.cancel()
         self._cache.clear()
         self.loaded_components.clear()
         self.logger.info("Startup optimizer shutdown complete")
@@ -0,0 +1,360 @@
+"""Startup Profiler
+
+Records where time goes before the dashboard's first window: the import
+time of every module (inclusive and self time, like ``python -X
+importtime`` but collected in-process so it can sit next to the rest of the
+report), named startup phases, the per-component times and critical path
+reported by StartupOptimizer and AsyncServiceManager, and marks such as
+``first_window``.
+
+Enabled with ``python main.py --profile-startup [REPORT]``; the report is
+written as JSON next to a plain-text summary (``logs/startup_profile.json``
+and ``.txt`` by default). When the profiler is not enabled every helper here
+is a no-op, so instrumented code costs nothing in normal runs.
+"""
+
+import importlib.abc
+import json
+import logging
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+DEFAULT_REPORT_PATH = Path("logs") / "startup_profile.json"
+
+# Modules whose own import takes at least this long (seconds) are listed as
+# deferred-import candidates in the text report
+HEAVY_IMPORT_SECONDS = 0.05
+
+
+@dataclass
+class ImportRecord:
+    """Time spent importing one module."""
+
+    module: str
+    start: float  # seconds since the profiler started
+    cumulative: float  # including nested imports
+    self_time: float  # excluding nested imports
+    parent: Optional[str]
+    thread: str
+
+
+@dataclass
+class PhaseRecord:
+    """One timed startup phase."""
+
+    name: str
+    start: Optional[float]
+    duration: float
+    source: str = "app"
+    thread: str = ""
+
+
+class _TimedLoader:
+    """Loader wrapper that times module creation and execution."""
+
+    def __init__(self, loader, profiler: "StartupProfiler", name: str):
+        self._loader = loader
+        self._profiler = profiler
+        self._name = name
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._loader, attr)
+
+    def create_module(self, spec):
+        # Timing starts here: extension modules do most of their work while
+        # being created, and exec_module always follows a successful create
+        self._profiler._begin_import(self._name)
+        try:
+            return self._loader.create_module(spec)
+        except BaseException:
+            self._profiler._end_import(self._name)
+            raise
+
+    def exec_module(self, module) -> None:
+        # Hand the real loader back to the module before it runs, so code that
+        # inspects __loader__ or __spec__.loader never sees the wrapper
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+        module.__loader__ = self._loader
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._end_import(self._name)
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """Meta path finder that wraps the loader of every module found after it."""
+
+    def __init__(self, profiler: "StartupProfiler"):
+        self._profiler = profiler
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find_spec = getattr(finder, "find_spec", None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self._profiler, fullname)
+        return spec
+
+
+class StartupProfiler:
+    """Collects import, phase and mark timings for one application start."""
+
+    def __init__(self, report_path: Optional[Path] = None):
+        """
+        Initialize startup profiler.
+
+        Args:
+            report_path: JSON report location (a .txt summary is written beside it)
+        """
+        self.report_path = Path(report_path) if report_path else DEFAULT_REPORT_PATH
+        self.started_at = time.perf_counter()
+        self.imports: List[ImportRecord] = []
+        self.phases: List[PhaseRecord] = []
+        self.marks: Dict[str, float] = {}
+        self.schedules: Dict[str, Dict[str, Any]] = {}
+
+        self._import_timer: Optional[_ImportTimer] = None
+        self._stacks = threading.local()
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def elapsed(self) -> float:
+        """Seconds since the profiler started."""
+        return time.perf_counter() - self.started_at
+
+    # Imports
+
+    def start_import_timing(self) -> None:
+        """Start timing every import from now on."""
+        if self._import_timer is None:
+            self._import_timer = _ImportTimer(self)
+            sys.meta_path.insert(0, self._import_timer)
+
+    def stop_import_timing(self) -> None:
+        """Stop timing imports (modules already wrapped keep their real loaders)."""
+        if self._import_timer is not None:
+            try:
+                sys.meta_path.remove(self._import_timer)
+            except ValueError:
+                pass
+            self._import_timer = None
+
+    def _begin_import(self, name: str) -> None:
+        stack = self._stack()
+        stack.append([name, time.perf_counter(), 0.0])
+
+    def _end_import(self, name: str) -> None:
+        stack = self._stack()
+        if not stack or stack[-1][0] != name:
+            return
+        _, started, nested = stack.pop()
+        cumulative = time.perf_counter() - started
+        parent = stack[-1][0] if stack else None
+        if stack:
+            stack[-1][2] += cumulative
+        record = ImportRecord(
+            module=name,
+            start=started - self.started_at,
+            cumulative=cumulative,
+            self_time=max(0.0, cumulative - nested),
+            parent=parent,
+            thread=threading.current_thread().name,
+        )
+        with self._lock:
+            self.imports.append(record)
+
+    def _stack(self) -> List[list]:
+        stack = getattr(self._stacks, "stack", None)
+        if stack is None:
+            stack = self._stacks.stack = []
+        return stack
+
+    # Phases and marks
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a block of startup work as a named phase."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._add_phase(PhaseRecord(
+                name=name,
+                start=started - self.started_at,
+                duration=time.perf_counter() - started,
+                thread=threading.current_thread().name,
+            ))
+
+    def record_phase(self, name: str, duration: float, source: str = "app") -> None:
+        """Record a phase timed elsewhere (e.g. by StartupOptimizer)."""
+        self._add_phase(PhaseRecord(name=name, start=None, duration=duration, source=source))
+
+    def _add_phase(self, record: PhaseRecord) -> None:
+        with self._lock:
+            self.phases.append(record)
+
+    def mark(self, name: str) -> float:
+        """Record the first time a named point is reached (e.g. first_window)."""
+        with self._lock:
+            return self.marks.setdefault(name, self.elapsed())
+
+    def collect_startup_optimizer(self, optimizer) -> None:
+        """Record per-component load times from a StartupOptimizer."""
+        try:
+            status = optimizer.get_loading_status()
+        except Exception as e:
+            self.logger.debug(f"Could not read StartupOptimizer status: {e}")
+            return
+        for name, component in status.get("components", {}).items():
+            self.record_phase(name, component.get("load_time", 0.0), source="StartupOptimizer")
+        total = optimizer.get_performance_stats().get("total_load_time")
+        if total:
+            self.record_phase("progressive_loading", total, source="StartupOptimizer")
+        self._add_schedule("StartupOptimizer", getattr(optimizer, "get_schedule_report", None))
+
+    def collect_service_manager(self, manager) -> None:
+        """Record per-service initialization times from an AsyncServiceManager."""
+        for name, result in (getattr(manager, "initialization_results", None) or {}).items():
+            self.record_phase(name, getattr(result, "duration", 0.0), source="AsyncServiceManager")
+        total = getattr(manager, "initialization_time", 0.0)
+        if total:
+            self.record_phase("service_initialization", total, source="AsyncServiceManager")
+        self._add_schedule("AsyncServiceManager", getattr(manager, "get_startup_schedule", None))
+
+    def _add_schedule(self, source: str, get_report) -> None:
+        """Keep a DependencyScheduler report (critical path, parallelism)."""
+        if get_report is None:
+            return
+        try:
+            schedule = get_report()
+        except Exception as e:
+            self.logger.debug(f"Could not read {source} schedule: {e}")
+            return
+        if schedule.get("critical_path") is not None:
+            with self._lock:
+                self.schedules[source] = schedule
+
+    # Report
+
+    def report(self, top: int = 30) -> Dict[str, Any]:
+        """Profile data as a JSON-serializable dictionary."""
+        with self._lock:
+            imports = list(self.imports)
+            phases = list(self.phases)
+            marks = dict(self.marks)
+            schedules = dict(self.schedules)
+        top_level = [record for record in imports if record.parent is None]
+        return {
+            "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "elapsed": self.elapsed(),
+            "marks": marks,
+            "imports": {
+                "modules": len(imports),
+                "total": sum(record.cumulative for record in top_level),
+                "by_self_time": [asdict(r) for r in sorted(imports, key=lambda r: -r.self_time)[:top]],
+                "by_cumulative": [asdict(r) for r in sorted(imports, key=lambda r: -r.cumulative)[:top]],
+                "top_level": [asdict(r) for r in sorted(top_level, key=lambda r: -r.cumulative)],
+            },
+            "phases": [asdict(phase) for phase in phases],
+            "schedules": schedules,
+        }
+
+    def format_report(self, top: int = 20) -> str:
+        """Human-readable summary of the profile."""
+        data = self.report(top)
+        lines = [f"Startup profile ({data['generated_at']}, Python {data['python']})", ""]
+
+        if data["marks"]:
+            lines.append("Marks (seconds since profiler start)")
+            for name, at in sorted(data["marks"].items(), key=lambda item: item[1]):
+                lines.append(f"  {name:<40} {at:8.3f}")
+            lines.append("")
+
+        imports = data["imports"]
+        lines.append(f"Imports: {imports['modules']} modules, {imports['total']:.3f}s at top level")
+        lines.append(f"  {'module':<52} {'cumulative':>10} {'self':>8}")
+        for record in imports["by_cumulative"][:top]:
+            lines.append(f"  {record['module']:<52} {record['cumulative']:10.3f} {record['self_time']:8.3f}")
+        heavy = [r for r in imports["by_self_time"] if r["self_time"] >= HEAVY_IMPORT_SECONDS]
+        if heavy:
+            lines.append("")
+            lines.append("Slowest modules by self time (deferred-import candidates)")
+            for record in heavy[:top]:
+                via = f" (via {record['parent']})" if record["parent"] else ""
+                lines.append(f"  {record['module']:<52} {record['self_time']:8.3f}{via}")
+        lines.append("")
+
+        if data["phases"]:
+            lines.append("Phases")
+            for phase in data["phases"]:
+                start = f"{phase['start']:8.3f}" if phase["start"] is not None else " " * 8
+                lines.append(f"  {phase['source']:<20} {phase['name']:<32} {start} {phase['duration']:8.3f}")
+
+        for source, schedule in data["schedules"].items():
+            lines.append("")
+            lines.append(
+                f"Critical path ({source}): {schedule['makespan']:.3f}s wall, "
+                f"{schedule['total_work']:.3f}s work, parallelism {schedule['parallelism']:.2f}"
+            )
+            for name in schedule["critical_path"]:
+                task = schedule["tasks"][name]
+                lines.append(f"  {name:<52} {task['start']:8.3f} {task['duration']:8.3f}")
+        return "\n".join(lines) + "\n"
+
+    def write_report(self, path: Optional[Path] = None) -> Path:
+        """Write the JSON report and a .txt summary beside it.
+
+        Returns:
+            Path of the JSON report
+        """
+        path = Path(path) if path else self.report_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.report(), indent=2), encoding="utf-8")
+        path.with_suffix(".txt").write_text(self.format_report(), encoding="utf-8")
+        self.logger.info(f"📊 Startup profile written to {path}")
+        return path
+
+
+_startup_profiler: Optional[StartupProfiler] = None
+
+
+def enable_startup_profiler(report_path: Optional[Path] = None) -> StartupProfiler:
+    """Create the process-wide startup profiler and start timing imports."""
+    global _startup_profiler
+    if _startup_profiler is None:
+        _startup_profiler = StartupProfiler(report_path)
+        _startup_profiler.start_import_timing()
+    return _startup_profiler
+
+
+def get_startup_profiler() -> Optional[StartupProfiler]:
+    """The startup profiler, or None when profiling is not enabled."""
+    return _startup_profiler
+
+
+def startup_phase(name: str):
+    """Context manager timing a startup phase (a no-op when not profiling)."""
+    profiler = _startup_profiler
+    return profiler.phase(name) if profiler is not None else nullcontext()
+
+
+def mark_startup(name: str) -> None:
+    """Record a startup mark such as "first_window" (no-op when not profiling)."""
+    if _startup_profiler is not None:
+        _startup_profiler.mark(name)
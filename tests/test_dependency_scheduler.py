@@ -0,0 +1,58 @@
+"""Tests for retrying timed-out startup tasks."""
+
+import threading
+import time
+
+from src.utils.dependency_scheduler import DependencyScheduler, ScheduledTask
+from src.utils.startup_optimizer import ComponentPriority, StartupOptimizer
+
+
+def slow_initializer(calls, seconds=0.3):
+    def initialize():
+        calls.append(threading.current_thread().name)
+        time.sleep(seconds)
+        return "ready"
+
+    return initialize
+
+
+def test_retry_waits_on_the_timed_out_call():
+    calls = []
+    scheduler = DependencyScheduler()
+    scheduler.add_task(
+        ScheduledTask("service", slow_initializer(calls), timeout=0.1, attempts=5, retry_backoff=0.01)
+    )
+
+    outcome = scheduler.run()["service"]
+
+    assert outcome.success and outcome.result == "ready"
+    assert outcome.attempts > 1
+    assert len(calls) == 1
+
+
+def test_failed_call_is_started_again():
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) == 1:
+            raise ValueError("first call fails")
+        return "ready"
+
+    scheduler = DependencyScheduler()
+    scheduler.add_task(ScheduledTask("service", flaky, attempts=2, retry_backoff=0.01))
+
+    assert scheduler.run()["service"].result == "ready"
+    assert len(calls) == 2
+
+
+def test_preload_retry_waits_on_the_timed_out_call():
+    calls = []
+    optimizer = StartupOptimizer()
+    optimizer.register_component(
+        "service", ComponentPriority.HIGH, slow_initializer(calls), timeout=0.1, retry_count=5
+    )
+
+    assert optimizer.preload_component("service")
+    assert optimizer.get_component_result("service") == "ready"
+    assert len(calls) == 1
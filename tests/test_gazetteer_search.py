@@ -0,0 +1,134 @@
+"""Tests for offline gazetteer lookups and their network fallback."""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("requests")
+
+from src.services.cache.geocode_store import GeocodeStore  # noqa: E402
+from src.services.weather.gazetteer import Gazetteer  # noqa: E402
+from src.services.weather.geocoding_service import GeocodingService  # noqa: E402
+
+PLACES = [
+    # name, latitude, longitude, country, admin1, population
+    ("Hana", 20.7578, -155.9903, "US", "HI", 1235),
+    ("Paris", 48.8534, 2.3488, "FR", "11", 2138551),
+    ("Springfield", 39.8017, -89.6437, "US", "IL", 114394),
+]
+
+
+def write_dump(path):
+    """GeoNames-style dump with the PLACES rows."""
+    rows = []
+    for geoname_id, (name, latitude, longitude, country, admin1, population) in enumerate(PLACES):
+        fields = [""] * 19
+        fields[0] = str(geoname_id)
+        fields[1] = fields[2] = name
+        fields[4], fields[5] = str(latitude), str(longitude)
+        fields[8], fields[10], fields[14] = country, admin1, str(population)
+        rows.append("\t".join(fields))
+    path.write_text("\n".join(rows) + "\n", encoding="utf-8")
+    return path
+
+
+class FakeGeolocator:
+    """Nominatim stand-in answering from a fixed table and recording queries."""
+
+    def __init__(self, answers):
+        self.answers = answers
+        self.queries = []
+
+    def geocode(self, query, **kwargs):
+        self.queries.append(query)
+        return self.answers.get(query)
+
+
+def nominatim_location(city, latitude, longitude, country="United States", country_code="us"):
+    address = {"city": city, "country": country, "country_code": country_code}
+    return SimpleNamespace(
+        raw={"address": address},
+        latitude=latitude,
+        longitude=longitude,
+        address=f"{city}, {country}",
+    )
+
+
+@pytest.fixture
+def dump(tmp_path, monkeypatch):
+    # Gazetteer indexes and the legacy geocoding cache live under the cwd
+    monkeypatch.chdir(tmp_path)
+    return write_dump(tmp_path / "cities.txt")
+
+
+@pytest.fixture
+def service(tmp_path, dump):
+    service = GeocodingService()
+    service.cache = GeocodeStore(tmp_path / "geocode.db")
+    service.gazetteer_path = str(dump)
+    return service
+
+
+def test_exact_and_prefix_matches_are_confident(dump):
+    gazetteer = Gazetteer.open(dump)
+    assert [place.name for place in gazetteer.search("Paris")] == ["Paris"]
+    assert gazetteer.search("Paris")[0].confident
+    assert gazetteer.search("Spring")[0].confident
+
+
+def test_loose_fuzzy_matches_are_not_confident(dump):
+    gazetteer = Gazetteer.open(dump)
+    places = gazetteer.search("Hanover")
+    assert places and places[0].name == "Hana"
+    assert not any(place.confident for place in places)
+
+
+def test_confident_match_skips_the_network(service):
+    service._geolocator = FakeGeolocator({})
+
+    results = service.search_locations_advanced("Paris")
+
+    assert [result.name for result in results] == ["Paris"]
+    assert service._geolocator.queries == []
+    assert service.get_from_cache("Paris") is not None
+
+
+def test_unknown_place_falls_through_to_the_network(service):
+    hanover = nominatim_location("Hanover", 43.7022, -72.2896)
+    service._geolocator = FakeGeolocator({"Hanover": [hanover]})
+
+    results = service.search_locations_advanced("Hanover")
+
+    assert service._geolocator.queries
+    assert results[0].name == "Hanover"
+    # The loose offline match is kept after the network's answer
+    assert [result.name for result in results[1:]] == ["Hana"]
+    assert service.get_from_cache("Hanover") is not None
+
+
+def test_fuzzy_only_results_are_not_cached(service):
+    service._geolocator = FakeGeolocator({})
+
+    results = service.search_locations_advanced("Hanover")
+
+    assert [result.name for result in results] == ["Hana"]
+    assert service.get_from_cache("Hanover") is None
+
+
+def test_reverse_geocode_keeps_the_queried_point(service):
+    # About 5 km from the Paris city centre
+    result = service.reverse_geocode_local(48.8900, 2.3900)
+
+    assert result.name == "Paris"
+    assert (result.latitude, result.longitude) == (48.8900, 2.3900)
+
+
+def test_reverse_geocode_reuses_nearby_names_at_the_queried_point(service):
+    nearby = nominatim_location("Hanover", 43.7022, -72.2896)
+    service._geolocator = SimpleNamespace(reverse=lambda query, exactly_one: nearby)
+    service.reverse_geocode("43.7022, -72.2896")
+
+    result = service.reverse_geocode_local(43.7050, -72.2900)
+
+    assert result.name == "Hanover"
+    assert (result.latitude, result.longitude) == (43.7050, -72.2900)
@@ -0,0 +1,157 @@
+"""Tests for training the ML weather prediction models from history."""
+
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("sklearn")
+pytest.importorskip("joblib")
+
+from src.services.weather.ml_weather_service import MLWeatherService  # noqa: E402
+
+HORIZON_ARTIFACTS = {"temperature_horizon_model", "humidity_horizon_model"}
+
+
+def make_history_db(path, locations=3, hours=300):
+    """weather_history with hourly readings for a few locations."""
+    conn = sqlite3.connect(path)
+    conn.execute(
+        """CREATE TABLE weather_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, location TEXT, timestamp TEXT,
+            temperature REAL, humidity REAL, pressure REAL, wind_speed REAL, visibility REAL
+        )"""
+    )
+    add_history(conn, locations, hours, datetime(2024, 1, 1))
+    conn.close()
+    return path
+
+
+def add_history(conn, locations, hours, start):
+    rng = np.random.default_rng(len(str(start)) + hours)
+    rows = [
+        (
+            f"City {city}",
+            (start + timedelta(hours=hour)).strftime("%Y-%m-%d %H:%M:%S"),
+            15 + 8 * np.sin(hour / 24 * 2 * np.pi) + city + rng.normal(0, 0.5),
+            60 + 20 * np.cos(hour / 24 * 2 * np.pi) + rng.normal(0, 2),
+            1013 + rng.normal(0, 3),
+            5 + rng.normal(0, 1),
+            10.0,
+        )
+        for city in range(locations)
+        for hour in range(hours)
+    ]
+    conn.executemany(
+        "INSERT INTO weather_history (location, timestamp, temperature, humidity, pressure,"
+        " wind_speed, visibility) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    conn.commit()
+
+
+def hourly_records(hours=200):
+    start = datetime(2024, 1, 1).timestamp()
+    return [
+        {
+            "dt": start + hour * 3600,
+            "temp": 15 + 8 * np.sin(hour / 24 * 2 * np.pi),
+            "humidity": 60 + 20 * np.cos(hour / 24 * 2 * np.pi),
+            "pressure": 1013,
+            "wind_speed": 5,
+            "clouds": 50,
+            "visibility": 10000,
+        }
+        for hour in range(hours)
+    ]
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return MLWeatherService()
+
+
+def saved_artifacts(service):
+    manifest = service.model_store.current()
+    assert manifest is not None
+    return set(manifest.artifacts)
+
+
+def test_full_retrain_drops_horizon_models_fitted_with_old_scaler(service, tmp_path):
+    db_path = make_history_db(tmp_path / "history.db")
+    records = hourly_records()
+    assert service.train_models(records)
+    assert service.train_horizon_models(records)
+    assert HORIZON_ARTIFACTS <= saved_artifacts(service)
+
+    assert service.train_from_history(db_path, incremental=False, parallel=False)
+
+    assert not service.horizon_models
+    assert saved_artifacts(service) == {"temperature_model", "humidity_model", "temperature_scaler"}
+    # Without horizon models, predictions come from the hourly models
+    assert not service._horizon_models_cover(24)
+    assert len(service.predict_weather(records[-1], hours_ahead=24)) == 24
+
+    # Refitting the horizon models uses (and saves with) the new scaler
+    assert service.train_horizon_models(records)
+    assert HORIZON_ARTIFACTS <= saved_artifacts(service)
+
+
+def test_incremental_run_keeps_scaler_and_horizon_models(service, tmp_path):
+    db_path = make_history_db(tmp_path / "history.db")
+    records = hourly_records()
+    assert service.train_from_history(db_path, incremental=False, parallel=False)
+    assert service.train_horizon_models(records)
+    scaler = service.prediction_scalers["temperature"]
+
+    conn = sqlite3.connect(db_path)
+    add_history(conn, 3, 100, datetime(2024, 3, 1))
+    conn.close()
+    assert service.train_from_history(db_path, incremental=True, parallel=False)
+
+    assert service.prediction_scalers["temperature"] is scaler
+    assert HORIZON_ARTIFACTS <= saved_artifacts(service)
+
+
+@pytest.mark.parametrize("target", ["temperature", "humidity"])
+def test_streaming_fit_keeps_estimator_count_bounded(service, tmp_path, target):
+    from src.services.weather.ml_training import fit_scaler, fit_streaming
+
+    db_path = make_history_db(tmp_path / "history.db", hours=600)
+    scaler, _ = fit_scaler(db_path, service.feature_names, chunk_size=200)
+    result = fit_streaming(target, db_path, service.feature_names, scaler, chunk_size=200, max_estimators=40)
+    # A fit from scratch leaves room for incremental runs
+    assert len(result.model.estimators_) <= 20
+
+    conn = sqlite3.connect(db_path)
+    for month in range(2, 8):
+        add_history(conn, 3, 200, datetime(2024, month, 1))
+        result = fit_streaming(
+            target, db_path, service.feature_names, scaler, result.model,
+            result.trained_through_id, chunk_size=200, max_estimators=40,
+        )
+        assert len(result.model.estimators_) <= 40
+        assert result.model.n_estimators == len(result.model.estimators_)
+    conn.close()
+    assert result.trained_through_id == 3 * (600 + 6 * 200)
+    assert result.model.predict(scaler.transform(np.zeros((1, len(service.feature_names))))).shape == (1,)
+
+
+def test_incremental_run_after_train_models_refits_from_scratch(service, tmp_path):
+    db_path = make_history_db(tmp_path / "history.db")
+    records = hourly_records()
+    assert service.train_models(records)
+    assert service.model_manifest.trained_through_id == 0
+    scaler = service.prediction_scalers["temperature"]
+    old_temperature_model = service.prediction_models["temperature"]
+
+    assert service.train_from_history(db_path, incremental=True, parallel=False)
+
+    assert service.prediction_scalers["temperature"] is not scaler
+    model = service.prediction_models["temperature"]
+    assert model is not old_temperature_model
+    # Grown from scratch, not stacked onto the 100 stages train_models() fitted
+    assert len(model.estimators_) < 100
+    assert service.model_manifest.trained_through_id == 3 * 300